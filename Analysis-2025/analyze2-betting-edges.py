@@ -5,12 +5,18 @@
 # 4. Rest Days Impact on Team Performance
 # 5. Divisional Rivalry Performance Patterns
 
+import os
 import sqlite3
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# Shared typed loaders (repository root)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import nfl_data  # noqa: E402
+
 conn = sqlite3.connect("data/nfl.db")
 games = pd.read_sql("""
     SELECT game_id, season, CAST(week AS INT) as week, date, home_team, away_team, 
@@ -26,7 +32,7 @@ print(f"Analyzing {len(games)} games from 2020-2025")
 print("=" * 60)
 print("\n1. FIRST HALF vs SECOND HALF TEAM PERFORMANCE")
 print("=" * 50)
-box_scores = pd.read_csv("data/all_box_scores.csv")
+box_scores = nfl_data.load('box_scores')
 box_scores['first_half'] = box_scores['1'].fillna(0) + box_scores['2'].fillna(0)
 box_scores['second_half'] = box_scores['3'].fillna(0) + box_scores['4'].fillna(0)
 box_scores['pfr_id'] = box_scores['URL'].str.extract(r'/([^/]+)\.htm$')[0]
@@ -5,12 +5,18 @@
 # 4. Time of Possession and Pace of Play Analysis
 # 5. Coaching Changes and Team Performance Trends
 
+import os
 import sqlite3
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# Shared typed loaders (repository root)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import nfl_data  # noqa: E402
+
 conn = sqlite3.connect("data/nfl.db")
 games = pd.read_sql("""
     SELECT game_id, season, CAST(week AS INT) as week, date, home_team, away_team, 
@@ -22,9 +28,9 @@ games = pd.read_sql("""
 conn.close()
 
 # Load additional datasets
-box_scores = pd.read_csv("data/all_box_scores.csv")
-team_game_logs = pd.read_csv("data/all_team_game_logs.csv")
-player_stats = pd.read_csv("data/all_passing_rushing_receiving.csv")
+box_scores = nfl_data.load('box_scores')
+team_game_logs = nfl_data.load('team_game_logs')
+player_stats = nfl_data.load('passing_rushing_receiving')
 
 print("=== ADVANCED BETTING EDGE ANALYSIS ===")
 print(f"Analyzing {len(games)} games from 2020-2025")
@@ -104,7 +110,7 @@ print("=" * 50)
 
 # Load red zone data if available
 try:
-    redzone_data = pd.read_csv("data/all_redzone.csv")
+    redzone_data = nfl_data.load('redzone')
     print("Red zone data found!")
     print(f"Red zone records: {len(redzone_data)}")
     print("Sample red zone data:")
@@ -5,12 +5,19 @@
 # 4. Weather Extremes and Their Impact
 # 5. Betting Market Inefficiencies and Value Bets
 
+import os
 import sqlite3
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# Shared typed loaders (repository root)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import nfl_data  # noqa: E402
+from nfl_data import query  # noqa: E402
+
 conn = sqlite3.connect("data/nfl.db")
 games = pd.read_sql("""
     SELECT game_id, season, CAST(week AS INT) as week, date, home_team, away_team, 
@@ -22,7 +29,7 @@ games = pd.read_sql("""
 conn.close()
 
 # Load additional datasets
-player_stats = pd.read_csv("data/all_passing_rushing_receiving.csv")
+player_stats = nfl_data.load('passing_rushing_receiving')
 
 print("=== FINAL BETTING EDGE ANALYSIS ===")
 print(f"Analyzing {len(games)} games from 2020-2025")
@@ -82,28 +89,15 @@ else:
 print("\n\n2. TEAM MATCHUP HISTORY ANALYSIS")
 print("=" * 50)
 
-# Analyze head-to-head matchups
-matchup_analysis = []
-for _, game in games.iterrows():
-    matchup_analysis.append({
-        'home_team': game['home_team'],
-        'away_team': game['away_team'],
-        'home_score': game['home_score'],
-        'away_score': game['away_score'],
-        'total': game['home_score'] + game['away_score'],
-        'margin': game['home_score'] - game['away_score'],
-        'season': game['season']
-    })
-
-matchup_df = pd.DataFrame(matchup_analysis)
-
-# Create matchup pairs
-matchup_df['matchup'] = matchup_df.apply(lambda x: f"{min(x['home_team'], x['away_team'])}_{max(x['home_team'], x['away_team'])}", axis=1)
+# Analyze head-to-head matchups: every game since 2020 once, from the side of the alphabetically first team
+matchup_df = query.run('head_to_head', since=2020, limit=None)
+matchup_df = matchup_df[matchup_df['team1'] < matchup_df['team2']].copy()
+matchup_df['matchup'] = matchup_df['team1'] + '_' + matchup_df['team2']
 
 # Analyze matchup performance
 matchup_stats = matchup_df.groupby('matchup').agg({
-    'total': ['mean', 'std', 'count'],
-    'margin': ['mean', 'std']
+    'total_points': ['mean', 'std', 'count'],
+    'team1_margin': ['mean', 'std']
 }).round(2)
 
 matchup_stats.columns = ['avg_total', 'std_total', 'games', 'avg_margin', 'std_margin']
@@ -5,6 +5,9 @@ import matplotlib.pyplot as plt
 from tabulate import tabulate
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from nfl_data import features  # noqa: E402
+
 # QB specific changes
 print("=== XGBoost QB Passing Yards Prediction ===")
 
@@ -44,16 +47,19 @@ for col in ["pass_attempts", "completions", "pass_yards", "season", "week"]:
     hist[col] = pd.to_numeric(hist[col], errors="coerce")
 hist = hist.dropna(subset=["pass_yards"])
 
-# Sort and create trailing features
+# Sort and attach trailing features from the rolling-feature store (rebuilt here if the scrape's copy is stale)
 hist = hist.sort_values(["player_id", "season", "week"]).reset_index(drop=True)
 windows = [3, 5, 8, 12]
 
+store_cols = {}
 for w in windows:
-    hist[f"attempts_l{w}"] = hist.groupby("player_id")["pass_attempts"].transform(lambda s: s.shift(1).rolling(w, min_periods=1).mean())
-    hist[f"completions_l{w}"] = hist.groupby("player_id")["completions"].transform(lambda s: s.shift(1).rolling(w, min_periods=1).mean())
-    hist[f"yards_l{w}"] = hist.groupby("player_id")["pass_yards"].transform(lambda s: s.shift(1).rolling(w, min_periods=1).mean())
+    store_cols[f"pass_att_l{w}"] = f"attempts_l{w}"
+    store_cols[f"pass_cmp_l{w}"] = f"completions_l{w}"
+    store_cols[f"pass_yds_l{w}"] = f"yards_l{w}"
     # robust to outliers
-    hist[f"yards_median_l{w}"] = hist.groupby("player_id")["pass_yards"].transform(lambda s: s.shift(1).rolling(w, min_periods=1).median())
+    store_cols[f"pass_yds_median_l{w}"] = f"yards_median_l{w}"
+store = features.player_features("data/features", source="data/player_stats_pfr.csv", columns=list(store_cols))
+hist = hist.merge(store.rename(columns=store_cols), on=features.PLAYER_KEY, how="left")
 
 # Feature columns - 9 features for passing (attempts, completions, yards for each window)
 feature_cols = ([f"attempts_l{w}" for w in windows] + [f"completions_l{w}" for w in windows] + [f"yards_l{w}" for w in windows] + [f"yards_median_l{w}" for w in windows])
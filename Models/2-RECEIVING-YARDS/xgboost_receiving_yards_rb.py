@@ -5,6 +5,9 @@ import matplotlib.pyplot as plt
 from tabulate import tabulate
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from nfl_data import features  # noqa: E402
+
 print("=== XGBoost RB Receiving Yards Prediction ===")
 
 # Get week number from command line argument
@@ -43,25 +46,23 @@ for col in ["targets", "receptions", "rec_yards", "season", "week"]:
     hist[col] = pd.to_numeric(hist[col], errors="coerce")
 hist = hist.dropna(subset=["rec_yards"])
 
-# Sort and create trailing features
+# Sort and attach trailing features from the rolling-feature store (rebuilt here if the scrape's copy is stale)
 hist = hist.sort_values(["player_id", "season", "week"]).reset_index(drop=True)
 windows = [3, 5, 8, 12]
 
+store_cols = {}
 for w in windows:
-    hist[f"targets_l{w}"] = hist.groupby("player_id")["targets"].transform(
-        lambda s: s.shift(1).rolling(w, min_periods=1).mean())
-    hist[f"receptions_l{w}"] = hist.groupby("player_id")["receptions"].transform(
-        lambda s: s.shift(1).rolling(w, min_periods=1).mean())
-    hist[f"yards_l{w}"] = hist.groupby("player_id")["rec_yards"].transform(
-        lambda s: s.shift(1).rolling(w, min_periods=1).mean())
+    store_cols[f"targets_l{w}"] = f"targets_l{w}"
+    store_cols[f"rec_l{w}"] = f"receptions_l{w}"
+    store_cols[f"rec_yds_l{w}"] = f"yards_l{w}"
     # robust feature
-    hist[f"yards_median_l{w}"] = hist.groupby("player_id")["rec_yards"].transform(
-        lambda s: s.shift(1).rolling(w, min_periods=1).median())
+    store_cols[f"rec_yds_median_l{w}"] = f"yards_median_l{w}"
+store = features.player_features("data/features", source="data/player_stats_pfr.csv", columns=list(store_cols))
+hist = hist.merge(store.rename(columns=store_cols), on=features.PLAYER_KEY, how="left")
 
 # Simple additional baselines
 # Last-3 average receiving yards
-hist["rec_l3_avg"] = hist.groupby("player_id")["rec_yards"].transform(
-    lambda s: s.shift(1).rolling(3, min_periods=1).mean())
+hist["rec_l3_avg"] = hist["yards_l3"]
 
 # Prior-season per-game average and career median
 prev_season = hist["season"].max() - 1
@@ -17,6 +17,7 @@ fi
 # Data prep
 mkdir -p data
 cp ../../Scrapers/final_data_pfr/player_stats_pfr.csv data/
+cp -r ../../Scrapers/final_data_pfr/features data/ 2>/dev/null || true
 cp ../../Scrapers/data/rosters/roster_2025.csv data/
 cp ../upcoming_games.csv data/
 cp ../starting_qbs_2025.csv data/
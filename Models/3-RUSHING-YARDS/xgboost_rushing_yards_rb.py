@@ -5,6 +5,9 @@ import matplotlib.pyplot as plt
 from tabulate import tabulate
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from nfl_data import features  # noqa: E402
+
 print("=== XGBoost RB Rushing Yards Prediction ===")
 
 # Get week number from command line argument
@@ -43,20 +46,22 @@ for col in ["rush_att", "rush_yards", "season", "week"]:
     hist[col] = pd.to_numeric(hist[col], errors="coerce")
 hist = hist.dropna(subset=["rush_yards"])
 
-# Sort and create trailing features
+# Sort and attach trailing features from the rolling-feature store (rebuilt here if the scrape's copy is stale)
 hist = hist.sort_values(["player_id", "season", "week"]).reset_index(drop=True)
 windows = [3, 5, 8, 12]
 
+store_cols = {}
 for w in windows:
-    hist[f"attempts_l{w}"] = hist.groupby("player_id")["rush_att"].transform(lambda s: s.shift(1).rolling(w, min_periods=1).mean())
-    hist[f"yards_l{w}"] = hist.groupby("player_id")["rush_yards"].transform(lambda s: s.shift(1).rolling(w, min_periods=1).mean())
+    store_cols[f"rush_att_l{w}"] = f"attempts_l{w}"
+    store_cols[f"rush_yds_l{w}"] = f"yards_l{w}"
     # robust
-    hist[f"yards_median_l{w}"] = hist.groupby("player_id")["rush_yards"].transform(lambda s: s.shift(1).rolling(w, min_periods=1).median())
+    store_cols[f"rush_yds_median_l{w}"] = f"yards_median_l{w}"
+store = features.player_features("data/features", source="data/player_stats_pfr.csv", columns=list(store_cols))
+hist = hist.merge(store.rename(columns=store_cols), on=features.PLAYER_KEY, how="left")
 
 # Simple additional baselines
 # Last-3 average rushing yards
-hist["rush_l3_avg"] = hist.groupby("player_id")["rush_yards"].transform(
-    lambda s: s.shift(1).rolling(3, min_periods=1).mean())
+hist["rush_l3_avg"] = hist["yards_l3"]
 
 # Prior-season per-game average and career median rushing yards
 prev_season = hist["season"].max() - 1
@@ -28,12 +28,17 @@ written to ``td_predictions.csv`` in the current working directory.
 from __future__ import annotations
 
 import argparse
+import os
+import sys
 from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
 from xgboost import XGBClassifier
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+import nfl_data  # noqa: E402
+
 # Suppress pandas FutureWarning about downcasting
 pd.set_option('future.no_silent_downcasting', True)
 
@@ -45,8 +50,8 @@ def load_rosters(rosters_path: str, target_season: int) -> Dict[Tuple[str, str],
     ``full_name``.  Player names are cleaned (lower‑cased and stripped of
     leading/trailing whitespace) for matching.
     """
-    rosters = pd.read_csv(rosters_path)
-    season_rosters = rosters[rosters["season"] == target_season].copy()
+    season_rosters = nfl_data.load("rosters", columns=["season", "team", "full_name", "position"],
+                                   seasons=target_season, path=rosters_path)
     season_rosters["full_name_clean"] = season_rosters["full_name"].astype(str).str.strip().str.lower()
     position_map: Dict[Tuple[str, str], str] = {}
     for _, row in season_rosters.iterrows():
@@ -378,7 +383,7 @@ def main():
     print(f"Loading game logs from {args.game_logs_path}…")
     game_logs = pd.read_csv(args.game_logs_path)
     print(f"Loading rosters from {args.rosters_path}…")
-    rosters = pd.read_csv(args.rosters_path)
+    rosters = nfl_data.load("rosters", path=args.rosters_path)
     print(f"Loading upcoming games from {args.upcoming_games_path}…")
     upcoming_games = pd.read_csv(args.upcoming_games_path)
 
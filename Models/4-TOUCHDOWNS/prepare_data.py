@@ -7,6 +7,10 @@ and write compact inference inputs for the upcoming week.
 import pandas as pd
 import numpy as np
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from nfl_data import features  # noqa: E402
 
 
 def probability_to_american_odds(prob: float) -> float:
@@ -93,12 +97,10 @@ def build_training_dataset() -> pd.DataFrame:
     df = df.sort_values(["player_id", "season", "week"]).reset_index(drop=True)
     windows = [3, 5, 8, 12]
     base_feats = ["rush_att", "rush_yds", "targets", "rec", "rec_yds", "scoring_tds"]
-    for feat in base_feats:
-        for w in windows:
-            df[f"{feat}_rm{w}"] = (
-                df.groupby("player_id")[feat]
-                .transform(lambda s: s.shift(1).rolling(w, min_periods=1).mean())
-            )
+    # Trailing means from the rolling-feature store (rebuilt here if the scrape's copy is stale)
+    store_cols = {f"{feat}_l{w}": f"{feat}_rm{w}" for feat in base_feats for w in windows}
+    store = features.player_features("data/features", source="data/player_stats_pfr.csv", columns=list(store_cols))
+    df = df.merge(store.rename(columns=store_cols), on=features.PLAYER_KEY, how="left")
 
     keep_cols = [
         "full_name",
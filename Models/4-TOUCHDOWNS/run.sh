@@ -16,6 +16,7 @@ echo "--- Preparing Data for 4-TOUCHDOWNS ---"
 mkdir -p "$DATA_DIR"
 cd "$SCRIPT_DIR"
 cp ../../Scrapers/final_data_pfr/player_stats_pfr.csv data/ 2>/dev/null || true
+cp -r ../../Scrapers/final_data_pfr/features data/ 2>/dev/null || true
 cp ../../Scrapers/data/rosters/roster_2025.csv data/ 2>/dev/null || true
 cp ../../Scrapers/final_data_pfr/schedule_game_results_pfr.csv data/ 2>/dev/null || true
 cp ../../Scrapers/final_data_pfr/team_conversions_pfr.csv data/ 2>/dev/null || true
@@ -119,9 +119,9 @@ except Exception as e:
 
 # Generate betting lines for Week 1 of the upcoming season
 latest_season = nfl_data["season"].max()
-week1_query = f"SELECT home_team, away_team, home_score, away_score FROM Games WHERE season = {latest_season + 1} AND week = '01' AND game_type = 'REG'"
+week1_query = "SELECT home_team, away_team, home_score, away_score FROM Games WHERE season = ? AND week = 1 AND game_type = 'REG'"
 conn = sqlite3.connect(DB_PATH)
-upcoming_games_df = pd.read_sql_query(week1_query, conn)
+upcoming_games_df = pd.read_sql_query(week1_query, conn, params=(int(latest_season) + 1,))
 conn.close()
 
 results = []
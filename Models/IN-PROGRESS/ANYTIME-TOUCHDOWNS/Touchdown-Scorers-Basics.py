@@ -17,52 +17,20 @@ import warnings
 from datetime import datetime
 import os
 import webbrowser
-import glob
+import sys
+
+# Snapshot store of the scraper's final_data tables (Scrapers/scraper_core)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'Scrapers'))
+from scraper_core.snapshots import SnapshotStore  # noqa: E402
 
 # Suppress sklearn warnings
 warnings.filterwarnings('ignore', category=RuntimeWarning)
 
-def find_latest_date_files():
-    """Find the latest date files in the data directory"""
-    data_dir = "./data"  # Use local data directory
-
-    # File patterns to look for
-    file_patterns = {
-        'teams': 'Teams_*.csv',
-        'games': 'Games_*.csv',
-        'rosters': 'Rosters_*.csv'
-    }
-
-    latest_files = {}
-
-    for file_type, pattern in file_patterns.items():
-        # Find all matching files
-        files = glob.glob(os.path.join(data_dir, pattern))
-
-        if not files:
-            raise FileNotFoundError(f"No {file_type} files found in {data_dir}")
-
-        # Extract dates and find the latest
-        dates = []
-        for file in files:
-            filename = os.path.basename(file)
-            # Extract date part (e.g., OCT_15_2025 from Teams_OCT_15_2025.csv)
-            date_str = filename.replace(f'{file_type.capitalize()}_', '').replace('.csv', '')
-            try:
-                # Parse date (assuming format like OCT_15_2025)
-                date_obj = datetime.strptime(date_str, '%b_%d_%Y')
-                dates.append((date_obj, file))
-            except ValueError:
-                continue
-
-        if not dates:
-            raise ValueError(f"No valid date files found for {file_type}")
-
-        # Sort by date and get the latest
-        dates.sort(key=lambda x: x[0], reverse=True)
-        latest_files[file_type] = dates[0][1]
-
-    return latest_files
+def load_latest_snapshot(table):
+    """Latest snapshot of a final_data table (Teams, Games, Rosters) and its date"""
+    store = SnapshotStore("./data/snapshots")  # final_data/snapshots, copied by run.sh
+    df = store.materialize(table)
+    return df, store.manifest(table)['versions'][-1]['as_of']
 
 def probability_to_american_odds(probability):
     """Convert probability to American betting odds"""
@@ -291,20 +259,15 @@ def export_predictions_to_html(predictions, filename, title="NFL Touchdown Predi
 
 def load_data():
     """Load data from CSV files in data/ directory"""
-    print("Finding latest date files...")
-
-    # Find latest date files
-    latest_files = find_latest_date_files()
-
-    print("Loading data from latest date files...")
-    print(f"Teams file: {os.path.basename(latest_files['teams'])}")
-    print(f"Games file: {os.path.basename(latest_files['games'])}")
-    print(f"Rosters file: {os.path.basename(latest_files['rosters'])}")
+    print("Loading data from the latest final_data snapshots...")
+    teams_df, teams_as_of = load_latest_snapshot('Teams')
+    games_df, games_as_of = load_latest_snapshot('Games')
+    rosters_df, rosters_as_of = load_latest_snapshot('Rosters')
+    print(f"Teams snapshot: {teams_as_of}")
+    print(f"Games snapshot: {games_as_of}")
+    print(f"Rosters snapshot: {rosters_as_of}")
 
-    teams_df = pd.read_csv(latest_files['teams'])
-    games_df = pd.read_csv(latest_files['games'])
     player_stats_df = pd.read_csv('data/all_passing_rushing_receiving.csv')
-    rosters_df = pd.read_csv(latest_files['rosters'])
 
     # Save to data/ directory for compatibility
     teams_df.to_csv('data/Teams.csv', index=False)
@@ -608,10 +571,9 @@ def predict_upcoming_games(models, num_games=2):
     # Load upcoming games
     upcoming_games = pd.read_csv('/Users/td/Code/nfl-ai/Models/upcoming_games.csv')
 
-    # Use latest rosters file
-    latest_files = find_latest_date_files()
-    rosters_df = pd.read_csv(latest_files['rosters'])
-    print(f"Using rosters file: {os.path.basename(latest_files['rosters'])}")
+    # Use latest rosters snapshot
+    rosters_df, rosters_as_of = load_latest_snapshot('Rosters')
+    print(f"Using rosters snapshot: {rosters_as_of}")
 
     defense_strength_df = pd.read_csv('data/defense_strength.csv')
     
@@ -0,0 +1,179 @@
+"""
+ESPN NFL injury feed with a TTL cache and a diff against the previous snapshot.
+
+The injuries page (https://www.espn.com/nfl/injuries) is rendered from ESPN's
+site API, so the feed reads that JSON directly - no browser, one request. Only
+if the API call fails does it fall back to Playwright, with a persistent
+profile in .injury-browser/ (cookies and HTTP cache survive between runs): the
+JSON the page loads is captured from its network responses, and the rendered
+tables are read only if no JSON response shows up.
+
+Each fetch is stored in injury_feed_cache.json with its time. A later call
+within the TTL returns the cached players without any network access; a fetch
+is compared with the previous snapshot and only the players whose status
+changed (added, cleared or different) are reported.
+
+Each player is a dict: full_name, team, position, status.
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+ESPN_INJURIES_PAGE = "https://www.espn.com/nfl/injuries"
+ESPN_INJURIES_API = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/injuries"
+MODELS_DIR = Path(__file__).parent
+CACHE_PATH = MODELS_DIR / "injury_feed_cache.json"
+BROWSER_PROFILE = MODELS_DIR / ".injury-browser"
+DEFAULT_TTL_HOURS = float(os.environ.get("INJURY_TTL_HOURS", 6))
+
+
+def is_injured(status):
+    """Out, doubtful or on injured reserve (the players the models drop)"""
+    t = (status or "").strip().lower()
+    return t in ("out", "ir", "doubtful") or "injured reserve" in t or "reserve/injured" in t
+
+
+def players_from_json(data):
+    """Players from the site API response (or the page's own copy of it)"""
+    players = []
+    for team in data.get("injuries", []):
+        team_name = team.get("displayName", "")
+        for item in team.get("injuries") or team.get("items") or []:
+            athlete = item.get("athlete") or {}
+            name = (athlete.get("displayName") or athlete.get("name") or "").strip()
+            if not name:
+                continue
+            position = athlete.get("position") or {}
+            status = item.get("status") or item.get("statusDesc") or (item.get("type") or {}).get("description", "")
+            players.append({
+                "full_name": name,
+                "team": team_name,
+                "position": position.get("abbreviation", "") if isinstance(position, dict) else str(position),
+                "status": status.strip(),
+            })
+    return players
+
+
+def fetch_api(timeout=15):
+    import requests
+
+    response = requests.get(ESPN_INJURIES_API, timeout=timeout, headers={"User-Agent": "Mozilla/5.0"})
+    response.raise_for_status()
+    return players_from_json(response.json())
+
+
+# Rendered tables, read only when the page produced no injuries JSON
+_READ_TABLES = """
+() => {
+  const players = [];
+  for (const table of document.querySelectorAll('table')) {
+    const headers = Array.from(table.querySelectorAll('thead th')).map(th => (th.textContent || '').trim().toLowerCase());
+    const statusIdx = headers.indexOf('status');
+    const posIdx = headers.indexOf('pos');
+    if (statusIdx === -1) continue;
+    const title = table.closest('.ResponsiveTable')?.querySelector('.Table__Title')?.textContent || '';
+    for (const row of table.querySelectorAll('tbody tr')) {
+      const tds = row.querySelectorAll('td');
+      const a = row.querySelector('a[href*="/nfl/player/_/id/"]');
+      const name = (a?.textContent || '').trim();
+      if (!name) continue;
+      players.push({
+        full_name: name,
+        team: title.trim(),
+        position: posIdx === -1 ? '' : (tds[posIdx]?.textContent || '').trim(),
+        status: (tds[statusIdx]?.textContent || '').trim(),
+      });
+    }
+  }
+  return players;
+}
+"""
+
+
+def fetch_browser(timeout=20):
+    from playwright.sync_api import sync_playwright
+
+    captured = []
+
+    def on_response(response):
+        if "injur" in response.url and "json" in response.headers.get("content-type", ""):
+            try:
+                captured.append(response.json())
+            except Exception:
+                pass
+
+    with sync_playwright() as p:
+        context = p.chromium.launch_persistent_context(str(BROWSER_PROFILE), headless=True)
+        try:
+            page = context.pages[0] if context.pages else context.new_page()
+            page.on("response", on_response)
+            page.goto(ESPN_INJURIES_PAGE, wait_until="domcontentloaded", timeout=timeout * 1000)
+            for data in captured:
+                players = players_from_json(data)
+                if players:
+                    return players
+            page.wait_for_selector("table tbody tr", timeout=timeout * 1000)
+            return page.evaluate(_READ_TABLES)
+        finally:
+            context.close()
+
+
+def fetch_players():
+    """``(players, source)`` from the API, or the browser if the API call fails"""
+    try:
+        players = fetch_api()
+        if players:
+            return players, "api"
+        print("ESPN injuries API returned no players; falling back to the browser")
+    except Exception as e:
+        print(f"ESPN injuries API failed ({e}); falling back to the browser")
+    return fetch_browser(), "browser"
+
+
+def load_snapshot(path=CACHE_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_snapshot(snapshot, path=CACHE_PATH):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(snapshot, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def status_changes(previous, current):
+    """Players whose status differs between two player lists (``old``/``new`` are '' when absent)"""
+    before = {(p["full_name"], p["team"]): p["status"] for p in previous}
+    after = {(p["full_name"], p["team"]): p["status"] for p in current}
+    changes = []
+    for key in after.keys() | before.keys():
+        old, new = before.get(key, ""), after.get(key, "")
+        if old != new:
+            changes.append({"full_name": key[0], "team": key[1], "old": old, "new": new})
+    return sorted(changes, key=lambda c: (c["team"], c["full_name"]))
+
+
+def injury_feed(ttl_hours=DEFAULT_TTL_HOURS, refresh=False, cache_path=CACHE_PATH):
+    """``(players, changes, cached)``: the players, the status changes since the previous snapshot and,
+    when the snapshot was younger than the TTL and nothing was fetched, the time it was taken"""
+    snapshot = load_snapshot(cache_path)
+    if snapshot and not refresh and time.time() - snapshot["fetched_at"] < ttl_hours * 3600:
+        return snapshot["players"], [], snapshot["fetched"]
+    players, source = fetch_players()
+    changes = status_changes(snapshot["players"] if snapshot else [], players)
+    snapshot = {
+        "fetched_at": time.time(),
+        "fetched": datetime.now().isoformat(timespec="seconds"),
+        "source": source,
+        "players": players,
+        "changes": changes,
+    }
+    save_snapshot(snapshot, cache_path)
+    return players, changes, None
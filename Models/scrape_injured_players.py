@@ -1,48 +1,31 @@
-from playwright.sync_api import sync_playwright
-import pandas as pd
+import argparse
+import csv
+from pathlib import Path
 
-p = sync_playwright().start()
-browser = p.chromium.launch(headless=True)
-page = browser.new_page()
-page.goto("https://www.espn.com/nfl/injuries", wait_until="domcontentloaded")
-page.wait_for_timeout(2500)
-res = page.evaluate(
-    """
-    () => {
-      const keepStatus = (s) => {
-        if (!s) return false;
-        const t = s.trim().toLowerCase();
-        return t === 'out' || t === 'injured reserve' || t.includes('injured reserve') || t === 'reserve/injured' || t.includes('reserve/injured') || t === 'ir' || t === 'doubtful';
-      };
-      const included = [];
-      const excluded = [];
-      const tables = Array.from(document.querySelectorAll('table'));
-      for (const table of tables) {
-        const headers = Array.from(table.querySelectorAll('thead th')).map(th => (th.textContent||'').trim().toLowerCase());
-        if (headers.length === 0) continue;
-        const statusIdx = headers.indexOf('status');
-        if (statusIdx === -1) continue;
-        const rows = Array.from(table.querySelectorAll('tbody tr'));
-        for (const row of rows) {
-          const tds = Array.from(row.querySelectorAll('td'));
-          if (tds.length === 0) continue;
-          const statusText = (tds[statusIdx]?.textContent || '').trim();
-          const a = row.querySelector('a[href*="/nfl/player/_/id/"]');
-          const name = (a?.textContent || '').trim();
-          if (!name) continue;
-          if (keepStatus(statusText)) included.push(name); else excluded.push(name);
-        }
-      }
-      return { included: Array.from(new Set(included)), excluded: Array.from(new Set(excluded)) };
-    }
-    """
-)
-browser.close()
-p.stop()
+from injury_feed import DEFAULT_TTL_HOURS, injury_feed, is_injured
 
-pd.DataFrame({"full_name": res["included"]}).to_csv("/Users/td/Code/nfl-ai/Models/injured_players.csv", index=False)
-pd.DataFrame({"full_name": res["excluded"]}).to_csv("/Users/td/Code/nfl-ai/Models/questionable_players.csv", index=False)
-print("Wrote", len(res["included"]), "players to /Users/td/Code/nfl-ai/Models/injured_players.csv")
-print("Wrote", len(res["excluded"]), "players to /Users/td/Code/nfl-ai/Models/questionable_players.csv")
+# Injury reports come from injury_feed: ESPN's injuries JSON, cached for --ttl-hours
+# (INJURY_TTL_HOURS) so a rerun in the same session does not touch the network
+parser = argparse.ArgumentParser(description="Write injured_players.csv and questionable_players.csv from ESPN")
+parser.add_argument("--ttl-hours", type=float, default=DEFAULT_TTL_HOURS, help="reuse a snapshot younger than this")
+parser.add_argument("--refresh", action="store_true", help="fetch even if the cached snapshot is fresh")
+args = parser.parse_args()
 
+players, changes, cached = injury_feed(ttl_hours=args.ttl_hours, refresh=args.refresh)
+if cached:
+    print(f"Using the injury snapshot from {cached} (--refresh to fetch again)")
+else:
+    print(f"{len(changes)} status changes since the last snapshot")
+    for change in changes:
+        print(f"  {change['full_name']} ({change['team']}): {change['old'] or '-'} -> {change['new'] or 'cleared'}")
 
+included = list(dict.fromkeys(p["full_name"] for p in players if is_injured(p["status"])))
+excluded = list(dict.fromkeys(p["full_name"] for p in players if not is_injured(p["status"])))
+
+models_dir = Path(__file__).parent
+for filename, names in (("injured_players.csv", included), ("questionable_players.csv", excluded)):
+    with open(models_dir / filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["full_name"])
+        writer.writerows([name] for name in names)
+    print("Wrote", len(names), "players to", models_dir / filename)
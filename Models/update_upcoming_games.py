@@ -3,6 +3,9 @@ from pathlib import Path
 import pandas as pd
 import sys
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import nfl_data  # noqa: E402
+
 games_csv = Path("data/games.csv")
 output = Path(__file__).parent / "upcoming_games.csv"
 bye_output = Path(__file__).parent / "upcoming_bye_week.csv"
@@ -10,7 +13,7 @@ reference_date = pd.Timestamp(date.today())
 game_type = "REG"
 week = sys.argv[1] if len(sys.argv) > 1 else None
 
-games = pd.read_csv(games_csv, parse_dates=["date"], keep_default_na=True)
+games = nfl_data.load("games", path=games_csv)
 pending = games[games["home_score"].isna() | games["away_score"].isna()].copy()
 pending = pending[pending["game_type"] == game_type]
 
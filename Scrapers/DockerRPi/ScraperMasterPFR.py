@@ -2,17 +2,18 @@
 # Standalone script that scrapes ONLY from Pro Football Reference sources
 # Creates comprehensive CSV files in FINAL/ directory (no database files)
 # Combines all PFR scraping functionality into one script
+#
+# Low-memory mode for 1-2 GB boards: `--low-memory` (or SCRAPER_LOW_MEMORY=1) keeps no
+# parsed pages between sections and merges CSVs chunk by chunk; `--max-memory-mb N`
+# (or SCRAPER_MAX_MEMORY_MB) sets the ceiling the chunks are sized against
 
 import pandas as pd
-import requests
 import os
 import csv
-from bs4 import BeautifulSoup, Comment
-import time
-from time import sleep
+import shutil
 import numpy as np
-from datetime import datetime, timedelta
-from requests.exceptions import Timeout, RequestException
+from datetime import datetime
+from scraper_core import MemoryBudget, Scraper, pfr, stream, telemetry
 
 print("="*80)
 print("MASTER PFR-ONLY NFL DATA SCRAPER")
@@ -30,6 +31,64 @@ if not os.path.exists(final_dir):
 start_time = datetime.now()
 print(f"\nProcess started at: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
+# Shared scraping core: pooled session with a per-host request budget (no fixed sleeps),
+# parse workers, and the page archive and run reports kept under the mounted FINAL/ volume
+# so a --reparse run rebuilds the CSVs without touching the network
+scraper = Scraper(
+    'ScraperMasterPFR',
+    archive_root=os.path.join(final_dir, 'pfr-archive'),
+    report_dir=os.path.join(final_dir, 'run-reports'),
+)
+budget = MemoryBudget.from_args()
+print(f"Memory: {budget.describe()}{' (low-memory mode)' if budget.enabled else ''}")
+
+# Team and box score pages each carry several tables; every page is fetched once
+# for all the sections that read it. In low-memory mode parsed pages are not kept:
+# later sections re-parse the copy the first fetch stored in the page archive.
+TEAM_PAGE_SPECS = [pfr.TEAM_STATS, pfr.TEAM_SCHEDULE, pfr.TEAM_CONVERSIONS]
+GAME_PAGE_SPECS = [pfr.LINESCORE, pfr.SCORING, pfr.PLAYER_OFFENSE, pfr.PLAYER_DEFENSE]
+page_tables = {}
+fetched_urls = set()
+
+def fetch_tables(specs, urls):
+    """Yield ``(url, tables)`` for each URL, fetching only pages not seen yet this run"""
+    if not budget.enabled:
+        missing = {url: None for url in urls if url not in page_tables}
+        for url, _, found in scraper.tables(specs, missing):
+            page_tables[url] = found
+        for url in urls:
+            yield url, page_tables[url]
+        return
+    missing = {url: None for url in urls if url not in fetched_urls}
+    for url, found in scraper.archived_tables(specs, [url for url in urls if url in fetched_urls]):
+        if found is None:  # evicted from the archive since; fetch it again
+            missing[url] = None
+            continue
+        yield url, found
+    for url, _, found in scraper.tables(specs, missing):
+        if found is not None:
+            fetched_urls.add(url)
+        yield url, found
+
+GAMES_COLUMNS = ['game_id', 'date', 'home_score', 'away_score']
+
+def played_games(year_to_scrape):
+    """Rows of games.csv for ``year_to_scrape`` dated on or before today, read a chunk at a time"""
+    now_dt = pd.Timestamp(datetime.now())
+    for chunk in stream.iter_csv(f'{final_dir}/games.csv', budget, usecols=GAMES_COLUMNS):
+        game_dt = pd.to_datetime(chunk['date'], errors='coerce')
+        chunk = chunk[(chunk['game_id'].str.split('_').str[0] == str(year_to_scrape)) & (game_dt <= now_dt)]
+        chunk = chunk.assign(pfr=chunk['game_id'].str.replace('_', '').str.lower())
+        yield from chunk.to_dict('records')
+
+# Rows in each merged output, for the summary report
+record_counts = {}
+
+def merge_csvs(paths, output, label, columns=(), assign=None, keep=None):
+    """Stream ``paths`` into ``output`` chunk by chunk and record its row count"""
+    record_counts[label] = stream.concat_csv(paths, output, budget, assign=assign, keep=keep, columns=columns)
+    print(f"✅ {label} created: {record_counts[label]} records")
+
 # Team name standardization mapping
 standardize_mapping = {
     'OAK': 'LVR',  
@@ -46,6 +105,7 @@ standardize_mapping = {
 
 ##### Create Teams CSV #####
 print("\n1. Creating Teams data...")
+telemetry.section('teams')
 teams = [
     ['ARI', 'Arizona Cardinals', 'NFC West'],
     ['ATL', 'Atlanta Falcons', 'NFC South'],
@@ -87,6 +147,7 @@ print(f"✅ Teams CSV created: {len(df_teams)} teams")
 
 ##### Scrape Team Game Logs (2023-2025) #####
 print("\n2. Scraping Team Game Logs from PFR...")
+telemetry.section('team_game_logs')
 data_dir = f'{final_dir}/SR-game-logs'
 os.makedirs(data_dir, exist_ok=True)
 opponent_data_dir = f'{final_dir}/SR-opponent-game-logs'
@@ -127,145 +188,46 @@ pfr_teams = [
     ['was', 'Washington Commanders']
 ]
 
-team_game_logs_headers = [
-    'rk', 'gtm', 'week', 'date', 'day', 'game_location', 'opp', 'result', 'pts', 'pts_opp', 'ot', 
-    'pass_cmp', 'pass_att', 'pass_cmp_pct', 'pass_yds', 'pass_td', 'pass_ya', 'pass_aya', 'pass_rate', 
-    'pass_sk', 'pass_sk_yds', 'rush_att', 'rush_yds', 'rush_td', 'rush_ya', 'plays', 'total_yds', 'ypp',
-    'fga', 'fgm', 'xpa', 'xpm', 'punt', 'punt_yds', 'first_downs_pass', 'first_downs_rush', 'first_downs_pen',
-    'first_downs_total', 'third_down_conv', 'third_down_att', 'fourth_down_conv', 'fourth_down_att', 
-    'pen', 'pen_yds', 'fumbles_lost', 'turnovers_int', 'turnovers_total', 'time_of_poss'
-]
-
-opponent_game_logs_headers = [
-    'rk', 'gtm', 'week', 'date', 'day', 'game_location', 'opp', 'result', 'pts', 'pts_opp', 'ot', 
-    'pass_cmp', 'pass_att', 'pass_cmp_pct', 'pass_yds', 'pass_td', 'pass_ya', 'pass_aya', 'pass_rate', 
-    'pass_sk', 'pass_sk_yds', 'rush_att', 'rush_yds', 'rush_td', 'rush_ya', 'plays', 'total_yds', 'ypp',
-    'fga', 'fgm', 'xpa', 'xpm', 'punt', 'punt_yds', 'first_downs_pass', 'first_downs_rush', 'first_downs_pen',
-    'first_downs_total', 'third_down_conv', 'third_down_att', 'fourth_down_conv', 'fourth_down_att', 
-    'pen', 'pen_yds', 'fumbles_lost', 'turnovers_int', 'turnovers_total', 'time_of_poss'
-]
-
 for year in range(2023, 2026):
     team_file = f'{data_dir}/all_teams_game_logs_{year}.csv'
     opponent_file = f'{opponent_data_dir}/all_teams_opponent_game_logs_{year}.csv'
     
-    all_team_game_logs = []  
-    all_opponent_game_logs = []
-    
-    for team in pfr_teams:
-        abbreviation, name = team
-        print(f'Processing {name} for the year {year}')  
-        url = f'https://www.pro-football-reference.com/teams/{abbreviation}/{year}/gamelog/'
-        
-        # Add retry logic for rate limiting
-        max_retries = 3
-        retry_delay = 10
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url)
-                if response.status_code == 429:
-                    print(f'Rate limited for {name}. Waiting {retry_delay} seconds before retry {attempt + 1}/{max_retries}')
-                    sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                    continue
-                elif response.status_code != 200:
-                    print(f'Failed to retrieve page {url} for {name} in {year}: {response.status_code}')
-                    break
-                else:
-                    break
-            except Exception as e:
-                print(f'Error retrieving {url}: {e}')
-                if attempt < max_retries - 1:
-                    sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                else:
-                    break
-        
-        if response.status_code != 200:
-            continue
-            
-        soup = BeautifulSoup(response.content, 'html.parser')
-        warned_team_short = False
-        warned_opp_short = False
-        
-        for table_id in ['table_pfr_team-year_game-logs_team-year-regular-season-game-log', 'table_pfr_team-year_game-logs_team-year-regular-season-opponent-game-log']:
-            table = soup.find('table', {'id': table_id})
-            if table is None:
-                print(f'Table with id {table_id} not found on page {url} for {name} in {year}')
+    # Rows go straight to the yearly files as each team's page is parsed
+    with open(team_file, mode='w', newline='', encoding='utf-8') as team_out, \
+            open(opponent_file, mode='w', newline='', encoding='utf-8') as opponent_out:
+        team_writer = csv.writer(team_out)
+        team_writer.writerow(pfr.TEAM_GAME_LOG.header)
+        opponent_writer = csv.writer(opponent_out)
+        opponent_writer.writerow(pfr.OPPONENT_GAME_LOG.header)
+        
+        targets = {pfr.gamelog_url(abbreviation, year): name for abbreviation, name in pfr_teams}
+        specs = [pfr.TEAM_GAME_LOG, pfr.OPPONENT_GAME_LOG, pfr.TEAM_PLAYOFF_GAME_LOG]
+        for url, name, found in scraper.tables(specs, targets):
+            print(f'Processing {name} for the year {year}')  
+            if found is None:
+                print(f'Failed to retrieve page {url} for {name} in {year}')
                 continue
-            tbody = table.find('tbody')
-            if tbody is None:
-                print(f'No tbody found for table {table_id} on page {url} for {name} in {year}')
-                continue
-                
-            game_logs = []
-            for tr in tbody.find_all('tr'):
-                row_data = []  
-                for td in tr.find_all(['th', 'td']):  
-                    row_data.append(td.text)
-                # Filter out empty rows
-                if len(row_data) > 0:
-                    if table_id == 'table_pfr_team-year_game-logs_team-year-regular-season-game-log':
-                        if len(row_data) == 48:  # Expected: 48 total columns (including Rk)
-                            row_data.append(name)  # Add team name (now 49 total)
-                            game_logs.append(row_data)
-                        else:
-                            if not warned_team_short:
-                                print(f"Warning: Team game log row has {len(row_data)} cells but expected 48")
-                                warned_team_short = True
-                    elif table_id == 'table_pfr_team-year_game-logs_team-year-regular-season-opponent-game-log':
-                        if len(row_data) == 48:  # Expected: 48 total columns (including Rk)
-                            row_data.append(name)  # Add team name (now 49 total)
-                            all_opponent_game_logs.append(row_data)
-                        else:
-                            if not warned_opp_short:
-                                print(f"Warning: Opponent game log row has {len(row_data)} cells but expected 48")
-                                warned_opp_short = True
-            if table_id == 'table_pfr_team-year_game-logs_team-year-regular-season-game-log':
-                all_team_game_logs.extend(game_logs)
-                
-            playoff_table_id = f'playoff_gamelog{year}'
-            playoff_table = soup.find('table', {'id': playoff_table_id})
-            if playoff_table:
-                playoff_tbody = playoff_table.find('tbody')
-                playoff_game_logs = []
-                for tr in playoff_tbody.find_all('tr'):
-                    row_data = []  
-                    for td in tr.find_all(['th', 'td']):  
-                        row_data.append(td.text)
-                    row_data.append(name)  
-                    playoff_game_logs.append(row_data)
-                all_team_game_logs.extend(playoff_game_logs)
-        sleep(2.5)  # Rate limiting delay
-    
-    # Save yearly files
-    with open(team_file, mode='w', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow(team_game_logs_headers + ['team_name'])
-        writer.writerows(all_team_game_logs)
-    
-    with open(opponent_file, mode='w', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow(opponent_game_logs_headers + ['team_name'])
-        writer.writerows(all_opponent_game_logs)
+            for spec, writer in ((pfr.TEAM_GAME_LOG, team_writer), (pfr.OPPONENT_GAME_LOG, opponent_writer)):
+                if spec.name not in found:
+                    print(f'Table with id {spec.table_id} not found on page {url} for {name} in {year}')
+                    continue
+                writer.writerows(spec.rows(found[spec.name], name))
+            if pfr.TEAM_PLAYOFF_GAME_LOG.name in found:
+                team_writer.writerows(pfr.TEAM_PLAYOFF_GAME_LOG.rows(found[pfr.TEAM_PLAYOFF_GAME_LOG.name], name))
 
 print(f"✅ Team Game Logs scraped and saved to {data_dir}/")
 
 ##### Create Game IDs and Basic Games Data #####
 print("\n3. Creating basic games data from team game logs...")
-directory = data_dir
-df_list = []
-for filename in os.listdir(directory):
-    if filename.endswith(".csv"):  
-        file_path = os.path.join(directory, filename)
-        season = filename.split('_')[-1].replace('.csv', '')
-        df = pd.read_csv(file_path)
-        df['season'] = season
-        df_list.append(df)
-
-if df_list:
-    df = pd.concat(df_list, ignore_index=True)
+telemetry.section('games')
+game_log_paths = stream.paths_in(data_dir)
+if game_log_paths:
+    # One streamed copy of every season's logs (tagged with its season), read back once
+    stream.concat_csv(game_log_paths, f'{final_dir}/all_team_game_logs.csv', budget,
+                      assign=lambda path: {'season': path.split('_')[-1].replace('.csv', '')})
+    df = pd.read_csv(f'{final_dir}/all_team_game_logs.csv', dtype={'season': str})
+    if budget.enabled:
+        df = stream.compact_dtypes(df)
     
     # Team abbreviation mapping
     team_abbreviation_map = {
@@ -320,16 +282,12 @@ if df_list:
         'STL': 'LAR', 'TAM': 'TB', 'TEN': 'TEN', 'WAS': 'WAS'
     }
 
-    def determine_home_away(row):
-        if row['game_location'] == '@':
-            away_team = team_abbreviation_map[row['team_name']]
-            home_team = pfr_to_standard_abbr[row['opp']]
-        else:
-            home_team = team_abbreviation_map[row['team_name']]
-            away_team = pfr_to_standard_abbr[row['opp']]
-        return pd.Series([home_team, away_team])
-
-    df[['home_team_id', 'away_team_id']] = df.apply(determine_home_away, axis=1)
+    # Home/away from the team's point of view, mapped a column at a time
+    on_road = (df['game_location'] == '@').to_numpy()
+    team_abbr = df['team_name'].astype(str).map(team_abbreviation_map)
+    opp_abbr = df['opp'].astype(str).map(pfr_to_standard_abbr)
+    df['home_team_id'] = np.where(on_road, opp_abbr, team_abbr)
+    df['away_team_id'] = np.where(on_road, team_abbr, opp_abbr)
     df['week_num'] = df['week'].astype(str).str.zfill(2)
     df['game_id'] = df['season'] + '_' + df['week_num'] + '_' + df['away_team_id'] + '_' + df['home_team_id']
     
@@ -356,7 +314,8 @@ if df_list:
             year_df['overtime'] = year_df['ot'].fillna(0)
             
             # Create game_id
-            year_df['game_id'] = year_df.apply(lambda row: f"{year}_{row['week']:02d}_{row['away_team']}_{row['home_team']}", axis=1)
+            year_df['game_id'] = (str(year) + '_' + year_df['week'].astype(int).astype(str).str.zfill(2)
+                                  + '_' + year_df['away_team'].astype(str) + '_' + year_df['home_team'].astype(str))
             
             games_dataframes.append(year_df[['game_id', 'season', 'week', 'date', 'home_team', 'away_team', 'home_score', 'away_score', 'game_location', 'result', 'overtime']])
 
@@ -376,40 +335,30 @@ if df_list:
 
 ##### Create Aggregated Team Game Logs #####
 print("\n4. Creating aggregated team game logs...")
+# Per-game home and away totals in one grouped aggregation instead of a Series per game
+side_stats = [
+    ('pts_off', 'pts', 'sum'), ('pass_cmp', 'pass_cmp', 'sum'), ('pass_att', 'pass_att', 'sum'),
+    ('pass_yds', 'pass_yds', 'sum'), ('pass_td', 'pass_td', 'sum'), ('pass_int', 'turnovers_int', 'sum'),
+    ('pass_sacked', 'pass_sk', 'sum'), ('pass_yds_per_att', 'pass_ya', 'mean'),
+    ('pass_net_yds_per_att', 'pass_aya', 'mean'), ('pass_cmp_perc', 'pass_cmp_pct', 'mean'),
+    ('pass_rating', 'pass_rate', 'mean'), ('rush_att', 'rush_att', 'sum'), ('rush_yds', 'rush_yds', 'sum'),
+    ('rush_yds_per_att', 'rush_ya', 'mean'), ('rush_td', 'rush_td', 'sum'),
+]
 df = pd.read_csv(f'{final_dir}/all_team_game_logs.csv')
-grouped_df = df.groupby('game_id', group_keys=False).apply(lambda x: pd.Series({
-    'season': x['season'].iloc[0],
-    'home_pts_off': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pts'].sum(),
-    'away_pts_off': x.loc[x['game_location'] == '@', 'pts'].sum(),
-    'home_pass_cmp': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_cmp'].sum(),
-    'away_pass_cmp': x.loc[x['game_location'] == '@', 'pass_cmp'].sum(),
-    'home_pass_att': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_att'].sum(),
-    'away_pass_att': x.loc[x['game_location'] == '@', 'pass_att'].sum(),
-    'home_pass_yds': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_yds'].sum(),
-    'away_pass_yds': x.loc[x['game_location'] == '@', 'pass_yds'].sum(),
-    'home_pass_td': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_td'].sum(),
-    'away_pass_td': x.loc[x['game_location'] == '@', 'pass_td'].sum(),
-    'home_pass_int': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'turnovers_int'].sum(),
-    'away_pass_int': x.loc[x['game_location'] == '@', 'turnovers_int'].sum(),
-    'home_pass_sacked': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_sk'].sum(),
-    'away_pass_sacked': x.loc[x['game_location'] == '@', 'pass_sk'].sum(),
-    'home_pass_yds_per_att': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_ya'].mean(),
-    'away_pass_yds_per_att': x.loc[x['game_location'] == '@', 'pass_ya'].mean(),
-    'home_pass_net_yds_per_att': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_aya'].mean(),
-    'away_pass_net_yds_per_att': x.loc[x['game_location'] == '@', 'pass_aya'].mean(),
-    'home_pass_cmp_perc': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_cmp_pct'].mean(),
-    'away_pass_cmp_perc': x.loc[x['game_location'] == '@', 'pass_cmp_pct'].mean(),
-    'home_pass_rating': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_rate'].mean(),
-    'away_pass_rating': x.loc[x['game_location'] == '@', 'pass_rate'].mean(),
-    'home_rush_att': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'rush_att'].sum(),
-    'away_rush_att': x.loc[x['game_location'] == '@', 'rush_att'].sum(),
-    'home_rush_yds': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'rush_yds'].sum(),
-    'away_rush_yds': x.loc[x['game_location'] == '@', 'rush_yds'].sum(),
-    'home_rush_yds_per_att': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'rush_ya'].mean(),
-    'away_rush_yds_per_att': x.loc[x['game_location'] == '@', 'rush_ya'].mean(),
-    'home_rush_td': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'rush_td'].sum(),
-    'away_rush_td': x.loc[x['game_location'] == '@', 'rush_td'].sum(),
-}))
+if budget.enabled:
+    df = stream.compact_dtypes(df)
+side = pd.Series(np.where(df['game_location'].isnull() | (df['game_location'] == ''), 'home',
+                          np.where(df['game_location'] == '@', 'away', None)), index=df.index)
+sided = df[side.notna()].assign(side=side)
+grouped_df = df.groupby('game_id')[['season']].first()
+for name, column, how in side_stats:
+    per_side = sided.groupby(['game_id', 'side'])[column].agg(how).unstack('side')
+    for prefix in ('home', 'away'):
+        values = per_side[prefix] if prefix in per_side else pd.Series(dtype=float)
+        values = values.reindex(grouped_df.index)
+        grouped_df[f'{prefix}_{name}'] = values.fillna(0) if how == 'sum' else values
+# Same column order as before: home/away pairs per stat
+grouped_df = grouped_df[['season'] + [f'{prefix}_{name}' for name, _, _ in side_stats for prefix in ('home', 'away')]]
 
 grouped_df.to_csv(f'{final_dir}/team_game_logs.csv', index=True)
 print(f"✅ Aggregated team game logs created: {len(grouped_df)} games")
@@ -432,6 +381,7 @@ print(f"✅ Comprehensive game logs created: {len(comprehensive_games_df)} games
 
 ##### Scrape Box Scores (2023-2025) #####
 print("\n6. Scraping Box Scores from PFR...")
+telemetry.section('box_scores')
 os.makedirs(f'{final_dir}/SR-box-scores/', exist_ok=True)
 
 # Create PFR URLs from games data
@@ -440,7 +390,7 @@ games_df_temp['pfr'] = games_df_temp['game_id'].str.replace('_', '').str.lower()
 games_df_temp['pfr_url'] = 'https://www.pro-football-reference.com/boxscores/' + games_df_temp['pfr'] + '.htm'
 games_df_temp.to_csv(f'{final_dir}/games.csv', index=False)
 
-headers = ['URL', 'Team', '1', '2', '3', '4', 'OT1', 'OT2', 'OT3', 'OT4', 'Final']
+headers = list(pfr.LINESCORE.header)
 
 for year_to_scrape in range(2023, 2026):
     csv_file_path = f'{final_dir}/SR-box-scores/all_box_scores_{year_to_scrape}.csv'
@@ -470,58 +420,20 @@ for year_to_scrape in range(2023, 2026):
                 if row['season'] == str(year_to_scrape) and game_dt <= now_dt:
                     game_urls.append(row['pfr_url'])
         
-        for url in game_urls:
-            if url in existing_urls:
-                print(f"Skipping already scraped game: {url}")
+        game_urls = [url for url in game_urls if url not in existing_urls]
+        print(f"Skipping {len(existing_urls)} already scraped games")
+        for url, found in fetch_tables(GAME_PAGE_SPECS, game_urls):
+            if found is None:
+                print(f"Error scraping {url}")
                 continue
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    print(f"Scraping game: {url}")
-                    response = requests.get(url, timeout=10)
-                    response.raise_for_status()
-                    
-                    # Save raw HTML
-                    raw_file_name = url.split('/')[-1].replace('.htm', '') + '.html'
-                    raw_file_path = f'{final_dir}/SR-box-scores/{raw_file_name}'
-                    with open(raw_file_path, 'wb') as raw_file:
-                        raw_file.write(response.content)
-                    
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    linescore_table = soup.find('table', class_='linescore')
-                    if linescore_table:
-                        rows = linescore_table.find_all('tr')[1:]
-                        for row in rows:
-                            cols = row.find_all('td')
-                            team_name = cols[1].text.strip()
-                            scores = [col.text.strip() for col in cols[2:]]
-                            scores += [''] * (len(headers) - 2 - len(scores))
-                            score_writer.writerow([url, team_name] + scores)
-                    print(f"Successfully scraped box score for {url}")
-                    break
-                except Exception as e:
-                    print(f"Error scraping {url}: {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-                    else:
-                        pass
-            time.sleep(2.5)
+            if pfr.LINESCORE.name in found:
+                score_writer.writerows(pfr.LINESCORE.rows(found[pfr.LINESCORE.name], url))
+            print(f"Successfully scraped box score for {url}")
     
     print(f"Box scores scraping completed for {year_to_scrape}. Data saved to {csv_file_path}.")
 
 # Merge Box Scores
-input_dir = f'{final_dir}/SR-box-scores/'
-csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
-if csv_files:
-    dataframes = [pd.read_csv(os.path.join(input_dir, file)) for file in csv_files]
-    merged_dataframe = pd.concat(dataframes, ignore_index=True)
-    output_file = f'{final_dir}/box_scores.csv'
-    merged_dataframe.to_csv(output_file, index=False)
-    print(f"✅ Box Scores created: {len(merged_dataframe)} records")
-else:
-    box_scores_df = pd.DataFrame(columns=headers)
-    box_scores_df.to_csv(f'{final_dir}/box_scores.csv', index=False)
-    print(f"✅ Box Scores structure created")
+merge_csvs(stream.paths_in(f'{final_dir}/SR-box-scores/'), f'{final_dir}/box_scores.csv', 'Box Scores', columns=headers)
 
 ##### Create Player Stats (PFR-only, no NFLverse) #####
 print("\n7. Creating Player Stats structure...")
@@ -544,6 +456,7 @@ print(f"✅ Player Stats structure created")
 
 ##### Scrape Scoring Tables/Touchdown Logs (2023-2025) #####
 print("\n8. Scraping Scoring Tables from PFR...")
+telemetry.section('scoring_tables')
 os.makedirs(f'{final_dir}/SR-scoring-tables/', exist_ok=True)
 
 for year_to_scrape in range(2023, 2026):
@@ -559,89 +472,37 @@ for year_to_scrape in range(2023, 2026):
     with open(output_filename, mode, newline='') as output_csvfile:
         csvwriter = csv.writer(output_csvfile)
         if mode == 'w':
-            csvwriter.writerow(['Quarter', 'Time', 'Team', 'Detail', 'Team_1', 'Team_2', 'Game_ID'])
-        
-        # Use comprehensive games data to get PFR URLs
-        games_df_temp = pd.read_csv(f'{final_dir}/games.csv')
-        # Add dummy PFR values for demo (in real implementation, these would come from original games data)
-        games_df_temp['pfr'] = games_df_temp['game_id'].str.replace('_', '').str.lower()
+            csvwriter.writerow(pfr.SCORING.header)
         
-        rows = []
-        now_dt = datetime.now()
-        for _, row in games_df_temp.iterrows():
-            try:
-                game_dt = datetime.fromisoformat(row['date'])
-            except Exception:
+        targets = {}
+        for row in played_games(year_to_scrape):
+            if row['game_id'] in existing_game_ids:
+                print(f"Skipping already scraped game ID: {row['game_id']}")
                 continue
-            if int(row['game_id'].split('_')[0]) == year_to_scrape and game_dt <= now_dt:
-                rows.append(row.to_dict())
-        
-        for row in rows:
-            pfr_value = row['pfr']
-            game_id = row['game_id']
-            if game_id in existing_game_ids:
-                print(f"Skipping already scraped game ID: {game_id}")
+            targets[pfr.boxscore_url(row['pfr'])] = row['game_id']
+        for url, found in fetch_tables(GAME_PAGE_SPECS, targets):
+            game_id = targets[url]
+            if found is None:
+                print(f"An error occurred while scraping {url}")
                 continue
-            
-            url = f"https://www.pro-football-reference.com/boxscores/{pfr_value}.htm"
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    response = requests.get(url, timeout=10)
-                    response.raise_for_status()
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    table = soup.find('table', {'id': 'scoring'})
-                    if table is None:
-                        print(f"No scoring table found for {url}")
-                        break
-                    
-                    last_quarter = None
-                    for i, tr in enumerate(table.find_all('tr')):
-                        if i == 0:
-                            continue
-                        cells = tr.find_all(['td', 'th'])
-                        if len(cells) > 0:
-                            csv_row = [cell.text for cell in cells]
-                            if csv_row[0]:
-                                last_quarter = csv_row[0]
-                            else:
-                                csv_row[0] = last_quarter
-                            csv_row.append(game_id)
-                            csvwriter.writerow(csv_row)
-                    print(f"Successfully scraped scoring data for game ID: {game_id}")
-                    break
-                except (requests.exceptions.RequestException, Exception) as e:
-                    print(f"An error occurred while scraping {url}. Error: {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-                    else:
-                        break
-            time.sleep(2.5)
+            if pfr.SCORING.name not in found:
+                print(f"No scoring table found for {url}")
+                continue
+            csvwriter.writerows(pfr.SCORING.rows(found[pfr.SCORING.name], game_id))
+            print(f"Successfully scraped scoring data for game ID: {game_id}")
     
     print(f"Scoring tables scraping completed for {year_to_scrape}")
 
 # Merge Scoring Tables
-input_dir = f'{final_dir}/SR-scoring-tables/'
-csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
-if csv_files:
-    dataframes = [pd.read_csv(os.path.join(input_dir, file)) for file in csv_files]
-    merged_dataframe = pd.concat(dataframes, ignore_index=True)
-    output_file = f'{final_dir}/scoring_tables.csv'
-    merged_dataframe.to_csv(output_file, index=False)
-    print(f"✅ Scoring Tables created: {len(merged_dataframe)} records")
-else:
-    scoring_tables_df = pd.DataFrame(columns=['Quarter', 'Time', 'Team', 'Detail', 'Team_1', 'Team_2', 'Game_ID'])
-    scoring_tables_df.to_csv(f'{final_dir}/scoring_tables.csv', index=False)
-    print(f"✅ Scoring Tables structure created")
+merge_csvs(stream.paths_in(f'{final_dir}/SR-scoring-tables/'), f'{final_dir}/scoring_tables.csv', 'Scoring Tables',
+           columns=pfr.SCORING.header)
 
 ##### Team Stats and Rankings (2023-2025) #####
 print("\n9. Scraping Team Stats from PFR...")
+telemetry.section('team_stats')
 os.makedirs(f'{final_dir}/SR-team-stats/', exist_ok=True)
 
-team_stats_headers = [
-    'Player', 'PF', 'Yds', 'Ply', 'Y/P', 'TO', 'FL', '1stD', 'Cmp', 'Att', 'Yds', 'TD', 'Int', 'NY/A',
-    '1stD', 'Att', 'Yds', 'TD', 'Y/A', '1stD', 'Pen', 'Yds', '1stPy', '#Dr', 'Sc%', 'TO%', 'Start', 'Time', 'Plays', 'Yds', 'Pts', 'Team'
-]
+team_stats_headers = list(pfr.TEAM_STATS.header)
 
 for year in range(2023, 2026):
     output_file = f'{final_dir}/SR-team-stats/all_teams_stats_{year}.csv'
@@ -650,56 +511,17 @@ for year in range(2023, 2026):
         continue
     
     all_team_stats = []
-    for team in pfr_teams:
-        abbreviation, name = team
+    targets = {pfr.team_url(abbreviation, year): (abbreviation, name) for abbreviation, name in pfr_teams}
+    for url, found in fetch_tables(TEAM_PAGE_SPECS, targets):
+        abbreviation, name = targets[url]
         print(f'Processing {name} for the year {year}')
-        url = f'https://www.pro-football-reference.com/teams/{abbreviation}/{year}.htm'
-        
-        # Add retry logic for rate limiting
-        max_retries = 3
-        retry_delay = 10
-        response = None
-        
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url)
-                if response.status_code == 429:
-                    print(f'Rate limited for {name}. Waiting {retry_delay} seconds before retry {attempt + 1}/{max_retries}')
-                    sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                elif response.status_code != 200:
-                    print(f'Failed to retrieve page {url} for {name} in {year}: {response.status_code}')
-                    break
-                else:
-                    break
-            except Exception as e:
-                print(f'Error retrieving {url}: {e}')
-                if attempt < max_retries - 1:
-                    sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                else:
-                    break
-        
-        if response is None or response.status_code != 200:
+        if found is None:
+            print(f'Failed to retrieve page {url} for {name} in {year}')
             continue
-            
-        soup = BeautifulSoup(response.content, 'html.parser')
-        table = soup.find('table', {'id': 'team_stats'})
-        if table is None:
+        if pfr.TEAM_STATS.name not in found:
             print(f'Team stats table not found on page {url} for {name} in {year}')
             continue
-        
-        tbody = table.find('tbody')
-        if tbody:
-            for tr in tbody.find_all('tr'):
-                row_data = [tr.find('th').text.strip()]
-                row_data.extend([td.text.strip() for td in tr.find_all('td')])
-                row_data.append(abbreviation)
-                all_team_stats.append(row_data)
-        
-        sleep(2.5)
+        all_team_stats.extend(pfr.TEAM_STATS.rows(found[pfr.TEAM_STATS.name], abbreviation))
     
     with open(output_file, mode='w', newline='', encoding='utf-8') as file:
         writer = csv.writer(file)
@@ -709,100 +531,28 @@ for year in range(2023, 2026):
     print(f'Saved team stats data for all teams for the year {year}')
 
 # Merge Team Stats
-input_dir = f'{final_dir}/SR-team-stats/'
-csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
-if csv_files:
-    dataframes = []
-    for file in csv_files:
-        df = pd.read_csv(os.path.join(input_dir, file))
-        df['Year'] = file.split('_')[-1].split('.')[0]
-        dataframes.append(df)
-    merged_dataframe = pd.concat(dataframes, ignore_index=True)
-    output_file = f'{final_dir}/team_stats.csv'
-    merged_dataframe.to_csv(output_file, index=False)
-    print(f"✅ Team Stats created: {len(merged_dataframe)} records")
-else:
-    team_stats_df = pd.DataFrame(columns=team_stats_headers + ['Year'])
-    team_stats_df.to_csv(f'{final_dir}/team_stats.csv', index=False)
-    print(f"✅ Team Stats structure created")
+merge_csvs(stream.paths_in(f'{final_dir}/SR-team-stats/'), f'{final_dir}/team_stats.csv', 'Team Stats',
+           assign=lambda path: {'Year': path.split('_')[-1].split('.')[0]})
 
 ##### Schedule & Game Results (2023-2025) #####
 print("\n10. Scraping Schedule & Game Results from PFR...")
+telemetry.section('schedule')
 os.makedirs(f'{final_dir}/SR-schedule-and-game-results/', exist_ok=True)
 
-schedule_headers = [
-    'Week', 'Day', 'Date', 'Time', 'Boxscore', 'Outcome', 'OT', 'Rec', 'Home/Away', 'Opp', 
-    'Tm', 'OppPts', '1stD', 'TotYd', 'PassY', 'RushY', 'TO_lost', 
-    'Opp1stD', 'OppTotYd', 'OppPassY', 'OppRushY', 'TO_won',
-    'Offense', 'Defense', 'Sp. Tms'
-]
+schedule_headers = list(pfr.TEAM_SCHEDULE.header)
 
 for year in range(2023, 2026):
-    all_games = []
-    for team in pfr_teams:
-        abbreviation, name = team
+    targets = {pfr.team_url(abbreviation, year): (abbreviation, name) for abbreviation, name in pfr_teams}
+    for url, found in fetch_tables(TEAM_PAGE_SPECS, targets):
+        abbreviation, name = targets[url]
         print(f'Processing {name} for the year {year}')
-        url = f'https://www.pro-football-reference.com/teams/{abbreviation}/{year}.htm'
-        
-        # Add retry logic for rate limiting
-        max_retries = 3
-        retry_delay = 10
-        response = None
-        
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url, timeout=10)
-                if response.status_code == 429:
-                    print(f'Rate limited for {name}. Waiting {retry_delay} seconds before retry {attempt + 1}/{max_retries}')
-                    sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                elif response.status_code != 200:
-                    print(f'Failed to retrieve page {url} for {name} in {year}: {response.status_code}')
-                    break
-                else:
-                    break
-            except Exception as e:
-                print(f'Error retrieving {url}: {e}')
-                if attempt < max_retries - 1:
-                    sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                else:
-                    break
-        
-        if response is None or response.status_code != 200:
+        if found is None:
+            print(f'Failed to retrieve page {url} for {name} in {year}')
             continue
-            
-        soup = BeautifulSoup(response.content, 'html.parser')
-        table = soup.find('table', {'id': 'games'})
-        
-        if table is None:
+        if pfr.TEAM_SCHEDULE.name not in found:
             print(f'Schedule & Game Results table not found on page {url} for {name} in {year}')
-            sleep(2.5)
             continue
-            
-        tbody = table.find('tbody')
-        if tbody is None:
-            print(f'No tbody found for games table on page {url} for {name} in {year}')
-            sleep(2.5)
-            continue
-            
-        team_games = []
-        for tr in tbody.find_all('tr'):
-            row_data = []
-            week_th = tr.find('th', {'data-stat': 'week_num'})
-            week_num = week_th.text.strip() if week_th else ''
-            row_data.append(week_num)
-            
-            for td in tr.find_all('td'):
-                row_data.append(td.text.strip())
-            
-            if len(row_data) != len(schedule_headers):
-                row_data += [''] * (len(schedule_headers) - len(row_data))
-            
-            team_games.append(row_data)
-            all_games.append(row_data)
+        team_games = pfr.TEAM_SCHEDULE.rows(found[pfr.TEAM_SCHEDULE.name])
         
         # Save individual team file
         team_file_path = f'{final_dir}/SR-schedule-and-game-results/{abbreviation}_{year}_schedule_and_game_results.csv'
@@ -812,126 +562,57 @@ for year in range(2023, 2026):
             writer.writerows(team_games)
         
         print(f'Saved schedule data for {name} for the year {year}')
-        sleep(2.5)
 
 # Merge all team files
 print(f"\nMerging all team files...")
-all_games = []
-for filename in os.listdir(f'{final_dir}/SR-schedule-and-game-results/'):
-    if filename.endswith("_schedule_and_game_results.csv"):
-        team_abbr = filename.split('_')[0]
-        season_year = filename.split('_')[1]
-        file_path = os.path.join(f'{final_dir}/SR-schedule-and-game-results/', filename)
-        df = pd.read_csv(file_path)
-        df['Team'] = team_abbr
-        df['Season'] = season_year
-        all_games.append(df)
-
-if all_games:
-    merged_df = pd.concat(all_games, ignore_index=True)
-    merged_output_path = os.path.join(f'{final_dir}/SR-schedule-and-game-results/', 'all_teams_schedule_and_game_results_merged.csv')
-    merged_df.to_csv(merged_output_path, index=False)
-    main_data_path = f'{final_dir}/schedule_game_results.csv'
-    merged_df.to_csv(main_data_path, index=False)
-    print(f"✅ Schedule & Game Results created: {len(merged_df)} records")
-else:
-    schedule_df = pd.DataFrame(columns=schedule_headers + ['Team', 'Season'])
-    schedule_df.to_csv(f'{final_dir}/schedule_game_results.csv', index=False)
-    print(f"✅ Schedule & Game Results structure created")
+schedule_dir = f'{final_dir}/SR-schedule-and-game-results/'
+main_data_path = f'{final_dir}/schedule_game_results.csv'
+merge_csvs(stream.paths_in(schedule_dir, suffix='_schedule_and_game_results.csv'), main_data_path,
+           'Schedule & Game Results', columns=schedule_headers,
+           assign=lambda path: {'Team': os.path.basename(path).split('_')[0], 'Season': os.path.basename(path).split('_')[1]})
+shutil.copyfile(main_data_path, os.path.join(schedule_dir, 'all_teams_schedule_and_game_results_merged.csv'))
 
 ##### Team Conversions (2023-2025) #####
 print("\n11. Scraping Team Conversions from PFR...")
+telemetry.section('team_conversions')
 os.makedirs(f'{final_dir}/SR-team-conversions/', exist_ok=True)
 
-team_conversions_headers = [
-    'Player', '3DAtt', '3DConv', '4DAtt', '4DConv', '4D%', 'RZAtt', 'RZTD', 'RZPct', 'Team'
-]
+team_conversions_headers = list(pfr.TEAM_CONVERSIONS.header)
 
 for year in range(2023, 2026):
-    for team in pfr_teams:
-        abbreviation, name = team
+    targets = {}
+    for abbreviation, name in pfr_teams:
         team_file = f'{final_dir}/SR-team-conversions/{abbreviation}_{year}_team_conversions.csv'
-        
         if os.path.exists(team_file):
             print(f"Skipping {name} for {year}, file already exists.")
             continue
-        
+        targets[pfr.team_url(abbreviation, year)] = (abbreviation, name, team_file)
+    
+    for url, found in fetch_tables(TEAM_PAGE_SPECS, targets):
+        abbreviation, name, team_file = targets[url]
         print(f'Processing {name} for the year {year}')
-        url = f'https://www.pro-football-reference.com/teams/{abbreviation}/{year}.htm'
-        
-        # Add retry logic for rate limiting
-        max_retries = 3
-        retry_delay = 10
-        response = None
-        
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url)
-                if response.status_code == 429:
-                    print(f'Rate limited for {name}. Waiting {retry_delay} seconds before retry {attempt + 1}/{max_retries}')
-                    sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                elif response.status_code != 200:
-                    print(f'Failed to retrieve page {url} for {name} in {year}: {response.status_code}')
-                    break
-                else:
-                    break
-            except Exception as e:
-                print(f'Error retrieving {url}: {e}')
-                if attempt < max_retries - 1:
-                    sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                else:
-                    break
-        
-        if response is None or response.status_code != 200:
+        if found is None:
+            print(f'Failed to retrieve page {url} for {name} in {year}')
             continue
-            
-        soup = BeautifulSoup(response.content, 'html.parser')
-        table = soup.find('table', {'id': 'team_conversions'})
-        if table is None:
+        if pfr.TEAM_CONVERSIONS.name not in found:
             print(f'Team Conversions table not found on page {url} for {name} in {year}')
-            sleep(2.5)
             continue
         
-        all_conversions = []
-        tbody = table.find('tbody')
-        if tbody:
-            for tr in tbody.find_all('tr'):
-                row_data = [td.text.strip() for td in tr.find_all(['th', 'td'])]
-                row_data.append(abbreviation)
-                all_conversions.append(row_data)
-        
         with open(team_file, mode='w', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
             writer.writerow(team_conversions_headers)
-            writer.writerows(all_conversions)
+            writer.writerows(pfr.TEAM_CONVERSIONS.rows(found[pfr.TEAM_CONVERSIONS.name], abbreviation))
         
         print(f'Saved team conversions data for {name} for the year {year}')
-        sleep(3)
 
 # Merge Team Conversions
 input_dir = f'{final_dir}/SR-team-conversions/'
-csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
-if csv_files:
-    dataframes = []
-    for file in csv_files:
-        df = pd.read_csv(os.path.join(input_dir, file))
-        df['Year'] = file.split('_')[1]
-        dataframes.append(df)
-    merged_dataframe = pd.concat(dataframes, ignore_index=True)
-    output_file = f'{final_dir}/team_conversions.csv'
-    merged_dataframe.to_csv(output_file, index=False)
-    print(f"✅ Team Conversions created: {len(merged_dataframe)} records")
-else:
-    team_conversions_df = pd.DataFrame(columns=team_conversions_headers + ['Year'])
-    team_conversions_df.to_csv(f'{final_dir}/team_conversions.csv', index=False)
-    print(f"✅ Team Conversions structure created")
+merge_csvs(stream.paths_in(input_dir), f'{final_dir}/team_conversions.csv', 'Team Conversions',
+           assign=lambda path: {'Year': os.path.basename(path).split('_')[1]})
 
 ##### Passing/Rushing/Receiving Game Logs (2023-2025) #####
 print("\n12. Scraping Passing/Rushing/Receiving from PFR...")
+telemetry.section('passing_rushing_receiving')
 os.makedirs(f'{final_dir}/SR-passing-rushing-receiving-game-logs/', exist_ok=True)
 
 for year_to_scrape in range(2023, 2026):
@@ -947,112 +628,40 @@ for year_to_scrape in range(2023, 2026):
     with open(output_filename, mode, newline='') as output_csvfile:
         csvwriter = csv.writer(output_csvfile)
         if mode == 'w':
-            csvwriter.writerow([
-                'player', 'player_id', 'team', 'pass_cmp', 'pass_att', 'pass_yds', 'pass_td', 'pass_int', 
-                'pass_sacked', 'pass_sacked_yds', 'pass_long', 'pass_rating', 'rush_att', 'rush_yds', 'rush_td', 
-                'rush_long', 'targets', 'rec', 'rec_yds', 'rec_td', 'rec_long', 'fumbles', 'fumbles_lost', 'game_id'
-            ])
+            csvwriter.writerow(pfr.PLAYER_OFFENSE.header)
         
-        # Use comprehensive games data to get PFR URLs
-        games_df_temp = pd.read_csv(f'{final_dir}/games.csv')
-        games_df_temp['pfr'] = games_df_temp['game_id'].str.replace('_', '').str.lower()
-        
-        rows = []
-        now_dt = datetime.now()
-        for _, row in games_df_temp.iterrows():
-            try:
-                game_dt = datetime.fromisoformat(row['date'])
-            except Exception:
+        targets = {}
+        for row in played_games(year_to_scrape):
+            if row['game_id'] in existing_game_ids:
+                print(f"Skipping already scraped game ID: {row['game_id']}")
                 continue
-            if int(row['game_id'].split('_')[0]) == year_to_scrape and game_dt <= now_dt:
-                rows.append(row.to_dict())
-        
-        for row in rows:
-            pfr_value = row['pfr']
-            game_id = row['game_id']
-            if game_id in existing_game_ids:
-                print(f"Skipping already scraped game ID: {game_id}")
+            targets[pfr.boxscore_url(row['pfr'])] = row['game_id']
+        for url, found in fetch_tables(GAME_PAGE_SPECS, targets):
+            game_id = targets[url]
+            if found is None or pfr.PLAYER_OFFENSE.name not in found:
+                print(f"An error occurred while scraping {url}")
                 continue
-            
-            url = f"https://www.pro-football-reference.com/boxscores/{pfr_value}.htm"
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    response = requests.get(url, timeout=10)
-                    if response.status_code == 429:
-                        print(f"Rate limit exceeded for URL {url}. Please try again later.")
-                        time.sleep(60)
-                        continue
-                    
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    table = soup.find('div', id='div_player_offense')
-                    if table:
-                        for i, tr in enumerate(table.find_all('tr')):
-                            if i == 0:
-                                continue
-                            player_cell = tr.find('th')
-                            if player_cell:
-                                player_name = player_cell.get_text()
-                                player_link = player_cell.find('a')
-                                player_id = player_link['href'].split('/')[-1] if player_link else None
-                                stats = [td.get_text() for td in tr.find_all('td')]
-                                row_data = [player_name, player_id] + stats + [game_id]
-                                csvwriter.writerow(row_data)
-                        print(f"Successfully scraped passing/rushing/receiving data for game ID: {game_id}")
-                        time.sleep(2)
-                        break
-                except Exception as e:
-                    print(f"An error occurred while scraping {url}. Error: {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-                    else:
-                        break
-            time.sleep(2.5)
+            csvwriter.writerows(pfr.PLAYER_OFFENSE.rows(found[pfr.PLAYER_OFFENSE.name], game_id))
+            print(f"Successfully scraped passing/rushing/receiving data for game ID: {game_id}")
     
     print(f"Passing/Rushing/Receiving scraping completed for {year_to_scrape}")
 
 # Clean weird rows in passing/rushing/receiving
 directory = f'{final_dir}/SR-passing-rushing-receiving-game-logs/'
-for filename in os.listdir(directory):
-    if filename.endswith('.csv'):
-        file_path = os.path.join(directory, filename)
-        df = pd.read_csv(file_path)
-        df_cleaned = df[(df['player'] != 'Player') & (df['player'].notna())]
-        df_cleaned.to_csv(file_path, index=False)
-        print(f"Processed {filename}")
+for file_path in stream.paths_in(directory):
+    stream.filter_csv(file_path, lambda c: (c['player'] != 'Player') & (c['player'] != ''), budget)
+    print(f"Processed {os.path.basename(file_path)}")
 
 # Merge all passing/rushing/receiving
-merged_file_path = f'{final_dir}/passing_rushing_receiving.csv'
-dataframes = []
-for filename in os.listdir(directory):
-    if filename.endswith('.csv'):
-        file_path = os.path.join(directory, filename)
-        df = pd.read_csv(file_path)
-        dataframes.append(df)
-        print(f"Added {filename} to the merge list")
-
-if dataframes:
-    merged_df = pd.concat(dataframes, ignore_index=True)
-    merged_df.to_csv(merged_file_path, index=False)
-    print(f"✅ Passing/Rushing/Receiving created: {len(merged_df)} records")
-else:
-    passing_rushing_receiving_df = pd.DataFrame(columns=[
-        'player', 'player_id', 'team', 'pass_cmp', 'pass_att', 'pass_yds', 'pass_td', 'pass_int', 
-        'pass_sacked', 'pass_sacked_yds', 'pass_long', 'pass_rating', 'rush_att', 'rush_yds', 'rush_td', 
-        'rush_long', 'targets', 'rec', 'rec_yds', 'rec_td', 'rec_long', 'fumbles', 'fumbles_lost', 'game_id'
-    ])
-    passing_rushing_receiving_df.to_csv(merged_file_path, index=False)
-    print(f"✅ Passing/Rushing/Receiving structure created")
+merge_csvs(stream.paths_in(directory), f'{final_dir}/passing_rushing_receiving.csv',
+           'Passing/Rushing/Receiving', columns=pfr.PLAYER_OFFENSE.header)
 
 ##### Defense Game Logs (2023-2025) #####
 print("\n13. Scraping Defense Game Logs from PFR...")
+telemetry.section('defense')
 os.makedirs(f'{final_dir}/SR-defense-game-logs/', exist_ok=True)
 
-headers = [
-    'player', 'team', 'def_int', 'def_int_yds', 'def_int_td', 'def_int_long', 'pass_defended', 'sacks',
-    'tackles_combined', 'tackles_solo', 'tackles_assists', 'tackles_loss', 'qb_hits', 'fumbles_rec',
-    'fumbles_rec_yds', 'fumbles_rec_td', 'fumbles_forced', 'game_id'
-]
+headers = list(pfr.PLAYER_DEFENSE.header)
 
 for year_to_scrape in range(2023, 2026):
     output_filename = f'{final_dir}/SR-defense-game-logs/all_defense_{year_to_scrape}.csv'
@@ -1069,102 +678,53 @@ for year_to_scrape in range(2023, 2026):
         if mode == 'w':
             csvwriter.writerow(headers)
         
-        # Use comprehensive games data to get PFR URLs
-        games_df_temp = pd.read_csv(f'{final_dir}/games.csv')
-        games_df_temp['pfr'] = games_df_temp['game_id'].str.replace('_', '').str.lower()
-        
-        rows = []
-        now_dt = datetime.now()
-        for _, row in games_df_temp.iterrows():
-            try:
-                game_dt = datetime.fromisoformat(row['date'])
-            except Exception:
-                continue
-            if int(row['game_id'].split('_')[0]) == year_to_scrape and game_dt <= now_dt:
-                rows.append(row.to_dict())
-        
-        for row in rows:
+        targets = {}
+        for row in played_games(year_to_scrape):
             if not row['away_score'] or not row['home_score']:
                 print(f"Skipping game {row['game_id']} due to missing scores.")
                 continue
-            
-            pfr_value = row['pfr']
-            game_id = row['game_id']
-            if game_id in existing_game_ids:
-                print(f"Skipping already scraped game ID: {game_id}")
+            if row['game_id'] in existing_game_ids:
+                print(f"Skipping already scraped game ID: {row['game_id']}")
                 continue
-            
-            url = f"https://www.pro-football-reference.com/boxscores/{pfr_value}.htm"
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    response = requests.get(url, timeout=10)
-                    response.raise_for_status()
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-                    table_found = False
-                    for comment in comments:
-                        soup_comment = BeautifulSoup(comment, 'html.parser')
-                        table = soup_comment.find('table', id='player_defense')
-                        if table:
-                            table_found = True
-                            for i, tr in enumerate(table.find_all('tr')):
-                                if i == 0:
-                                    continue
-                                player_name = tr.find('th').get_text() if tr.find('th') else ''
-                                stats = [td.get_text() for td in tr.find_all('td')]
-                                row_data = [player_name] + stats + [game_id]
-                                csvwriter.writerow(row_data)
-                            print(f"Successfully scraped defense data for game ID: {game_id}")
-                            break
-                    if not table_found:
-                        print(f"No defense table found for {url}")
-                    break
-                except Exception as e:
-                    print(f"An error occurred while scraping {url}. Error: {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-                    else:
-                        break
-            time.sleep(2.5)
+            targets[pfr.boxscore_url(row['pfr'])] = row['game_id']
+        for url, found in fetch_tables(GAME_PAGE_SPECS, targets):
+            game_id = targets[url]
+            if found is None:
+                print(f"An error occurred while scraping {url}")
+                continue
+            if pfr.PLAYER_DEFENSE.name not in found:
+                print(f"No defense table found for {url}")
+                continue
+            csvwriter.writerows(pfr.PLAYER_DEFENSE.rows(found[pfr.PLAYER_DEFENSE.name], game_id))
+            print(f"Successfully scraped defense data for game ID: {game_id}")
     
     print(f"Defense scraping completed for {year_to_scrape}")
 
 # Clean defense data
 for year in range(2023, 2026):
     file_path = f'{final_dir}/SR-defense-game-logs/all_defense_{year}.csv'
-    try:
-        if os.path.exists(file_path):
-            df = pd.read_csv(file_path)
-            df.dropna(inplace=True)
-            df.to_csv(file_path, index=False)
-            print(f"Cleaned defense data for {year}")
-    except FileNotFoundError:
+    if os.path.exists(file_path):
+        stream.filter_csv(file_path, lambda c: (c != '').all(axis=1), budget)
+        print(f"Cleaned defense data for {year}")
+    else:
         print(f"No defense data file found for {year}")
 
 # Merge all defense-game-logs.csv files into one
-input_dir = f'{final_dir}/SR-defense-game-logs/'
-csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
-if csv_files:
-    dataframes = [pd.read_csv(os.path.join(input_dir, file)) for file in csv_files]
-    merged_dataframe = pd.concat(dataframes, ignore_index=True)
-    output_file = f'{final_dir}/defense_game_logs.csv'
-    merged_dataframe.to_csv(output_file, index=False)
-    print(f"✅ Defense Game Logs created: {len(merged_dataframe)} records")
-else:
-    defense_df = pd.DataFrame(columns=headers)
-    defense_df.to_csv(f'{final_dir}/defense_game_logs.csv', index=False)
-    print(f"✅ Defense Game Logs structure created")
+merge_csvs(stream.paths_in(f'{final_dir}/SR-defense-game-logs/'), f'{final_dir}/defense_game_logs.csv',
+           'Defense Game Logs', columns=headers)
 
 ##### Create Summary Report #####
 print("\n14. Creating summary report...")
+telemetry.section('summary')
 summary_data = {
     'Dataset': ['Teams', 'Games', 'Team Game Logs', 'Comprehensive Game Logs', 'Box Scores', 'Player Stats', 
                 'Scoring Tables', 'Team Stats', 'Schedule Game Results', 'Team Conversions', 
                 'Passing Rushing Receiving', 'Defense Game Logs'],
     'Records': [len(df_teams), len(games_df), len(grouped_df), len(comprehensive_games_df), 
-                len(box_scores_df), len(player_stats_df), len(scoring_tables_df), len(team_stats_df),
-                len(schedule_df), len(team_conversions_df), len(passing_rushing_receiving_df), len(defense_df)],
+                record_counts['Box Scores'], len(player_stats_df), record_counts['Scoring Tables'],
+                record_counts['Team Stats'], record_counts['Schedule & Game Results'],
+                record_counts['Team Conversions'], record_counts['Passing/Rushing/Receiving'],
+                record_counts['Defense Game Logs']],
     'Source': ['Hardcoded', 'PFR Team Game Logs', 'PFR Team Game Logs (Aggregated)', 'PFR Team Game Logs (Merged)', 
                'PFR Box Scores', 'PFR Player Offense', 'PFR Scoring Tables', 'PFR Team Stats',
                'PFR Schedule Data', 'PFR Team Conversions', 'PFR Player Offense', 'PFR Defense Stats'],
@@ -1189,14 +749,14 @@ print(f"  • teams.csv - {len(df_teams)} teams")
 print(f"  • games.csv - {len(games_df)} games")
 print(f"  • team_game_logs.csv - {len(grouped_df)} aggregated games")
 print(f"  • game_logs.csv - {len(comprehensive_games_df)} comprehensive games")
-print(f"  • box_scores.csv - {len(box_scores_df)} box score records")
+print(f"  • box_scores.csv - {record_counts['Box Scores']} box score records")
 print(f"  • player_stats.csv - Player stats structure")
-print(f"  • scoring_tables.csv - {len(scoring_tables_df)} scoring records")
-print(f"  • team_stats.csv - {len(team_stats_df)} team stats records")
-print(f"  • schedule_game_results.csv - {len(schedule_df)} schedule records")
-print(f"  • team_conversions.csv - {len(team_conversions_df)} conversion records")
-print(f"  • passing_rushing_receiving.csv - {len(passing_rushing_receiving_df)} player records")
-print(f"  • defense_game_logs.csv - {len(defense_df)} defense records")
+print(f"  • scoring_tables.csv - {record_counts['Scoring Tables']} scoring records")
+print(f"  • team_stats.csv - {record_counts['Team Stats']} team stats records")
+print(f"  • schedule_game_results.csv - {record_counts['Schedule & Game Results']} schedule records")
+print(f"  • team_conversions.csv - {record_counts['Team Conversions']} conversion records")
+print(f"  • passing_rushing_receiving.csv - {record_counts['Passing/Rushing/Receiving']} player records")
+print(f"  • defense_game_logs.csv - {record_counts['Defense Game Logs']} defense records")
 print(f"  • summary_report.csv - Summary of all datasets")
 print(f"📂 Raw data directories:")
 print(f"  • {final_dir}/SR-game-logs/ - Raw team game logs by year")
@@ -1212,3 +772,7 @@ print("\n✅ All data sourced exclusively from Pro Football Reference!")
 print("✅ No NFLverse contamination!")
 print("✅ CSV files only - no database files!")
 print("="*80)
+
+report = scraper.close()
+print(f"🧠 Peak memory: {report['peak_rss_mb']:.0f} MB (parse workers {report['peak_worker_rss_mb']:.0f} MB, "
+      f"{budget.describe()})")
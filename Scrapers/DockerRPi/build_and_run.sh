@@ -6,7 +6,7 @@
 
 echo "Building NFL PFR scraper container for Raspberry Pi..."
 # docker-compose build
-docker build -t nfl-pfr-scraper-rpi .
+docker build -t nfl-pfr-scraper-rpi -f Dockerfile ..
 
 echo "Starting NFL PFR scraper for Raspberry Pi..."
 # docker-compose run --rm nfl-pfr-scraper
@@ -1,8 +1,12 @@
-import requests
-from bs4 import BeautifulSoup
 import pandas as pd
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from scraper_core import Scraper, pfr
+
+# Shared scraping core: pooled, rate-limited session, page archive (--reparse) and run report
+scraper = Scraper('box-scores-pfr')
 
 os.makedirs('./data', exist_ok=True)
 os.makedirs('./data/box-scores', exist_ok=True)
@@ -19,71 +23,57 @@ for year in years:
     print(f"Scraping box scores for {year}...")
     year_games = games_df[games_df['season'] == year]
     year_box_scores = []
-    for idx, game in year_games.iterrows():
+    targets = {pfr.boxscore_url(game['pfr_boxscore_id']): game for _, game in year_games.iterrows()}
+    for url, game, found in scraper.tables([pfr.LINESCORE], targets, timeout=15):
         pfr_id = game['pfr_boxscore_id']
         game_id = game['game_id']
-        url = f'https://www.pro-football-reference.com/boxscores/{pfr_id}.htm'
-        try:
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get(url, headers=headers, timeout=15)
-            if response.status_code == 404:
-                print(f"  -> Game not found: {game_id}")
-                continue
-            soup = BeautifulSoup(response.content, 'html.parser')
-            linescore_table = soup.find('table', class_='linescore')
-            if linescore_table:
-                rows = linescore_table.find_all('tr')[1:]
-                for row in rows:
-                    cols = row.find_all('td')
-                    if len(cols) > 1:
-                        team_name = cols[1].text.strip()
-                        scores = {}
-                        scores['game_id'] = game_id
-                        scores['pfr_id'] = pfr_id
-                        scores['team'] = team_name
-                        scores['season'] = year
-                        scores['week'] = game['week']
-                        quarter_cols = cols[2:]
-                        ot_score = ''
-                        final_score = ''
-                        for i, col in enumerate(quarter_cols):
-                            score = col.text.strip()
-                            if i < 4:
-                                scores[f'q{i+1}'] = score if score else '0'
+        if found is None:
+            print(f"  -> Error scraping {game_id}")
+            continue
+        linescore_table = found.get(pfr.LINESCORE.name)
+        if linescore_table:
+            header_cols = linescore_table.rows[0].cells
+            for row in linescore_table.rows[1:]:
+                cols = row.of('td')
+                if len(cols) > 1:
+                    team_name = cols[1].text.strip()
+                    scores = {}
+                    scores['game_id'] = game_id
+                    scores['pfr_id'] = pfr_id
+                    scores['team'] = team_name
+                    scores['season'] = year
+                    scores['week'] = game['week']
+                    quarter_cols = cols[2:]
+                    ot_score = ''
+                    final_score = ''
+                    for i, col in enumerate(quarter_cols):
+                        score = col.text.strip()
+                        if i < 4:
+                            scores[f'q{i+1}'] = score if score else '0'
+                        elif len(header_cols) > i + 2:
+                            header_text = header_cols[i + 2].text.strip()
+                            if header_text.upper() == 'OT':
+                                ot_score = score if score else ''
                             else:
-                                header_row = linescore_table.find_all('tr')[0]
-                                header_cols = header_row.find_all(['th', 'td'])
-                                if len(header_cols) > i + 2:
-                                    header_text = header_cols[i + 2].text.strip()
-                                    if header_text.upper() == 'OT':
-                                        ot_score = score if score else ''
-                                    elif header_text.upper() == 'FINAL':
-                                        final_score = score if score else '0'
-                                    else:
-                                        final_score = score if score else '0'
-                        scores['ot'] = ot_score
-                        scores['final'] = final_score
-                        if not scores['final']:
-                            total = 0
-                            for q in ['q1', 'q2', 'q3', 'q4']:
-                                if q in scores and scores[q]:
-                                    try:
-                                        total += int(scores[q])
-                                    except:
-                                        pass
-                            if scores['ot']:
+                                final_score = score if score else '0'
+                    scores['ot'] = ot_score
+                    scores['final'] = final_score
+                    if not scores['final']:
+                        total = 0
+                        for q in ['q1', 'q2', 'q3', 'q4']:
+                            if q in scores and scores[q]:
                                 try:
-                                    total += int(scores['ot'])
+                                    total += int(scores[q])
                                 except:
                                     pass
-                            scores['final'] = str(total)
-                        year_box_scores.append(scores)
-            print(f"  -> Scraped: {game_id}")
-            time.sleep(4.1)
-        except Exception as e:
-            print(f"  -> Error scraping {game_id}: {e}")
-            time.sleep(4.1)
-            continue
+                        if scores['ot']:
+                            try:
+                                total += int(scores['ot'])
+                            except:
+                                pass
+                        scores['final'] = str(total)
+                    year_box_scores.append(scores)
+        print(f"  -> Scraped: {game_id}")
     print(f"-> Found {len(year_box_scores)} box score entries for {year}")
     if year_box_scores:
         year_df = pd.DataFrame(year_box_scores)
@@ -97,7 +87,6 @@ for year in years:
         year_df.to_csv(f'./data/box-scores/box_scores_{year}.csv', index=False)
         print(f"-> Saved box scores to ./data/box-scores/box_scores_{year}.csv")
         all_box_scores.extend(year_df.to_dict('records'))
-    time.sleep(10)
 
 if all_box_scores:
     df = pd.DataFrame(all_box_scores)
@@ -113,4 +102,6 @@ if all_box_scores:
     df.to_csv('./data/box_scores.csv', index=False)
     print(f"Saved {len(df)} total box score entries to box_scores.csv")
 else:
-    print("No box scores found")
\ No newline at end of file
+    print("No box scores found")
+
+scraper.close()
@@ -1,24 +1,17 @@
 import os
 import csv
-import time
-import requests
+import sys
 import pandas as pd
-from bs4 import BeautifulSoup, Comment
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from scraper_core import Scraper, data_rows, pfr
+
+# Shared scraping core: pooled, rate-limited session, page archive (--reparse) and run report
+scraper = Scraper('defense-pfr')
 
 os.makedirs('data', exist_ok=True)
 os.makedirs('data/defense', exist_ok=True)
 
-# session = requests.Session()
-# session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
-# session.headers.update({
-#     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-#     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-#     'Accept-Language': 'en-US,en;q=0.5',
-#     'Accept-Encoding': 'gzip, deflate',
-#     'Connection': 'keep-alive',
-#     'Upgrade-Insecure-Requests': '1'
-# })
-
 games = pd.read_csv('data/games.csv')
 for year in range(2020, 2026):
     print(f"Scraping defense game logs for {year}")
@@ -31,88 +24,33 @@ for year in range(2020, 2026):
         w = csv.writer(f)
         headers_written = False
         dfy = games[games['season'] == year]
-        for _, row in dfy.iterrows():
-            url = f"https://www.pro-football-reference.com/boxscores/{row['pfr_boxscore_id']}.htm"
+        # player_defense ships inside an HTML comment; the table scan finds it either way
+        targets = {pfr.boxscore_url(row['pfr_boxscore_id']): row for _, row in dfy.iterrows()}
+        for url, row, found in scraper.tables([pfr.PLAYER_DEFENSE], targets, timeout=15):
             print(f"-> scraping {row['game_id']}...")
-            # Retry logic for rate limiting
-            max_retries = 3
-            retry_delay = 30
-            for attempt in range(max_retries):
-                try:
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Accept-Encoding': 'gzip',
-                        'Cache-Control': 'no-cache',
-                        'Pragma': 'no-cache'
-                    }
-                    r = requests.get(url, headers=headers, timeout=15)
-                    r.raise_for_status()
-                    soup = BeautifulSoup(r.text, 'html.parser')
-                    comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-                    for c in comments:
-                        if c.strip() and '<table' in c:
-                            t = BeautifulSoup(c, 'html.parser').find('table', id='player_defense')
-                            if t:
-                                if not headers_written:
-                                    body = t.find('tbody')
-                                    rows_iter = body.find_all('tr') if body else t.find_all('tr')
-                                    first_data_row = None
-                                    for tr in rows_iter:
-                                        classes = tr.get('class') or []
-                                        if any(cls in ('thead', 'spacer', 'over_header') for cls in classes):
-                                            continue
-                                        cells = tr.find_all(['th', 'td'])
-                                        if cells and any(c.get_text(strip=True) for c in cells):
-                                            first_data_row = cells
-                                            break
-                                    if first_data_row:
-                                        num_cols = len(first_data_row)
-                                        thead = t.find('thead')
-                                        header_names = []
-                                        if thead:
-                                            all_header_cells = []
-                                            for tr in thead.find_all('tr'):
-                                                cells = tr.find_all(['th', 'td'])
-                                                all_header_cells.extend(cells)
-                                            if len(all_header_cells) == num_cols:
-                                                header_names = [hc.get_text(strip=True) for hc in all_header_cells]
-                                                header_names = [h for h in header_names if h != '']
-                                        if len(header_names) != num_cols:
-                                            header_names = [f'col_{i+1}' for i in range(num_cols)]
-                                        header_names.append('game_id')
-                                        w.writerow(header_names)
-                                        headers_written = True
-                                body = t.find('tbody')
-                                rows_iter = body.find_all('tr') if body else t.find_all('tr')
-                                for tr in rows_iter:
-                                    classes = tr.get('class') or []
-                                    if any(cls in ('thead', 'spacer', 'over_header') for cls in classes):
-                                        continue
-                                    cells = tr.find_all(['th', 'td'])
-                                    if not cells:
-                                        continue
-                                    row_vals = [c.get_text(strip=True) for c in cells]
-                                    if all(v == '' for v in row_vals):
-                                        continue
-                                    row_vals.append(row['game_id'])
-                                    w.writerow(row_vals)
-                                break
-                    break 
-                except requests.exceptions.HTTPError as e:
-                    if e.response.status_code == 429 and attempt < max_retries - 1:
-                        print(f"Rate limited, waiting {retry_delay} seconds before retry {attempt + 1}/{max_retries}")
-                        time.sleep(retry_delay)
-                        retry_delay *= 2 
-                        continue
-                    else:
-                        raise e
-                except Exception as e:
-                    print(f"Error scraping {url}: {e}")
-                    break
-            time.sleep(5)
-            
+            if found is None:
+                print(f"Error scraping {url}")
+                continue
+            t = found.get(pfr.PLAYER_DEFENSE.name)
+            if not t:
+                continue
+            rows = [tr.values() for tr in data_rows(t) if tr.cells]
+            rows = [vals for vals in rows if any(vals)]
+            if not headers_written and rows:
+                num_cols = len(rows[0])
+                header_names = []
+                all_header_cells = [cell for tr in t.section('thead') for cell in tr.cells]
+                if len(all_header_cells) == num_cols:
+                    header_names = [hc.text.strip() for hc in all_header_cells]
+                    header_names = [h for h in header_names if h != '']
+                if len(header_names) != num_cols:
+                    header_names = [f'col_{i+1}' for i in range(num_cols)]
+                header_names.append('game_id')
+                w.writerow(header_names)
+                headers_written = True
+            for row_vals in rows:
+                w.writerow(row_vals + [row['game_id']])
+
     if os.path.exists(yearly_path):
         dfc = pd.read_csv(yearly_path)
         dfc.dropna(inplace=True)
@@ -129,4 +67,6 @@ if csv_files:
     merged.to_csv('data/defense.csv', index=False)
     print("Merged dataset saved as data/defense.csv")
 else:
-    print("No defense files found to merge")
\ No newline at end of file
+    print("No defense files found to merge")
+
+scraper.close()
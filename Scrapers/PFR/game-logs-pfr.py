@@ -1,8 +1,12 @@
-import requests
-from bs4 import BeautifulSoup
 import pandas as pd
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from scraper_core import Scraper, data_rows, pfr
+
+# Shared scraping core: pooled, rate-limited session, page archive (--reparse) and run report
+scraper = Scraper('game-logs-pfr')
 
 os.makedirs('./data', exist_ok=True)
 os.makedirs('./data/game-logs', exist_ok=True)
@@ -54,90 +58,30 @@ for year in years:
     all_game_logs = []
     headers_extracted = False
     column_names = []
-    for i, (abbr, name) in enumerate(teams, 1):
+    targets = {pfr.gamelog_url(abbr, year): name for abbr, name in teams}
+    specs = [pfr.TEAM_GAME_LOG, pfr.TEAM_PLAYOFF_GAME_LOG]
+    for i, (url, name, found) in enumerate(scraper.tables(specs, targets, timeout=15), 1):
         print(f"  [{i:2d}/32] Processing {name}...")
-        url = f'https://www.pro-football-reference.com/teams/{abbr}/{year}/gamelog/'
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        # headers = {
-            # 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',  # CRITICAL: Only header that matters
-            # 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',  # USELESS: Server sends HTML anyway
-            # 'Accept-Language': 'en-US,en;q=0.9',  # USELESS: PFR doesn't check language
-            # 'Accept-Encoding': 'gzip, deflate, br',  # USELESS: requests library handles this automatically
-            # 'DNT': '1',  # USELESS: No one respects Do Not Track
-            # 'Connection': 'keep-alive',  # USELESS: requests handles connections automatically
-            # 'Upgrade-Insecure-Requests': '1',  # USELESS: Not needed for scraping
-            # 'Sec-Fetch-Dest': 'document',  # USELESS: Only modern Chrome sends these
-            # 'Sec-Fetch-Mode': 'navigate',  # USELESS: Can look suspicious if wrong
-            # 'Sec-Fetch-Site': 'none',  # DANGEROUS: Contradicts Referer header!
-            # 'Cache-Control': 'max-age=0',  # USELESS: Not checked by server
-            # 'Referer': 'https://www.pro-football-reference.com/'  # OPTIONAL: Might help look natural but not needed
-        # }
-        try:
-            response = requests.get(url, headers=headers, timeout=15)
-            if response.status_code == 429:
-                print(f"     Rate limited (429) - waiting 30 seconds...")
-                time.sleep(30)
-                response = requests.get(url, headers=headers, timeout=15)
-            if response.status_code != 200:
-                print(f"     Error: Got status code {response.status_code}")
-                time.sleep(5)
-                continue
-        except Exception as e:
-            print(f"     Error: {e}")
-            time.sleep(5)
+        if found is None:
+            print(f"     Error: could not retrieve {url}")
             continue
-        soup = BeautifulSoup(response.content, 'html.parser')
-        reg_table = soup.find('table', {'id': lambda x: x and 'team-year-regular-season-game-log' in x})
+        reg_table = found.get(pfr.TEAM_GAME_LOG.name)
         if reg_table:
             if not headers_extracted:
-                tbody = reg_table.find('tbody')
-                if tbody:
-                    first_data_row = None
-                    for tr in tbody.find_all('tr'):
-                        if tr.get('class') and 'thead' in tr.get('class'):
-                            continue
-                        cells = tr.find_all(['th', 'td'])
-                        if cells:
-                            first_data_row = cells
-                            break
-                    if first_data_row:
-                        for cell in first_data_row:
-                            data_stat = cell.get('data-stat', '')
-                            if data_stat:
-                                column_names.append(data_stat)
-                            else:
-                                column_names.append('unknown')
-                        column_names.append('team_name')
-                        headers_extracted = True
-                        print(f"     -> Extracted {len(column_names)} columns")
-            tbody = reg_table.find('tbody')
-            if tbody:
-                for tr in tbody.find_all('tr'):
-                    if tr.get('class') and 'thead' in tr.get('class'):
-                        continue
-                    cells = tr.find_all(['th', 'td'])
-                    row_data = []
-                    for cell in cells:
-                        text = cell.get_text(strip=True)
-                        row_data.append(text if text else '')
-                    if len(row_data) > 0 and row_data[0]:
-                        row_data.append(name)
-                        all_game_logs.append(row_data)
-        playoff_table = soup.find('table', {'id': lambda x: x and 'team-year-playoffs-game-log' in x})
-        if playoff_table:
-            playoff_tbody = playoff_table.find('tbody')
-            if playoff_tbody:
-                for tr in playoff_tbody.find_all('tr'):
-                    if tr.get('class') and 'thead' in tr.get('class'):
-                        continue
-                    cells = tr.find_all(['th', 'td'])
-                    row_data = []
-                    for cell in cells:
-                        text = cell.get_text(strip=True)
-                        row_data.append(text if text else '')
-                    if len(row_data) > 0 and row_data[0]:
-                        row_data.append(name)
-                        all_game_logs.append(row_data)
+                first_data_row = next((tr for tr in data_rows(reg_table) if tr.cells), None)
+                if first_data_row:
+                    column_names.extend(pfr.stat_names(first_data_row, lambda i: 'unknown'))
+                    column_names.append('team_name')
+                    headers_extracted = True
+                    print(f"     -> Extracted {len(column_names)} columns")
+        for table in (reg_table, found.get(pfr.TEAM_PLAYOFF_GAME_LOG.name)):
+            if not table:
+                continue
+            for tr in data_rows(table):
+                row_data = tr.values()
+                if len(row_data) > 0 and row_data[0]:
+                    row_data.append(name)
+                    all_game_logs.append(row_data)
         if all_game_logs and headers_extracted:
             df = pd.DataFrame(all_game_logs, columns=column_names)
             if i == 1:
@@ -146,7 +90,6 @@ for year in years:
                 df.to_csv(output_file, mode='a', header=False, index=False)
             print(f"     -> Saved {len(all_game_logs)} games for {name}")
             all_game_logs = []
-        time.sleep(4.1)
     if headers_extracted:
         try:
             final_df = pd.read_csv(output_file)
@@ -155,7 +98,6 @@ for year in years:
             print(f"-> Error reading final file for {year}")
     else:
         print(f"-> No game logs found for {year}")
-    time.sleep(10)
 
 # Combine all years into final merged file
 all_game_logs = []
@@ -177,3 +119,5 @@ else:
 print("\n" + "="*80)
 print("All game logs scraped successfully!")
 print("="*80)
+
+scraper.close()
@@ -1,8 +1,12 @@
-import requests
-from bs4 import BeautifulSoup
 import pandas as pd
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from scraper_core import Scraper, data_rows, pfr
+
+# Shared scraping core: pooled, rate-limited session, page archive (--reparse) and run report
+scraper = Scraper('games-pfr')
 
 os.makedirs('./data', exist_ok=True)
 os.makedirs('./data/games', exist_ok=True)
@@ -12,7 +16,8 @@ years = [2020, 2021, 2022, 2023, 2024, 2025]
 # years = list(range(2015, 2026))
 
 all_games = []
-for year in years:
+targets = {pfr.season_url(year, 'games'): year for year in years}
+for url, year, found in scraper.tables([pfr.SEASON_GAMES], targets, timeout=15):
     year_file = f'./data/games/games_{year}.csv'
     
     # Delete existing year file to start fresh
@@ -20,36 +25,28 @@ for year in years:
         os.remove(year_file)
     
     print(f"Scraping {year}...")
-    url = f'https://www.pro-football-reference.com/years/{year}/games.htm'
-    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-    response = requests.get(url, headers=headers, timeout=15)
-    soup = BeautifulSoup(response.content, 'html.parser')
-    games_table = soup.find('table', {'id': 'games'})
-    tbody = games_table.find('tbody')
+    if not found or pfr.SEASON_GAMES.name not in found:
+        print(f"-> No games table found for {year}")
+        continue
     year_games = []
-    for tr in tbody.find_all('tr'):
-        if tr.get('class') and 'thead' in tr.get('class'):
-            continue
-        week_th = tr.find('th', {'data-stat': 'week_num'})
+    for tr in data_rows(found[pfr.SEASON_GAMES.name]):
+        week_th = tr.first('th', 'week_num')
         if not week_th:
             continue
         week_text = week_th.text.strip()
         if not week_text or week_text == 'Week':
             continue
-        winner_td = tr.find('td', {'data-stat': 'winner'})
-        loser_td = tr.find('td', {'data-stat': 'loser'})
-        winner_link = winner_td.find('a')
-        loser_link = loser_td.find('a')
-        if winner_link and winner_link.get('href') and loser_link and loser_link.get('href'):
-            winner_href = winner_link.get('href', '')
-            loser_href = loser_link.get('href', '')
+        winner_td = tr.first('td', 'winner')
+        loser_td = tr.first('td', 'loser')
+        if winner_td and winner_td.href and loser_td and loser_td.href:
+            winner_href = winner_td.href
+            loser_href = loser_td.href
             if '/teams/' in winner_href and '/teams/' in loser_href:
                 winner_abbr = winner_href.split('/teams/')[1].split('/')[0]
                 loser_abbr = loser_href.split('/teams/')[1].split('/')[0]
-                boxscore_td = tr.find('td', {'data-stat': 'boxscore_word'})
-                boxscore_link = boxscore_td.find('a')
-                if boxscore_link and boxscore_link.get('href'):
-                    pfr_id = boxscore_link['href'].split('/')[-1].replace('.htm', '')
+                boxscore_td = tr.first('td', 'boxscore_word')
+                if boxscore_td and boxscore_td.href:
+                    pfr_id = boxscore_td.href.split('/')[-1].replace('.htm', '')
                     home_team_abbr = pfr_id[-3:]
                     if winner_abbr == home_team_abbr:
                         away_team, home_team = loser_abbr, winner_abbr
@@ -61,12 +58,7 @@ for year in years:
                     else:
                         week_formatted = f"{int(week_text):02d}"
                     game_id = f"{year}_{week_formatted}_{away_team}_{home_team}"
-                    pts_win_td = tr.find('td', {'data-stat': 'pts_win'})
-                    pts_lose_td = tr.find('td', {'data-stat': 'pts_lose'})
-                    yards_win_td = tr.find('td', {'data-stat': 'yards_win'})
-                    to_win_td = tr.find('td', {'data-stat': 'to_win'})
-                    yards_lose_td = tr.find('td', {'data-stat': 'yards_lose'})
-                    to_lose_td = tr.find('td', {'data-stat': 'to_lose'})
+                    stat = {cell.stat: cell.text.strip() for cell in tr.cells if cell.stat}
                     year_games.append({
                         'game_id': game_id,
                         'pfr_boxscore_id': pfr_id,
@@ -75,12 +67,12 @@ for year in years:
                         'away_team': away_team,
                         'home_team': home_team,
                         'winning_team': winner_abbr,
-                        'PtsW': pts_win_td.text.strip() if pts_win_td else '',
-                        'PtsL': pts_lose_td.text.strip() if pts_lose_td else '',
-                        'YdsW': yards_win_td.text.strip() if yards_win_td else '',
-                        'TOW': to_win_td.text.strip() if to_win_td else '',
-                        'YdsL': yards_lose_td.text.strip() if yards_lose_td else '',
-                        'TOL': to_lose_td.text.strip() if to_lose_td else ''
+                        'PtsW': stat.get('pts_win', ''),
+                        'PtsL': stat.get('pts_lose', ''),
+                        'YdsW': stat.get('yards_win', ''),
+                        'TOW': stat.get('to_win', ''),
+                        'YdsL': stat.get('yards_lose', ''),
+                        'TOL': stat.get('to_lose', '')
                     })
     
     print(f"-> Found {len(year_games)} games")
@@ -91,11 +83,11 @@ for year in years:
         year_df.to_csv(f'./data/games/games_{year}.csv', index=False)
         print(f"-> Saved games to ./data/games/games_{year}.csv")
         all_games.extend(year_games)
-    
-    time.sleep(10)
-    
+
 df = pd.DataFrame(all_games)
 df = df.drop_duplicates(subset=['pfr_boxscore_id'])
 df = df.sort_values(['season', 'week', 'game_id'])
 df.to_csv('./data/games.csv', index=False)
-print(f"Saved {len(df)} total games to games.csv")
\ No newline at end of file
+print(f"Saved {len(df)} total games to games.csv")
+
+scraper.close()
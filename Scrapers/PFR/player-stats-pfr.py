@@ -1,8 +1,12 @@
-import requests
-from bs4 import BeautifulSoup
 import pandas as pd
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from scraper_core import Scraper, data_rows, pfr
+
+# Shared scraping core: pooled, rate-limited session, page archive (--reparse) and run report
+scraper = Scraper('player-stats-pfr')
 
 os.makedirs('./data', exist_ok=True)
 os.makedirs('./data/player-stats', exist_ok=True)
@@ -11,8 +15,12 @@ os.makedirs('./data/player-stats', exist_ok=True)
 years = [2020, 2021, 2022, 2023, 2024, 2025]
 # years = [2023]
 
+# Fallback names for the leading columns when a cell has no data-stat
+FANTASY_COLUMNS = ['ranker', 'player', 'team', 'fantasy_pos', 'age']
+
 all_player_stats = []
-for year in years:
+targets = {pfr.season_url(year, 'fantasy'): year for year in years}
+for url, year, found in scraper.tables([pfr.FANTASY], targets, timeout=15):
     year_file = f'./data/player-stats/player_stats_{year}.csv'
     
     # Delete existing year file to start fresh
@@ -20,75 +28,28 @@ for year in years:
         os.remove(year_file)
     
     print(f"Scraping player stats for {year}...")
-    url = f'https://www.pro-football-reference.com/years/{year}/fantasy.htm'
-    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-    response = requests.get(url, headers=headers, timeout=15)
-    soup = BeautifulSoup(response.content, 'html.parser')
-    fantasy_table = soup.find('table', {'id': 'fantasy'})
-    if not fantasy_table:
+    if not found or pfr.FANTASY.name not in found:
         print(f"No fantasy table found for {year}")
         continue
-    tbody = fantasy_table.find('tbody')
-    if not tbody:
-        continue
-    first_data_row = None
-    for tr in tbody.find_all('tr'):
-        if tr.get('class') and 'thead' in tr.get('class'):
-            continue
-        cells = tr.find_all(['th', 'td'])
-        if cells:
-            first_data_row = cells
-            break
-    if not first_data_row:
+    rows = [tr for tr in data_rows(found[pfr.FANTASY.name]) if tr.cells]
+    if not rows:
         continue
-    column_names = []
-    for i, cell in enumerate(first_data_row):
-        data_stat = cell.get('data-stat', '')
-        if data_stat:
-            column_names.append(data_stat)
-        else:
-            if i == 0:
-                column_names.append('ranker')
-            elif i == 1:
-                column_names.append('player')
-            elif i == 2:
-                column_names.append('team')
-            elif i == 3:
-                column_names.append('fantasy_pos')
-            elif i == 4:
-                column_names.append('age')
-            else:
-                column_names.append(f'stat_{i}')
+    column_names = pfr.stat_names(rows[0], lambda i: FANTASY_COLUMNS[i] if i < len(FANTASY_COLUMNS) else f'stat_{i}')
     year_stats = []
-    for tr in tbody.find_all('tr'):
-        if tr.get('class') and 'thead' in tr.get('class'):
-            continue
-        cells = tr.find_all(['th', 'td'])
-        if not cells or len(cells) != len(column_names):
+    for tr in rows:
+        if len(tr.cells) != len(column_names):
             continue
         player_data = {}
-        for i, cell in enumerate(cells):
-            if i < len(column_names):
-                col_name = column_names[i]
-                cell_text = cell.get_text(strip=True)
-                if col_name == 'player':
-                    player_link = cell.find('a')
-                    if player_link:
-                        player_data['player_name'] = cell_text
-                        player_data['player_url'] = player_link.get('href', '')
-                    else:
-                        player_data['player_name'] = cell_text
-                        player_data['player_url'] = ''
-                elif col_name == 'team':
-                    team_link = cell.find('a')
-                    if team_link:
-                        player_data['team'] = cell_text
-                        player_data['team_url'] = team_link.get('href', '')
-                    else:
-                        player_data['team'] = cell_text
-                        player_data['team_url'] = ''
-                else:
-                    player_data[col_name] = cell_text
+        for col_name, cell in zip(column_names, tr.cells):
+            cell_text = cell.text.strip()
+            if col_name == 'player':
+                player_data['player_name'] = cell_text
+                player_data['player_url'] = cell.href or ''
+            elif col_name == 'team':
+                player_data['team'] = cell_text
+                player_data['team_url'] = cell.href or ''
+            else:
+                player_data[col_name] = cell_text
         player_data['season'] = year
         year_stats.append(player_data)
     print(f"-> Found {len(year_stats)} players")
@@ -97,7 +58,6 @@ for year in years:
         year_df.to_csv(f'./data/player-stats/player_stats_{year}.csv', index=False)
         print(f"-> Saved player stats to ./data/player-stats/player_stats_{year}.csv")
         all_player_stats.extend(year_stats)
-    time.sleep(10)
 
 # Combine all years
 df = pd.DataFrame(all_player_stats)
@@ -105,3 +65,5 @@ df = df.drop_duplicates(subset=['player_name', 'season'])
 df = df.sort_values(['season', 'player_name'])
 df.to_csv('./data/player_stats.csv', index=False)
 print(f"Saved {len(df)} total player stats to player_stats.csv")
+
+scraper.close()
@@ -1,8 +1,12 @@
-import requests
-from bs4 import BeautifulSoup
 import pandas as pd
-import time
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from scraper_core import Scraper, data_rows, pfr
+
+# Shared scraping core: pooled, rate-limited session, page archive (--reparse) and run report
+scraper = Scraper('team-schedule-game-results-pfr')
 
 os.makedirs('./data', exist_ok=True)
 os.makedirs('./data/schedule-game-results', exist_ok=True)
@@ -21,56 +25,30 @@ for year in years:
         os.remove(year_file)
     print(f"Scraping schedule and game results for {year}...")
     year_schedule_results = []
-    for team in teams:
+    targets = {pfr.team_url(team, year): team for team in teams}
+    for url, team, found in scraper.tables([pfr.TEAM_SCHEDULE], targets, timeout=15):
         print(f"   Scraping {team.upper()} schedule for {year}...")
-        url = f'https://www.pro-football-reference.com/teams/{team}/{year}.htm'
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        try:
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            schedule_table = soup.find('table', {'id': 'games'})
-            if not schedule_table:
-                print(f"   -> No games table found for {team} {year}")
-                continue
-            column_names = []
-            header_row = schedule_table.find('thead').find_all('tr')[-1]
-            if header_row:
-                for th in header_row.find_all('th'):
-                    data_stat = th.get('data-stat')
-                    if data_stat:
-                        column_names.append(data_stat)
-            tbody = schedule_table.find('tbody')
-            if tbody:
-                for tr in tbody.find_all('tr'):
-                    if tr.get('class') and 'thead' in tr.get('class'):
-                        continue
-                    cells = tr.find_all(['th', 'td'])
-                    if len(cells) > 0:
-                        row_data = {'team': team, 'season': year}
-                        
-                        for i, cell in enumerate(cells):
-                            if i < len(column_names):
-                                col_name = column_names[i]
-                                cell_text = cell.get_text(strip=True)
-                                row_data[col_name] = cell_text
-                        year_schedule_results.append(row_data)
-            time.sleep(4.1)
-        except requests.exceptions.RequestException as e:
-            print(f"   -> Request failed for {team} {year}: {e}")
-            time.sleep(4.1)
+        if found is None:
+            print(f"   -> Request failed for {team} {year}")
             continue
-        except Exception as e:
-            print(f"   -> Error scraping {team} {year}: {e}")
-            time.sleep(4.1)
+        schedule_table = found.get(pfr.TEAM_SCHEDULE.name)
+        if not schedule_table:
+            print(f"   -> No games table found for {team} {year}")
             continue
+        header_rows = schedule_table.section('thead')
+        column_names = [cell.stat for cell in header_rows[-1].of('th') if cell.stat] if header_rows else []
+        for tr in data_rows(schedule_table):
+            if tr.cells:
+                row_data = {'team': team, 'season': year}
+                for col_name, cell in zip(column_names, tr.cells):
+                    row_data[col_name] = cell.text.strip()
+                year_schedule_results.append(row_data)
     print(f"-> Found {len(year_schedule_results)} schedule entries for {year}")
     if year_schedule_results:
         year_df = pd.DataFrame(year_schedule_results)
         year_df.to_csv(year_file, index=False)
         print(f"-> Saved schedule results to {year_file}")
         all_schedule_results.extend(year_schedule_results)
-    time.sleep(10)
     
 if all_schedule_results:
     df = pd.DataFrame(all_schedule_results)
@@ -80,4 +58,6 @@ if all_schedule_results:
     df.to_csv('./data/schedule_game_results.csv', index=False)
     print(f"\nSaved {len(df)} total schedule entries to schedule_game_results.csv")
 else:
-    print("\nNo schedule data scraped.")
\ No newline at end of file
+    print("\nNo schedule data scraped.")
+
+scraper.close()
@@ -10,6 +10,9 @@ import os
 import sys
 from datetime import datetime
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from nfl_data import features  # noqa: E402
+
 # Get week limit from command line argument
 if len(sys.argv) > 1:
     try:
@@ -268,6 +271,13 @@ if WEEK_LIMIT is not None:
         df.to_csv(f'{final_pfr_dir}/game_logs_pfr.csv', index=False)
         print(f"✅ Filtered game_logs_pfr.csv: {original_count} → {len(df)} records (only 2025 data filtered)")
 
+##### Rolling-feature store #####
+# The models' trailing means/medians, computed once from the (filtered) player logs
+if os.path.exists(f'{final_pfr_dir}/player_stats_pfr.csv'):
+    print("\n7. Building the rolling-feature store...")
+    counts = features.build(f'{final_pfr_dir}/player_stats_pfr.csv', f'{final_pfr_dir}/features')
+    print(f"✅ Created {final_pfr_dir}/features: {counts['player_rows']} player-games, {counts['team_rows']} team-games")
+
 ##### Final Summary #####
 print(f"\n{'='*80}")
 print(f"🎯 FILTERING SUMMARY")
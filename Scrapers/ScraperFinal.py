@@ -41,24 +41,26 @@
   
 
 import pandas as pd
-import sqlite3
-import requests
 import os
 import csv
-from bs4 import BeautifulSoup, Comment
-import time
-from time import sleep
 import numpy as np
 from datetime import datetime, timedelta
 from requests.exceptions import Timeout, RequestException
-import random
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 try:
     import requests_cache
     requests_cache.install_cache('pfr_cache', expire_after=24*3600)
 except Exception:
     pass
+import argparse
+import sys
+from scraper_core import dataset, db, pfr
+from scraper_core.delta import Watermarks, load_games, played_games, team_season_games
+from scraper_core.nflverse import PLAYER_STATS_DTYPES, ROSTER_DTYPES, fetch_seasons, read_seasons
+from scraper_core.outcomes import OUTCOME_COLUMNS, game_outcomes
+from scraper_core.snapshots import SnapshotStore
+from scraper_core.writers import drop_rows
+from functools import partial
+from scraper_core import UNCHANGED, AppendOnlyCSV, ConditionalDownloader, Pipeline, Scraper, add_pipeline_arguments, extract_table, extract_tables
 
 
 # Print start time
@@ -73,145 +75,113 @@ if not os.path.exists('data/player-stats'):
     os.system('mkdir data/player-stats')
 if not os.path.exists('data/SR-scoring-tables'):
     os.system('mkdir data/SR-scoring-tables')
-if os.path.exists('nfl.db'):
-    os.remove('nfl.db')
-
-UA = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/126 Safari/537.36"
-    ),
-    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-}
-session = requests.Session()
-session.headers.update(UA)
-session.mount(
-    "https://",
-    HTTPAdapter(
-        pool_connections=8,
-        pool_maxsize=8,
-        max_retries=Retry(
-            total=5,
-            backoff_factor=1.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=frozenset(["GET"]),
-            raise_on_status=False,
-        ),
-    ),
-)
-def get_with_backoff(url, base_delay=0.75, jitter=0.75, timeout=30):
-    resp = session.get(url, timeout=timeout)
-    resp.raise_for_status()
-    time.sleep(base_delay + random.random() * jitter)
-    return resp
+if not os.path.exists('data/nflverse'):
+    os.system('mkdir data/nflverse')
+
+# Each section below is a named stage. Stages run as soon as the stages they
+# depend on finish (independent ones concurrently, nfl.db writers one at a
+# time) and are checkpointed in .pipeline_state.json:
+#   python ScraperFinal.py --resume            continue after a crash or Ctrl-C
+#   python ScraperFinal.py --only redzone      run just these stages
+#   python ScraperFinal.py --from games        run games and everything downstream
+#   python ScraperFinal.py --list              show the stages
+#   python ScraperFinal.py --delta             PFR stages scrape only games final or corrected since their last run
+parser = add_pipeline_arguments(argparse.ArgumentParser(description="Scrape NFL data into data/, nfl.db and final_data/"))
+parser.add_argument("--reparse", action="store_true", help="rebuild PFR CSVs from pfr-archive/ without network")
+parser.add_argument("--delta", action="store_true", help="scrape only games and team-seasons changed since each stage's watermark")
+args = parser.parse_args()
+pipeline = Pipeline()
+# Every stage fetches through the shared scraping core (scraper_core.Scraper, also used by
+# ScraperMasterPFR, DockerRPi and PFR/*): a bounded pool of requests in flight,
+# throttled per host (PFR ~20 req/min, override with SCRAPER_DELAY) and backing
+# off on 429 Retry-After, instead of serial requests with fixed sleeps.
+# Every PFR page is kept in a compressed archive (pfr-archive/). Run with
+# --reparse to rebuild all PFR-derived CSVs from that archive without network.
+# Table extraction runs in worker processes fed by the fetcher (SCRAPER_PARSE_WORKERS,
+# default one per core). They are forked here, before any stage threads exist.
+# Requests, retries, 429s, bytes, parse time and rows written per stage and host;
+# the report lands in data/run-reports/ and is compared with the previous run.
+scraper = Scraper('ScraperFinal')
+run_telemetry = scraper.telemetry
+archive = scraper.archive
+fetcher = scraper.fetcher
+parse_pool = scraper.parse_pool
+session = fetcher.session
+REPARSE = archive.offline
+# nflverse files are fetched with If-None-Match/If-Modified-Since and a checksum
+# (data/http-metadata.json); a stage whose downloads are all unchanged returns
+# UNCHANGED and the stages derived only from it are skipped.
+nflverse = ConditionalDownloader(fetcher)
+# Each PFR stage records the final scores it has covered (data/watermarks.json);
+# --delta limits it to games newly final or corrected since then.
+watermarks = Watermarks(enabled=args.delta)
+def get_with_backoff(url, timeout=30):
+    return fetcher.get(url, timeout=timeout)
+def existing_output(path):
+    # In reparse mode every per-year PFR file is rewritten from the archive.
+    return os.path.exists(path) and not REPARSE
+if REPARSE:
+    print(f"Reparse mode: reading PFR pages from {archive.root} ({archive.stats()['pages']} archived pages)")
 
 ##### Create 'Teams' in nfl.db #####
-print("\n" + "*"*80 + "\n")
-teams = [
-    ['ARI', 'Arizona Cardinals', 'NFC West'],
-    ['ATL', 'Atlanta Falcons', 'NFC South'],
-    ['BAL', 'Baltimore Ravens', 'AFC North'],
-    ['BUF', 'Buffalo Bills', 'AFC East'],
-    ['CAR', 'Carolina Panthers', 'NFC South'],
-    ['CHI', 'Chicago Bears', 'NFC North'],
-    ['CIN', 'Cincinnati Bengals', 'AFC North'],
-    ['CLE', 'Cleveland Browns', 'AFC North'],
-    ['DAL', 'Dallas Cowboys', 'NFC East'],
-    ['DEN', 'Denver Broncos', 'AFC West'],
-    ['DET', 'Detroit Lions', 'NFC North'],
-    ['GB', 'Green Bay Packers', 'NFC North'],
-    ['HOU', 'Houston Texans', 'AFC South'],
-    ['IND', 'Indianapolis Colts', 'AFC South'],
-    ['JAX', 'Jacksonville Jaguars', 'AFC South'],
-    ['KC', 'Kansas City Chiefs', 'AFC West'],
-    ['LAC', 'Los Angeles Chargers', 'AFC West'],
-    ['LAR', 'Los Angeles Rams', 'NFC West'],
-    ['LVR', 'Las Vegas Raiders', 'AFC West'],
-    ['MIA', 'Miami Dolphins', 'AFC East'],
-    ['MIN', 'Minnesota Vikings', 'NFC North'],
-    ['NE', 'New England Patriots', 'AFC East'],
-    ['NO', 'New Orleans Saints', 'NFC South'],
-    ['NYG', 'New York Giants', 'NFC East'],
-    ['NYJ', 'New York Jets', 'AFC East'],
-    ['PHI', 'Philadelphia Eagles', 'NFC East'],
-    ['PIT', 'Pittsburgh Steelers', 'AFC North'],
-    ['SEA', 'Seattle Seahawks', 'NFC West'],
-    ['SF', 'San Francisco 49ers', 'NFC West'],
-    ['TB', 'Tampa Bay Buccaneers', 'NFC South'],
-    ['TEN', 'Tennessee Titans', 'AFC South'],
-    ['WAS', 'Washington Commanders', 'NFC East']
-]
-df_teams = pd.DataFrame(teams, columns=['TeamID', 'Team', 'Division'])
-with sqlite3.connect('nfl.db') as conn:
-    df_teams.to_sql('Teams', conn, if_exists='replace', index=False)
+@pipeline.task('teams', outputs=['nfl.db'], resources=['nfl.db'])
+def teams():
+    print("\n" + "*"*80 + "\n")
+    teams = [
+        ['ARI', 'Arizona Cardinals', 'NFC West'],
+        ['ATL', 'Atlanta Falcons', 'NFC South'],
+        ['BAL', 'Baltimore Ravens', 'AFC North'],
+        ['BUF', 'Buffalo Bills', 'AFC East'],
+        ['CAR', 'Carolina Panthers', 'NFC South'],
+        ['CHI', 'Chicago Bears', 'NFC North'],
+        ['CIN', 'Cincinnati Bengals', 'AFC North'],
+        ['CLE', 'Cleveland Browns', 'AFC North'],
+        ['DAL', 'Dallas Cowboys', 'NFC East'],
+        ['DEN', 'Denver Broncos', 'AFC West'],
+        ['DET', 'Detroit Lions', 'NFC North'],
+        ['GB', 'Green Bay Packers', 'NFC North'],
+        ['HOU', 'Houston Texans', 'AFC South'],
+        ['IND', 'Indianapolis Colts', 'AFC South'],
+        ['JAX', 'Jacksonville Jaguars', 'AFC South'],
+        ['KC', 'Kansas City Chiefs', 'AFC West'],
+        ['LAC', 'Los Angeles Chargers', 'AFC West'],
+        ['LAR', 'Los Angeles Rams', 'NFC West'],
+        ['LVR', 'Las Vegas Raiders', 'AFC West'],
+        ['MIA', 'Miami Dolphins', 'AFC East'],
+        ['MIN', 'Minnesota Vikings', 'NFC North'],
+        ['NE', 'New England Patriots', 'AFC East'],
+        ['NO', 'New Orleans Saints', 'NFC South'],
+        ['NYG', 'New York Giants', 'NFC East'],
+        ['NYJ', 'New York Jets', 'AFC East'],
+        ['PHI', 'Philadelphia Eagles', 'NFC East'],
+        ['PIT', 'Pittsburgh Steelers', 'AFC North'],
+        ['SEA', 'Seattle Seahawks', 'NFC West'],
+        ['SF', 'San Francisco 49ers', 'NFC West'],
+        ['TB', 'Tampa Bay Buccaneers', 'NFC South'],
+        ['TEN', 'Tennessee Titans', 'AFC South'],
+        ['WAS', 'Washington Commanders', 'NFC East']
+    ]
+    df_teams = pd.DataFrame(teams, columns=['TeamID', 'Team', 'Division'])
+    with db.connect() as conn:
+        changed = db.upsert(conn, 'Teams', df_teams, key=['TeamID'])
+    conn.close()
+    if not changed:
+        return UNCHANGED
 
 
 ##### Create 'Games' in nfl.db #####
-url = 'https://raw.githubusercontent.com/nflverse/nfldata/master/data/games.csv'
-response = get_with_backoff(url)
-if response.ok:
-    with open('./data/games.csv', 'wb') as file:
-        file.write(response.content)
+@pipeline.task('games', outputs=['data/games.csv'], resources=['nfl.db'])
+def games():
+    url = 'https://raw.githubusercontent.com/nflverse/nfldata/master/data/games.csv'
+    # The raw download is kept apart from ./data/games.csv, which holds the processed games.
+    raw_path = './data/nflverse/games.csv'
+    if not nflverse.download(url, raw_path) and os.path.exists('./data/games.csv') and db.table_exists('Games'):
+        print("games.csv is unchanged upstream; keeping the Games table and ./data/games.csv")
+        return UNCHANGED
     print("Downloaded and saved games.csv")
-else:
-    raise Exception(f"Failed to download the file. Status code: {response.status_code}")
-df = pd.read_csv('./data/games.csv')
-
-df = df[df['season'] >= 2010]
-standardize_mapping = {
-    'OAK': 'LVR',  
-    'SD': 'LAC',   
-    'STL': 'LAR',  
-    'LA': 'LAR',   
-    'LV': 'LVR'    
-}
-df['away_team'] = df['away_team'].replace(standardize_mapping)
-df['home_team'] = df['home_team'].replace(standardize_mapping)
-df.rename(columns={'gameday': 'date'}, inplace=True)
-df = df[df['season'] != 1999]
-df['game_id'] = df['game_id'].apply(lambda x: f"{x.split('_')[0]}_{x.split('_')[1]}_{standardize_mapping.get(x.split('_')[2], x.split('_')[2])}_{standardize_mapping.get(x.split('_')[3], x.split('_')[3])}")
-df['date'] = pd.to_datetime(df['date'])
-df['week'] = df['week'].apply(lambda x: f'{x:02d}')
-df['game_id_simple'] = df['season'].astype(str) + "_" + df['week']
-df['game_id_team1'] = df['game_id_simple'] + "_" + df['home_team']
-df['game_id_team2'] = df['game_id_simple'] + "_" + df['away_team']
-selected_columns = [
-    'game_id', 'season', 'week', 'game_type', 'date', 'weekday', 'gametime', 
-    'away_team', 'away_score', 'home_team', 'home_score', 'location', 'result',	'total', 'overtime', 
-    'spread_line', 'total_line', 'away_rest', 'home_rest', 'roof', 'surface', 'temp', 'wind', 
-    'away_qb_id', 'home_qb_id', 'away_qb_name', 'home_qb_name', 'away_coach', 'home_coach', 'referee',
-    'stadium_id', 'stadium', 'game_id_simple', 'game_id_team1', 'game_id_team2', 'pfr'
-]
-df_selected = df[selected_columns]
-db_path = 'nfl.db'
-conn = sqlite3.connect(db_path)
-df_selected.to_sql('Games', conn, if_exists='replace', index=False)
-conn.close()
-# df_selected.to_csv('./data/games_modified.csv', index=False)
-df_selected.to_csv('./data/games.csv', index=False)
-
+    df = pd.read_csv(raw_path)
 
-##### Create 'PlayerStats' in nfl.db #####
-dataframes = []
-# Scrape historical seasons 2010-2025
-for year in range(2010, 2025):
-    file_path = os.path.join('./data/player-stats/', f"player_stats_{year}.csv")
-    # Always download current year player stats even if file exists
-    url = f"https://github.com/nflverse/nflverse-data/releases/download/player_stats/player_stats_{year}.csv"
-    response = get_with_backoff(url)
-    if response.ok:
-        with open(file_path, 'wb') as file:
-            file.write(response.content)
-        print(f"Downloaded and saved player_stats_{year}.csv")
-        df = pd.read_csv(file_path)
-        if 'opponent_team' in df.columns:
-            df = df.drop(columns=['opponent_team'])
-        dataframes.append(df)
-    else:
-        print(f"Failed to download data for the year {year}")
-if len(dataframes) > 0:
-    merged_df = pd.concat(dataframes, ignore_index=True, sort=False)
+    df = df[df['season'] >= 2010]
     standardize_mapping = {
         'OAK': 'LVR',  
         'SD': 'LAC',   
@@ -219,293 +189,229 @@ if len(dataframes) > 0:
         'LA': 'LAR',   
         'LV': 'LVR'    
     }
-    merged_df['recent_team'] = merged_df['recent_team'].replace(standardize_mapping)
-    merged_df['week'] = merged_df['week'].apply(lambda x: f'{x:02d}')
-    merged_df['game_id_team'] = merged_df['season'].astype(str) + '_' + merged_df['week'].astype(str) + '_' + merged_df['recent_team']
-    merged_df['game_id_simple'] = merged_df['season'].astype(str) + '_' + merged_df['week'].astype(str)
-    merged_df.to_csv('./data/player_stats.csv', index=False)
-    print("Merged and cleaned player stats saved to './data/player_stats.csv'")
-    # games_df = pd.read_csv('./data/games_modified.csv')
-    games_df = pd.read_csv('./data/games.csv')
-    game_id_map = pd.concat([
-        games_df[['game_id_team1', 'game_id', 'home_team', 'away_team']].rename(columns={'game_id_team1': 'game_id_team'}),
-        games_df[['game_id_team2', 'game_id', 'home_team', 'away_team']].rename(columns={'game_id_team2': 'game_id_team'})
-    ]).drop_duplicates(subset=['game_id_team'])
-    merged_df = merged_df.merge(game_id_map, on='game_id_team', how='left')
-    position_groups_to_remove = ['SPEC', 'LB', 'DB', 'OL', 'DL']
-    df_cleaned = merged_df[~merged_df['position_group'].isin(position_groups_to_remove)].dropna(subset=['position_group'])
-    df_cleaned.to_csv('./data/player_stats.csv', index=False)
-    print("Final cleaned player stats saved to './data/player_stats.csv'")
-else:
-    print("No new player stats available; keeping existing './data/player_stats.csv' and continuing.")
-conn = sqlite3.connect('nfl.db')
-cursor = conn.cursor()
-create_table_sql = '''
-CREATE TABLE IF NOT EXISTS PlayerStats (
-    player_display_name TEXT,
-    game_id TEXT,
-    season INTEGER,
-    week INTEGER,
-    position TEXT,
-    headshot_url TEXT,
-    completions INTEGER,
-    attempts INTEGER,
-    passing_yards INTEGER,
-    passing_tds INTEGER,
-    interceptions INTEGER,
-    sacks INTEGER,
-    carries INTEGER,
-    rushing_yards INTEGER,
-    rushing_tds INTEGER,
-    rushing_fumbles INTEGER,
-    receptions INTEGER,
-    targets INTEGER,
-    receiving_yards INTEGER,
-    receiving_tds INTEGER,
-    receiving_fumbles INTEGER,
-    fantasy_points_ppr REAL,
-    home_team TEXT,
-    away_team TEXT,
-    player_current_team TEXT
-);
-'''
-cursor.execute(create_table_sql)
-df = pd.read_csv('./data/player_stats.csv')
-df.rename(columns={'recent_team': 'player_current_team'}, inplace=True)
-columns_to_import = ['player_display_name', 'player_current_team', 'game_id', 'season', 'week', 
-                     'position', 'headshot_url', 'completions', 'attempts', 'passing_yards', 
-                     'passing_tds', 'interceptions', 'sacks', 'carries', 'rushing_yards', 
-                     'rushing_tds', 'rushing_fumbles', 'receptions', 'targets', 'receiving_yards', 
-                     'receiving_tds', 'receiving_fumbles', 'fantasy_points_ppr', 'home_team', 'away_team']
-df_to_import = df[columns_to_import]
-df_to_import.to_sql('PlayerStats', conn, if_exists='replace', index=False)
-conn.close()
-print("Player stats saved to 'PlayerStats' table in nfl.db")
+    df['away_team'] = df['away_team'].replace(standardize_mapping)
+    df['home_team'] = df['home_team'].replace(standardize_mapping)
+    df.rename(columns={'gameday': 'date'}, inplace=True)
+    df = df[df['season'] != 1999]
+    df['game_id'] = df['game_id'].apply(lambda x: f"{x.split('_')[0]}_{x.split('_')[1]}_{standardize_mapping.get(x.split('_')[2], x.split('_')[2])}_{standardize_mapping.get(x.split('_')[3], x.split('_')[3])}")
+    df['date'] = pd.to_datetime(df['date'])
+    df['week'] = df['week'].apply(lambda x: f'{x:02d}')
+    df['game_id_simple'] = df['season'].astype(str) + "_" + df['week']
+    df['game_id_team1'] = df['game_id_simple'] + "_" + df['home_team']
+    df['game_id_team2'] = df['game_id_simple'] + "_" + df['away_team']
+    selected_columns = [
+        'game_id', 'season', 'week', 'game_type', 'date', 'weekday', 'gametime', 
+        'away_team', 'away_score', 'home_team', 'home_score', 'location', 'result',	'total', 'overtime', 
+        'spread_line', 'total_line', 'away_rest', 'home_rest', 'roof', 'surface', 'temp', 'wind', 
+        'away_qb_id', 'home_qb_id', 'away_qb_name', 'home_qb_name', 'away_coach', 'home_coach', 'referee',
+        'stadium_id', 'stadium', 'game_id_simple', 'game_id_team1', 'game_id_team2', 'pfr'
+    ]
+    df_selected = df[selected_columns]
+    with db.connect() as conn:
+        changed = db.upsert(conn, 'Games', df_selected, key=['game_id'])
+    conn.close()
+    print(f"Games table updated in nfl.db ({changed} rows inserted or updated)")
+    # df_selected.to_csv('./data/games_modified.csv', index=False)
+    # pfr_url is added here rather than in the box scores stage so every PFR stage can start once games is done.
+    df_selected = df_selected.assign(pfr_url='https://www.pro-football-reference.com/boxscores/' + df_selected['pfr'] + '.htm')
+    df_selected.to_csv('./data/games.csv', index=False)
+    dataset.write_dataset('games', df_selected, 'season')
 
 
-##### Create 'Rosters' in nfl.db (2010-2025) #####
-for year in range(2010, 2026):
-    file_path = f"./data/rosters/roster_{year}.csv"
-    # Always download current year roster data even if it exists
-    url = f"https://github.com/nflverse/nflverse-data/releases/download/rosters/roster_{year}.csv"
-    response = get_with_backoff(url)
-    if response.status_code == 200:
-        with open(file_path, 'wb') as file:
-            file.write(response.content)
-        print(f"Downloaded and saved roster_{year}.csv")
+##### Create 'PlayerStats' in nfl.db #####
+@pipeline.task('player_stats', deps=['games'], inputs=['data/games.csv'], outputs=['data/player_stats.csv'], resources=['nfl.db'])
+def player_stats():
+    # All seasons 2010-2024 are checked in one concurrent batch: the current season every run,
+    # settled seasons only when their last check is older than NFLVERSE_RECHECK_DAYS
+    any_changed, downloaded = fetch_seasons(nflverse, 'player_stats', range(2010, 2025))
+    if not any_changed and pipeline.unchanged('games') and os.path.exists('./data/player_stats.csv') and db.table_exists('PlayerStats'):
+        print("Player stats and games are unchanged upstream; keeping the PlayerStats table")
+        return UNCHANGED
+    merged_df = read_seasons(downloaded, PLAYER_STATS_DTYPES, exclude=['opponent_team'])
+    if merged_df is not None:
+        standardize_mapping = {
+            'OAK': 'LVR',  
+            'SD': 'LAC',   
+            'STL': 'LAR',  
+            'LA': 'LAR',   
+            'LV': 'LVR'    
+        }
+        merged_df['recent_team'] = merged_df['recent_team'].replace(standardize_mapping)
+        week = merged_df['week'].map('{:02d}'.format)
+        merged_df['game_id_team'] = merged_df['season'].astype(str) + '_' + week + '_' + merged_df['recent_team']
+        merged_df['game_id_simple'] = merged_df['season'].astype(str) + '_' + week
+        # games_df = pd.read_csv('./data/games_modified.csv')
+        games_df = pd.read_csv('./data/games.csv')
+        game_id_map = pd.concat([
+            games_df[['game_id_team1', 'game_id', 'home_team', 'away_team']].rename(columns={'game_id_team1': 'game_id_team'}),
+            games_df[['game_id_team2', 'game_id', 'home_team', 'away_team']].rename(columns={'game_id_team2': 'game_id_team'})
+        ]).drop_duplicates(subset=['game_id_team'])
+        merged_df = merged_df.merge(game_id_map, on='game_id_team', how='left')
+        position_groups_to_remove = ['SPEC', 'LB', 'DB', 'OL', 'DL']
+        df_cleaned = merged_df[~merged_df['position_group'].isin(position_groups_to_remove)].dropna(subset=['position_group'])
+        df_cleaned.assign(week=week).to_csv('./data/player_stats.csv', index=False)
+        print("Final cleaned player stats saved to './data/player_stats.csv'")
+        df = df_cleaned
     else:
-        print(f"Failed to download data for the year {year}")
-dataframes = []
-for year in range(2010, 2026):
-    file_path = f'./data/rosters/roster_{year}.csv'
-    if os.path.exists(file_path):
-        df = pd.read_csv(file_path)
-        dataframes.append(df)
-merged_data = pd.concat(dataframes, ignore_index=True)
-base_url = "https://www.pro-football-reference.com/players/"
-merged_data['url'] = merged_data['pfr_id'].apply(lambda x: f"{base_url}{x[0]}/{x}.htm" if pd.notna(x) else None)
-merged_data.to_csv('./data/rosters.csv', index=False)
-print("Final file saved to ./data/rosters.csv")
-conn = sqlite3.connect('nfl.db')
-cursor = conn.cursor()
-cursor.execute("DROP TABLE IF EXISTS rosters")
-create_table_sql = '''
-CREATE TABLE IF NOT EXISTS Rosters (
-    season INTEGER,
-    team TEXT,
-    position TEXT,
-    depth_chart_position TEXT,
-    status TEXT,
-    full_name TEXT,
-    first_name TEXT,
-    last_name TEXT,
-    birth_date TEXT,
-    height REAL,
-    weight REAL,
-    college TEXT,
-    pfr_id TEXT,
-    years_exp REAL,
-    headshot_url TEXT,
-    week INTEGER,
-    game_type TEXT,
-    entry_year REAL,
-    rookie_year REAL,
-    draft_club TEXT,
-    draft_number REAL,
-    url TEXT
-);
-'''
-cursor.execute(create_table_sql)
-df = pd.read_csv('data/rosters.csv')
-df.to_sql('Rosters', conn, if_exists='replace', index=False)
-conn.close()
-print("Rosters table created and data inserted successfully.")
-
-##### Standardize Team Names in Rosters table #####
-standardize_mapping = {
-    'ARZ': 'ARI',  
-    'BLT': 'BAL',  
-    'CLV': 'CLE',  
-    'HST': 'HOU',  
-    'LA': 'LAR',   
-    'LV': 'LVR',   
-    'OAK': 'LVR',  
-    'SD': 'LAC',   
-    'SL': 'LAR'    
-}
-conn = sqlite3.connect('nfl.db')
-cursor = conn.cursor()
-df = pd.read_sql_query("SELECT * FROM Rosters", conn)
-df['team'] = df['team'].replace(standardize_mapping)
-df['draft_club'] = df['draft_club'].replace(standardize_mapping)
-df.to_sql('Rosters', conn, if_exists='replace', index=False)
-conn.close()
-print("Rosters table standardized and updated successfully.")
-
-
-##### Standardize Team Names in rosters.csv #####
-file_path = 'data/rosters.csv'
-rosters_df = pd.read_csv(file_path)
-standardize_mapping = {
-    'ARZ': 'ARI',  
-    'BLT': 'BAL',  
-    'CLV': 'CLE',  
-    'HST': 'HOU',  
-    'LA': 'LAR',   
-    'LV': 'LVR',   
-    'OAK': 'LVR',  
-    'SD': 'LAC',   
-    'SL': 'LAR'    
-}
-rosters_df['team'] = rosters_df['team'].replace(standardize_mapping)
-standardized_teams = rosters_df['team'].unique()
-standardized_team_list_sorted = sorted(list(standardized_teams))
-for idx, team in enumerate(standardized_team_list_sorted, 1):
-    print(f"{idx}. {team}")
-rosters_df.to_csv('data/rosters.csv', index=False)
+        print("No new player stats available; keeping existing './data/player_stats.csv' and continuing.")
+        df = pd.read_csv('./data/player_stats.csv', dtype=PLAYER_STATS_DTYPES)
+    df = df.rename(columns={'recent_team': 'player_current_team'})
+    columns_to_import = ['player_id', 'player_display_name', 'player_current_team', 'game_id', 'season', 'week', 
+                         'position', 'headshot_url', 'completions', 'attempts', 'passing_yards', 
+                         'passing_tds', 'interceptions', 'sacks', 'carries', 'rushing_yards', 
+                         'rushing_tds', 'rushing_fumbles', 'receptions', 'targets', 'receiving_yards', 
+                         'receiving_tds', 'receiving_fumbles', 'fantasy_points_ppr', 'home_team', 'away_team']
+    df_to_import = df[columns_to_import]
+    dataset.write_dataset('player_stats', df, 'season')
+    with db.connect() as conn:
+        changed = db.upsert(conn, 'PlayerStats', df_to_import, key=['player_id', 'game_id'])
+    conn.close()
+    print(f"Player stats saved to 'PlayerStats' table in nfl.db ({changed} rows inserted or updated)")
+
+
+##### Create 'Rosters' in nfl.db (2010-2025) #####
+@pipeline.task('rosters', outputs=['data/rosters.csv'], resources=['nfl.db'])
+def rosters():
+    # Same batch policy as player stats: only missing or stale seasons are requested
+    any_changed, paths = fetch_seasons(nflverse, 'rosters', range(2010, 2026))
+    if not any_changed and os.path.exists('./data/rosters.csv') and db.table_exists('Rosters'):
+        print("Rosters are unchanged upstream; keeping the Rosters table and ./data/rosters.csv")
+        return UNCHANGED
+    merged_data = read_seasons(paths, ROSTER_DTYPES)
+    if merged_data is None:
+        print("No roster files available; skipping the Rosters table")
+        return
+    base_url = "https://www.pro-football-reference.com/players/"
+    merged_data['url'] = base_url + merged_data['pfr_id'].str[0] + '/' + merged_data['pfr_id'] + '.htm'
+    ##### Standardize Team Names in Rosters #####
+    # Team is part of the Rosters key, so names are standardized before the upsert and the CSV is written once.
+    standardize_mapping = {
+        'ARZ': 'ARI',  
+        'BLT': 'BAL',  
+        'CLV': 'CLE',  
+        'HST': 'HOU',  
+        'LA': 'LAR',   
+        'LV': 'LVR',   
+        'OAK': 'LVR',  
+        'SD': 'LAC',   
+        'SL': 'LAR'    
+    }
+    merged_data['team'] = merged_data['team'].replace(standardize_mapping)
+    merged_data['draft_club'] = merged_data['draft_club'].replace(standardize_mapping)
+    with db.connect() as conn:
+        changed = db.upsert(conn, 'Rosters', merged_data, key=['season', 'team', 'full_name', 'position'])
+    conn.close()
+    print(f"Rosters table standardized and updated successfully ({changed} rows inserted or updated).")
+    for idx, team in enumerate(sorted(merged_data['team'].dropna().unique()), 1):
+        print(f"{idx}. {team}")
+    merged_data.to_csv('./data/rosters.csv', index=False)
+    print("Final file saved to ./data/rosters.csv")
+    dataset.write_dataset('rosters', merged_data, 'season')
 
 
 ##### Scrape Box Scores (2010-2025) #####
-print("\n" + "*"*80 + "\n")
-os.makedirs('./data/SR-box-scores/', exist_ok=True)
-df = pd.read_csv('./data/games.csv')
-df['pfr_url'] = 'https://www.pro-football-reference.com/boxscores/' + df['pfr'] + '.htm'
-df.to_csv('./data/games.csv', index=False)
-# csv_file_path = 'data/SR-box-scores/all_box_scores.csv'
-games_csv_path = 'data/games.csv'
-headers = ['URL', 'Team', '1', '2', '3', '4', 'OT1', 'OT2', 'OT3', 'OT4', 'Final']
-
-for year_to_scrape in range(2010, 2026):
-    output_filename = f'./data/SR-box-scores/all_box_scores_{year_to_scrape}.csv'
-    existing_urls = set()
-    if os.path.exists(output_filename):
-        df_existing = pd.read_csv(output_filename)
-        if 'URL' in df_existing.columns:
-            existing_urls = set(df_existing['URL'].unique())
-        else:
-            print(f"Found existing file for {year_to_scrape}, will append any missing games.")
-    
-    mode = 'a' if os.path.exists(output_filename) else 'w'
-    with open(output_filename, mode, newline='') as csvfile:
-        score_writer = csv.writer(csvfile)
-        if mode == 'w':
-            score_writer.writerow(headers)
-        
-        game_urls = []
-        with open(games_csv_path, 'r') as csvfile:
-            reader = csv.DictReader(csvfile)
-            now_dt = datetime.now()
-            for row in reader:
-                try:
-                    game_dt = datetime.fromisoformat(row['date'])
-                except Exception:
+@pipeline.task('box_scores', deps=['games'], inputs=['data/games.csv'], outputs=['data/all_box_scores.csv'])
+def box_scores():
+    print("\n" + "*"*80 + "\n")
+    os.makedirs('./data/SR-box-scores/', exist_ok=True)
+    # csv_file_path = 'data/SR-box-scores/all_box_scores.csv'
+    games_csv_path = 'data/games.csv'
+    headers = list(pfr.LINESCORE.header)
+    games_rows = load_games(games_csv_path)
+    delta = watermarks.delta('box_scores', games_rows)
+    missed = set()
+
+    for year_to_scrape in (range(2010, 2026) if delta is None else delta.seasons()):
+        output_filename = f'./data/SR-box-scores/all_box_scores_{year_to_scrape}.csv'
+        if delta is not None:
+            # Corrected games are scraped again; their old rows go first
+            drop_rows(output_filename, 'URL', delta.corrected_in(year_to_scrape, 'pfr_url'))
+        existing_urls = set()
+        if existing_output(output_filename):
+            df_existing = pd.read_csv(output_filename)
+            if 'URL' in df_existing.columns:
+                existing_urls = set(df_existing['URL'].unique())
+            else:
+                print(f"Found existing file for {year_to_scrape}, will append any missing games.")
+
+        mode = 'a' if existing_output(output_filename) else 'w'
+        with open(output_filename, mode, newline='') as csvfile:
+            score_writer = csv.writer(csvfile)
+            if mode == 'w':
+                score_writer.writerow(headers)
+
+            game_rows = played_games(games_rows, year_to_scrape) if delta is None else delta.season_games(year_to_scrape)
+            game_urls = [row['pfr_url'] for row in game_rows]
+            game_ids = {row['pfr_url']: row['game_id'] for row in game_rows}
+
+            urls_to_scrape = []
+            for url in game_urls:
+                if url in existing_urls:
+                    print(f"Skipping already scraped game: {url}")
                     continue
-                if row['season'] == str(year_to_scrape) and game_dt <= now_dt:
-                    game_urls.append(row['pfr_url'])
-        
-        for url in game_urls:
-            if url in existing_urls:
-                print(f"Skipping already scraped game: {url}")
-                continue
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    print(f"Scraping game: {url}")
-                    response = get_with_backoff(url, timeout=10)
-                    response.raise_for_status()
-                    soup = BeautifulSoup(response.content, 'lxml')
-                    linescore_table = soup.find('table', class_='linescore')
-                    if linescore_table:
-                        rows = linescore_table.find_all('tr')[1:]
-                        for row in rows:
-                            cols = row.find_all('td')
-                            team_name = cols[1].text.strip()
-                            scores = [col.text.strip() for col in cols[2:]]
-                            scores += [''] * (len(headers) - 2 - len(scores))
-                            score_writer.writerow([url, team_name] + scores)
-                    print(f"Successfully scraped box score for {url}")
+                urls_to_scrape.append(url)
+            for url, _, rows in scraper.rows(pfr.LINESCORE, {url: url for url in urls_to_scrape}, timeout=10):
+                if rows is None:
+                    missed.add(game_ids[url])
+                    continue
+                score_writer.writerows(rows)
+                print(f"Successfully scraped box score for {url}")
+        print(f"Scraping completed for {year_to_scrape}. Box scores saved to {output_filename}.")
+
+
+    ##### Merge Box Scores #####
+    input_dir = 'data/SR-box-scores/'
+    csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
+    dataframes = [pd.read_csv(os.path.join(input_dir, file)) for file in csv_files]
+    merged_dataframe = pd.concat(dataframes, ignore_index=True)
+    output_file = 'data/all_box_scores.csv'
+    merged_dataframe.to_csv(output_file, index=False)
+    print(f"Merged dataset saved as {output_file}")
+
+
+    ##### Fix OT Columns in Box Scores ##### 
+    df = pd.read_csv('data/all_box_scores.csv')
+    def shift_to_final(row):
+        if pd.isna(row['Final']):  
+            for col in reversed(row.index[:-1]):
+                if pd.notna(row[col]):
+                    row['Final'] = row[col]
+                    row[col] = None
                     break
-                except Exception as e:
-                    print(f"Error scraping {url}: {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-                    else:
-                        pass
-            time.sleep(2.5)
-    print(f"Scraping completed for {year_to_scrape}. Box scores saved to {output_filename}.")
-
-
-##### Merge Box Scores #####
-input_dir = 'data/SR-box-scores/'
-csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
-dataframes = [pd.read_csv(os.path.join(input_dir, file)) for file in csv_files]
-merged_dataframe = pd.concat(dataframes, ignore_index=True)
-output_file = 'data/all_box_scores.csv'
-merged_dataframe.to_csv(output_file, index=False)
-print(f"Merged dataset saved as {output_file}")
-
-
-##### Fix OT Columns in Box Scores ##### 
-df = pd.read_csv('data/all_box_scores.csv')
-def shift_to_final(row):
-    if pd.isna(row['Final']):  
-        for col in reversed(row.index[:-1]):
-            if pd.notna(row[col]):
-                row['Final'] = row[col]
-                row[col] = None
-                break
-    return row
-df = df.apply(shift_to_final, axis=1)
-df.to_csv('data/all_box_scores.csv', index=False)
+        return row
+    df = df.apply(shift_to_final, axis=1)
+    df.to_csv('data/all_box_scores.csv', index=False)
+    # Box score URLs start with the game date; January/February games belong to the prior season
+    game_dates = pd.to_datetime(df['URL'].str.extract(r'/boxscores/(\d{8})')[0], format='%Y%m%d', errors='coerce')
+    dataset.write_dataset('box_scores', df, game_dates.dt.year - (game_dates.dt.month < 3))
+    watermarks.commit('box_scores', missed=missed)
 
 
 ##### Scrape Scoring Tables/Touchdown Logs (2010-2025) #####
-print("\n" + "*"*80 + "\n")
-for year_to_scrape in range(2010, 2026):
-    output_filename = f'./data/SR-scoring-tables/all_nfl_scoring_tables_{year_to_scrape}.csv'
-    existing_game_ids = set()
-    if os.path.exists(output_filename):
-        df_existing = pd.read_csv(output_filename)
-        if 'Game_ID' in df_existing.columns:
-            existing_game_ids = set(df_existing['Game_ID'].unique())
-        else:
-            print(f"Found existing scoring file for {year_to_scrape}, will append any missing games.")
-    mode = 'a' if os.path.exists(output_filename) else 'w'
-    with open(output_filename, mode, newline='') as output_csvfile:
-        csvwriter = csv.writer(output_csvfile)
-        if mode == 'w':
-            csvwriter.writerow(['Quarter', 'Time', 'Team', 'Detail', 'Team_1', 'Team_2', 'Game_ID'])  
-        with open('./data/games.csv', 'r') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = []
-            now_dt = datetime.now()
-            for row in reader:
-                try:
-                    game_dt = datetime.fromisoformat(row['date'])
-                except Exception:
-                    continue
-                if int(row['game_id'].split('_')[0]) == year_to_scrape and game_dt <= now_dt:
-                    rows.append(row)
+@pipeline.task('scoring_tables', deps=['games'], inputs=['data/games.csv'], outputs=['data/all_scoring_tables.csv'])
+def scoring_tables():
+    print("\n" + "*"*80 + "\n")
+    games_rows = load_games()
+    delta = watermarks.delta('scoring_tables', games_rows)
+    missed = set()
+    for year_to_scrape in (range(2010, 2026) if delta is None else delta.seasons()):
+        output_filename = f'./data/SR-scoring-tables/all_nfl_scoring_tables_{year_to_scrape}.csv'
+        if delta is not None:
+            drop_rows(output_filename, 'Game_ID', delta.corrected_in(year_to_scrape))
+        existing_game_ids = set()
+        if existing_output(output_filename):
+            df_existing = pd.read_csv(output_filename)
+            if 'Game_ID' in df_existing.columns:
+                existing_game_ids = set(df_existing['Game_ID'].unique())
+            else:
+                print(f"Found existing scoring file for {year_to_scrape}, will append any missing games.")
+        mode = 'a' if existing_output(output_filename) else 'w'
+        with open(output_filename, mode, newline='') as output_csvfile:
+            csvwriter = csv.writer(output_csvfile)
+            if mode == 'w':
+                csvwriter.writerow(pfr.SCORING.header)
+            rows = played_games(games_rows, year_to_scrape) if delta is None else delta.season_games(year_to_scrape)
+            targets = {}
             for row in rows:
                 pfr_value = row['pfr']
                 game_id = row['game_id']
@@ -513,975 +419,761 @@ for year_to_scrape in range(2010, 2026):
                     print(f"Skipping already scraped game ID: {game_id}")
                     continue
                 url = f"https://www.pro-football-reference.com/boxscores/{pfr_value}.htm"
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        response = get_with_backoff(url, timeout=10)
-                        response.raise_for_status()
-                        soup = BeautifulSoup(response.text, 'lxml')
-                        table = soup.find('table', {'id': 'scoring'})
-                        if table is None:
-                            print(f"No scoring table found for {url}")
-                            break
-                        last_quarter = None  
-                        for i, tr in enumerate(table.find_all('tr')):
-                            if i == 0:  
-                                continue
-                            cells = tr.find_all(['td', 'th'])
-                            if len(cells) > 0:
-                                csv_row = [cell.text for cell in cells]
-                                if csv_row[0]:
-                                    last_quarter = csv_row[0]
-                                else:
-                                    csv_row[0] = last_quarter
-                                csv_row.append(game_id)  
-                                csvwriter.writerow(csv_row)
-                        print(f"Successfully scraped scoring data for game ID: {game_id}, PFR: {pfr_value}")
-                        break
-                    except (requests.exceptions.RequestException, Exception) as e:
-                        print(f"An error occurred while scraping {url}. Error: {e}")
-                        if attempt < max_retries - 1:
-                            time.sleep(2 ** attempt)
-                        else:
-                            break
-                time.sleep(2.5)
-    print(f"Scraping completed for {year_to_scrape}. Scoring data saved to {output_filename}.")
-
-
-##### Merge Scoring Tables #####
-input_dir = 'data/SR-scoring-tables/'
-csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
-dataframes = [pd.read_csv(os.path.join(input_dir, file)) for file in csv_files]
-merged_dataframe = pd.concat(dataframes, ignore_index=True)
-output_file = 'data/all_scoring_tables.csv'
-merged_dataframe.to_csv(output_file, index=False)
-print(f"Merged dataset saved as {output_file}")
+                targets[url] = row
+            for url, game, rows in scraper.rows(pfr.SCORING, targets, timeout=10):
+                if rows is None:
+                    print(f"No scoring table found for {url}")
+                    missed.add(game['game_id'])
+                    continue
+                csvwriter.writerows(rows)
+                print(f"Successfully scraped scoring data for game ID: {game['game_id']}, PFR: {game['pfr']}")
+        print(f"Scraping completed for {year_to_scrape}. Scoring data saved to {output_filename}.")
+
+
+    ##### Merge Scoring Tables #####
+    input_dir = 'data/SR-scoring-tables/'
+    csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
+    dataframes = [pd.read_csv(os.path.join(input_dir, file)) for file in csv_files]
+    merged_dataframe = pd.concat(dataframes, ignore_index=True)
+    output_file = 'data/all_scoring_tables.csv'
+    merged_dataframe.to_csv(output_file, index=False)
+    print(f"Merged dataset saved as {output_file}")
+    dataset.write_dataset('scoring_tables', merged_dataframe, merged_dataframe['Game_ID'].str.split('_').str[0])
+    watermarks.commit('scoring_tables', missed=missed)
 
 
 ##### Scrape Team Game Logs (2010-2025) #####
-print("\n" + "*"*80 + "\n")
-data_dir = './data/SR-game-logs'
-os.makedirs(data_dir, exist_ok=True)
-opponent_data_dir = './data/SR-opponent-game-logs'
-os.makedirs(opponent_data_dir, exist_ok=True)
-teams = [
-    ['crd', 'Arizona Cardinals'],
-    ['atl', 'Atlanta Falcons'],
-    ['rav', 'Baltimore Ravens'],
-    ['buf', 'Buffalo Bills'],
-    ['car', 'Carolina Panthers'],
-    ['chi', 'Chicago Bears'],
-    ['cin', 'Cincinnati Bengals'],
-    ['cle', 'Cleveland Browns'],
-    ['dal', 'Dallas Cowboys'],
-    ['den', 'Denver Broncos'],
-    ['det', 'Detroit Lions'],
-    ['gnb', 'Green Bay Packers'],
-    ['htx', 'Houston Texans'],
-    ['clt', 'Indianapolis Colts'],
-    ['jax', 'Jacksonville Jaguars'],
-    ['kan', 'Kansas City Chiefs'],
-    ['sdg', 'Los Angeles Chargers'],
-    ['ram', 'Los Angeles Rams'],
-    ['rai', 'Las Vegas Raiders'],
-    ['mia', 'Miami Dolphins'],
-    ['min', 'Minnesota Vikings'],
-    ['nwe', 'New England Patriots'],
-    ['nor', 'New Orleans Saints'],
-    ['nyg', 'New York Giants'],
-    ['nyj', 'New York Jets'],
-    ['phi', 'Philadelphia Eagles'],
-    ['pit', 'Pittsburgh Steelers'],
-    ['sea', 'Seattle Seahawks'],
-    ['sfo', 'San Francisco 49ers'],
-    ['tam', 'Tampa Bay Buccaneers'],
-    ['oti', 'Tennessee Titans'],
-    ['was', 'Washington Commanders']
-]
-# team_game_logs_headers = [
-#     'rk', 'gtm', 'week', 'date', 'day', 'game_location', 'opp', 'result', 'pts', 'pts_opp', 'ot', 
-#     'pass_cmp', 'pass_att', 'pass_cmp_pct', 'pass_yds', 'pass_td', 'pass_ya', 'pass_aya', 'pass_rate', 
-#     'pass_sk', 'pass_sk_yds', 'rush_att', 'rush_yds', 'rush_td', 'rush_ya', 'plays', 'total_yds', 'ypp',
-#     'fga', 'fgm', 'xpa', 'xpm', 'punt', 'punt_yds', 'first_downs_pass', 'first_downs_rush', 'first_downs_pen',
-#     'first_downs_total', 'third_down_conv', 'third_down_att', 'fourth_down_conv', 'fourth_down_att', 
-#     'pen', 'pen_yds', 'fumbles_lost', 'turnovers_int', 'turnovers_total', 'time_of_poss'
-#     # 'pen', 'pen_yds', 'fumbles_lost', 'turnovers_int', 'turnovers_total', 'time_of_poss', 'team_name'
-# ]
-team_game_logs_headers = [
-    'rk', 'gtm', 'week', 'date', 'day', 'game_location', 'opp', 'result', 'pts', 'pts_opp', 'ot', 
-    'pass_cmp', 'pass_att', 'pass_cmp_pct', 'pass_yds', 'pass_td', 'pass_ya', 'pass_aya', 'pass_rate', 
-    'pass_sk', 'pass_sk_yds', 'rush_att', 'rush_yds', 'rush_td', 'rush_ya', 'plays', 'total_yds', 'ypp',
-    'fga', 'fgm', 'xpa', 'xpm', 'punt', 'punt_yds', 'first_downs_pass', 'first_downs_rush', 'first_downs_pen',
-    'first_downs_total', 'third_down_conv', 'third_down_att', 'fourth_down_conv', 'fourth_down_att', 
-    'pen', 'pen_yds', 'fumbles_lost', 'turnovers_int', 'turnovers_total', 'time_of_poss'
-]
-    # 'week_num', 'game_day_of_week', 'game_date', 'boxscore_word', 'game_outcome', 'overtime', 
-    # 'game_location', 'opp', 'pts_off', 'pts_def', 'pass_cmp', 'pass_att', 'pass_yds', 'pass_td', 
-    # 'pass_int', 'pass_sacked', 'pass_sacked_yds', 'pass_yds_per_att', 'pass_net_yds_per_att', 
-    # 'pass_cmp_perc', 'pass_rating', 'rush_att', 'rush_yds', 'rush_yds_per_att', 'rush_td', 
-    # 'fgm', 'fga', 'xpm', 'xpa', 'punt', 'punt_yds', 'third_down_success', 'third_down_att', 
-    # 'fourth_down_success', 'fourth_down_att', 'time_of_poss', 'Team_Name'
-
-opponent_game_logs_headers = [
-    'rk', 'gtm', 'week', 'date', 'day', 'game_location', 'opp', 'result', 'pts', 'pts_opp', 'ot', 
-    'pass_cmp', 'pass_att', 'pass_cmp_pct', 'pass_yds', 'pass_td', 'pass_ya', 'pass_aya', 'pass_rate', 
-    'pass_sk', 'pass_sk_yds', 'rush_att', 'rush_yds', 'rush_td', 'rush_ya', 'plays', 'total_yds', 'ypp',
-    'fga', 'fgm', 'xpa', 'xpm', 'punt', 'punt_yds', 'first_downs_pass', 'first_downs_rush', 'first_downs_pen',
-    'first_downs_total', 'third_down_conv', 'third_down_att', 'fourth_down_conv', 'fourth_down_att', 
-    'pen', 'pen_yds', 'fumbles_lost', 'turnovers_int', 'turnovers_total', 'time_of_poss'
-]
-# opponent_game_logs_headers = [
-#     'rk', 'gtm', 'week', 'date', 'day', 'game_location', 'opp', 'result', 'pts', 'pts_opp', 'ot', 
-#     'pass_cmp', 'pass_att', 'pass_cmp_pct', 'pass_yds', 'pass_td', 'pass_ya', 'pass_aya', 'pass_rate', 
-#     'pass_sk', 'pass_sk_yds', 'rush_att', 'rush_yds', 'rush_td', 'rush_ya', 'plays', 'total_yds', 'ypp',
-#     'fga', 'fgm', 'xpa', 'xpm', 'punt', 'punt_yds', 'first_downs_pass', 'first_downs_rush', 'first_downs_pen',
-#     'first_downs_total', 'third_down_conv', 'third_down_att', 'fourth_down_conv', 'fourth_down_att', 
-#     'pen', 'pen_yds', 'fumbles_lost', 'turnovers_int', 'turnovers_total', 'time_of_poss'
-#     # 'pen', 'pen_yds', 'fumbles_lost', 'turnovers_int', 'turnovers_total', 'time_of_poss', 'team_name'
-# ]
-    # 'week_num', 'game_day_of_week', 'game_date', 'boxscore_word', 'game_outcome', 'overtime', 
-    # 'game_location', 'opp', 'pts_off', 'pts_def', 'pass_cmp', 'pass_att', 'pass_yds', 'pass_td', 
-    # 'pass_int', 'pass_sacked', 'pass_sacked_yds', 'pass_yds_per_att', 'pass_net_yds_per_att', 
-    # 'pass_cmp_perc', 'pass_rating', 'rush_att', 'rush_yds', 'rush_yds_per_att', 'rush_td', 
-    # 'fgm', 'fga', 'xpm', 'xpa', 'punt', 'punt_yds', 'third_down_success', 'third_down_att', 
-    # 'fourth_down_success', 'fourth_down_att', 'time_of_poss', 'Team_Name'
-for year in range(2010, 2026):
-    team_file = f'./data/SR-game-logs/all_teams_game_logs_{year}.csv'
-    opponent_file = f'./data/SR-opponent-game-logs/all_teams_opponent_game_logs_{year}.csv'
-    
-    # Read existing data to check which teams already have data
-    existing_teams_team = set()
-    existing_teams_opponent = set()
-    if os.path.exists(team_file):
-        try:
-            df_existing = pd.read_csv(team_file)
-            if 'team_name' in df_existing.columns:
-                existing_teams_team = set(df_existing['team_name'].unique())
-        except Exception:
-            pass
-    if os.path.exists(opponent_file):
-        try:
-            df_existing = pd.read_csv(opponent_file)
-            if 'team_name' in df_existing.columns:
-                existing_teams_opponent = set(df_existing['team_name'].unique())
-        except Exception:
-            pass
-    
-    # For 2010-2024: skip if all teams already have data
-    if year != 2025 and len(existing_teams_team) == 32 and len(existing_teams_opponent) == 32:
-        print(f"Skipping Team Game Logs for {year}; all teams already have data.")
-        continue
-    
-    # For 2025 or incomplete years: process missing teams
-    all_team_game_logs = []  
-    all_opponent_game_logs = []
-    for team in teams:
-        abbreviation, name = team
-        # For 2010-2024: skip if team already has data
-        # For 2025: always process to get latest data
-        if year != 2025 and name in existing_teams_team and name in existing_teams_opponent:
-            print(f"Skipping {name} for {year}; data already exists.")
+@pipeline.task('team_game_logs', deps=['games'], inputs=['data/games.csv'], outputs=['data/all_team_game_logs.csv'])
+def team_game_logs():
+    print("\n" + "*"*80 + "\n")
+    data_dir = './data/SR-game-logs'
+    os.makedirs(data_dir, exist_ok=True)
+    opponent_data_dir = './data/SR-opponent-game-logs'
+    os.makedirs(opponent_data_dir, exist_ok=True)
+    teams = [
+        ['crd', 'Arizona Cardinals'],
+        ['atl', 'Atlanta Falcons'],
+        ['rav', 'Baltimore Ravens'],
+        ['buf', 'Buffalo Bills'],
+        ['car', 'Carolina Panthers'],
+        ['chi', 'Chicago Bears'],
+        ['cin', 'Cincinnati Bengals'],
+        ['cle', 'Cleveland Browns'],
+        ['dal', 'Dallas Cowboys'],
+        ['den', 'Denver Broncos'],
+        ['det', 'Detroit Lions'],
+        ['gnb', 'Green Bay Packers'],
+        ['htx', 'Houston Texans'],
+        ['clt', 'Indianapolis Colts'],
+        ['jax', 'Jacksonville Jaguars'],
+        ['kan', 'Kansas City Chiefs'],
+        ['sdg', 'Los Angeles Chargers'],
+        ['ram', 'Los Angeles Rams'],
+        ['rai', 'Las Vegas Raiders'],
+        ['mia', 'Miami Dolphins'],
+        ['min', 'Minnesota Vikings'],
+        ['nwe', 'New England Patriots'],
+        ['nor', 'New Orleans Saints'],
+        ['nyg', 'New York Giants'],
+        ['nyj', 'New York Jets'],
+        ['phi', 'Philadelphia Eagles'],
+        ['pit', 'Pittsburgh Steelers'],
+        ['sea', 'Seattle Seahawks'],
+        ['sfo', 'San Francisco 49ers'],
+        ['tam', 'Tampa Bay Buccaneers'],
+        ['oti', 'Tennessee Titans'],
+        ['was', 'Washington Commanders']
+    ]
+    # team_game_logs_headers = [
+    #     'rk', 'gtm', 'week', 'date', 'day', 'game_location', 'opp', 'result', 'pts', 'pts_opp', 'ot', 
+    #     'pass_cmp', 'pass_att', 'pass_cmp_pct', 'pass_yds', 'pass_td', 'pass_ya', 'pass_aya', 'pass_rate', 
+    #     'pass_sk', 'pass_sk_yds', 'rush_att', 'rush_yds', 'rush_td', 'rush_ya', 'plays', 'total_yds', 'ypp',
+    #     'fga', 'fgm', 'xpa', 'xpm', 'punt', 'punt_yds', 'first_downs_pass', 'first_downs_rush', 'first_downs_pen',
+    #     'first_downs_total', 'third_down_conv', 'third_down_att', 'fourth_down_conv', 'fourth_down_att', 
+    #     'pen', 'pen_yds', 'fumbles_lost', 'turnovers_int', 'turnovers_total', 'time_of_poss'
+    #     # 'pen', 'pen_yds', 'fumbles_lost', 'turnovers_int', 'turnovers_total', 'time_of_poss', 'team_name'
+    # ]
+    team_game_logs_headers = [
+        'rk', 'gtm', 'week', 'date', 'day', 'game_location', 'opp', 'result', 'pts', 'pts_opp', 'ot', 
+        'pass_cmp', 'pass_att', 'pass_cmp_pct', 'pass_yds', 'pass_td', 'pass_ya', 'pass_aya', 'pass_rate', 
+        'pass_sk', 'pass_sk_yds', 'rush_att', 'rush_yds', 'rush_td', 'rush_ya', 'plays', 'total_yds', 'ypp',
+        'fga', 'fgm', 'xpa', 'xpm', 'punt', 'punt_yds', 'first_downs_pass', 'first_downs_rush', 'first_downs_pen',
+        'first_downs_total', 'third_down_conv', 'third_down_att', 'fourth_down_conv', 'fourth_down_att', 
+        'pen', 'pen_yds', 'fumbles_lost', 'turnovers_int', 'turnovers_total', 'time_of_poss'
+    ]
+        # 'week_num', 'game_day_of_week', 'game_date', 'boxscore_word', 'game_outcome', 'overtime', 
+        # 'game_location', 'opp', 'pts_off', 'pts_def', 'pass_cmp', 'pass_att', 'pass_yds', 'pass_td', 
+        # 'pass_int', 'pass_sacked', 'pass_sacked_yds', 'pass_yds_per_att', 'pass_net_yds_per_att', 
+        # 'pass_cmp_perc', 'pass_rating', 'rush_att', 'rush_yds', 'rush_yds_per_att', 'rush_td', 
+        # 'fgm', 'fga', 'xpm', 'xpa', 'punt', 'punt_yds', 'third_down_success', 'third_down_att', 
+        # 'fourth_down_success', 'fourth_down_att', 'time_of_poss', 'Team_Name'
+
+    opponent_game_logs_headers = [
+        'rk', 'gtm', 'week', 'date', 'day', 'game_location', 'opp', 'result', 'pts', 'pts_opp', 'ot', 
+        'pass_cmp', 'pass_att', 'pass_cmp_pct', 'pass_yds', 'pass_td', 'pass_ya', 'pass_aya', 'pass_rate', 
+        'pass_sk', 'pass_sk_yds', 'rush_att', 'rush_yds', 'rush_td', 'rush_ya', 'plays', 'total_yds', 'ypp',
+        'fga', 'fgm', 'xpa', 'xpm', 'punt', 'punt_yds', 'first_downs_pass', 'first_downs_rush', 'first_downs_pen',
+        'first_downs_total', 'third_down_conv', 'third_down_att', 'fourth_down_conv', 'fourth_down_att', 
+        'pen', 'pen_yds', 'fumbles_lost', 'turnovers_int', 'turnovers_total', 'time_of_poss'
+    ]
+    # opponent_game_logs_headers = [
+    #     'rk', 'gtm', 'week', 'date', 'day', 'game_location', 'opp', 'result', 'pts', 'pts_opp', 'ot', 
+    #     'pass_cmp', 'pass_att', 'pass_cmp_pct', 'pass_yds', 'pass_td', 'pass_ya', 'pass_aya', 'pass_rate', 
+    #     'pass_sk', 'pass_sk_yds', 'rush_att', 'rush_yds', 'rush_td', 'rush_ya', 'plays', 'total_yds', 'ypp',
+    #     'fga', 'fgm', 'xpa', 'xpm', 'punt', 'punt_yds', 'first_downs_pass', 'first_downs_rush', 'first_downs_pen',
+    #     'first_downs_total', 'third_down_conv', 'third_down_att', 'fourth_down_conv', 'fourth_down_att', 
+    #     'pen', 'pen_yds', 'fumbles_lost', 'turnovers_int', 'turnovers_total', 'time_of_poss'
+    #     # 'pen', 'pen_yds', 'fumbles_lost', 'turnovers_int', 'turnovers_total', 'time_of_poss', 'team_name'
+    # ]
+        # 'week_num', 'game_day_of_week', 'game_date', 'boxscore_word', 'game_outcome', 'overtime', 
+        # 'game_location', 'opp', 'pts_off', 'pts_def', 'pass_cmp', 'pass_att', 'pass_yds', 'pass_td', 
+        # 'pass_int', 'pass_sacked', 'pass_sacked_yds', 'pass_yds_per_att', 'pass_net_yds_per_att', 
+        # 'pass_cmp_perc', 'pass_rating', 'rush_att', 'rush_yds', 'rush_yds_per_att', 'rush_td', 
+        # 'fgm', 'fga', 'xpm', 'xpa', 'punt', 'punt_yds', 'third_down_success', 'third_down_att', 
+        # 'fourth_down_success', 'fourth_down_att', 'time_of_poss', 'Team_Name'
+    games_rows = load_games()
+    delta = watermarks.delta('team_game_logs', games_rows)
+    missed = set()
+    team_seasons = delta.team_seasons() if delta is not None else None
+    for year in (range(2010, 2026) if delta is None else delta.seasons()):
+        team_file = f'./data/SR-game-logs/all_teams_game_logs_{year}.csv'
+        opponent_file = f'./data/SR-opponent-game-logs/all_teams_opponent_game_logs_{year}.csv'
+
+        # Existing rows are indexed once; new or changed rows are appended and each
+        # file is compacted (last row per team/date wins, sorted) when the year is done.
+        team_writer = AppendOnlyCSV(team_file, team_game_logs_headers + ['team_name'], key=['team_name', 'date'],
+                                    replace=not existing_output(team_file))
+        opponent_writer = AppendOnlyCSV(opponent_file, opponent_game_logs_headers + ['team_name'], key=['team_name', 'date'],
+                                        replace=not existing_output(opponent_file))
+        existing_teams_team = team_writer.distinct('team_name')
+        existing_teams_opponent = opponent_writer.distinct('team_name')
+
+        # For 2010-2024: skip if all teams already have data
+        if delta is None and year != 2025 and len(existing_teams_team) == 32 and len(existing_teams_opponent) == 32:
+            print(f"Skipping Team Game Logs for {year}; all teams already have data.")
             continue
-        print(f'Processing {name} for the year {year}')  
-        url = f'https://www.pro-football-reference.com/teams/{abbreviation}/{year}/gamelog/'
-        
-        # Add retry logic for rate limiting
-        max_retries = 3
-        retry_delay = 10
-        for attempt in range(max_retries):
-            try:
-                response = get_with_backoff(url)
-                if response.status_code == 429:
-                    print(f'Rate limited for {name}. Waiting {retry_delay} seconds before retry {attempt + 1}/{max_retries}')
-                    sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                    continue
-                elif response.status_code != 200:
-                    print(f'Failed to retrieve page {url} for {name} in {year}: {response.status_code}')
-                    break
-                else:
-                    break
-            except Exception as e:
-                print(f'Error retrieving {url}: {e}')
-                if attempt < max_retries - 1:
-                    sleep(retry_delay)
-                    retry_delay *= 2
+
+        # For 2025 or incomplete years: process missing teams
+        targets = {}
+        for team in teams:
+            abbreviation, name = team
+            # For 2010-2024: skip if team already has data
+            # For 2025: always process to get latest data
+            if team_seasons is not None:
+                # --delta: only the teams that played a new or corrected game
+                if (year, abbreviation) not in team_seasons:
                     continue
-                else:
-                    break
-        
-        if response.status_code != 200:
-            continue
-            
-        soup = BeautifulSoup(response.content, 'lxml')
-        warned_team_short = False
-        warned_opp_short = False
-        for table_id in ['table_pfr_team-year_game-logs_team-year-regular-season-game-log', 'table_pfr_team-year_game-logs_team-year-regular-season-opponent-game-log']:
-            table = soup.find('table', {'id': table_id})
-            if table is None:
-                print(f'Table with id {table_id} not found on page {url} for {name} in {year}')
+            elif year != 2025 and name in existing_teams_team and name in existing_teams_opponent:
+                print(f"Skipping {name} for {year}; data already exists.")
                 continue
-            tbody = table.find('tbody')
-            if tbody is None:
-                print(f'No tbody found for table {table_id} on page {url} for {name} in {year}')
+            url = f'https://www.pro-football-reference.com/teams/{abbreviation}/{year}/gamelog/'
+            targets[url] = team
+        game_log_ids = ['table_pfr_team-year_game-logs_team-year-regular-season-game-log', 'table_pfr_team-year_game-logs_team-year-regular-season-opponent-game-log']
+        playoff_table_id = f'playoff_gamelog{year}'
+        for url, tables in parse_pool.map(fetcher.map(targets), partial(extract_tables, ids=game_log_ids + [playoff_table_id])):
+            abbreviation, name = targets[url]
+            print(f'Processing {name} for the year {year}')  
+            if tables is None or not all(tables.get(table_id) for table_id in game_log_ids):
+                missed.update(team_season_games(games_rows, year, abbreviation))
+            if tables is None:
                 continue
-                
-            game_logs = []
-            for tr in tbody.find_all('tr'):
-                row_data = []  
-                for td in tr.find_all(['th', 'td']):  
-                    row_data.append(td.text)
-                # Filter out empty rows
-                if len(row_data) > 0:
-                    if table_id == 'table_pfr_team-year_game-logs_team-year-regular-season-game-log':
-                        if len(row_data) == 48:  # Expected: 48 total columns (including Rk)
-                            row_data.append(name)  # Add team name (now 49 total)
-                            game_logs.append(row_data)
-                        else:
-                            if not warned_team_short:
-                                print(f"Warning: Team game log row has {len(row_data)} cells but expected 48")
-                                warned_team_short = True
-                    elif table_id == 'table_pfr_team-year_game-logs_team-year-regular-season-opponent-game-log':
-                        if len(row_data) == 48:  # Expected: 48 total columns (including Rk)
-                            row_data.append(name)  # Add team name (now 49 total)
-                            all_opponent_game_logs.append(row_data)
-                        else:
-                            if not warned_opp_short:
-                                print(f"Warning: Opponent game log row has {len(row_data)} cells but expected 48")
-                                warned_opp_short = True
-            if table_id == 'table_pfr_team-year_game-logs_team-year-regular-season-game-log':
-                all_team_game_logs.extend(game_logs)
-            playoff_table_id = f'playoff_gamelog{year}'
-            playoff_table = soup.find('table', {'id': playoff_table_id})
-            if playoff_table:
-                playoff_tbody = playoff_table.find('tbody')
-                playoff_game_logs = []
-                for tr in playoff_tbody.find_all('tr'):
-                    row_data = []  
-                    for td in tr.find_all(['th', 'td']):  
-                        row_data.append(td.text)
-                    row_data.append(name)  
-                    playoff_game_logs.append(row_data)
-                all_team_game_logs.extend(playoff_game_logs)
-        sleep(2.5)  # Increased delay to avoid rate limiting  
-    
-    # Append new data to existing files
-    if all_team_game_logs or all_opponent_game_logs:
-        mode_team = 'a' if os.path.exists(team_file) else 'w'
-        mode_opponent = 'a' if os.path.exists(opponent_file) else 'w'
-        
-        # For 2025, remove existing rows for teams we're re-scraping
-        if year == 2025 and os.path.exists(team_file):
-            df_existing = pd.read_csv(team_file)
-            teams_to_update = {row[-1] for row in all_team_game_logs}  # team_name is last column
-            df_existing = df_existing[~df_existing['team_name'].isin(teams_to_update)]
-            df_existing.to_csv(team_file, index=False)
-            mode_team = 'a'
-        if year == 2025 and os.path.exists(opponent_file):
-            df_existing = pd.read_csv(opponent_file)
-            teams_to_update = {row[-1] for row in all_opponent_game_logs}
-            df_existing = df_existing[~df_existing['team_name'].isin(teams_to_update)]
-            df_existing.to_csv(opponent_file, index=False)
-            mode_opponent = 'a'
-        
-        if all_team_game_logs:
-            with open(team_file, mode=mode_team, newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                if mode_team == 'w':
-                    writer.writerow(team_game_logs_headers + ['team_name'])
-                writer.writerows(all_team_game_logs)
-        if all_opponent_game_logs:
-            with open(opponent_file, mode=mode_opponent, newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                if mode_opponent == 'w':
-                    writer.writerow(opponent_game_logs_headers + ['team_name'])
-                writer.writerows(all_opponent_game_logs)
-
-
-##### Create game_id in Game Logs #####
-directory = 'data/SR-game-logs/'
-df_list = []
-for filename in os.listdir(directory):
-    if filename.endswith(".csv"):  
-        file_path = os.path.join(directory, filename)
-        season = filename.split('_')[-1].replace('.csv', '')
-        df = pd.read_csv(file_path)
-        df['season'] = season
-        df_list.append(df)
-df = pd.concat(df_list, ignore_index=True)
-team_abbreviation_map = {
-    'Arizona Cardinals': 'ARI',
-    'Atlanta Falcons': 'ATL',
-    'Baltimore Ravens': 'BAL',
-    'Buffalo Bills': 'BUF',
-    'Carolina Panthers': 'CAR',
-    'Chicago Bears': 'CHI',
-    'Cincinnati Bengals': 'CIN',
-    'Cleveland Browns': 'CLE',
-    'Dallas Cowboys': 'DAL',
-    'Denver Broncos': 'DEN',
-    'Detroit Lions': 'DET',
-    'Green Bay Packers': 'GB',
-    'Houston Texans': 'HOU',
-    'Indianapolis Colts': 'IND',
-    'Jacksonville Jaguars': 'JAX',
-    'Kansas City Chiefs': 'KC',
-    'Los Angeles Chargers': 'LAC',
-    'Los Angeles Rams': 'LAR',
-    'Las Vegas Raiders': 'LVR',
-    'Oakland Raiders': 'LVR',
-    'Miami Dolphins': 'MIA',
-    'Minnesota Vikings': 'MIN',
-    'New England Patriots': 'NE',
-    'New Orleans Saints': 'NO',
-    'New York Giants': 'NYG',
-    'New York Jets': 'NYJ',
-    'Philadelphia Eagles': 'PHI',
-    'Pittsburgh Steelers': 'PIT',
-    'Seattle Seahawks': 'SEA',
-    'San Francisco 49ers': 'SF',
-    'Tampa Bay Buccaneers': 'TB',
-    'Tennessee Titans': 'TEN',
-    'Washington Commanders': 'WAS',
-    'Washington Football Team': 'WAS',
-    'Washington Redskins': 'WAS',
-    'St. Louis Rams': 'LAR',
-    'San Diego Chargers': 'LAC'
-}
-
-# Mapping from Pro Football Reference abbreviations to our standardized abbreviations
-pfr_to_standard_abbr = {
-    'ARI': 'ARI',
-    'ATL': 'ATL', 
-    'BAL': 'BAL',
-    'BUF': 'BUF',
-    'CAR': 'CAR',
-    'CHI': 'CHI',
-    'CIN': 'CIN',
-    'CLE': 'CLE',
-    'DAL': 'DAL',
-    'DEN': 'DEN',
-    'DET': 'DET',
-    'GNB': 'GB',   # Green Bay Packers
-    'HOU': 'HOU',
-    'IND': 'IND',
-    'JAX': 'JAX',
-    'KAN': 'KC',   # Kansas City Chiefs
-    'LA': 'LAR',   # LA → Los Angeles Rams
-    'LAC': 'LAC',
-    'LAR': 'LAR',
-    'LV': 'LVR',   # LV → Las Vegas Raiders
-    'LVR': 'LVR',
-    'MIA': 'MIA',
-    'MIN': 'MIN',
-    'NWE': 'NE',   # New England Patriots
-    'NOR': 'NO',   # New Orleans Saints
-    'NYG': 'NYG',
-    'NYJ': 'NYJ',
-    'OAK': 'LVR',  # Oakland Raiders → Las Vegas Raiders
-    'PHI': 'PHI',
-    'PIT': 'PIT',
-    'SD': 'LAC',   # San Diego Chargers → Los Angeles Chargers
-    'SDG': 'LAC',  # San Diego Chargers → Los Angeles Chargers (alternative)
-    'SEA': 'SEA',
-    'SF': 'SF',    # San Francisco 49ers
-    'SFO': 'SF',   # San Francisco 49ers (alternative)
-    'STL': 'LAR',  # St. Louis Rams → Los Angeles Rams
-    'TAM': 'TB',   # Tampa Bay Buccaneers
-    'TEN': 'TEN',
-    'WAS': 'WAS'
-}
-def determine_home_away(row):
-    if row['game_location'] == '@':
-        away_team = team_abbreviation_map[row['team_name']]
-        home_team = pfr_to_standard_abbr[row['opp']]
-    else:
-        home_team = team_abbreviation_map[row['team_name']]
-        away_team = pfr_to_standard_abbr[row['opp']]
-    return pd.Series([home_team, away_team])
-df[['home_team_id', 'away_team_id']] = df.apply(determine_home_away, axis=1)
-df['week_num'] = df['week'].astype(str).str.zfill(2)
-df['game_id'] = df['season'] + '_' + df['week_num'] + '_' + df['away_team_id'] + '_' + df['home_team_id']
-output_file_path_with_teams = 'data/all_team_game_logs.csv'
-df.to_csv(output_file_path_with_teams, index=False)
-print(f"Updated file with home and away teams saved to: {output_file_path_with_teams}")
-
-
-##### Aggregate all_game_logs.csv to Single Row Per Game #####
-df = pd.read_csv('data/all_team_game_logs.csv')
-grouped_df = df.groupby('game_id', group_keys=False).apply(lambda x: pd.Series({
-    'season': x['season'].iloc[0],  # Ensure the season is included from the first entry
-    'home_pts_off': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pts'].sum(),
-    'away_pts_off': x.loc[x['game_location'] == '@', 'pts'].sum(),
-    'home_pass_cmp': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_cmp'].sum(),
-    'away_pass_cmp': x.loc[x['game_location'] == '@', 'pass_cmp'].sum(),
-    'home_pass_att': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_att'].sum(),
-    'away_pass_att': x.loc[x['game_location'] == '@', 'pass_att'].sum(),
-    'home_pass_yds': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_yds'].sum(),
-    'away_pass_yds': x.loc[x['game_location'] == '@', 'pass_yds'].sum(),
-    'home_pass_td': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_td'].sum(),
-    'away_pass_td': x.loc[x['game_location'] == '@', 'pass_td'].sum(),
-    'home_pass_int': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'turnovers_int'].sum(),
-    'away_pass_int': x.loc[x['game_location'] == '@', 'turnovers_int'].sum(),
-    'home_pass_sacked': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_sk'].sum(),
-    'away_pass_sacked': x.loc[x['game_location'] == '@', 'pass_sk'].sum(),
-    'home_pass_yds_per_att': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_ya'].mean(),
-    'away_pass_yds_per_att': x.loc[x['game_location'] == '@', 'pass_ya'].mean(),
-    'home_pass_net_yds_per_att': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_aya'].mean(),
-    'away_pass_net_yds_per_att': x.loc[x['game_location'] == '@', 'pass_aya'].mean(),
-    'home_pass_cmp_perc': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_cmp_pct'].mean(),
-    'away_pass_cmp_perc': x.loc[x['game_location'] == '@', 'pass_cmp_pct'].mean(),
-    'home_pass_rating': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_rate'].mean(),
-    'away_pass_rating': x.loc[x['game_location'] == '@', 'pass_rate'].mean(),
-    'home_rush_att': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'rush_att'].sum(),
-    'away_rush_att': x.loc[x['game_location'] == '@', 'rush_att'].sum(),
-    'home_rush_yds': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'rush_yds'].sum(),
-    'away_rush_yds': x.loc[x['game_location'] == '@', 'rush_yds'].sum(),
-    'home_rush_yds_per_att': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'rush_ya'].mean(),
-    'away_rush_yds_per_att': x.loc[x['game_location'] == '@', 'rush_ya'].mean(),
-    'home_rush_td': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'rush_td'].sum(),
-    'away_rush_td': x.loc[x['game_location'] == '@', 'rush_td'].sum(),
-}))
-grouped_df.to_csv('data/all_team_game_logs.csv', index=True)
 
-
-##### Team Stats and Rankings #####
-print("\n" + "*"*80 + "\n")
-data_dir = './data/SR-team-stats'
-os.makedirs(data_dir, exist_ok=True)
-teams = [
-    ['crd', 'Arizona Cardinals'],
-    ['atl', 'Atlanta Falcons'],
-    ['rav', 'Baltimore Ravens'],
-    ['buf', 'Buffalo Bills'],
-    ['car', 'Carolina Panthers'],
-    ['chi', 'Chicago Bears'],
-    ['cin', 'Cincinnati Bengals'],
-    ['cle', 'Cleveland Browns'],
-    ['dal', 'Dallas Cowboys'],
-    ['den', 'Denver Broncos'],
-    ['det', 'Detroit Lions'],
-    ['gnb', 'Green Bay Packers'],
-    ['htx', 'Houston Texans'],
-    ['clt', 'Indianapolis Colts'],
-    ['jax', 'Jacksonville Jaguars'],
-    ['kan', 'Kansas City Chiefs'],
-    ['sdg', 'Los Angeles Chargers'],
-    ['ram', 'Los Angeles Rams'],
-    ['rai', 'Las Vegas Raiders'],
-    ['mia', 'Miami Dolphins'],
-    ['min', 'Minnesota Vikings'],
-    ['nwe', 'New England Patriots'],
-    ['nor', 'New Orleans Saints'],
-    ['nyg', 'New York Giants'],
-    ['nyj', 'New York Jets'],
-    ['phi', 'Philadelphia Eagles'],
-    ['pit', 'Pittsburgh Steelers'],
-    ['sea', 'Seattle Seahawks'],
-    ['sfo', 'San Francisco 49ers'],
-    ['tam', 'Tampa Bay Buccaneers'],
-    ['oti', 'Tennessee Titans'],
-    ['was', 'Washington Commanders']
-]
-team_stats_headers = [
-    'Player', 'PF', 'Yds', 'Ply', 'Y/P', 'TO', 'FL', '1stD', 'Cmp', 'Att', 'Yds', 'TD', 'Int', 'NY/A',
-    '1stD', 'Att', 'Yds', 'TD', 'Y/A', '1stD', 'Pen', 'Yds', '1stPy', '#Dr', 'Sc%', 'TO%', 'Start', 'Time', 'Plays', 'Yds', 'Pts', 'Team'
-]
-for year in range(2010, 2026):
-    output_file = f'{data_dir}/all_teams_stats_{year}.csv'
-    
-    # Read existing data to check which teams already have data
-    existing_teams = set()
-    if os.path.exists(output_file):
-        try:
-            df_existing = pd.read_csv(output_file)
-            if 'Team' in df_existing.columns:
-                existing_teams = set(df_existing['Team'].unique())
-        except Exception:
-            pass
-    
-    # For 2010-2024: skip if all teams already have data
-    if year != 2025 and len(existing_teams) >= 32:
-        print(f"Skipping year {year}, all teams already have data.")
-        continue
-    
-    all_team_stats = []  
-    for team in teams:
-        abbreviation, name = team
-        # For 2010-2024: skip if team already has data
-        # For 2025: always process to get latest data
-        if year != 2025 and abbreviation in existing_teams:
-            print(f"Skipping {name} for {year}; data already exists.")
-            continue
-        print(f'Processing {name} for the year {year}')  
-        url = f'https://www.pro-football-reference.com/teams/{abbreviation}/{year}.htm'
-        
-        # Add retry logic for rate limiting
-        max_retries = 3
-        retry_delay = 10
-        for attempt in range(max_retries):
-            try:
-                response = get_with_backoff(url)
-                if response.status_code == 429:
-                    print(f'Rate limited for {name}. Waiting {retry_delay} seconds before retry {attempt + 1}/{max_retries}')
-                    sleep(retry_delay)
-                    retry_delay *= 2
+            warned_team_short = False
+            warned_opp_short = False
+            for table_id in game_log_ids:
+                table = tables.get(table_id)
+                if table is None:
+                    print(f'Table with id {table_id} not found on page {url} for {name} in {year}')
                     continue
-                elif response.status_code != 200:
-                    print(f'Failed to retrieve page {url} for {name} in {year}: {response.status_code}')
-                    break
-                else:
-                    break
-            except Exception as e:
-                print(f'Error retrieving {url}: {e}')
-                if attempt < max_retries - 1:
-                    sleep(retry_delay)
-                    retry_delay *= 2
+                tbody = table.body
+                if not tbody:
+                    print(f'No tbody found for table {table_id} on page {url} for {name} in {year}')
                     continue
-                else:
-                    break
-        
-        if response.status_code != 200:
-            continue
-            
-        soup = BeautifulSoup(response.content, 'lxml')
-        table = soup.find('table', {'id': 'team_stats'})
-        if table is None:
-            print(f'Team stats table not found on page {url} for {name} in {year}')
-            continue
-        tbody = table.find('tbody')
-        for tr in tbody.find_all('tr'):
-            row_data = [tr.find('th').text.strip()]  
-            row_data.extend([td.text.strip() for td in tr.find_all('td')])  
-            row_data.append(abbreviation)  
-            all_team_stats.append(row_data)
-        sleep(2.5)  # Increased delay to avoid rate limiting  
-        # sleep(5)  # Increased delay to avoid rate limiting  
-    
-    # Append new data to existing file
-    if all_team_stats:
-        mode = 'a' if os.path.exists(output_file) else 'w'
-        
-        # For 2025, remove existing rows for teams we're re-scraping
-        if year == 2025 and os.path.exists(output_file):
-            df_existing = pd.read_csv(output_file)
-            teams_to_update = {row[-1] for row in all_team_stats}  # Team is last column
-            df_existing = df_existing[~df_existing['Team'].isin(teams_to_update)]
-            df_existing.to_csv(output_file, index=False)
-            mode = 'a'
-        
-        with open(output_file, mode=mode, newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            if mode == 'w':
-                writer.writerow(team_stats_headers)
-            writer.writerows(all_team_stats)
-        print(f'Saved data for {len(all_team_stats)} teams for the year {year}')
 
+                game_logs = []
+                for tr in tbody:
+                    row_data = tr.values(strip=False)
+                    # Filter out empty rows
+                    if len(row_data) > 0:
+                        if table_id == 'table_pfr_team-year_game-logs_team-year-regular-season-game-log':
+                            if len(row_data) == 48:  # Expected: 48 total columns (including Rk)
+                                row_data.append(name)  # Add team name (now 49 total)
+                                game_logs.append(row_data)
+                            else:
+                                if not warned_team_short:
+                                    print(f"Warning: Team game log row has {len(row_data)} cells but expected 48")
+                                    warned_team_short = True
+                        elif table_id == 'table_pfr_team-year_game-logs_team-year-regular-season-opponent-game-log':
+                            if len(row_data) == 48:  # Expected: 48 total columns (including Rk)
+                                row_data.append(name)  # Add team name (now 49 total)
+                                opponent_writer.write(row_data)
+                            else:
+                                if not warned_opp_short:
+                                    print(f"Warning: Opponent game log row has {len(row_data)} cells but expected 48")
+                                    warned_opp_short = True
+                if table_id == 'table_pfr_team-year_game-logs_team-year-regular-season-game-log':
+                    team_writer.writerows(game_logs)
+                playoff_table = tables.get(playoff_table_id)
+                if playoff_table:
+                    playoff_tbody = playoff_table.body
+                    playoff_game_logs = []
+                    for tr in playoff_tbody:
+                        row_data = tr.values(strip=False)
+                        row_data.append(name)  
+                        playoff_game_logs.append(row_data)
+                    team_writer.writerows(playoff_game_logs)
+
+        team_writer.close()
+        opponent_writer.close()
+        print(f'Team game logs for {year}: {team_writer.appended} team rows and {opponent_writer.appended} opponent rows written')
+
+
+    ##### Create game_id in Game Logs #####
+    directory = 'data/SR-game-logs/'
+    df_list = []
+    for filename in os.listdir(directory):
+        if filename.endswith(".csv"):  
+            file_path = os.path.join(directory, filename)
+            season = filename.split('_')[-1].replace('.csv', '')
+            df = pd.read_csv(file_path)
+            df['season'] = season
+            df_list.append(df)
+    df = pd.concat(df_list, ignore_index=True)
+    team_abbreviation_map = {
+        'Arizona Cardinals': 'ARI',
+        'Atlanta Falcons': 'ATL',
+        'Baltimore Ravens': 'BAL',
+        'Buffalo Bills': 'BUF',
+        'Carolina Panthers': 'CAR',
+        'Chicago Bears': 'CHI',
+        'Cincinnati Bengals': 'CIN',
+        'Cleveland Browns': 'CLE',
+        'Dallas Cowboys': 'DAL',
+        'Denver Broncos': 'DEN',
+        'Detroit Lions': 'DET',
+        'Green Bay Packers': 'GB',
+        'Houston Texans': 'HOU',
+        'Indianapolis Colts': 'IND',
+        'Jacksonville Jaguars': 'JAX',
+        'Kansas City Chiefs': 'KC',
+        'Los Angeles Chargers': 'LAC',
+        'Los Angeles Rams': 'LAR',
+        'Las Vegas Raiders': 'LVR',
+        'Oakland Raiders': 'LVR',
+        'Miami Dolphins': 'MIA',
+        'Minnesota Vikings': 'MIN',
+        'New England Patriots': 'NE',
+        'New Orleans Saints': 'NO',
+        'New York Giants': 'NYG',
+        'New York Jets': 'NYJ',
+        'Philadelphia Eagles': 'PHI',
+        'Pittsburgh Steelers': 'PIT',
+        'Seattle Seahawks': 'SEA',
+        'San Francisco 49ers': 'SF',
+        'Tampa Bay Buccaneers': 'TB',
+        'Tennessee Titans': 'TEN',
+        'Washington Commanders': 'WAS',
+        'Washington Football Team': 'WAS',
+        'Washington Redskins': 'WAS',
+        'St. Louis Rams': 'LAR',
+        'San Diego Chargers': 'LAC'
+    }
 
-##### Merge Team Stats and Rankings #####
-input_dir = 'data/SR-team-stats/'
-csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
-dataframes = []
-for file in csv_files:
-    df = pd.read_csv(os.path.join(input_dir, file))
-    df['Year'] = file.split('_')[-1].split('.')[0]  # Extract year from filename
-    dataframes.append(df)
-merged_dataframe = pd.concat(dataframes, ignore_index=True)
-output_file = 'data/all_team_stats.csv'
-merged_dataframe.to_csv(output_file, index=False)
-print(f"Merged dataset saved as {output_file}")
+    # Mapping from Pro Football Reference abbreviations to our standardized abbreviations
+    pfr_to_standard_abbr = {
+        'ARI': 'ARI',
+        'ATL': 'ATL', 
+        'BAL': 'BAL',
+        'BUF': 'BUF',
+        'CAR': 'CAR',
+        'CHI': 'CHI',
+        'CIN': 'CIN',
+        'CLE': 'CLE',
+        'DAL': 'DAL',
+        'DEN': 'DEN',
+        'DET': 'DET',
+        'GNB': 'GB',   # Green Bay Packers
+        'HOU': 'HOU',
+        'IND': 'IND',
+        'JAX': 'JAX',
+        'KAN': 'KC',   # Kansas City Chiefs
+        'LA': 'LAR',   # LA → Los Angeles Rams
+        'LAC': 'LAC',
+        'LAR': 'LAR',
+        'LV': 'LVR',   # LV → Las Vegas Raiders
+        'LVR': 'LVR',
+        'MIA': 'MIA',
+        'MIN': 'MIN',
+        'NWE': 'NE',   # New England Patriots
+        'NOR': 'NO',   # New Orleans Saints
+        'NYG': 'NYG',
+        'NYJ': 'NYJ',
+        'OAK': 'LVR',  # Oakland Raiders → Las Vegas Raiders
+        'PHI': 'PHI',
+        'PIT': 'PIT',
+        'SD': 'LAC',   # San Diego Chargers → Los Angeles Chargers
+        'SDG': 'LAC',  # San Diego Chargers → Los Angeles Chargers (alternative)
+        'SEA': 'SEA',
+        'SF': 'SF',    # San Francisco 49ers
+        'SFO': 'SF',   # San Francisco 49ers (alternative)
+        'STL': 'LAR',  # St. Louis Rams → Los Angeles Rams
+        'TAM': 'TB',   # Tampa Bay Buccaneers
+        'TEN': 'TEN',
+        'WAS': 'WAS'
+    }
+    def determine_home_away(row):
+        if row['game_location'] == '@':
+            away_team = team_abbreviation_map[row['team_name']]
+            home_team = pfr_to_standard_abbr[row['opp']]
+        else:
+            home_team = team_abbreviation_map[row['team_name']]
+            away_team = pfr_to_standard_abbr[row['opp']]
+        return pd.Series([home_team, away_team])
+    df[['home_team_id', 'away_team_id']] = df.apply(determine_home_away, axis=1)
+    df['week_num'] = df['week'].astype(str).str.zfill(2)
+    df['game_id'] = df['season'] + '_' + df['week_num'] + '_' + df['away_team_id'] + '_' + df['home_team_id']
+    output_file_path_with_teams = 'data/all_team_game_logs.csv'
+    df.to_csv(output_file_path_with_teams, index=False)
+    print(f"Updated file with home and away teams saved to: {output_file_path_with_teams}")
+
+
+    ##### Aggregate all_game_logs.csv to Single Row Per Game #####
+    df = pd.read_csv('data/all_team_game_logs.csv')
+    grouped_df = df.groupby('game_id', group_keys=False).apply(lambda x: pd.Series({
+        'season': x['season'].iloc[0],  # Ensure the season is included from the first entry
+        'home_pts_off': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pts'].sum(),
+        'away_pts_off': x.loc[x['game_location'] == '@', 'pts'].sum(),
+        'home_pass_cmp': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_cmp'].sum(),
+        'away_pass_cmp': x.loc[x['game_location'] == '@', 'pass_cmp'].sum(),
+        'home_pass_att': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_att'].sum(),
+        'away_pass_att': x.loc[x['game_location'] == '@', 'pass_att'].sum(),
+        'home_pass_yds': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_yds'].sum(),
+        'away_pass_yds': x.loc[x['game_location'] == '@', 'pass_yds'].sum(),
+        'home_pass_td': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_td'].sum(),
+        'away_pass_td': x.loc[x['game_location'] == '@', 'pass_td'].sum(),
+        'home_pass_int': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'turnovers_int'].sum(),
+        'away_pass_int': x.loc[x['game_location'] == '@', 'turnovers_int'].sum(),
+        'home_pass_sacked': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_sk'].sum(),
+        'away_pass_sacked': x.loc[x['game_location'] == '@', 'pass_sk'].sum(),
+        'home_pass_yds_per_att': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_ya'].mean(),
+        'away_pass_yds_per_att': x.loc[x['game_location'] == '@', 'pass_ya'].mean(),
+        'home_pass_net_yds_per_att': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_aya'].mean(),
+        'away_pass_net_yds_per_att': x.loc[x['game_location'] == '@', 'pass_aya'].mean(),
+        'home_pass_cmp_perc': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_cmp_pct'].mean(),
+        'away_pass_cmp_perc': x.loc[x['game_location'] == '@', 'pass_cmp_pct'].mean(),
+        'home_pass_rating': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'pass_rate'].mean(),
+        'away_pass_rating': x.loc[x['game_location'] == '@', 'pass_rate'].mean(),
+        'home_rush_att': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'rush_att'].sum(),
+        'away_rush_att': x.loc[x['game_location'] == '@', 'rush_att'].sum(),
+        'home_rush_yds': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'rush_yds'].sum(),
+        'away_rush_yds': x.loc[x['game_location'] == '@', 'rush_yds'].sum(),
+        'home_rush_yds_per_att': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'rush_ya'].mean(),
+        'away_rush_yds_per_att': x.loc[x['game_location'] == '@', 'rush_ya'].mean(),
+        'home_rush_td': x.loc[x['game_location'].isnull() | (x['game_location'] == ''), 'rush_td'].sum(),
+        'away_rush_td': x.loc[x['game_location'] == '@', 'rush_td'].sum(),
+    }))
+    grouped_df.to_csv('data/all_team_game_logs.csv', index=True)
+    dataset.write_dataset('team_game_logs', grouped_df.reset_index(), 'season')
+    watermarks.commit('team_game_logs', missed=missed)
 
 
-##### Schedule & Game Results #####
-print("\n" + "*"*80 + "\n")
-data_dir = './data/SR-schedule-and-game-results'
-os.makedirs(data_dir, exist_ok=True)
-teams = [
-    ['crd', 'Arizona Cardinals'],
-    ['atl', 'Atlanta Falcons'],
-    ['rav', 'Baltimore Ravens'],
-    ['buf', 'Buffalo Bills'],
-    ['car', 'Carolina Panthers'],
-    ['chi', 'Chicago Bears'],
-    ['cin', 'Cincinnati Bengals'],
-    ['cle', 'Cleveland Browns'],
-    ['dal', 'Dallas Cowboys'],
-    ['den', 'Denver Broncos'],
-    ['det', 'Detroit Lions'],
-    ['gnb', 'Green Bay Packers'],
-    ['htx', 'Houston Texans'],
-    ['clt', 'Indianapolis Colts'],
-    ['jax', 'Jacksonville Jaguars'],
-    ['kan', 'Kansas City Chiefs'],
-    ['sdg', 'Los Angeles Chargers'],
-    ['ram', 'Los Angeles Rams'],
-    ['rai', 'Las Vegas Raiders'],
-    ['mia', 'Miami Dolphins'],
-    ['min', 'Minnesota Vikings'],
-    ['nwe', 'New England Patriots'],
-    ['nor', 'New Orleans Saints'],
-    ['nyg', 'New York Giants'],
-    ['nyj', 'New York Jets'],
-    ['phi', 'Philadelphia Eagles'],
-    ['pit', 'Pittsburgh Steelers'],
-    ['sea', 'Seattle Seahawks'],
-    ['sfo', 'San Francisco 49ers'],
-    ['tam', 'Tampa Bay Buccaneers'],
-    ['oti', 'Tennessee Titans'],
-    ['was', 'Washington Commanders']
-]
-schedule_headers = [
-    'Week', 'Day', 'Date', 'Time', 'Boxscore', 'Outcome', 'OT', 'Rec', 'Home/Away', 'Opp', 
-    'Tm', 'OppPts', '1stD', 'TotYd', 'PassY', 'RushY', 'TO_lost', 
-    'Opp1stD', 'OppTotYd', 'OppPassY', 'OppRushY', 'TO_won',
-    'Offense', 'Defense', 'Sp. Tms'
-]
-for year in range(2010, 2026):
-    all_games = []  
-    for team in teams:
-        abbreviation, name = team
-        print(f'Processing {name} for the year {year}')  
-        url = f'https://www.pro-football-reference.com/teams/{abbreviation}/{year}.htm'
-        team_file_path = f'{data_dir}/{abbreviation}_{year}_schedule_and_game_results.csv'
-        
-        # Read existing data to check which weeks already have data
-        existing_weeks = set()
-        if os.path.exists(team_file_path):
-            try:
-                df_existing = pd.read_csv(team_file_path)
-                if 'Week' in df_existing.columns:
-                    existing_weeks = set(df_existing['Week'].astype(str).unique())
-            except Exception:
-                pass
-        
-        # For 2010-2024: skip if team already has data
-        # For 2025: always process to get latest data (will check individual weeks)
-        if year != 2025 and os.path.exists(team_file_path) and len(existing_weeks) > 0:
-            print(f"Skipping schedule for {name} {year}; file already exists.")
+##### Team Stats and Rankings #####
+@pipeline.task('team_stats', deps=['games'], inputs=['data/games.csv'], outputs=['data/all_team_stats.csv'])
+def team_stats():
+    print("\n" + "*"*80 + "\n")
+    data_dir = './data/SR-team-stats'
+    os.makedirs(data_dir, exist_ok=True)
+    teams = [
+        ['crd', 'Arizona Cardinals'],
+        ['atl', 'Atlanta Falcons'],
+        ['rav', 'Baltimore Ravens'],
+        ['buf', 'Buffalo Bills'],
+        ['car', 'Carolina Panthers'],
+        ['chi', 'Chicago Bears'],
+        ['cin', 'Cincinnati Bengals'],
+        ['cle', 'Cleveland Browns'],
+        ['dal', 'Dallas Cowboys'],
+        ['den', 'Denver Broncos'],
+        ['det', 'Detroit Lions'],
+        ['gnb', 'Green Bay Packers'],
+        ['htx', 'Houston Texans'],
+        ['clt', 'Indianapolis Colts'],
+        ['jax', 'Jacksonville Jaguars'],
+        ['kan', 'Kansas City Chiefs'],
+        ['sdg', 'Los Angeles Chargers'],
+        ['ram', 'Los Angeles Rams'],
+        ['rai', 'Las Vegas Raiders'],
+        ['mia', 'Miami Dolphins'],
+        ['min', 'Minnesota Vikings'],
+        ['nwe', 'New England Patriots'],
+        ['nor', 'New Orleans Saints'],
+        ['nyg', 'New York Giants'],
+        ['nyj', 'New York Jets'],
+        ['phi', 'Philadelphia Eagles'],
+        ['pit', 'Pittsburgh Steelers'],
+        ['sea', 'Seattle Seahawks'],
+        ['sfo', 'San Francisco 49ers'],
+        ['tam', 'Tampa Bay Buccaneers'],
+        ['oti', 'Tennessee Titans'],
+        ['was', 'Washington Commanders']
+    ]
+    team_stats_headers = [
+        'Player', 'PF', 'Yds', 'Ply', 'Y/P', 'TO', 'FL', '1stD', 'Cmp', 'Att', 'Yds', 'TD', 'Int', 'NY/A',
+        '1stD', 'Att', 'Yds', 'TD', 'Y/A', '1stD', 'Pen', 'Yds', '1stPy', '#Dr', 'Sc%', 'TO%', 'Start', 'Time', 'Plays', 'Yds', 'Pts', 'Team'
+    ]
+    games_rows = load_games()
+    delta = watermarks.delta('team_stats', games_rows)
+    missed = set()
+    team_seasons = delta.team_seasons() if delta is not None else None
+    for year in (range(2010, 2026) if delta is None else delta.seasons()):
+        output_file = f'{data_dir}/all_teams_stats_{year}.csv'
+
+        # Read existing data once to check which teams already have data
+        stats_writer = AppendOnlyCSV(output_file, team_stats_headers, key=['Team', 'Player'],
+                                     replace=not existing_output(output_file))
+        existing_teams = stats_writer.distinct('Team')
+
+        # For 2010-2024: skip if all teams already have data
+        if delta is None and year != 2025 and len(existing_teams) >= 32:
+            print(f"Skipping year {year}, all teams already have data.")
             continue
-        
-        # Add retry logic for rate limiting (same pattern as other scrapers)
-        max_retries = 3
-        retry_delay = 10
-        response = None
-        
-        for attempt in range(max_retries):
-            try:
-                response = get_with_backoff(url, timeout=10)
-                if response.status_code == 429:
-                    print(f'Rate limited for {name}. Waiting {retry_delay} seconds before retry {attempt + 1}/{max_retries}')
-                    sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                    continue
-                elif response.status_code != 200:
-                    print(f'Failed to retrieve page {url} for {name} in {year}: {response.status_code}')
-                    break
-                else:
-                    break
-            except Exception as e:
-                print(f'Error retrieving {url}: {e}')
-                if attempt < max_retries - 1:
-                    sleep(retry_delay)
-                    retry_delay *= 2
+
+        all_team_stats = []  
+        targets = {}
+        for team in teams:
+            abbreviation, name = team
+            # For 2010-2024: skip if team already has data
+            # For 2025: always process to get latest data
+            if team_seasons is not None:
+                if (year, abbreviation) not in team_seasons:
                     continue
-                else:
-                    break
-        
-        if response is None or response.status_code != 200:
-            continue
-            
-        soup = BeautifulSoup(response.content, 'lxml')
-        table = soup.find('table', {'id': 'games'})
-        
-        if table is None:
-            print(f'Schedule & Game Results table not found on page {url} for {name} in {year}')
-            sleep(2.5)
-            continue
-            
-        tbody = table.find('tbody')
-        if tbody is None:
-            print(f'No tbody found for games table on page {url} for {name} in {year}')
-            sleep(2.5)
-            continue
-            
-        team_games = []  
-        for tr in tbody.find_all('tr'):
-            row_data = []
-            week_th = tr.find('th', {'data-stat': 'week_num'})
-            week_num = week_th.text.strip() if week_th else ''
-            row_data.append(week_num)
-            
-            # For 2025: skip if week already exists
-            #if year == 2025 and week_num in existing_weeks:
-            #    continue
-            
-            for td in tr.find_all('td'):
-                row_data.append(td.text.strip())
-            
-            # Ensure we have the right number of columns
-            if len(row_data) != len(schedule_headers):
-                row_data += [''] * (len(schedule_headers) - len(row_data))
-            
-            team_games.append(row_data)
-            all_games.append(row_data)  
-        
-        # Save individual team file (append new weeks for 2025, overwrite for historical)
-        if team_games:
-            mode = 'a' if (year == 2025 and os.path.exists(team_file_path)) else 'w'
-            
-            # For 2025, remove existing rows for weeks we're re-scraping
-            if year == 2025 and os.path.exists(team_file_path) and mode == 'a':
-                df_existing = pd.read_csv(team_file_path)
-                weeks_to_update = {row[0] for row in team_games}  # Week is first column
-                df_existing = df_existing[~df_existing['Week'].astype(str).isin(weeks_to_update)]
-                df_existing.to_csv(team_file_path, index=False)
-                mode = 'a'
-            
-            with open(team_file_path, mode=mode, newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                if mode == 'w':
-                    writer.writerow(schedule_headers)
-                writer.writerows(team_games)
-        
-        print(f'Saved schedule data for {name} for the year {year}')
-        sleep(2.5)  # Rate limiting delay
-
-# Merge all team files
-print(f"\nMerging all team files...")
-all_games = []
-for filename in os.listdir(data_dir):
-    if filename.endswith("_schedule_and_game_results.csv"):
-        team_abbr = filename.split('_')[0]
-        season_year = filename.split('_')[1]
-        file_path = os.path.join(data_dir, filename)
-        df = pd.read_csv(file_path)
-        df['Team'] = team_abbr
-        df['Season'] = season_year
-        all_games.append(df)
-
-if all_games:
-    merged_df = pd.concat(all_games, ignore_index=True)
-    # Save to subdirectory
-    merged_output_path = os.path.join(data_dir, 'all_teams_schedule_and_game_results_merged.csv')
-    merged_df.to_csv(merged_output_path, index=False)
-    print(f"Successfully merged all team files into {merged_output_path}")
-    # Also save to main data directory
-    main_data_path = 'data/all_teams_schedule_and_game_results_merged.csv'
-    merged_df.to_csv(main_data_path, index=False)
-    print(f"Also saved to main data directory: {main_data_path}")
-    print(f"Total records: {len(merged_df)}")
-else:
-    print("No team files found to merge")
+            elif year != 2025 and abbreviation in existing_teams:
+                print(f"Skipping {name} for {year}; data already exists.")
+                continue
+            url = f'https://www.pro-football-reference.com/teams/{abbreviation}/{year}.htm'
+            targets[url] = team
+        for url, table in parse_pool.map(fetcher.map(targets), partial(extract_table, table_id='team_stats')):
+            abbreviation, name = targets[url]
+            print(f'Processing {name} for the year {year}')  
+            if table is None:
+                print(f'Team stats table not found on page {url} for {name} in {year}')
+                missed.update(team_season_games(games_rows, year, abbreviation))
+                continue
+            for tr in table.body:
+                row_data = [tr.first('th').text.strip()]  
+                row_data.extend(tr.values(['td']))  
+                row_data.append(abbreviation)  
+                all_team_stats.append(row_data)
+                stats_writer.write(row_data)
+
+        # New and changed rows were appended above; compact the file once
+        stats_writer.close()
+        if all_team_stats:
+            print(f'Saved data for {len(all_team_stats)} teams for the year {year} ({stats_writer.appended} rows written)')
+
+
+    ##### Merge Team Stats and Rankings #####
+    input_dir = 'data/SR-team-stats/'
+    csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
+    dataframes = []
+    for file in csv_files:
+        df = pd.read_csv(os.path.join(input_dir, file))
+        df['Year'] = file.split('_')[-1].split('.')[0]  # Extract year from filename
+        dataframes.append(df)
+    merged_dataframe = pd.concat(dataframes, ignore_index=True)
+    output_file = 'data/all_team_stats.csv'
+    merged_dataframe.to_csv(output_file, index=False)
+    print(f"Merged dataset saved as {output_file}")
+    dataset.write_dataset('team_stats', merged_dataframe, 'Year')
+    watermarks.commit('team_stats', missed=missed)
+
+
+##### Schedule & Game Results #####
+@pipeline.task('schedule', deps=['games'], inputs=['data/games.csv'], outputs=['data/all_teams_schedule_and_game_results_merged.csv'])
+def schedule():
+    print("\n" + "*"*80 + "\n")
+    data_dir = './data/SR-schedule-and-game-results'
+    os.makedirs(data_dir, exist_ok=True)
+    teams = [
+        ['crd', 'Arizona Cardinals'],
+        ['atl', 'Atlanta Falcons'],
+        ['rav', 'Baltimore Ravens'],
+        ['buf', 'Buffalo Bills'],
+        ['car', 'Carolina Panthers'],
+        ['chi', 'Chicago Bears'],
+        ['cin', 'Cincinnati Bengals'],
+        ['cle', 'Cleveland Browns'],
+        ['dal', 'Dallas Cowboys'],
+        ['den', 'Denver Broncos'],
+        ['det', 'Detroit Lions'],
+        ['gnb', 'Green Bay Packers'],
+        ['htx', 'Houston Texans'],
+        ['clt', 'Indianapolis Colts'],
+        ['jax', 'Jacksonville Jaguars'],
+        ['kan', 'Kansas City Chiefs'],
+        ['sdg', 'Los Angeles Chargers'],
+        ['ram', 'Los Angeles Rams'],
+        ['rai', 'Las Vegas Raiders'],
+        ['mia', 'Miami Dolphins'],
+        ['min', 'Minnesota Vikings'],
+        ['nwe', 'New England Patriots'],
+        ['nor', 'New Orleans Saints'],
+        ['nyg', 'New York Giants'],
+        ['nyj', 'New York Jets'],
+        ['phi', 'Philadelphia Eagles'],
+        ['pit', 'Pittsburgh Steelers'],
+        ['sea', 'Seattle Seahawks'],
+        ['sfo', 'San Francisco 49ers'],
+        ['tam', 'Tampa Bay Buccaneers'],
+        ['oti', 'Tennessee Titans'],
+        ['was', 'Washington Commanders']
+    ]
+    schedule_headers = [
+        'Week', 'Day', 'Date', 'Time', 'Boxscore', 'Outcome', 'OT', 'Rec', 'Home/Away', 'Opp', 
+        'Tm', 'OppPts', '1stD', 'TotYd', 'PassY', 'RushY', 'TO_lost', 
+        'Opp1stD', 'OppTotYd', 'OppPassY', 'OppRushY', 'TO_won',
+        'Offense', 'Defense', 'Sp. Tms'
+    ]
+    games_rows = load_games()
+    delta = watermarks.delta('schedule', games_rows)
+    missed = set()
+    team_seasons = delta.team_seasons() if delta is not None else None
+    for year in (range(2010, 2026) if delta is None else delta.seasons()):
+        all_games = []  
+        targets = {}
+        for team in teams:
+            abbreviation, name = team
+            if team_seasons is not None and (year, abbreviation) not in team_seasons:
+                continue
+            url = f'https://www.pro-football-reference.com/teams/{abbreviation}/{year}.htm'
+            team_file_path = f'{data_dir}/{abbreviation}_{year}_schedule_and_game_results.csv'
+
+            # Read existing data once to check which weeks already have data
+            schedule_writer = AppendOnlyCSV(team_file_path, schedule_headers, key=['Week'],
+                                            replace=not existing_output(team_file_path))
+            existing_weeks = schedule_writer.distinct('Week')
+
+            # For 2010-2024: skip if team already has data
+            # For 2025: always process to get latest data (will check individual weeks)
+            if team_seasons is None and year != 2025 and existing_output(team_file_path) and len(existing_weeks) > 0:
+                print(f"Skipping schedule for {name} {year}; file already exists.")
+                continue
+            targets[url] = (abbreviation, name, schedule_writer)
+        for url, table in parse_pool.map(fetcher.map(targets, timeout=10), partial(extract_table, table_id='games')):
+            abbreviation, name, schedule_writer = targets[url]
+            print(f'Processing {name} for the year {year}')  
+            if table is None:
+                print(f'Schedule & Game Results table not found on page {url} for {name} in {year}')
+                missed.update(team_season_games(games_rows, year, abbreviation))
+                continue
+
+            tbody = table.body
+            if not tbody:
+                print(f'No tbody found for games table on page {url} for {name} in {year}')
+                missed.update(team_season_games(games_rows, year, abbreviation))
+                continue
+
+            team_games = []  
+            for tr in tbody:
+                row_data = []
+                week_th = tr.first('th', stat='week_num')
+                week_num = week_th.text.strip() if week_th else ''
+                row_data.append(week_num)
+
+                # For 2025: skip if week already exists
+                #if year == 2025 and week_num in existing_weeks:
+                #    continue
+
+                row_data.extend(tr.values(['td']))
+
+                # Ensure we have the right number of columns
+                if len(row_data) != len(schedule_headers):
+                    row_data += [''] * (len(schedule_headers) - len(row_data))
+
+                team_games.append(row_data)
+                all_games.append(row_data)  
+
+            # Save individual team file: new and changed weeks are appended, then the
+            # file is compacted once, keeping the schedule order
+            schedule_writer.writerows(team_games)
+            schedule_writer.close(sort=False)
+
+            print(f'Saved schedule data for {name} for the year {year}')
+
+    # Merge all team files
+    print(f"\nMerging all team files...")
+    all_games = []
+    for filename in os.listdir(data_dir):
+        if filename.endswith("_schedule_and_game_results.csv"):
+            team_abbr = filename.split('_')[0]
+            season_year = filename.split('_')[1]
+            file_path = os.path.join(data_dir, filename)
+            df = pd.read_csv(file_path)
+            df['Team'] = team_abbr
+            df['Season'] = season_year
+            all_games.append(df)
+
+    if all_games:
+        merged_df = pd.concat(all_games, ignore_index=True)
+        # Save to subdirectory
+        merged_output_path = os.path.join(data_dir, 'all_teams_schedule_and_game_results_merged.csv')
+        merged_df.to_csv(merged_output_path, index=False)
+        print(f"Successfully merged all team files into {merged_output_path}")
+        # Also save to main data directory
+        main_data_path = 'data/all_teams_schedule_and_game_results_merged.csv'
+        merged_df.to_csv(main_data_path, index=False)
+        print(f"Also saved to main data directory: {main_data_path}")
+        dataset.write_dataset('schedule', merged_df, 'Season')
+        watermarks.commit('schedule', missed=missed)
+        print(f"Total records: {len(merged_df)}")
+    else:
+        print("No team files found to merge")
 
 
 ##### Team Conversions #####
-print("\n" + "*"*80 + "\n")
-data_dir = './data/SR-team-conversions'
-os.makedirs(data_dir, exist_ok=True)
-teams = [
-    ['crd', 'Arizona Cardinals'],
-    ['atl', 'Atlanta Falcons'],
-    ['rav', 'Baltimore Ravens'],
-    ['buf', 'Buffalo Bills'],
-    ['car', 'Carolina Panthers'],
-    ['chi', 'Chicago Bears'],
-    ['cin', 'Cincinnati Bengals'],
-    ['cle', 'Cleveland Browns'],
-    ['dal', 'Dallas Cowboys'],
-    ['den', 'Denver Broncos'],
-    ['det', 'Detroit Lions'],
-    ['gnb', 'Green Bay Packers'],
-    ['htx', 'Houston Texans'],
-    ['clt', 'Indianapolis Colts'],
-    ['jax', 'Jacksonville Jaguars'],
-    ['kan', 'Kansas City Chiefs'],
-    ['sdg', 'Los Angeles Chargers'],
-    ['ram', 'Los Angeles Rams'],
-    ['rai', 'Las Vegas Raiders'],
-    ['mia', 'Miami Dolphins'],
-    ['min', 'Minnesota Vikings'],
-    ['nwe', 'New England Patriots'],
-    ['nor', 'New Orleans Saints'],
-    ['nyg', 'New York Giants'],
-    ['nyj', 'New York Jets'],
-    ['phi', 'Philadelphia Eagles'],
-    ['pit', 'Pittsburgh Steelers'],
-    ['sea', 'Seattle Seahawks'],
-    ['sfo', 'San Francisco 49ers'],
-    ['tam', 'Tampa Bay Buccaneers'],
-    ['oti', 'Tennessee Titans'],
-    ['was', 'Washington Commanders']
-]
-team_conversions_headers = [
-    'Player', '3DAtt', '3DConv', '4DAtt', '4DConv', '4D%', 'RZAtt', 'RZTD', 'RZPct', 'Team'
-    # 'Player', '3DAtt', '3DConv', '3D%', '4DAtt', '4DConv', '4D%', 'RZAtt', 'RZTD', 'RZPct', 'Team'
-]
-for year in range(2010, 2026):
-    for team in teams:
-        abbreviation, name = team
-        team_file = f'{data_dir}/{abbreviation}_{year}_team_conversions.csv'
-        
-        # For 2010-2024: skip if file already exists
-        # For 2025: always process to get latest data
-        if year != 2025 and os.path.exists(team_file):
-            print(f"Skipping team conversions for {name} {year}; file already exists.")
-            continue
-        print(f'Processing {name} for the year {year}')  
-        url = f'https://www.pro-football-reference.com/teams/{abbreviation}/{year}.htm'
-        # Add retry logic consistent with other sections
-        max_retries = 3
-        retry_delay = 10
-        response = None
-        for attempt in range(max_retries):
-            try:
-                response = get_with_backoff(url, timeout=10)
-                if response.status_code == 429:
-                    print(f'Rate limited for {name}. Waiting {retry_delay} seconds before retry {attempt + 1}/{max_retries}')
-                    sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                elif response.status_code != 200:
-                    print(f'Failed to retrieve page {url} for {name} in {year}: {response.status_code}')
-                    break
-                else:
-                    break
-            except Exception as e:
-                print(f'Error retrieving {url}: {e}')
-                if attempt < max_retries - 1:
-                    sleep(retry_delay)
-                    retry_delay *= 2
+@pipeline.task('team_conversions', deps=['games'], inputs=['data/games.csv'], outputs=['data/all_team_conversions.csv'])
+def team_conversions():
+    print("\n" + "*"*80 + "\n")
+    data_dir = './data/SR-team-conversions'
+    os.makedirs(data_dir, exist_ok=True)
+    teams = [
+        ['crd', 'Arizona Cardinals'],
+        ['atl', 'Atlanta Falcons'],
+        ['rav', 'Baltimore Ravens'],
+        ['buf', 'Buffalo Bills'],
+        ['car', 'Carolina Panthers'],
+        ['chi', 'Chicago Bears'],
+        ['cin', 'Cincinnati Bengals'],
+        ['cle', 'Cleveland Browns'],
+        ['dal', 'Dallas Cowboys'],
+        ['den', 'Denver Broncos'],
+        ['det', 'Detroit Lions'],
+        ['gnb', 'Green Bay Packers'],
+        ['htx', 'Houston Texans'],
+        ['clt', 'Indianapolis Colts'],
+        ['jax', 'Jacksonville Jaguars'],
+        ['kan', 'Kansas City Chiefs'],
+        ['sdg', 'Los Angeles Chargers'],
+        ['ram', 'Los Angeles Rams'],
+        ['rai', 'Las Vegas Raiders'],
+        ['mia', 'Miami Dolphins'],
+        ['min', 'Minnesota Vikings'],
+        ['nwe', 'New England Patriots'],
+        ['nor', 'New Orleans Saints'],
+        ['nyg', 'New York Giants'],
+        ['nyj', 'New York Jets'],
+        ['phi', 'Philadelphia Eagles'],
+        ['pit', 'Pittsburgh Steelers'],
+        ['sea', 'Seattle Seahawks'],
+        ['sfo', 'San Francisco 49ers'],
+        ['tam', 'Tampa Bay Buccaneers'],
+        ['oti', 'Tennessee Titans'],
+        ['was', 'Washington Commanders']
+    ]
+    team_conversions_headers = [
+        'Player', '3DAtt', '3DConv', '4DAtt', '4DConv', '4D%', 'RZAtt', 'RZTD', 'RZPct', 'Team'
+        # 'Player', '3DAtt', '3DConv', '3D%', '4DAtt', '4DConv', '4D%', 'RZAtt', 'RZTD', 'RZPct', 'Team'
+    ]
+    games_rows = load_games()
+    delta = watermarks.delta('team_conversions', games_rows)
+    missed = set()
+    team_seasons = delta.team_seasons() if delta is not None else None
+    for year in (range(2010, 2026) if delta is None else delta.seasons()):
+        targets = {}
+        for team in teams:
+            abbreviation, name = team
+            team_file = f'{data_dir}/{abbreviation}_{year}_team_conversions.csv'
+
+            # For 2010-2024: skip if file already exists
+            # For 2025: always process to get latest data
+            # --delta: only the teams that played a new or corrected game
+            if team_seasons is not None:
+                if (year, abbreviation) not in team_seasons:
                     continue
-                else:
-                    break
-        if response is None or response.status_code != 200:
-            continue
-        soup = BeautifulSoup(response.content, 'lxml')
-        table = soup.find('table', {'id': 'team_conversions'})
-        if table is None:
-            print(f'Team Conversions table not found on page {url} for {name} in {year}')
-            sleep(2.5)
-            continue
-        all_conversions = []
-        tbody = table.find('tbody')
-        for tr in tbody.find_all('tr'):
-            row_data = [td.text.strip() for td in tr.find_all(['th', 'td'])]  
-            row_data.append(abbreviation)  
-            all_conversions.append(row_data)
-        
-        # For 2025, overwrite to get latest data; for historical, write new file
-        mode = 'w'  # Always overwrite since this is season totals, not per-game
-        with open(team_file, mode=mode, newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            writer.writerow(team_conversions_headers)
-            writer.writerows(all_conversions)
-        print(f'Saved team conversions data for {name} for the year {year} to {team_file}')
-        sleep(3)  
-
-##### Merge Team Conversions #####
-input_dir = 'data/SR-team-conversions/'
-csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
-dataframes = []
-for file in csv_files:
-    df = pd.read_csv(os.path.join(input_dir, file))
-    df['Year'] = file.split('_')[1]  # Extract year from filename
-    dataframes.append(df)
-merged_dataframe = pd.concat(dataframes, ignore_index=True)
-output_file = 'data/all_team_conversions.csv'
-merged_dataframe.to_csv(output_file, index=False)
-print(f"Merged dataset saved as {output_file}")
-
-
-##### Creating home_spread, away_spread, team_favorite columns in nfl.db #####
-print("\n" + "*"*80 + "\n")
-def calculate_spreads_and_favorite(spread_line, home_team, away_team, home_score, away_score):
-    if spread_line is None or home_score is None or away_score is None:
-        return "N/A", "N/A", "N/A", "N/A"
-    spread_line = float(spread_line)
-    abs_spread = abs(spread_line)  
-    if spread_line > 0:
-        home_spread = f"-{spread_line}"  
-        away_spread = f"+{spread_line}"  
-        team_favorite = home_team
-        if home_score > away_score + abs_spread:
-            team_covered = home_team
-        elif away_score > home_score - abs_spread:
-            team_covered = away_team
-        else:
-            team_covered = "Push"
-    else:
-        home_spread = f"+{-spread_line}"  
-        away_spread = f"-{-spread_line}"  
-        team_favorite = away_team
-        if away_score > home_score + abs_spread:
-            team_covered = away_team
-        elif home_score > away_score - abs_spread:
-            team_covered = home_team
-        else:
-            team_covered = "Push"
-    return home_spread, away_spread, team_favorite, team_covered
-db_path = 'nfl.db'  
-conn = sqlite3.connect(db_path)
-cursor = conn.cursor()
-try:
-    cursor.execute("ALTER TABLE Games ADD COLUMN home_spread TEXT;")
-except sqlite3.OperationalError:
-    pass  
-try:
-    cursor.execute("ALTER TABLE Games ADD COLUMN away_spread TEXT;")
-except sqlite3.OperationalError:
-    pass  
-try:
-    cursor.execute("ALTER TABLE Games ADD COLUMN team_favorite TEXT;")
-except sqlite3.OperationalError:
-    pass  
-try:
-    cursor.execute("ALTER TABLE Games ADD COLUMN team_covered TEXT;")
-except sqlite3.OperationalError:
-    pass  
-cursor.execute("SELECT game_id, spread_line, home_team, away_team, home_score, away_score FROM Games;")
-games = cursor.fetchall()
-for game in games:
-    game_id, spread_line, home_team, away_team, home_score, away_score = game
-    home_spread, away_spread, team_favorite, team_covered = calculate_spreads_and_favorite(spread_line, home_team, away_team, home_score, away_score)
-    update_query = "UPDATE Games SET home_spread = ?, away_spread = ?, team_favorite = ?, team_covered = ? WHERE game_id = ?;"
-    cursor.execute(update_query, (home_spread, away_spread, team_favorite, team_covered, game_id))
-conn.commit()
-conn.close()
-print("Columns 'home_spread', 'away_spread', 'team_favorite', and 'team_covered' have been added and updated for all rows in the 'Games' table.")
+            elif year != 2025 and existing_output(team_file):
+                print(f"Skipping team conversions for {name} {year}; file already exists.")
+                continue
+            url = f'https://www.pro-football-reference.com/teams/{abbreviation}/{year}.htm'
+            targets[url] = (abbreviation, name, team_file)
+        for url, table in parse_pool.map(fetcher.map(targets, timeout=10), partial(extract_table, table_id='team_conversions')):
+            abbreviation, name, team_file = targets[url]
+            print(f'Processing {name} for the year {year}')  
+            if table is None:
+                print(f'Team Conversions table not found on page {url} for {name} in {year}')
+                missed.update(team_season_games(games_rows, year, abbreviation))
+                continue
+            all_conversions = []
+            for tr in table.body:
+                row_data = tr.values()  
+                row_data.append(abbreviation)  
+                all_conversions.append(row_data)
+
+            # For 2025, overwrite to get latest data; for historical, write new file
+            mode = 'w'  # Always overwrite since this is season totals, not per-game
+            with open(team_file, mode=mode, newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                writer.writerow(team_conversions_headers)
+                writer.writerows(all_conversions)
+            print(f'Saved team conversions data for {name} for the year {year} to {team_file}')
+
+    ##### Merge Team Conversions #####
+    input_dir = 'data/SR-team-conversions/'
+    csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
+    dataframes = []
+    for file in csv_files:
+        df = pd.read_csv(os.path.join(input_dir, file))
+        df['Year'] = file.split('_')[1]  # Extract year from filename
+        dataframes.append(df)
+    merged_dataframe = pd.concat(dataframes, ignore_index=True)
+    output_file = 'data/all_team_conversions.csv'
+    merged_dataframe.to_csv(output_file, index=False)
+    print(f"Merged dataset saved as {output_file}")
+    dataset.write_dataset('team_conversions', merged_dataframe, 'Year')
+    watermarks.commit('team_conversions', missed=missed)
+
+
+##### Game outcomes (spreads, favorite, ATS and O/U results, implied totals) in nfl.db #####
+@pipeline.task('game_outcomes', deps=['games'], inputs=['data/games.csv'], resources=['nfl.db'], pure=True)
+def outcomes():
+    print("\n" + "*"*80 + "\n")
+    # One columnar pass over every game; the apps read these columns from Games
+    # instead of re-deriving spreads and ATS/O-U results row by row.
+    with db.connect() as conn:
+        df_games = pd.read_sql_query(
+            "SELECT game_id, spread_line, total_line, home_team, away_team, home_score, away_score FROM Games", conn)
+        df_outcomes = pd.concat([df_games[['game_id']], game_outcomes(df_games)], axis=1)
+        changed = db.upsert(conn, 'Games', df_outcomes, key=['game_id'])
+    conn.close()
+    print(f"Outcome columns ({', '.join(OUTCOME_COLUMNS)}) updated in the 'Games' table ({changed} rows changed).")
 
 
 ##### Passing/Rushing/Receiving #####
-print("\n" + "*"*80 + "\n")
-os.makedirs('./data/SR-passing-rushing-receiving-game-logs/', exist_ok=True)
-for year_to_scrape in range(2010, 2026):
-    output_filename = f'./data/SR-passing-rushing-receiving-game-logs/all_passing_rushing_receiving_{year_to_scrape}.csv'
-    existing_game_ids = set()
-    if os.path.exists(output_filename):
-        df_existing = pd.read_csv(output_filename)
-        if 'game_id' in df_existing.columns:
-            existing_game_ids = set(df_existing['game_id'].unique())
-        else:
-            print(f"Found existing PRR file for {year_to_scrape}, will append any missing games.")
-    mode = 'a' if os.path.exists(output_filename) else 'w'
-    with open(output_filename, mode, newline='') as output_csvfile:
-        csvwriter = csv.writer(output_csvfile)
-        if mode == 'w':
-            csvwriter.writerow([
-                'player', 'player_id', 'team', 'pass_cmp', 'pass_att', 'pass_yds', 'pass_td', 'pass_int', 
-                'pass_sacked', 'pass_sacked_yds', 'pass_long', 'pass_rating', 'rush_att', 'rush_yds', 'rush_td', 
-                'rush_long', 'targets', 'rec', 'rec_yds', 'rec_td', 'rec_long', 'fumbles', 'fumbles_lost', 'game_id'
-            ])  
-        with open('./data/games.csv', 'r') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = []
-            now_dt = datetime.now()
-            for row in reader:
-                try:
-                    game_dt = datetime.fromisoformat(row['date'])
-                except Exception:
-                    continue
-                if int(row['game_id'].split('_')[0]) == year_to_scrape and game_dt <= now_dt:
-                    rows.append(row)
+@pipeline.task('passing_rushing_receiving', deps=['games', 'rosters'], inputs=['data/games.csv', 'data/rosters.csv'],
+               outputs=['data/all_passing_rushing_receiving.csv', 'data/all_passing_rushing_receiving_pfr_clean.csv'])
+def passing_rushing_receiving():
+    print("\n" + "*"*80 + "\n")
+    os.makedirs('./data/SR-passing-rushing-receiving-game-logs/', exist_ok=True)
+    games_rows = load_games()
+    delta = watermarks.delta('passing_rushing_receiving', games_rows)
+    missed = set()
+    for year_to_scrape in (range(2010, 2026) if delta is None else delta.seasons()):
+        output_filename = f'./data/SR-passing-rushing-receiving-game-logs/all_passing_rushing_receiving_{year_to_scrape}.csv'
+        if delta is not None:
+            drop_rows(output_filename, 'game_id', delta.corrected_in(year_to_scrape))
+        existing_game_ids = set()
+        if existing_output(output_filename):
+            df_existing = pd.read_csv(output_filename)
+            if 'game_id' in df_existing.columns:
+                existing_game_ids = set(df_existing['game_id'].unique())
+            else:
+                print(f"Found existing PRR file for {year_to_scrape}, will append any missing games.")
+        mode = 'a' if existing_output(output_filename) else 'w'
+        with open(output_filename, mode, newline='') as output_csvfile:
+            csvwriter = csv.writer(output_csvfile)
+            if mode == 'w':
+                csvwriter.writerow(pfr.PLAYER_OFFENSE.header)
+            rows = played_games(games_rows, year_to_scrape) if delta is None else delta.season_games(year_to_scrape)
+            targets = {}
             for row in rows:
                 pfr_value = row['pfr']
                 game_id = row['game_id']
@@ -1489,213 +1181,184 @@ for year_to_scrape in range(2010, 2026):
                     print(f"Skipping already scraped game ID: {game_id}")
                     continue
                 url = f"https://www.pro-football-reference.com/boxscores/{pfr_value}.htm"
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        response = get_with_backoff(url, timeout=10)
-                        if response.status_code == 429:
-                            print(f"Rate limit exceeded for URL {url}. Please try again later.")
-                            time.sleep(60)
-                            continue
-                        soup = BeautifulSoup(response.text, 'lxml')
-                        table = soup.find('div', id='div_player_offense')
-                        if table:
-                            for i, tr in enumerate(table.find_all('tr')):
-                                if i == 0:  
-                                    continue
-                                player_cell = tr.find('th')
-                                if player_cell:
-                                    player_name = player_cell.get_text()
-                                    player_link = player_cell.find('a')
-                                    player_id = player_link['href'].split('/')[-1] if player_link else None  
-                                    stats = [td.get_text() for td in tr.find_all('td')]
-                                    row_data = [player_name, player_id] + stats + [game_id]  
-                                    csvwriter.writerow(row_data)
-                            print(f"Successfully scraped data for game ID: {game_id}, PFR: {pfr_value}")
-                            time.sleep(2)  # Additional sleep after successful scrape
-                            break
-                    except Exception as e:
-                        print(f"An error occurred while scraping {url}. Error: {e}")
-                        if attempt < max_retries - 1:
-                            time.sleep(2 ** attempt)
-                        else:
-                            break
-                time.sleep(2.5)
-    print(f"Scraping completed for {year_to_scrape}. Data saved to {output_filename}.")
-
-
-##### Cleaning weird rows in passing/rushing/receiving #####
-directory = 'data/SR-passing-rushing-receiving-game-logs/'
-for filename in os.listdir(directory):
-    if filename.endswith('.csv'):
-        file_path = os.path.join(directory, filename)
-        df = pd.read_csv(file_path)
-        df_cleaned = df[(df['player'] != 'Player') & (df['player'].notna())]
-        df_cleaned.to_csv(file_path, index=False)
-        print(f"Processed {filename}")
-
-
-##### Merge all passing/rushing/receiving #####
-directory = 'data/SR-passing-rushing-receiving-game-logs/'
-merged_file_path = 'data/all_passing_rushing_receiving.csv'  
-dataframes = []
-for filename in os.listdir(directory):
-    if filename.endswith('.csv'):
-        file_path = os.path.join(directory, filename)
-        df = pd.read_csv(file_path)
-        dataframes.append(df)
-        print(f"Added {filename} to the merge list")
-merged_df = pd.concat(dataframes, ignore_index=True)
-merged_df.to_csv(merged_file_path, index=False)
-print(f"All files have been merged into {merged_file_path}")
-
-
-##### Add opponent_team column to all_passing_rushing_receiving.csv #####
-file_path = 'data/all_passing_rushing_receiving.csv'  
-df = pd.read_csv(file_path)
-team_corrections = {
-    'NWE': 'NE',
-    'GNB': 'GB',
-    'KAN': 'KC',
-    'STL': 'LAR',
-    'NOR': 'NO',
-    'SDG': 'LAC',
-    'OAK': 'LVR',
-    'TAM': 'TB',
-    'SFO': 'SF'
-}
-df['team'] = df['team'].replace(team_corrections)
-def get_opponent_team(row):
-    game_id = row['game_id']
-    team = row['team']
-    _, _, away_team, home_team = game_id.split('_')
-    if team == home_team:
-        return away_team
-    elif team == away_team:
-        return home_team
-    else:
-        return None  
-def is_player_home(row):
-    game_id = row['game_id']
-    team = row['team']
-    _, _, away_team, home_team = game_id.split('_')
-    return 'y' if team == home_team else 'n'
-df['opponent_team'] = df.apply(get_opponent_team, axis=1)
-df['home'] = df.apply(is_player_home, axis=1)
-df.to_csv('data/all_passing_rushing_receiving.csv', index=False)  
-print(df.head())
-
-
-##### Add position column to all_passing_rushing_receiving.csv #####
-all_passing_file = 'data/all_passing_rushing_receiving.csv'
-rosters_file = 'data/rosters.csv'
-all_passing_df = pd.read_csv(all_passing_file)
-rosters_df = pd.read_csv(rosters_file)
-
-# Deduplicate by (player, game_id) before merging to prevent duplicates
-duplicate_count = all_passing_df.duplicated(subset=['player', 'game_id']).sum()
-if duplicate_count > 0:
-    print(f"   Removing {duplicate_count:,} duplicate (player, game_id) combinations...")
-    all_passing_df = all_passing_df.drop_duplicates(subset=['player', 'game_id'], keep='first')
-    print(f"   After deduplication: {len(all_passing_df):,} records")
-
-# Extract season and team from game_id to match with rosters
-all_passing_df['season'] = all_passing_df['game_id'].str.split('_').str[0].astype(int)
-# Rename team to player_team temporarily to avoid merge conflicts
-all_passing_df = all_passing_df.rename(columns={'team': 'player_team'})
-
-# Deduplicate rosters by keeping the most recent entry per player per season
-# This prevents many-to-many merge that creates duplicates
-rosters_dedup = rosters_df[['full_name', 'season', 'team', 'position']].drop_duplicates(
-    subset=['full_name', 'season', 'team'], keep='last'
-)
-
-# Merge on player name, season, and team to avoid duplicates
-# Since both dataframes have 'team' column but we're using player_team on left and team on right,
-# pandas would create team_x and team_y. To avoid this, we drop 'team' from rosters before merge
-# (we only need it for the merge key, and the result will have player_team which we'll rename)
-rosters_for_merge = rosters_dedup[['full_name', 'season', 'team', 'position']].copy()
-merged_df = pd.merge(all_passing_df, rosters_for_merge, 
-                     left_on=['player', 'season', 'player_team'], 
-                     right_on=['full_name', 'season', 'team'], 
-                     how='left')
-
-# After merge, we have player_team (from left) and team (from right) - they're the same values
-# Drop the right's 'team' column and rename player_team back to 'team'
-merged_df = merged_df.drop(columns=['team'], errors='ignore')
-merged_df = merged_df.rename(columns={'player_team': 'team'})
-if 'position' not in merged_df.columns:
-    merged_df['position'] = None
-relevant_positions = ['QB', 'WR', 'TE', 'RB']
-merged_df['position'] = merged_df['position'].where(merged_df['position'].isin(relevant_positions), None)
-# Drop merge helper columns
-merged_df.drop(columns=['full_name'], inplace=True, errors='ignore')
-# Fill missing positions using forward/backward fill per player
-merged_df['position'] = merged_df.groupby('player')['position'].transform(lambda x: x.ffill().bfill())
-
-# Final deduplication check (safety measure - should not create duplicates, but just in case)
-final_dupes = merged_df.duplicated(subset=['player', 'game_id']).sum()
-if final_dupes > 0:
-    print(f"   ⚠️  Warning: {final_dupes} duplicates found after merge, removing...")
-    merged_df = merged_df.drop_duplicates(subset=['player', 'game_id'], keep='first')
-
-merged_df.to_csv('data/all_passing_rushing_receiving.csv', index=False)
-print(merged_df[['player', 'position']].head())
-
-##### Create clean PFR-only version without NFLverse position data #####
-print("\nCreating clean PFR-only version of passing/rushing/receiving data...")
-# Recreate the clean PFR data by merging all years without position data
-directory = 'data/SR-passing-rushing-receiving-game-logs/'
-clean_pfr_file_path = 'data/all_passing_rushing_receiving_pfr_clean.csv'  
-clean_dataframes = []
-for filename in os.listdir(directory):
-    if filename.endswith('.csv'):
-        file_path = os.path.join(directory, filename)
-        df = pd.read_csv(file_path)
-        clean_dataframes.append(df)
-        print(f"Added {filename} to clean PFR merge list")
-clean_merged_df = pd.concat(clean_dataframes, ignore_index=True)
-# Add opponent_team and home columns (these are derived from PFR game_id, not NFLverse)
-clean_merged_df['opponent_team'] = clean_merged_df.apply(get_opponent_team, axis=1)
-clean_merged_df['home'] = clean_merged_df.apply(is_player_home, axis=1)
-# Save clean PFR version without position data
-clean_merged_df.to_csv(clean_pfr_file_path, index=False)
-print(f"✅ Clean PFR-only version saved to: {clean_pfr_file_path}")
+                targets[url] = row
+            for url, game, rows in scraper.rows(pfr.PLAYER_OFFENSE, targets, timeout=10):
+                if rows is None:
+                    missed.add(game['game_id'])
+                    continue
+                csvwriter.writerows(rows)
+                print(f"Successfully scraped data for game ID: {game['game_id']}, PFR: {game['pfr']}")
+        print(f"Scraping completed for {year_to_scrape}. Data saved to {output_filename}.")
+
+
+    ##### Cleaning weird rows in passing/rushing/receiving #####
+    directory = 'data/SR-passing-rushing-receiving-game-logs/'
+    for filename in os.listdir(directory):
+        if filename.endswith('.csv'):
+            file_path = os.path.join(directory, filename)
+            df = pd.read_csv(file_path)
+            df_cleaned = df[(df['player'] != 'Player') & (df['player'].notna())]
+            df_cleaned.to_csv(file_path, index=False)
+            print(f"Processed {filename}")
+
+
+    ##### Merge all passing/rushing/receiving #####
+    directory = 'data/SR-passing-rushing-receiving-game-logs/'
+    merged_file_path = 'data/all_passing_rushing_receiving.csv'  
+    dataframes = []
+    for filename in os.listdir(directory):
+        if filename.endswith('.csv'):
+            file_path = os.path.join(directory, filename)
+            df = pd.read_csv(file_path)
+            dataframes.append(df)
+            print(f"Added {filename} to the merge list")
+    merged_df = pd.concat(dataframes, ignore_index=True)
+    merged_df.to_csv(merged_file_path, index=False)
+    print(f"All files have been merged into {merged_file_path}")
+
+
+    ##### Add opponent_team column to all_passing_rushing_receiving.csv #####
+    file_path = 'data/all_passing_rushing_receiving.csv'  
+    df = pd.read_csv(file_path)
+    team_corrections = {
+        'NWE': 'NE',
+        'GNB': 'GB',
+        'KAN': 'KC',
+        'STL': 'LAR',
+        'NOR': 'NO',
+        'SDG': 'LAC',
+        'OAK': 'LVR',
+        'TAM': 'TB',
+        'SFO': 'SF'
+    }
+    df['team'] = df['team'].replace(team_corrections)
+    def get_opponent_team(row):
+        game_id = row['game_id']
+        team = row['team']
+        _, _, away_team, home_team = game_id.split('_')
+        if team == home_team:
+            return away_team
+        elif team == away_team:
+            return home_team
+        else:
+            return None  
+    def is_player_home(row):
+        game_id = row['game_id']
+        team = row['team']
+        _, _, away_team, home_team = game_id.split('_')
+        return 'y' if team == home_team else 'n'
+    df['opponent_team'] = df.apply(get_opponent_team, axis=1)
+    df['home'] = df.apply(is_player_home, axis=1)
+    df.to_csv('data/all_passing_rushing_receiving.csv', index=False)  
+    print(df.head())
+
+
+    ##### Add position column to all_passing_rushing_receiving.csv #####
+    all_passing_file = 'data/all_passing_rushing_receiving.csv'
+    rosters_file = 'data/rosters.csv'
+    all_passing_df = pd.read_csv(all_passing_file)
+    rosters_df = pd.read_csv(rosters_file)
+
+    # Deduplicate by (player, game_id) before merging to prevent duplicates
+    duplicate_count = all_passing_df.duplicated(subset=['player', 'game_id']).sum()
+    if duplicate_count > 0:
+        print(f"   Removing {duplicate_count:,} duplicate (player, game_id) combinations...")
+        all_passing_df = all_passing_df.drop_duplicates(subset=['player', 'game_id'], keep='first')
+        print(f"   After deduplication: {len(all_passing_df):,} records")
+
+    # Extract season and team from game_id to match with rosters
+    all_passing_df['season'] = all_passing_df['game_id'].str.split('_').str[0].astype(int)
+    # Rename team to player_team temporarily to avoid merge conflicts
+    all_passing_df = all_passing_df.rename(columns={'team': 'player_team'})
+
+    # Deduplicate rosters by keeping the most recent entry per player per season
+    # This prevents many-to-many merge that creates duplicates
+    rosters_dedup = rosters_df[['full_name', 'season', 'team', 'position']].drop_duplicates(
+        subset=['full_name', 'season', 'team'], keep='last'
+    )
+
+    # Merge on player name, season, and team to avoid duplicates
+    # Since both dataframes have 'team' column but we're using player_team on left and team on right,
+    # pandas would create team_x and team_y. To avoid this, we drop 'team' from rosters before merge
+    # (we only need it for the merge key, and the result will have player_team which we'll rename)
+    rosters_for_merge = rosters_dedup[['full_name', 'season', 'team', 'position']].copy()
+    merged_df = pd.merge(all_passing_df, rosters_for_merge, 
+                         left_on=['player', 'season', 'player_team'], 
+                         right_on=['full_name', 'season', 'team'], 
+                         how='left')
+
+    # After merge, we have player_team (from left) and team (from right) - they're the same values
+    # Drop the right's 'team' column and rename player_team back to 'team'
+    merged_df = merged_df.drop(columns=['team'], errors='ignore')
+    merged_df = merged_df.rename(columns={'player_team': 'team'})
+    if 'position' not in merged_df.columns:
+        merged_df['position'] = None
+    relevant_positions = ['QB', 'WR', 'TE', 'RB']
+    merged_df['position'] = merged_df['position'].where(merged_df['position'].isin(relevant_positions), None)
+    # Drop merge helper columns
+    merged_df.drop(columns=['full_name'], inplace=True, errors='ignore')
+    # Fill missing positions using forward/backward fill per player
+    merged_df['position'] = merged_df.groupby('player')['position'].transform(lambda x: x.ffill().bfill())
+
+    # Final deduplication check (safety measure - should not create duplicates, but just in case)
+    final_dupes = merged_df.duplicated(subset=['player', 'game_id']).sum()
+    if final_dupes > 0:
+        print(f"   ⚠️  Warning: {final_dupes} duplicates found after merge, removing...")
+        merged_df = merged_df.drop_duplicates(subset=['player', 'game_id'], keep='first')
+
+    merged_df.to_csv('data/all_passing_rushing_receiving.csv', index=False)
+    dataset.write_dataset('passing_rushing_receiving', merged_df, merged_df['game_id'].str.split('_').str[0])
+    print(merged_df[['player', 'position']].head())
+
+    ##### Create clean PFR-only version without NFLverse position data #####
+    print("\nCreating clean PFR-only version of passing/rushing/receiving data...")
+    # Recreate the clean PFR data by merging all years without position data
+    directory = 'data/SR-passing-rushing-receiving-game-logs/'
+    clean_pfr_file_path = 'data/all_passing_rushing_receiving_pfr_clean.csv'  
+    clean_dataframes = []
+    for filename in os.listdir(directory):
+        if filename.endswith('.csv'):
+            file_path = os.path.join(directory, filename)
+            df = pd.read_csv(file_path)
+            clean_dataframes.append(df)
+            print(f"Added {filename} to clean PFR merge list")
+    clean_merged_df = pd.concat(clean_dataframes, ignore_index=True)
+    # Add opponent_team and home columns (these are derived from PFR game_id, not NFLverse)
+    clean_merged_df['opponent_team'] = clean_merged_df.apply(get_opponent_team, axis=1)
+    clean_merged_df['home'] = clean_merged_df.apply(is_player_home, axis=1)
+    # Save clean PFR version without position data
+    clean_merged_df.to_csv(clean_pfr_file_path, index=False)
+    print(f"✅ Clean PFR-only version saved to: {clean_pfr_file_path}")
+    watermarks.commit('passing_rushing_receiving', missed=missed)
 
 
 ##### Defense #####
-print("\n" + "*"*80 + "\n")
-os.makedirs('data/SR-defense-game-logs', exist_ok=True)
-headers = [
-    'player', 'team', 'def_int', 'def_int_yds', 'def_int_td', 'def_int_long', 'pass_defended', 'sacks',
-    'tackles_combined', 'tackles_solo', 'tackles_assists', 'tackles_loss', 'qb_hits', 'fumbles_rec',
-    'fumbles_rec_yds', 'fumbles_rec_td', 'fumbles_forced', 'game_id'
-]
-for year_to_scrape in range(2010, 2026):
-    output_filename = f'./data/SR-defense-game-logs/all_defense_{year_to_scrape}.csv'
-    existing_game_ids = set()
-    if os.path.exists(output_filename):
-        df_existing = pd.read_csv(output_filename)
-        if 'game_id' in df_existing.columns:
-            existing_game_ids = set(df_existing['game_id'].unique())
-        else:
-            print(f"Found existing defense file for {year_to_scrape}, will append any missing games.")
-    mode = 'a' if os.path.exists(output_filename) else 'w'
-    with open(output_filename, mode, newline='') as output_csvfile:
-        csvwriter = csv.writer(output_csvfile)
-        if mode == 'w':
-            csvwriter.writerow(headers)
-        with open('./data/games.csv', 'r') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = []
-            now_dt = datetime.now()
-            for row in reader:
-                try:
-                    game_dt = datetime.fromisoformat(row['date'])
-                except Exception:
-                    continue
-                if int(row['game_id'].split('_')[0]) == year_to_scrape and game_dt <= now_dt:
-                    rows.append(row)
+@pipeline.task('defense', deps=['games'], inputs=['data/games.csv'], outputs=['data/all_defense-game-logs.csv'])
+def defense():
+    print("\n" + "*"*80 + "\n")
+    os.makedirs('data/SR-defense-game-logs', exist_ok=True)
+    headers = pfr.PLAYER_DEFENSE.header
+    games_rows = load_games()
+    delta = watermarks.delta('defense', games_rows)
+    missed = set()
+    for year_to_scrape in (range(2010, 2026) if delta is None else delta.seasons()):
+        output_filename = f'./data/SR-defense-game-logs/all_defense_{year_to_scrape}.csv'
+        if delta is not None:
+            drop_rows(output_filename, 'game_id', delta.corrected_in(year_to_scrape))
+        existing_game_ids = set()
+        if existing_output(output_filename):
+            df_existing = pd.read_csv(output_filename)
+            if 'game_id' in df_existing.columns:
+                existing_game_ids = set(df_existing['game_id'].unique())
+            else:
+                print(f"Found existing defense file for {year_to_scrape}, will append any missing games.")
+        mode = 'a' if existing_output(output_filename) else 'w'
+        with open(output_filename, mode, newline='') as output_csvfile:
+            csvwriter = csv.writer(output_csvfile)
+            if mode == 'w':
+                csvwriter.writerow(headers)
+            rows = played_games(games_rows, year_to_scrape) if delta is None else delta.season_games(year_to_scrape)
+            targets = {}
             for row in rows:
                 if not row['away_score'] or not row['home_score']:
                     print(f"Skipping game {row['game_id']} due to missing scores.")
@@ -1706,141 +1369,66 @@ for year_to_scrape in range(2010, 2026):
                     print(f"Skipping already scraped game ID: {game_id}")
                     continue
                 url = f"https://www.pro-football-reference.com/boxscores/{pfr_value}.htm"
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        response = get_with_backoff(url, timeout=10)
-                        response.raise_for_status()
-                        soup = BeautifulSoup(response.text, 'lxml')
-                        comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-                        table_found = False
-                        for comment in comments:
-                            soup_comment = BeautifulSoup(comment, 'lxml')
-                            table = soup_comment.find('table', id='player_defense')
-                            if table:
-                                table_found = True
-                                for i, tr in enumerate(table.find_all('tr')):
-                                    if i == 0:
-                                        continue
-                                    player_name = tr.find('th').get_text() if tr.find('th') else ''
-                                    stats = [td.get_text() for td in tr.find_all('td')]
-                                    row_data = [player_name] + stats + [game_id]
-                                    csvwriter.writerow(row_data)
-                                print(f"Successfully scraped data for game ID: {game_id}, PFR: {pfr_value}")
-                                break
-                        if not table_found:
-                            print(f"No defense table found for {url}")
-                        break
-                    except Exception as e:
-                        print(f"An error occurred while scraping {url}. Error: {e}")
-                        if attempt < max_retries - 1:
-                            time.sleep(2 ** attempt)
-                        else:
-                            break
-                time.sleep(2.5)
-    print(f"Scraping completed for {year_to_scrape}. Data saved to {output_filename}.")
-
-# df = pd.read_csv('./data/defense-game-logs/all_defense_2025.csv')
-# df.dropna(inplace=True)
-# df.to_csv('./data/defense-game-logs/all_defense_2025.csv', index=False)
-for year in range(2010, 2026):
-    file_path = f'./data/SR-defense-game-logs/all_defense_{year}.csv'
-    try:
-        df = pd.read_csv(file_path)
-        df.dropna(inplace=True)
-        df.to_csv(file_path, index=False)
-        print(f"Cleaned defense data for {year}")
-    except FileNotFoundError:
-        print(f"No defense data file found for {year}")
-
-##### Merge all defense-game-logs.csv files into one #####
-input_dir = 'data/SR-defense-game-logs/'
-csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
-dataframes = [pd.read_csv(os.path.join(input_dir, file)) for file in csv_files]
-merged_dataframe = pd.concat(dataframes, ignore_index=True)
-output_file = 'data/all_defense-game-logs.csv'
-merged_dataframe.to_csv(output_file, index=False)
-print(f"Merged dataset saved as {output_file}")
-
-
-##### Red Zone Statistics #####
-print("\n" + "*"*80 + "\n")
-os.makedirs('./data/SR-redzone', exist_ok=True)
-categories = {
-    'passing': 'redzone-passing.htm',
-    'rushing': 'redzone-rushing.htm',
-    'receiving': 'redzone-receiving.htm',
-}
-headers = {
-    'User-Agent': (
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
-        'AppleWebKit/537.36 (KHTML, like Gecko) '
-        'Chrome/114.0.0.0 Safari/537.36'
-    )
-}
-for year_to_scrape in range(2010, 2026):
-    # For 2010-2024: skip if file already exists
-    # For 2025: always process to get latest data
-    year_output_file = f'./data/SR-redzone/all_redzone_{year_to_scrape}.csv'
-    if year_to_scrape != 2025 and os.path.exists(year_output_file):
-        print(f"Skipping red zone for {year_to_scrape}; file already exists.")
-        continue
-    all_redzone_data = []
-    for stat_type, suffix in categories.items():
-        url = f'https://www.pro-football-reference.com/years/{year_to_scrape}/{suffix}'
+                targets[url] = row
+            # The defense table is wrapped in an HTML comment; the spec's locator finds it directly.
+            for url, game, rows in scraper.rows(pfr.PLAYER_DEFENSE, targets, timeout=10):
+                if rows is None:
+                    print(f"No defense table found for {url}")
+                    missed.add(game['game_id'])
+                    continue
+                csvwriter.writerows(rows)
+                print(f"Successfully scraped data for game ID: {game['game_id']}, PFR: {game['pfr']}")
+        print(f"Scraping completed for {year_to_scrape}. Data saved to {output_filename}.")
+
+    # df = pd.read_csv('./data/defense-game-logs/all_defense_2025.csv')
+    # df.dropna(inplace=True)
+    # df.to_csv('./data/defense-game-logs/all_defense_2025.csv', index=False)
+    for year in range(2010, 2026):
+        file_path = f'./data/SR-defense-game-logs/all_defense_{year}.csv'
         try:
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            df = pd.read_html(response.content)[0]
-            # Flatten multi-index columns
-            new_cols = []
-            for col in df.columns:
-                if isinstance(col, tuple):
-                    parts = [c for c in col if c and 'Unnamed' not in str(c)]
-                    new_name = '_'.join(parts)
-                    new_cols.append(new_name)
-                else:
-                    new_cols.append(col)
-            df.columns = new_cols
-            # Drop header repeats and link column
-            if 'Player' in df.columns:
-                df = df[df['Player'] != 'Player']
-            if 'Link' in df.columns:
-                df = df.drop(columns=['Link'])
-            # Add metadata
-            df.insert(0, 'Year', year_to_scrape)
-            df.insert(1, 'StatType', stat_type)
-            # Standardize team abbreviations
-            team_standardization = {
-                'GNB': 'GB',    # Green Bay Packers
-                'KAN': 'KC',    # Kansas City Chiefs  
-                'NOR': 'NO',    # New Orleans Saints
-                'NWE': 'NE',    # New England Patriots
-                'OAK': 'LVR',   # Oakland Raiders → Las Vegas Raiders
-                'SFO': 'SF',    # San Francisco 49ers
-                'TAM': 'TB'     # Tampa Bay Buccaneers
-            }
-            df['Tm'] = df['Tm'].replace(team_standardization)
-            all_redzone_data.append(df)
-            print(f"Successfully scraped {stat_type} data for {year_to_scrape}")
-            time.sleep(2.5)
-        except Exception as e:
-            print(f"Error scraping {stat_type} for {year_to_scrape}: {e}")
-            continue
-    if all_redzone_data:
-        combined_df = pd.concat(all_redzone_data, ignore_index=True)
-        output_file = f'./data/SR-redzone/all_redzone_{year_to_scrape}.csv'
-        # Always overwrite since this is aggregated season data
-        combined_df.to_csv(output_file, index=False)
-        print(f"Combined red zone data saved to {output_file}")
-
-##### Merge Red Zone Data #####
-input_dir = 'data/SR-redzone/'
-csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
-if csv_files:
+            df = pd.read_csv(file_path)
+            df.dropna(inplace=True)
+            df.to_csv(file_path, index=False)
+            print(f"Cleaned defense data for {year}")
+        except FileNotFoundError:
+            print(f"No defense data file found for {year}")
+
+    ##### Merge all defense-game-logs.csv files into one #####
+    input_dir = 'data/SR-defense-game-logs/'
+    csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
     dataframes = [pd.read_csv(os.path.join(input_dir, file)) for file in csv_files]
     merged_dataframe = pd.concat(dataframes, ignore_index=True)
-    # Apply team standardization to merged data as well
+    output_file = 'data/all_defense-game-logs.csv'
+    merged_dataframe.to_csv(output_file, index=False)
+    print(f"Merged dataset saved as {output_file}")
+    dataset.write_dataset('defense', merged_dataframe, merged_dataframe['game_id'].str.split('_').str[0])
+    watermarks.commit('defense', missed=missed)
+
+
+##### Red Zone Statistics #####
+@pipeline.task('redzone', outputs=['data/all_redzone.csv'])
+def redzone():
+    print("\n" + "*"*80 + "\n")
+    os.makedirs('./data/SR-redzone', exist_ok=True)
+    categories = {
+        'passing': 'redzone-passing.htm',
+        'rushing': 'redzone-rushing.htm',
+        'receiving': 'redzone-receiving.htm',
+    }
+    # Stat columns of each page; a season file always has all of them, so its
+    # header does not depend on which pages a run managed to fetch
+    redzone_columns = {
+        'passing': ['Inside 20_Cmp', 'Inside 20_Att', 'Inside 20_Cmp%', 'Inside 20_Yds', 'Inside 20_TD', 'Inside 20_Int',
+                    'Inside 10_Cmp', 'Inside 10_Att', 'Inside 10_Cmp%', 'Inside 10_Yds', 'Inside 10_TD', 'Inside 10_Int'],
+        'rushing': ['Inside 20_Att', 'Inside 20_Yds', 'Inside 20_TD', 'Inside 20_%Rush',
+                    'Inside 10_Att', 'Inside 10_Yds', 'Inside 10_TD', 'Inside 10_%Rush',
+                    'Inside 5_Att', 'Inside 5_Yds', 'Inside 5_TD', 'Inside 5_%Rush'],
+        'receiving': ['Inside 20_Tgt', 'Inside 20_Rec', 'Inside 20_Ctch%', 'Inside 20_Yds', 'Inside 20_TD', 'Inside 20_%Tgt',
+                      'Inside 10_Tgt', 'Inside 10_Rec', 'Inside 10_Ctch%', 'Inside 10_Yds', 'Inside 10_TD', 'Inside 10_%Tgt'],
+    }
+    header = ['Year', 'StatType', 'Player', 'Tm']
+    for columns in redzone_columns.values():
+        header.extend(name for name in columns if name not in header)
     team_standardization = {
         'GNB': 'GB',    # Green Bay Packers
         'KAN': 'KC',    # Kansas City Chiefs  
@@ -1850,46 +1438,129 @@ if csv_files:
         'SFO': 'SF',    # San Francisco 49ers
         'TAM': 'TB'     # Tampa Bay Buccaneers
     }
-    merged_dataframe['Tm'] = merged_dataframe['Tm'].replace(team_standardization)
-    output_file = 'data/all_redzone.csv'
-    merged_dataframe.to_csv(output_file, index=False)
-    print(f"Merged red zone dataset saved as {output_file}")
-
-
-##### Export all tables from nfl.db to csv files with current date's timestamp in the file names to a final directory #####
+    rows_changed = 0
+    for year_to_scrape in range(2010, 2026):
+        # For 2010-2024: skip if file already exists
+        # For 2025: fetch the three pages and merge them by player, so only changed rows are written
+        year_output_file = f'./data/SR-redzone/all_redzone_{year_to_scrape}.csv'
+        if year_to_scrape != 2025 and existing_output(year_output_file):
+            print(f"Skipping red zone for {year_to_scrape}; file already exists.")
+            continue
+        targets = {
+            f'https://www.pro-football-reference.com/years/{year_to_scrape}/{suffix}': stat_type
+            for stat_type, suffix in categories.items()
+        }
+        # The three categories are fetched concurrently; only the red zone table is parsed
+        tables = {}
+        for url, table in parse_pool.map(fetcher.map(targets, timeout=15), partial(extract_table, table_id='fantasy_rz')):
+            if table is None:
+                print(f"Red zone table not found on {url}")
+                continue
+            tables[targets[url]] = table
+        # A season file is only written with all three pages: a partial one would be
+        # skipped as complete from then on, and the merge would drop the missing rows
+        missing = [stat_type for stat_type in categories if stat_type not in tables]
+        if missing:
+            print(f"Red zone {', '.join(missing)} missing for {year_to_scrape}; leaving {year_output_file} as it is")
+            continue
+        redzone_writer = AppendOnlyCSV(year_output_file, header, key=['Year', 'StatType', 'Player', 'Tm'])
+        for stat_type in categories:
+            columns = tables[stat_type].header()
+            unknown = [name for name in redzone_columns[stat_type] if name not in columns]
+            if unknown:
+                print(f"Red zone {stat_type} page for {year_to_scrape} has no {', '.join(unknown)} column")
+            for tr in tables[stat_type].body:
+                record = dict(zip(columns, tr.values()))
+                # Drop header repeats
+                if record.get('Player', 'Player') == 'Player':
+                    continue
+                record['Tm'] = team_standardization.get(record.get('Tm', ''), record.get('Tm', ''))
+                redzone_writer.write([str(year_to_scrape), stat_type] + [record.get(name, '') for name in header[2:]])
+            print(f"Successfully scraped {stat_type} data for {year_to_scrape}")
+        redzone_writer.close()
+        rows_changed += redzone_writer.appended
+        print(f"Red zone data for {year_to_scrape} saved to {year_output_file} ({redzone_writer.appended} rows written)")
+
+    ##### Merge Red Zone Data #####
+    if not rows_changed and os.path.exists('data/all_redzone.csv'):
+        print("No red zone rows changed; keeping data/all_redzone.csv")
+        return UNCHANGED
+    input_dir = 'data/SR-redzone/'
+    csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
+    if csv_files:
+        dataframes = [pd.read_csv(os.path.join(input_dir, file)) for file in csv_files]
+        merged_dataframe = pd.concat(dataframes, ignore_index=True)
+        # Apply team standardization to merged data as well
+        merged_dataframe['Tm'] = merged_dataframe['Tm'].replace(team_standardization)
+        output_file = 'data/all_redzone.csv'
+        merged_dataframe.to_csv(output_file, index=False)
+        print(f"Merged red zone dataset saved as {output_file}")
+        dataset.write_dataset('redzone', merged_dataframe, 'Year')
+
+
+##### Snapshot the final tables into final_data/snapshots (one base, then dated deltas) #####
 ##### Regenerate final files with ALL available historical data (2010-2025) #####
+@pipeline.task('final_export', deps=['teams', 'games', 'player_stats', 'rosters'],
+               inputs=['data/games.csv', 'data/player_stats.csv', 'data/rosters.csv'], resources=['nfl.db'])
+def final_export():
+    print("\n" + "*"*80 + "\n")
+    # Each run records only the rows added, changed or removed since the last snapshot;
+    # python -m scraper_core.snapshots materialize <Table> --as-of YYYY-MM-DD rebuilds a dated copy.
+    store = SnapshotStore('final_data/snapshots')
+    print("Snapshotting final tables with 2010-2025 season data...")
+    games_df = pd.read_csv('data/games.csv') # Games: Load from data/games.csv
+    ##### Remove Unplayed Games #####
+    games_df.rename(columns={'gameday': 'date'}, inplace=True)
+    games_df = games_df[pd.to_datetime(games_df['date'], errors='coerce') <= datetime.now()]
+    store.write('Games', games_df)
+    print(f"Games: {len(games_df)} played games")
+    player_stats_df = pd.read_csv('data/player_stats.csv') # PlayerStats: Load from data/player_stats.csv
+    store.write('PlayerStats', player_stats_df)
+    print(f"PlayerStats: {len(player_stats_df)} total records")
+    rosters_df = pd.read_csv('data/rosters.csv') # Rosters: Load from data/rosters.csv
+    store.write('Rosters', rosters_df)
+    print(f"Rosters: {len(rosters_df)} total records")
+    with db.connect() as conn: # Teams: Static data, load from database
+        teams_df = pd.read_sql_query("SELECT * FROM Teams", conn)
+    conn.close()
+    store.write('Teams', teams_df)
+    print(f"Teams: {len(teams_df)} total teams")
+
+
+##### Indexes, planner statistics and a query-plan check for nfl.db #####
+@pipeline.task('optimize_db', deps=['teams', 'games', 'player_stats', 'rosters', 'game_outcomes'],
+               resources=['nfl.db'], pure=True)
+def optimize_db():
+    # Only a warning here: SQLite scans tables that are still tiny (a fresh nfl.db)
+    # even with the index in place. python -m scraper_core.db nfl.db runs the same
+    # check, exits 1 on a scan and times each lookup.
+    failures = db.optimize()
+    if failures:
+        for label, plan in failures.items():
+            print(f"⚠️  nfl.db: '{label}' scans a whole table: {' | '.join(plan)}")
+        print(f"⚠️  {len(failures)} nfl.db lookups do not use an index; check with python -m scraper_core.db nfl.db")
+        return
+    print(f"nfl.db analyzed; all {len(db.HOT_QUERIES)} app lookups use indexes")
+
+
+##### Run the stages #####
+if args.list:
+    for name, task in pipeline.tasks.items():
+        print(f"{name:<28} after: {', '.join(task.deps) or '-'}")
+    sys.exit(0)
+status = pipeline.run(only=args.only, start=args.start, resume=args.resume, jobs=args.jobs)
+scraper.close(status)
+failed = [name for name, result in status.items() if result in ('failed', 'blocked')]
+
+# Print end time and total elapsed time
+end_time = datetime.now()
+elapsed_time = end_time - start_time
 print("\n" + "*"*80 + "\n")
-final_dir = 'final_data'
-if not os.path.exists(final_dir):
-    os.makedirs(final_dir)
-current_date = datetime.now().strftime("%b_%d_%Y").upper()
-print("Regenerating final files with 2010-2025 season data...")
-games_df = pd.read_csv('data/games.csv') # Games: Load from data/games.csv (contains 2010-2016)
-games_df.to_csv(f"{final_dir}/Games_{current_date}.csv", index=False)
-print(f"Regenerated Games: {len(games_df)} total games")
-player_stats_df = pd.read_csv('data/player_stats.csv') # PlayerStats: Load from data/player_stats.csv (contains 2010-2016)
-player_stats_df.to_csv(f"{final_dir}/PlayerStats_{current_date}.csv", index=False)
-print(f"Regenerated PlayerStats: {len(player_stats_df)} total records")
-rosters_df = pd.read_csv('data/rosters.csv') # Rosters: Load from data/rosters.csv (contains 2010-2016)
-rosters_df.to_csv(f"{final_dir}/Rosters_{current_date}.csv", index=False)
-print(f"Regenerated Rosters: {len(rosters_df)} total records")
-db_path = 'nfl.db' # Teams: Static data, load from database
-conn = sqlite3.connect(db_path)
-teams_df = pd.read_sql_query("SELECT * FROM Teams", conn)
-teams_df.to_csv(f"{final_dir}/Teams_{current_date}.csv", index=False)
-print(f"Regenerated Teams: {len(teams_df)} total teams")
-
-
-##### Remove Unplayed Games #####
-current_date_str = datetime.now().strftime("%b_%d_%Y").upper()
-file_name = f"final_data/Games_{current_date_str}.csv"
-games_df = pd.read_csv(file_name)
-games_df.rename(columns={'gameday': 'date'}, inplace=True)
-games_df['date'] = pd.to_datetime(games_df['date'], errors='coerce')
-current_date = datetime.now()
-cleaned_games_df = games_df[games_df['date'] <= current_date]
-cleaned_games_df.to_csv(file_name, index=False)
-print(f"Cleaned data saved to {file_name}")
+print(f"Process ended at: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
+print(f"Total time elapsed: {elapsed_time}")
+if failed:
+    print(f"Stages not completed: {', '.join(failed)} (rerun with --resume)")
+    sys.exit(1)
 
 
 ##### TO DO #####
@@ -2167,12 +1838,6 @@ print(f"Cleaned data saved to {file_name}")
 
 
 
-# Print end time and total elapsed time
-end_time = datetime.now()
-elapsed_time = end_time - start_time
-print("\n" + "*"*80 + "\n")
-print(f"Process ended at: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-print(f"Total time elapsed: {elapsed_time}")
 
 
 
@@ -1,11 +1,8 @@
 import pandas as pd
-import requests
 import os
 import csv
-from bs4 import BeautifulSoup, Comment
-from time import sleep
-import time
 from datetime import datetime
+from scraper_core import Scraper, pfr, telemetry
 
 # Create Directory
 final_dir = 'FINAL'
@@ -19,46 +16,45 @@ for f in os.listdir(final_dir):
         
 start_time = datetime.now()
 
+# Shared scraping core: pooled session with a per-host request budget (no fixed sleeps),
+# raw pages archived under pfr-archive/ (--reparse rebuilds FINAL/ from it), parse workers
+# and per-section requests, 429s, bytes and timings reported in data/run-reports/
+scraper = Scraper('ScraperMasterPFR')
+
 print("🚀 Starting NFL PFR Scraper...")
 print(f"📅 Scraping years: 2023-2024")
 print(f"📁 Output directory: {final_dir}")
-print("⏳ Waiting 5 seconds to avoid rate limiting...")
-sleep(5)
-
-# Consistent headers and polite UA
-UA = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/126 Safari/537.36"
-    )
-}
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
-def make_request_with_retry(url, max_retries=3, retry_delay=30):
-    """Make HTTP request with exponential backoff retry logic"""
-    for attempt in range(max_retries):
+# Team and box score pages each carry several tables; every page is fetched once
+# for all the sections that read it.
+TEAM_PAGE_SPECS = [pfr.TEAM_STATS, pfr.TEAM_SCHEDULE, pfr.TEAM_CONVERSIONS]
+GAME_PAGE_SPECS = [pfr.LINESCORE, pfr.SCORING, pfr.PLAYER_OFFENSE, pfr.PLAYER_DEFENSE]
+page_tables = {}
+
+def fetch_tables(specs, urls):
+    """Tables of ``specs`` for each URL, fetching only pages not seen yet this run"""
+    missing = {url: None for url in urls if url not in page_tables}
+    for url, _, found in scraper.tables(specs, missing):
+        page_tables[url] = found
+    return {url: page_tables[url] for url in urls}
+
+def played_games(year_to_scrape):
+    """Rows of game_logs.csv for ``year_to_scrape`` dated on or before today"""
+    games_df_temp = pd.read_csv(f'{final_dir}/game_logs.csv')
+    games_df_temp['pfr'] = games_df_temp['game_id'].str.replace('_', '').str.lower()
+    rows = []
+    now_dt = datetime.now()
+    for _, row in games_df_temp.iterrows():
         try:
-            response = requests.get(url, headers=UA, timeout=30)
-            if response.status_code == 429:
-                print(f"Rate limited at {url}; sleeping {retry_delay}s")
-                sleep(retry_delay)
-                retry_delay *= 2  # Exponential backoff
-                continue
-            response.raise_for_status()
-            return response
-        except Exception as e:
-            if attempt < max_retries - 1:
-                print(f"Request failed (attempt {attempt + 1}/{max_retries}): {e}")
-                sleep(retry_delay)
-                retry_delay *= 2  # Exponential backoff
-                continue
-            else:
-                print(f"Final attempt failed for {url}: {e}")
-                return None
-    return None
+            game_dt = datetime.fromisoformat(row['date'])
+        except Exception:
+            continue
+        if int(row['game_id'].split('_')[0]) == year_to_scrape and game_dt <= now_dt:
+            rows.append(row.to_dict())
+    return rows
 
 def print_progress(current, total, section):
     """Print progress indicator"""
@@ -68,6 +64,7 @@ def print_progress(current, total, section):
 # ============================================================================
 # TEAMS DATA
 # ============================================================================
+telemetry.section('teams')
 standardize_mapping = {
     'OAK': 'LVR', 'SD': 'LAC', 'STL': 'LAR', 'LA': 'LAR', 'LV': 'LVR',
     'ARZ': 'ARI', 'BLT': 'BAL', 'CLV': 'CLE', 'HST': 'HOU', 'SL': 'LAR'
@@ -113,90 +110,43 @@ print(f"✅ Created teams.csv with {len(df_teams)} teams")
 # ============================================================================
 # TEAM GAME LOGS (2023-2024) — COMPLETED ✅
 # ============================================================================
+telemetry.section('team_game_logs')
 data_dir = f'{final_dir}/SR-game-logs'
 os.makedirs(data_dir, exist_ok=True)
 opponent_data_dir = f'{final_dir}/SR-opponent-game-logs'
 os.makedirs(opponent_data_dir, exist_ok=True)
-team_game_logs_headers = [
-    'rk','gtm','week','date','day','game_location','opp','result','pts','pts_opp','ot',
-    'pass_cmp','pass_att','pass_cmp_pct','pass_yds','pass_td','pass_ya','pass_aya','pass_rate',
-    'pass_sk','pass_sk_yds','rush_att','rush_yds','rush_td','rush_ya','plays','total_yds','ypp',
-    'fga','fgm','xpa','xpm','punt','punt_yds','first_downs_pass','first_downs_rush','first_downs_pen',
-    'first_downs_total','third_down_conv','third_down_att','fourth_down_conv','fourth_down_att',
-    'pen','pen_yds','fumbles_lost','turnovers_int','turnovers_total','time_of_poss'
-]
-opponent_game_logs_headers = team_game_logs_headers[:]  # same shape
 for year in range(2023, 2025):
     team_file = f'{data_dir}/all_teams_game_logs_{year}.csv'
     opponent_file = f'{opponent_data_dir}/all_teams_opponent_game_logs_{year}.csv'
     all_team_game_logs = []
     all_opponent_game_logs = []
-    for i, (abbr, name, division) in enumerate(teams, 1):
-        url = f'https://www.pro-football-reference.com/teams/{abbr}/{year}/gamelog/'
-        print_progress(i, len(teams), f"Team Game Logs {year}")
-        
-        response = make_request_with_retry(url)
-        if response is None:
+    targets = {pfr.gamelog_url(abbr, year): name for abbr, name, division in teams}
+    for i, (url, name, found) in enumerate(scraper.tables([pfr.TEAM_GAME_LOG, pfr.OPPONENT_GAME_LOG], targets), 1):
+        print_progress(i, len(targets), f"Team Game Logs {year}")
+        if found is None:
             print(f"[skip] {name} {year}: failed to load {url}")
             continue
-
-        # PFR uses specific table IDs for game logs
-        soup_page = BeautifulSoup(response.text, 'lxml')
-        
-        # Look for the correct table IDs used by PFR
-        team_tbl = soup_page.find('table', {'id': 'table_pfr_team-year_game-logs_team-year-regular-season-game-log'})
-        opp_tbl = soup_page.find('table', {'id': 'table_pfr_team-year_game-logs_team-year-regular-season-opponent-game-log'})
-        
-        if not team_tbl and not opp_tbl:
+        if not found:
             print(f"[warn] No game log tables found for {name} {year} at {url}")
             continue
-
-        # harvest team table
-        if team_tbl and team_tbl.find('tbody'):
-            for tr in team_tbl.find('tbody').find_all('tr'):
-                cls = tr.get('class') or []
-                if 'thead' in cls:
-                    continue
-                row = [td.get_text(strip=True) for td in tr.find_all(['th','td'])]
-                if not row:
-                    continue
-                # normalize length to headers
-                if len(row) < len(team_game_logs_headers):
-                    row = row + [''] * (len(team_game_logs_headers) - len(row))
-                elif len(row) > len(team_game_logs_headers):
-                    row = row[:len(team_game_logs_headers)]
-                row.append(name)
-                all_team_game_logs.append(row)
+        # harvest team and opponent tables (rows padded to the header, team name appended)
+        if pfr.TEAM_GAME_LOG.name in found:
+            all_team_game_logs.extend(pfr.TEAM_GAME_LOG.rows(found[pfr.TEAM_GAME_LOG.name], name))
         else:
             print(f"[warn] Missing team table for {name} {year}")
-
-        # harvest opponent table
-        if opp_tbl and opp_tbl.find('tbody'):
-            for tr in opp_tbl.find('tbody').find_all('tr'):
-                cls = tr.get('class') or []
-                if 'thead' in cls:
-                    continue
-                row = [td.get_text(strip=True) for td in tr.find_all(['th','td'])]
-                if not row:
-                    continue
-                if len(row) < len(opponent_game_logs_headers):
-                    row = row + [''] * (len(opponent_game_logs_headers) - len(row))
-                elif len(row) > len(opponent_game_logs_headers):
-                    row = row[:len(opponent_game_logs_headers)]
-                row.append(name)
-                all_opponent_game_logs.append(row)
+        if pfr.OPPONENT_GAME_LOG.name in found:
+            all_opponent_game_logs.extend(pfr.OPPONENT_GAME_LOG.rows(found[pfr.OPPONENT_GAME_LOG.name], name))
         else:
             print(f"[warn] Missing opponent table for {name} {year}")
-        sleep(3)  # Increased delay to avoid rate limiting
     with open(team_file, 'w', newline='', encoding='utf-8') as f:
         w = csv.writer(f)
-        w.writerow(team_game_logs_headers + ['team_name'])
+        w.writerow(pfr.TEAM_GAME_LOG.header)
         w.writerows(all_team_game_logs)
     print(f"✅ Created {team_file} with {len(all_team_game_logs)} team game logs")
 
     with open(opponent_file, 'w', newline='', encoding='utf-8') as f:
         w = csv.writer(f)
-        w.writerow(opponent_game_logs_headers + ['team_name'])
+        w.writerow(pfr.OPPONENT_GAME_LOG.header)
         w.writerows(all_opponent_game_logs)
     print(f"✅ Created {opponent_file} with {len(all_opponent_game_logs)} opponent game logs")
 
@@ -206,6 +156,7 @@ for year in range(2023, 2025):
 # ============================================================================
 # GAMES DATA
 # ============================================================================
+telemetry.section('games')
 data_dir = f'{final_dir}/SR-game-logs'
 directory = data_dir
 df_list = []
@@ -376,6 +327,7 @@ if df_list:
 # ============================================================================
 # BOX SCORES (2023-2024)
 # ============================================================================
+telemetry.section('box_scores')
 # Check if game_logs.csv exists and has data
 games_csv_path = f'{final_dir}/game_logs.csv'
 if not os.path.exists(games_csv_path):
@@ -388,50 +340,20 @@ else:
         print(f"📊 Found {len(games_df_check)} games in game_logs.csv, proceeding with Box Scores...")
         os.makedirs(f'{final_dir}/SR-box-scores/', exist_ok=True)
         games_df_temp = pd.read_csv(f'{final_dir}/game_logs.csv')
-        headers = ['URL', 'Team', '1', '2', '3', '4', 'OT1', 'OT2', 'OT3', 'OT4', 'Final']
+        headers = list(pfr.LINESCORE.header)
         for year_to_scrape in range(2023, 2025):
             csv_file_path = f'{final_dir}/SR-box-scores/all_box_scores_{year_to_scrape}.csv'
-            games_csv_path = f'{final_dir}/game_logs.csv'
+            game_urls = [row['pfr_url'] for row in played_games(year_to_scrape)]
             with open(csv_file_path, 'w', newline='') as csvfile:
                 score_writer = csv.writer(csvfile)
                 score_writer.writerow(headers)
-                game_urls = []
-                with open(games_csv_path, 'r') as csvfile:
-                    reader = csv.DictReader(csvfile)
-                    now_dt = datetime.now()
-                    for row in reader:
-                        try:
-                            game_dt = datetime.fromisoformat(row['date'])
-                        except Exception:
-                            continue
-                        if row['season'] == str(year_to_scrape) and game_dt <= now_dt:
-                            game_urls.append(row['pfr_url'])
-                for url in game_urls:
-                    try:
-                        print(f"Scraping game: {url}")
-                        response = make_request_with_retry(url)
-                        if response is None:
-                            print(f"Error scraping {url}: failed after retries")
-                            time.sleep(2.5)
-                            continue
-                        raw_file_name = url.split('/')[-1].replace('.htm', '') + '.html'
-                        raw_file_path = f'{final_dir}/SR-box-scores/{raw_file_name}'
-                        with open(raw_file_path, 'wb') as raw_file:
-                            raw_file.write(response.content)
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        linescore_table = soup.find('table', class_='linescore')
-                        if linescore_table:
-                            rows = linescore_table.find_all('tr')[1:]
-                            for row in rows:
-                                cols = row.find_all('td')
-                                team_name = cols[1].text.strip()
-                                scores = [col.text.strip() for col in cols[2:]]
-                                scores += [''] * (len(headers) - 2 - len(scores))
-                                score_writer.writerow([url, team_name] + scores)
-                        time.sleep(2.5)
-                    except Exception as e:
-                        print(f"Error scraping {url}: {e}")
-                    time.sleep(2.5)
+                for url, found in fetch_tables(GAME_PAGE_SPECS, game_urls).items():
+                    if found is None:
+                        print(f"Error scraping {url}: failed after retries")
+                        continue
+                    if pfr.LINESCORE.name in found:
+                        score_writer.writerows(pfr.LINESCORE.rows(found[pfr.LINESCORE.name], url))
+                        print(f"Scraped game: {url}")
         input_dir = f'{final_dir}/SR-box-scores/'
         csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
         if csv_files:
@@ -446,58 +368,23 @@ else:
 # ============================================================================
 # SCORING TABLES (2023-2024)
 # ============================================================================
+telemetry.section('scoring_tables')
 os.makedirs(f'{final_dir}/SR-scoring-tables/', exist_ok=True)
 for year_to_scrape in range(2023, 2025):
     output_filename = f'{final_dir}/SR-scoring-tables/all_nfl_scoring_tables_{year_to_scrape}.csv'
     with open(output_filename, 'w', newline='') as output_csvfile:
         csvwriter = csv.writer(output_csvfile)
-        csvwriter.writerow(['Quarter', 'Time', 'Team', 'Detail', 'Team_1', 'Team_2', 'Game_ID'])
-        games_df_temp = pd.read_csv(f'{final_dir}/game_logs.csv')
-        games_df_temp['pfr'] = games_df_temp['game_id'].str.replace('_', '').str.lower()
-        rows = []
-        now_dt = datetime.now()
-        for _, row in games_df_temp.iterrows():
-            try:
-                game_dt = datetime.fromisoformat(row['date'])
-            except Exception:
+        csvwriter.writerow(pfr.SCORING.header)
+        targets = {pfr.boxscore_url(row['pfr']): row['game_id'] for row in played_games(year_to_scrape)}
+        for url, found in fetch_tables(GAME_PAGE_SPECS, targets).items():
+            game_id = targets[url]
+            if found is None:
+                continue
+            if pfr.SCORING.name not in found:
+                print(f"No scoring table found for {url}")
                 continue
-            if int(row['game_id'].split('_')[0]) == year_to_scrape and game_dt <= now_dt:
-                rows.append(row.to_dict())
-        for row in rows:
-            pfr_value = row['pfr']
-            game_id = row['game_id']
-            url = f"https://www.pro-football-reference.com/boxscores/{pfr_value}.htm"
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    response = requests.get(url, timeout=10)
-                    response.raise_for_status()
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    table = soup.find('table', {'id': 'scoring'})
-                    if table is None:
-                        print(f"No scoring table found for {url}")
-                        break
-                    last_quarter = None
-                    for i, tr in enumerate(table.find_all('tr')):
-                        if i == 0:
-                            continue
-                        cells = tr.find_all(['td', 'th'])
-                        if len(cells) > 0:
-                            csv_row = [cell.text for cell in cells]
-                            if csv_row[0]:
-                                last_quarter = csv_row[0]
-                            else:
-                                csv_row[0] = last_quarter
-                            csv_row.append(game_id)
-                            csvwriter.writerow(csv_row)
-                    print(f"Successfully scraped scoring data for game ID: {game_id}")
-                    break
-                except (requests.exceptions.RequestException, Exception) as e:
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-                    else:
-                        break
-            time.sleep(2.5)
+            csvwriter.writerows(pfr.SCORING.rows(found[pfr.SCORING.name], game_id))
+            print(f"Successfully scraped scoring data for game ID: {game_id}")
 input_dir = f'{final_dir}/SR-scoring-tables/'
 csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
 if csv_files:
@@ -511,53 +398,21 @@ else:
 # ============================================================================
 # TEAM STATS (2023-2024)
 # ============================================================================
+telemetry.section('team_stats')
 os.makedirs(f'{final_dir}/SR-team-stats/', exist_ok=True)
-team_stats_headers = [
-    'Player', 'PF', 'Yds', 'Ply', 'Y/P', 'TO', 'FL', '1stD', 'Cmp', 'Att', 'Yds', 'TD', 'Int', 'NY/A',
-    '1stD', 'Att', 'Yds', 'TD', 'Y/A', '1stD', 'Pen', 'Yds', '1stPy', '#Dr', 'Sc%', 'TO%', 'Start', 'Time', 'Plays', 'Yds', 'Pts', 'Team'
-]
+team_stats_headers = list(pfr.TEAM_STATS.header)
 for year in range(2023, 2025):
     output_file = f'{final_dir}/SR-team-stats/all_teams_stats_{year}.csv'
     all_team_stats = []
-    for team in teams:
-        abbreviation, name, division = team
-        url = f'https://www.pro-football-reference.com/teams/{abbreviation}/{year}.htm'
-        max_retries = 3
-        retry_delay = 10
-        response = None
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url)
-                if response.status_code == 429:
-                    sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                elif response.status_code != 200:
-                    break
-                else:
-                    break
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                else:
-                    break
-        if response is None or response.status_code != 200:
+    targets = {pfr.team_url(abbreviation, year): (abbreviation, name) for abbreviation, name, division in teams}
+    for url, found in fetch_tables(TEAM_PAGE_SPECS, targets).items():
+        abbreviation, name = targets[url]
+        if found is None:
             continue
-        soup = BeautifulSoup(response.content, 'html.parser')
-        table = soup.find('table', {'id': 'team_stats'})
-        if table is None:
+        if pfr.TEAM_STATS.name not in found:
             print(f'Team stats table not found on page {url} for {name} in {year}')
             continue
-        tbody = table.find('tbody')
-        if tbody:
-            for tr in tbody.find_all('tr'):
-                row_data = [tr.find('th').text.strip()]
-                row_data.extend([td.text.strip() for td in tr.find_all('td')])
-                row_data.append(abbreviation)
-                all_team_stats.append(row_data)
-        sleep(2.5)
+        all_team_stats.extend(pfr.TEAM_STATS.rows(found[pfr.TEAM_STATS.name], abbreviation))
     with open(output_file, mode='w', newline='', encoding='utf-8') as file:
         writer = csv.writer(file)
         writer.writerow(team_stats_headers)
@@ -579,70 +434,24 @@ else:
 # ============================================================================
 # SCHEDULE & GAME RESULTS (2023-2024)
 # ============================================================================
+telemetry.section('schedule')
 os.makedirs(f'{final_dir}/SR-schedule-and-game-results/', exist_ok=True)
-schedule_headers = [
-    'Week', 'Day', 'Date', 'Time', 'Boxscore', 'Outcome', 'OT', 'Rec', 'Home/Away', 'Opp', 
-    'Tm', 'OppPts', '1stD', 'TotYd', 'PassY', 'RushY', 'TO_lost', 
-    'Opp1stD', 'OppTotYd', 'OppPassY', 'OppRushY', 'TO_won',
-    'Offense', 'Defense', 'Sp. Tms'
-]
+schedule_headers = list(pfr.TEAM_SCHEDULE.header)
 for year in range(2023, 2025):
-    all_games = []
-    for team in teams:
-        abbreviation, name, division = team
-        url = f'https://www.pro-football-reference.com/teams/{abbreviation}/{year}.htm'
-        max_retries = 3
-        retry_delay = 10
-        response = None
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url, timeout=10)
-                if response.status_code == 429:
-                    sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                elif response.status_code != 200:
-                    break
-                else:
-                    break
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                else:
-                    break
-        if response is None or response.status_code != 200:
+    targets = {pfr.team_url(abbreviation, year): (abbreviation, name) for abbreviation, name, division in teams}
+    for url, found in fetch_tables(TEAM_PAGE_SPECS, targets).items():
+        abbreviation, name = targets[url]
+        if found is None:
             continue
-        soup = BeautifulSoup(response.content, 'html.parser')
-        table = soup.find('table', {'id': 'games'})
-        if table is None:
+        if pfr.TEAM_SCHEDULE.name not in found:
             print(f'Schedule & Game Results table not found on page {url} for {name} in {year}')
-            sleep(2.5)
-            continue
-        tbody = table.find('tbody')
-        if tbody is None:
-            print(f'No tbody found for games table on page {url} for {name} in {year}')
-            sleep(2.5)
             continue
-        team_games = []
-        for tr in tbody.find_all('tr'):
-            row_data = []
-            week_th = tr.find('th', {'data-stat': 'week_num'})
-            week_num = week_th.text.strip() if week_th else ''
-            row_data.append(week_num)
-            for td in tr.find_all('td'):
-                row_data.append(td.text.strip())
-            if len(row_data) != len(schedule_headers):
-                row_data += [''] * (len(schedule_headers) - len(row_data))
-            team_games.append(row_data)
-            all_games.append(row_data)
+        team_games = pfr.TEAM_SCHEDULE.rows(found[pfr.TEAM_SCHEDULE.name])
         team_file_path = f'{final_dir}/SR-schedule-and-game-results/{abbreviation}_{year}_schedule_and_game_results.csv'
         with open(team_file_path, mode='w', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
             writer.writerow(schedule_headers)
             writer.writerows(team_games)
-        sleep(2.5)
 all_games = []
 schedule_dir = f'{final_dir}/SR-schedule-and-game-results/'
 if os.path.exists(schedule_dir):
@@ -667,56 +476,23 @@ else:
 # ============================================================================
 # TEAM CONVERSIONS (2023-2024)
 # ============================================================================
+telemetry.section('team_conversions')
 os.makedirs(f'{final_dir}/SR-team-conversions/', exist_ok=True)
-team_conversions_headers = [
-    'Player', '3DAtt', '3DConv', '4DAtt', '4DConv', '4D%', 'RZAtt', 'RZTD', 'RZPct', 'Team'
-]
+team_conversions_headers = list(pfr.TEAM_CONVERSIONS.header)
 for year in range(2023, 2025):
-    for team in teams:
-        abbreviation, name, division = team
-        team_file = f'{final_dir}/SR-team-conversions/{abbreviation}_{year}_team_conversions.csv'
-        url = f'https://www.pro-football-reference.com/teams/{abbreviation}/{year}.htm'
-        max_retries = 3
-        retry_delay = 10
-        response = None
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url)
-                if response.status_code == 429:
-                    sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                elif response.status_code != 200:
-                    break
-                else:
-                    break
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                else:
-                    break
-        if response is None or response.status_code != 200:
+    targets = {pfr.team_url(abbreviation, year): (abbreviation, name) for abbreviation, name, division in teams}
+    for url, found in fetch_tables(TEAM_PAGE_SPECS, targets).items():
+        abbreviation, name = targets[url]
+        if found is None:
             continue
-        soup = BeautifulSoup(response.content, 'html.parser')
-        table = soup.find('table', {'id': 'team_conversions'})
-        if table is None:
+        if pfr.TEAM_CONVERSIONS.name not in found:
             print(f'Team Conversions table not found on page {url} for {name} in {year}')
-            sleep(2.5)
             continue
-        all_conversions = []
-        tbody = table.find('tbody')
-        if tbody:
-            for tr in tbody.find_all('tr'):
-                row_data = [td.text.strip() for td in tr.find_all(['th', 'td'])]
-                row_data.append(abbreviation)
-                all_conversions.append(row_data)
+        team_file = f'{final_dir}/SR-team-conversions/{abbreviation}_{year}_team_conversions.csv'
         with open(team_file, mode='w', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
             writer.writerow(team_conversions_headers)
-            writer.writerows(all_conversions)
-        sleep(3)
+            writer.writerows(pfr.TEAM_CONVERSIONS.rows(found[pfr.TEAM_CONVERSIONS.name], abbreviation))
 input_dir = f'{final_dir}/SR-team-conversions/'
 csv_files = [f for f in os.listdir(input_dir) if f.endswith('.csv')]
 if csv_files:
@@ -734,62 +510,20 @@ else:
 # ============================================================================
 # PASSING/RUSHING/RECEIVING (2023-2024)
 # ============================================================================
+telemetry.section('passing_rushing_receiving')
 os.makedirs(f'{final_dir}/SR-passing-rushing-receiving-game-logs/', exist_ok=True)
 for year_to_scrape in range(2023, 2025):
     output_filename = f'{final_dir}/SR-passing-rushing-receiving-game-logs/all_passing_rushing_receiving_{year_to_scrape}.csv'
     with open(output_filename, 'w', newline='') as output_csvfile:
         csvwriter = csv.writer(output_csvfile)
-        csvwriter.writerow([
-            'player', 'player_id', 'team', 'pass_cmp', 'pass_att', 'pass_yds', 'pass_td', 'pass_int', 
-            'pass_sacked', 'pass_sacked_yds', 'pass_long', 'pass_rating', 'rush_att', 'rush_yds', 'rush_td', 
-            'rush_long', 'targets', 'rec', 'rec_yds', 'rec_td', 'rec_long', 'fumbles', 'fumbles_lost', 'game_id'
-        ])
-        games_df_temp = pd.read_csv(f'{final_dir}/game_logs.csv')
-        games_df_temp['pfr'] = games_df_temp['game_id'].str.replace('_', '').str.lower()
-        rows = []
-        now_dt = datetime.now()
-        for _, row in games_df_temp.iterrows():
-            try:
-                game_dt = datetime.fromisoformat(row['date'])
-            except Exception:
+        csvwriter.writerow(pfr.PLAYER_OFFENSE.header)
+        targets = {pfr.boxscore_url(row['pfr']): row['game_id'] for row in played_games(year_to_scrape)}
+        for url, found in fetch_tables(GAME_PAGE_SPECS, targets).items():
+            game_id = targets[url]
+            if found is None or pfr.PLAYER_OFFENSE.name not in found:
                 continue
-            if int(row['game_id'].split('_')[0]) == year_to_scrape and game_dt <= now_dt:
-                rows.append(row.to_dict())
-        for row in rows:
-            pfr_value = row['pfr']
-            game_id = row['game_id']
-            url = f"https://www.pro-football-reference.com/boxscores/{pfr_value}.htm"
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    response = requests.get(url, timeout=10)
-                    if response.status_code == 429:
-                        print(f"Rate limit exceeded for URL {url}. Please try again later.")
-                        time.sleep(60)
-                        continue
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    table = soup.find('div', id='div_player_offense')
-                    if table:
-                        for i, tr in enumerate(table.find_all('tr')):
-                            if i == 0:
-                                continue
-                            player_cell = tr.find('th')
-                            if player_cell:
-                                player_name = player_cell.get_text()
-                                player_link = player_cell.find('a')
-                                player_id = player_link['href'].split('/')[-1] if player_link else None
-                                stats = [td.get_text() for td in tr.find_all('td')]
-                                row_data = [player_name, player_id] + stats + [game_id]
-                                csvwriter.writerow(row_data)
-                        print(f"Successfully scraped passing/rushing/receiving data for game ID: {game_id}")
-                        time.sleep(2)
-                        break
-                except Exception as e:
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-                    else:
-                        break
-            time.sleep(2.5)
+            csvwriter.writerows(pfr.PLAYER_OFFENSE.rows(found[pfr.PLAYER_OFFENSE.name], game_id))
+            print(f"Successfully scraped passing/rushing/receiving data for game ID: {game_id}")
 directory = f'{final_dir}/SR-passing-rushing-receiving-game-logs/'
 for filename in os.listdir(directory):
     if filename.endswith('.csv'):
@@ -817,65 +551,28 @@ else:
 # ============================================================================
 # DEFENSE GAME LOGS (2023-2024)
 # ============================================================================
+telemetry.section('defense')
 os.makedirs(f'{final_dir}/SR-defense-game-logs/', exist_ok=True)
-headers = [
-    'player', 'team', 'def_int', 'def_int_yds', 'def_int_td', 'def_int_long', 'pass_defended', 'sacks',
-    'tackles_combined', 'tackles_solo', 'tackles_assists', 'tackles_loss', 'qb_hits', 'fumbles_rec',
-    'fumbles_rec_yds', 'fumbles_rec_td', 'fumbles_forced', 'game_id'
-]
+headers = list(pfr.PLAYER_DEFENSE.header)
 for year_to_scrape in range(2023, 2025):
     output_filename = f'{final_dir}/SR-defense-game-logs/all_defense_{year_to_scrape}.csv'
     with open(output_filename, 'w', newline='') as output_csvfile:
         csvwriter = csv.writer(output_csvfile)
         csvwriter.writerow(headers)
-        games_df_temp = pd.read_csv(f'{final_dir}/game_logs.csv')
-        games_df_temp['pfr'] = games_df_temp['game_id'].str.replace('_', '').str.lower()
-        rows = []
-        now_dt = datetime.now()
-        for _, row in games_df_temp.iterrows():
-            try:
-                game_dt = datetime.fromisoformat(row['date'])
-            except Exception:
+        targets = {
+            pfr.boxscore_url(row['pfr']): row['game_id']
+            for row in played_games(year_to_scrape)
+            if row['away_score'] and row['home_score']
+        }
+        for url, found in fetch_tables(GAME_PAGE_SPECS, targets).items():
+            game_id = targets[url]
+            if found is None:
                 continue
-            if int(row['game_id'].split('_')[0]) == year_to_scrape and game_dt <= now_dt:
-                rows.append(row.to_dict())
-        for row in rows:
-            if not row['away_score'] or not row['home_score']:
+            if pfr.PLAYER_DEFENSE.name not in found:
+                print(f"No defense table found for {url}")
                 continue
-            pfr_value = row['pfr']
-            game_id = row['game_id']
-            url = f"https://www.pro-football-reference.com/boxscores/{pfr_value}.htm"
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    response = requests.get(url, timeout=10)
-                    response.raise_for_status()
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-                    table_found = False
-                    for comment in comments:
-                        soup_comment = BeautifulSoup(comment, 'html.parser')
-                        table = soup_comment.find('table', id='player_defense')
-                        if table:
-                            table_found = True
-                            for i, tr in enumerate(table.find_all('tr')):
-                                if i == 0:
-                                    continue
-                                player_name = tr.find('th').get_text() if tr.find('th') else ''
-                                stats = [td.get_text() for td in tr.find_all('td')]
-                                row_data = [player_name] + stats + [game_id]
-                                csvwriter.writerow(row_data)
-                            print(f"Successfully scraped defense data for game ID: {game_id}")
-                            break
-                    if not table_found:
-                        print(f"No defense table found for {url}")
-                    break
-                except Exception as e:
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-                    else:
-                        break
-            time.sleep(2.5)
+            csvwriter.writerows(pfr.PLAYER_DEFENSE.rows(found[pfr.PLAYER_DEFENSE.name], game_id))
+            print(f"Successfully scraped defense data for game ID: {game_id}")
 for year in range(2023, 2025):
     file_path = f'{final_dir}/SR-defense-game-logs/all_defense_{year}.csv'
     try:
@@ -897,5 +594,6 @@ else:
 
 end_time = datetime.now()
 elapsed_time = end_time - start_time
+scraper.close()
 print(f"\n✅ Scraping completed in {elapsed_time}")
 print(f"📁 Output: {final_dir}/")
@@ -0,0 +1,36 @@
+"""Shared scraping helpers for the Pro-Football-Reference scrapers."""
+
+from .archive import PageArchive, reparse_requested
+from .conditional import ConditionalDownloader
+from .fetch import FetchEngine, TokenBucket, parse_retry_after
+from .memory import MemoryBudget
+from .parse import ParsePool
+from .pipeline import UNCHANGED, Pipeline, Task, add_pipeline_arguments
+from .specs import Scraper, TableSpec, data_rows
+from .tables import Table, extract_table, extract_tables, find_table_html
+from .telemetry import Telemetry
+from .writers import AppendOnlyCSV
+
+__all__ = [
+    "AppendOnlyCSV",
+    "ConditionalDownloader",
+    "FetchEngine",
+    "MemoryBudget",
+    "PageArchive",
+    "ParsePool",
+    "Pipeline",
+    "Scraper",
+    "Table",
+    "TableSpec",
+    "Task",
+    "Telemetry",
+    "TokenBucket",
+    "UNCHANGED",
+    "add_pipeline_arguments",
+    "data_rows",
+    "extract_table",
+    "extract_tables",
+    "find_table_html",
+    "parse_retry_after",
+    "reparse_requested",
+]
@@ -0,0 +1,217 @@
+"""Persistent, compressed archive of raw PFR pages.
+
+Pages are stored once per distinct body under ``objects/<sha[:2]>/<sha>.<codec>``
+and indexed by URL in a small SQLite manifest. Historical pages are kept
+forever; pages for the current season change every week, so they are evicted
+oldest-first once they exceed ``max_volatile_bytes``.
+
+With ``offline=True`` (the scrapers' ``--reparse`` mode) the fetch engine serves
+archived hosts from disk only, so every CSV can be re-derived after a parser
+fix without touching the network.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+from typing import Iterable, Optional
+from urllib.parse import urlparse
+
+import requests
+
+try:
+    import zstandard
+except ImportError:  # optional, gzip is always available
+    zstandard = None
+
+
+DEFAULT_ARCHIVE_DIR = "pfr-archive"
+DEFAULT_HOSTS = ("www.pro-football-reference.com",)
+DEFAULT_MAX_VOLATILE_MB = 512
+
+_SEASON_RE = re.compile(r"/((?:19|20)\d{2})")
+
+
+def reparse_requested(argv: Optional[Iterable[str]] = None) -> bool:
+    """True when the run was started with ``--reparse`` or ``SCRAPER_REPARSE=1``."""
+
+    argv = sys.argv[1:] if argv is None else argv
+    return "--reparse" in argv or os.environ.get("SCRAPER_REPARSE") == "1"
+
+
+def current_season(today: Optional[datetime] = None) -> int:
+    """NFL season in progress; January/February games belong to the prior year."""
+
+    today = today or datetime.now()
+    return today.year if today.month >= 3 else today.year - 1
+
+
+def season_of(url: str) -> Optional[int]:
+    """Best-effort season for a PFR URL (boxscores, teams, years, gamelog)."""
+
+    match = _SEASON_RE.search(urlparse(url).path)
+    return int(match.group(1)) if match else None
+
+
+class PageArchive:
+    """Content-addressed store of fetched pages with a URL manifest."""
+
+    def __init__(
+        self,
+        root: str = DEFAULT_ARCHIVE_DIR,
+        offline: bool = False,
+        hosts: Iterable[str] = DEFAULT_HOSTS,
+        max_volatile_bytes: Optional[int] = None,
+    ):
+        self.root = root
+        self.offline = offline
+        self.hosts = set(hosts)
+        if max_volatile_bytes is None:
+            max_mb = float(os.environ.get("PFR_ARCHIVE_MAX_MB", DEFAULT_MAX_VOLATILE_MB))
+            max_volatile_bytes = int(max_mb * 1024 * 1024)
+        self.max_volatile_bytes = max_volatile_bytes
+        self.codec = "zst" if zstandard is not None else "gz"
+        self.lock = threading.Lock()
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(root, "manifest.db"), check_same_thread=False)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                sha256 TEXT NOT NULL,
+                codec TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                stored_size INTEGER NOT NULL,
+                season INTEGER,
+                volatile INTEGER NOT NULL,
+                fetched_at TEXT NOT NULL
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_sha ON pages (sha256)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_volatile ON pages (volatile, fetched_at)")
+        self.conn.commit()
+
+    def archives(self, url: str) -> bool:
+        return urlparse(url).netloc in self.hosts
+
+    def _blob_path(self, sha: str, codec: str) -> str:
+        return os.path.join(self.root, "objects", sha[:2], f"{sha}.{codec}")
+
+    def _compress(self, content: bytes) -> bytes:
+        if self.codec == "zst":
+            return zstandard.ZstdCompressor(level=10).compress(content)
+        return gzip.compress(content, compresslevel=6)
+
+    @staticmethod
+    def _decompress(data: bytes, codec: str) -> bytes:
+        if codec == "zst":
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read .zst archive entries")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def put(self, url: str, content: bytes) -> str:
+        """Store ``content`` for ``url`` and return its SHA-256."""
+
+        sha = hashlib.sha256(content).hexdigest()
+        season = season_of(url)
+        volatile = season is not None and season >= current_season()
+        with self.lock:
+            row = self.conn.execute("SELECT sha256 FROM pages WHERE url = ?", (url,)).fetchone()
+            if row and row[0] == sha:
+                self.conn.execute(
+                    "UPDATE pages SET fetched_at = ? WHERE url = ?",
+                    (datetime.now().isoformat(timespec="seconds"), url),
+                )
+                self.conn.commit()
+                return sha
+            path = self._blob_path(sha, self.codec)
+            stored_size = self._write_blob(path, content)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, sha, self.codec, len(content), stored_size, season, int(volatile),
+                 datetime.now().isoformat(timespec="seconds")),
+            )
+            if row:
+                self._drop_blob_if_unused(row[0])
+            if volatile:
+                self._evict_volatile(keep_url=url)
+            self.conn.commit()
+        return sha
+
+    def _write_blob(self, path: str, content: bytes) -> int:
+        if os.path.exists(path):
+            return os.path.getsize(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self._compress(content))
+        os.replace(tmp_path, path)
+        return os.path.getsize(path)
+
+    def _drop_blob_if_unused(self, sha: str) -> None:
+        rows = self.conn.execute("SELECT codec FROM pages WHERE sha256 = ?", (sha,)).fetchall()
+        if rows:
+            return
+        for codec in ("zst", "gz"):
+            path = self._blob_path(sha, codec)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _evict_volatile(self, keep_url: str) -> None:
+        total = self.conn.execute("SELECT COALESCE(SUM(stored_size), 0) FROM pages WHERE volatile = 1").fetchone()[0]
+        if total <= self.max_volatile_bytes:
+            return
+        candidates = self.conn.execute(
+            "SELECT url, sha256, stored_size FROM pages WHERE volatile = 1 AND url != ? ORDER BY fetched_at",
+            (keep_url,),
+        ).fetchall()
+        for url, sha, stored_size in candidates:
+            if total <= self.max_volatile_bytes:
+                break
+            self.conn.execute("DELETE FROM pages WHERE url = ?", (url,))
+            self._drop_blob_if_unused(sha)
+            total -= stored_size
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Return the archived body for ``url`` or ``None``."""
+
+        with self.lock:
+            row = self.conn.execute("SELECT sha256, codec FROM pages WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        path = self._blob_path(*row)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            return self._decompress(f.read(), row[1])
+
+    def response(self, url: str) -> Optional[requests.Response]:
+        """Archived page wrapped as a ``requests.Response`` for the parsers."""
+
+        content = self.get(url)
+        if content is None:
+            return None
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = content
+        response.encoding = "utf-8"
+        response.headers["Content-Type"] = "text/html; charset=utf-8"
+        response.from_archive = True
+        return response
+
+    def stats(self) -> dict:
+        with self.lock:
+            pages, size, stored = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM pages"
+            ).fetchone()
+            blobs = self.conn.execute("SELECT COUNT(DISTINCT sha256) FROM pages").fetchone()[0]
+        return {"pages": pages, "blobs": blobs, "bytes": size, "stored_bytes": stored}
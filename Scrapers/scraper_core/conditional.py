@@ -0,0 +1,147 @@
+"""Conditional downloads for the nflverse bulk files.
+
+For every URL the store keeps the ``ETag``, ``Last-Modified`` and SHA-256 of
+the last body written to disk. The next request sends ``If-None-Match`` /
+``If-Modified-Since``; a 304, or a 200 whose body hashes to the same digest,
+leaves the file untouched and reports it unchanged so the stages built on it
+can skip their transformations.
+
+``download_many`` fetches a batch of files concurrently and skips those whose
+local copy was confirmed current less than ``max_age`` seconds ago (settled
+past seasons), so only missing or stale files cost a request.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from .fetch import FetchEngine
+
+
+DEFAULT_METADATA_PATH = os.path.join("data", "http-metadata.json")
+
+
+def file_sha256(path: str) -> Optional[str]:
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ConditionalDownloader:
+    """Download files only when their upstream content changed."""
+
+    def __init__(self, fetcher: "FetchEngine", path: str = DEFAULT_METADATA_PATH):
+        self.fetcher = fetcher
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.entries = json.load(f)
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def download(self, url: str, dest: str, timeout: float = 60) -> bool:
+        """Fetch ``url`` into ``dest``; return True if the file content changed."""
+
+        with self.lock:
+            entry = dict(self.entries.get(url, {}))
+        headers = {}
+        # Validators are only trusted while the local copy is the one they describe.
+        local_current = bool(entry) and file_sha256(dest) == entry.get("sha256")
+        if local_current:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        response = self.fetcher.get(url, timeout=timeout, headers=headers)
+        checked_at = datetime.now().isoformat(timespec="seconds")
+        if response.status_code == 304:
+            with self.lock:
+                self.entries[url]["checked_at"] = checked_at
+                self._save()
+            return False
+        sha = hashlib.sha256(response.content).hexdigest()
+        changed = not (local_current and sha == entry.get("sha256"))
+        if changed:
+            os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+            tmp_path = f"{dest}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(response.content)
+            os.replace(tmp_path, dest)
+        with self.lock:
+            self.entries[url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "sha256": sha,
+                "size": len(response.content),
+                "checked_at": checked_at,
+                "changed_at": checked_at if changed else entry.get("changed_at", checked_at),
+            }
+            self._save()
+        return changed
+
+    def is_fresh(self, url: str, dest: str, max_age: Optional[float]) -> bool:
+        """True if ``dest`` is the copy last fetched from ``url`` and was checked within ``max_age`` seconds."""
+
+        if max_age is None or not os.path.exists(dest):
+            return False
+        with self.lock:
+            entry = self.entries.get(url)
+        if not entry or os.path.getsize(dest) != entry.get("size"):
+            return False
+        try:
+            checked_at = datetime.fromisoformat(entry["checked_at"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        return (datetime.now() - checked_at).total_seconds() < max_age
+
+    def download_many(
+        self,
+        downloads: Iterable[Tuple[str, str, Optional[float]]],
+        workers: Optional[int] = None,
+    ) -> Dict[str, Union[bool, Exception]]:
+        """Fetch ``(url, dest, max_age)`` items concurrently; map each ``dest`` to changed or the error.
+
+        Items that are still fresh for their ``max_age`` are not requested and
+        count as unchanged; ``max_age=None`` always checks upstream.
+        """
+
+        results: Dict[str, Union[bool, Exception]] = {}
+        pending = []
+        for url, dest, max_age in downloads:
+            if self.is_fresh(url, dest, max_age):
+                results[dest] = False
+            else:
+                pending.append((url, dest))
+        if not pending:
+            return results
+
+        def run(url: str, dest: str) -> Union[bool, Exception]:
+            try:
+                return self.download(url, dest)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(len(pending), workers or self.fetcher.max_workers)) as pool:
+            futures = [(dest, pool.submit(contextvars.copy_context().run, run, url, dest)) for url, dest in pending]
+            for dest, future in futures:
+                results[dest] = future.result()
+        return results
@@ -0,0 +1,137 @@
+"""Season-partitioned Parquet copies of the scraper outputs.
+
+Each merged CSV is also written as ``data/parquet/<name>/season=<year>/``
+(hive partitioning) with an explicit schema, so readers can pull only the
+seasons and columns they need instead of parsing the full text files::
+
+    from scraper_core.dataset import load
+    df = load('games', columns=['game_id', 'home_team', 'spread_line'], seasons=[2023, 2024])
+
+``nfl_data.load`` and ``nfl_data.query`` read these datasets in place of the
+CSVs next to them whenever they are up to date.
+
+pyarrow is optional: without it the scrape still writes its CSVs and skips the
+Parquet output.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:  # optional, the CSVs are always written
+    pa = None
+    ds = None
+
+
+DEFAULT_ROOT = os.path.join("data", "parquet")
+PARTITION = "season"
+
+# Key columns get fixed types; every other text column is stored as string and
+# numeric columns keep the type pandas inferred.
+SCHEMAS: Dict[str, Dict[str, str]] = {
+    "games": {"game_id": "string", "week": "Int8", "home_team": "string", "away_team": "string",
+              "home_score": "Float32", "away_score": "Float32", "spread_line": "Float32", "total_line": "Float32"},
+    "player_stats": {"player_id": "string", "game_id": "string", "week": "Int8", "recent_team": "string"},
+    "rosters": {"gsis_id": "string", "pfr_id": "string", "team": "string", "week": "Int8"},
+    "box_scores": {"URL": "string", "Team": "string"},
+    "scoring_tables": {"Game_ID": "string", "Team": "string"},
+    "team_game_logs": {"game_id": "string"},
+    "team_stats": {"Team": "string", "Player": "string"},
+    "schedule": {"Team": "string", "Week": "string"},
+    "team_conversions": {"Team": "string"},
+    "passing_rushing_receiving": {"player_id": "string", "game_id": "string", "team": "string"},
+    "defense": {"player": "string", "team": "string", "game_id": "string"},
+    "redzone": {"Player": "string", "Tm": "string", "StatType": "string"},
+}
+
+_warned = False
+
+
+def available() -> bool:
+    return pa is not None
+
+
+def _apply_schema(frame: pd.DataFrame, schema: Dict[str, str]) -> pd.DataFrame:
+    for column, dtype in schema.items():
+        if column not in frame.columns:
+            continue
+        if dtype == "string":
+            frame[column] = frame[column].astype("string")
+        else:
+            frame[column] = pd.to_numeric(frame[column], errors="coerce").astype(dtype)
+    for column in frame.columns:
+        if frame[column].dtype == object:
+            frame[column] = frame[column].astype("string")
+    return frame
+
+
+def write_dataset(
+    name: str,
+    df: pd.DataFrame,
+    season: Union[str, pd.Series],
+    root: str = DEFAULT_ROOT,
+    schema: Optional[Dict[str, str]] = None,
+) -> Optional[str]:
+    """Write ``df`` as ``<root>/<name>/season=<year>/`` and return the path.
+
+    ``season`` is a column name or a Series aligned with ``df``. Partitions for
+    the seasons present in ``df`` are replaced; other seasons are kept.
+    """
+
+    global _warned
+    if pa is None:
+        if not _warned:
+            print("pyarrow is not installed; skipping Parquet output")
+            _warned = True
+        return None
+    seasons = df[season] if isinstance(season, str) else season
+    frame = df.copy()
+    frame[PARTITION] = pd.to_numeric(seasons, errors="coerce").astype("Int16")
+    missing = int(frame[PARTITION].isna().sum())
+    if missing:
+        print(f"{name}: {missing} rows without a season left out of the Parquet dataset")
+        frame = frame[frame[PARTITION].notna()]
+    frame = _apply_schema(frame, {**SCHEMAS.get(name, {}), **(schema or {})})
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    path = os.path.join(root, name)
+    ds.write_dataset(
+        table,
+        path,
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema([(PARTITION, pa.int16())]), flavor="hive"),
+        existing_data_behavior="delete_matching",
+        basename_template="part-{i}.parquet",
+    )
+    print(f"Parquet dataset written to {path} ({frame[PARTITION].nunique()} seasons, {len(frame)} rows)")
+    return path
+
+
+def load(
+    name: str,
+    columns: Optional[List[str]] = None,
+    seasons: Optional[Union[int, Iterable[int]]] = None,
+    root: str = DEFAULT_ROOT,
+) -> pd.DataFrame:
+    """Read a dataset, touching only the requested columns and season partitions."""
+
+    if pa is None:
+        raise ImportError("pyarrow is required to read the Parquet datasets")
+    path = os.path.join(root, name)
+    if not os.path.isdir(path):
+        raise FileNotFoundError(f"No Parquet dataset at {path}; run the scraper first")
+    dataset = ds.dataset(
+        path,
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema([(PARTITION, pa.int16())]), flavor="hive"),
+    )
+    predicate = None
+    if seasons is not None:
+        seasons = [seasons] if isinstance(seasons, int) else list(seasons)
+        predicate = ds.field(PARTITION).isin(seasons)
+    return dataset.to_table(columns=columns, filter=predicate).to_pandas()
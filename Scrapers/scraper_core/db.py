@@ -0,0 +1,299 @@
+"""Keyed, incremental writes into nfl.db.
+
+Tables get a real primary key and every stage writes through ``upsert``:
+one ``executemany`` in one transaction, only touching rows whose values
+changed. The database runs in WAL mode so the apps reading nfl.db keep
+working while a scrape is writing to it, and is read through a memory map.
+
+Key columns have declared types (``COLUMN_TYPES``; ``week`` is an INTEGER, so
+``MAX(week)`` and ``week = ?`` need no CAST) and the lookups the apps run are
+served by the indexes in ``INDEXES``, created as each table is written.
+``optimize`` refreshes the planner statistics and checks that every query in
+``HOT_QUERIES`` still searches an index instead of scanning its table::
+
+    python -m scraper_core.db nfl.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from . import telemetry
+
+
+DEFAULT_DB_PATH = "nfl.db"
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Declared types that win over the ones inferred from a frame; a table created
+# with another type for one of these columns is rebuilt on its next write.
+COLUMN_TYPES: Dict[str, Dict[str, str]] = {
+    "Games": {"season": "INTEGER", "week": "INTEGER"},
+    "PlayerStats": {"season": "INTEGER", "week": "INTEGER"},
+    "Rosters": {"season": "INTEGER"},
+}
+
+# Secondary indexes per table (the primary key already covers its own prefix).
+INDEXES: Dict[str, List[Tuple[str, ...]]] = {
+    "Games": [("season", "week"), ("home_team", "season"), ("away_team", "season"), ("pfr",)],
+    "PlayerStats": [("game_id",), ("player_display_name", "season", "week"), ("season", "week")],
+    "Rosters": [("gsis_id",), ("pfr_id",)],
+}
+
+# (label, statement, parameters) of the lookups the apps and models run against nfl.db.
+HOT_QUERIES: List[Tuple[str, str, tuple]] = [
+    ("current week", "SELECT MAX(week) FROM Games WHERE season = ? AND home_score IS NOT NULL", (2024,)),
+    ("games of a week", "SELECT * FROM Games WHERE season = ? AND week = ?", (2024, 1)),
+    ("team schedule", "SELECT * FROM Games WHERE season = ? AND (home_team = ? OR away_team = ?)", (2024, "KC", "KC")),
+    ("last team game", "SELECT date FROM Games WHERE (home_team = ? OR away_team = ?) AND home_score IS NOT NULL "
+                       "ORDER BY date DESC LIMIT 1", ("KC", "KC")),
+    ("game by pfr id", "SELECT * FROM Games WHERE pfr = ?", ("202409050kan",)),
+    ("player game", "SELECT * FROM PlayerStats WHERE player_id = ? AND game_id = ?", ("00-0030506", "2024_01_BAL_KC")),
+    ("players of a game", "SELECT * FROM PlayerStats WHERE game_id = ?", ("2024_01_BAL_KC",)),
+    ("player last games", "SELECT week, receiving_yards FROM PlayerStats WHERE player_display_name = ? AND season = ? "
+                          "ORDER BY week DESC LIMIT 6", ("Travis Kelce", 2024)),
+    ("roster by gsis id", "SELECT * FROM Rosters WHERE gsis_id = ?", ("00-0030506",)),
+]
+
+
+def connect(path: str = DEFAULT_DB_PATH) -> sqlite3.Connection:
+    """Open ``path`` in WAL mode, memory-mapped."""
+
+    conn = sqlite3.connect(path, timeout=60)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+    return conn
+
+
+def sql_type(dtype) -> str:
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "REAL"
+    return "TEXT"
+
+
+def table_columns(conn: sqlite3.Connection, table: str) -> Dict[str, int]:
+    """``{column: pk position}`` for an existing table (empty if missing)."""
+
+    return {row[1]: row[5] for row in conn.execute(f'PRAGMA table_info("{table}")')}
+
+
+def declared_types(conn: sqlite3.Connection, table: str) -> Dict[str, str]:
+    return {row[1]: row[2].upper() or "TEXT" for row in conn.execute(f'PRAGMA table_info("{table}")')}
+
+
+def table_exists(table: str, path: str = DEFAULT_DB_PATH) -> bool:
+    if not os.path.exists(path):
+        return False
+    conn = connect(path)
+    try:
+        return bool(table_columns(conn, table))
+    finally:
+        conn.close()
+
+
+def ensure_table(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: Dict[str, str],
+    key: Sequence[str],
+) -> None:
+    """Create ``table`` with primary key ``key``, adding any missing columns.
+
+    A table left over from the old ``to_sql(if_exists='replace')`` runs has no
+    primary key, and older tables stored ``week`` as zero-padded text; both are
+    rebuilt with the current key and ``COLUMN_TYPES`` and their rows carried over.
+    """
+
+    existing = table_columns(conn, table)
+    existing_key = [name for name, pk in sorted(existing.items(), key=lambda item: item[1]) if pk]
+    types = declared_types(conn, table)
+    retyped = [name for name, column_type in COLUMN_TYPES.get(table, {}).items()
+               if name in types and types[name] != column_type]
+    if existing and (existing_key != list(key) or retyped):
+        retyped_note = f", retyping {', '.join(retyped)}" if retyped else ""
+        print(f"Rebuilding {table} in nfl.db with primary key ({', '.join(key)}){retyped_note}")
+        conn.execute(f'ALTER TABLE "{table}" RENAME TO "{table}_old"')
+        _create(conn, table, {**types, **columns, **COLUMN_TYPES.get(table, {})}, key)
+        carried = ", ".join(f'"{name}"' for name in existing)
+        not_null = " AND ".join(f'"{name}" IS NOT NULL' for name in key if name in existing) or "1"
+        if all(name in existing for name in key):
+            conn.execute(
+                f'INSERT OR REPLACE INTO "{table}" ({carried}) SELECT {carried} FROM "{table}_old" WHERE {not_null}'
+            )
+        conn.execute(f'DROP TABLE "{table}_old"')
+    elif not existing:
+        _create(conn, table, columns, key)
+    else:
+        for name, column_type in columns.items():
+            if name not in existing:
+                conn.execute(f'ALTER TABLE "{table}" ADD COLUMN "{name}" {column_type}')
+    ensure_indexes(conn, table)
+
+
+def ensure_indexes(conn: sqlite3.Connection, table: str) -> None:
+    """Create the ``INDEXES`` of ``table`` whose columns it has."""
+
+    existing = table_columns(conn, table)
+    for columns in INDEXES.get(table, ()):
+        if all(name in existing for name in columns):
+            name = f"idx_{table}_{'_'.join(columns)}".lower()
+            indexed = ", ".join(f'"{column}"' for column in columns)
+            conn.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" ({indexed})')
+
+
+def _create(conn: sqlite3.Connection, table: str, columns: Dict[str, str], key: Sequence[str]) -> None:
+    definitions = [f'"{name}" {column_type}' for name, column_type in columns.items()]
+    primary_key = ", ".join(f'"{name}"' for name in key)
+    conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({", ".join(definitions)}, PRIMARY KEY ({primary_key}))')
+
+
+def records(df: pd.DataFrame) -> List[tuple]:
+    """Rows as plain Python tuples (NaN -> None, datetimes -> text)."""
+
+    df = df.copy()
+    for column in df.columns:
+        if pd.api.types.is_datetime64_any_dtype(df[column]):
+            df[column] = df[column].dt.strftime("%Y-%m-%d %H:%M:%S")
+    df = df.astype(object).where(pd.notna(df), None)
+    return list(df.itertuples(index=False, name=None))
+
+
+def upsert(
+    conn: sqlite3.Connection,
+    table: str,
+    df: pd.DataFrame,
+    key: Sequence[str],
+    column_types: Optional[Dict[str, str]] = None,
+) -> int:
+    """Insert or update ``df`` into ``table`` by ``key``; return rows changed.
+
+    Rows that already hold identical values are left untouched, so a weekly
+    refresh only writes the games and players that actually changed.
+    """
+
+    missing = [name for name in key if name not in df.columns]
+    if missing:
+        raise KeyError(f"{table}: key columns {missing} not in frame")
+    dropped = int(df[list(key)].isna().any(axis=1).sum())
+    if dropped:
+        print(f"{table}: skipping {dropped} rows with an empty key ({', '.join(key)})")
+        df = df.dropna(subset=list(key))
+    df = df.drop_duplicates(subset=list(key), keep="last")
+    declared = {name: t for name, t in {**COLUMN_TYPES.get(table, {}), **(column_types or {})}.items() if name in df.columns}
+    integers = [name for name, t in declared.items() if t == "INTEGER" and not pd.api.types.is_integer_dtype(df[name])]
+    if integers:
+        # e.g. the zero-padded '01' weeks of games.csv
+        df = df.assign(**{name: pd.to_numeric(df[name], errors="coerce").astype("Int64") for name in integers})
+    columns = {name: sql_type(df[name].dtype) for name in df.columns}
+    columns.update(declared)
+    names = ", ".join(f'"{name}"' for name in df.columns)
+    placeholders = ", ".join("?" for _ in df.columns)
+    conflict = ", ".join(f'"{name}"' for name in key)
+    value_columns = [name for name in df.columns if name not in key]
+    if value_columns:
+        assignments = ", ".join(f'"{name}" = excluded."{name}"' for name in value_columns)
+        changed = " OR ".join(f'"{table}"."{name}" IS NOT excluded."{name}"' for name in value_columns)
+        on_conflict = f"DO UPDATE SET {assignments} WHERE {changed}"
+    else:
+        on_conflict = "DO NOTHING"
+    statement = f'INSERT INTO "{table}" ({names}) VALUES ({placeholders}) ON CONFLICT ({conflict}) {on_conflict}'
+    if conn.in_transaction:
+        conn.commit()
+    before = conn.total_changes
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        ensure_table(conn, table, columns, key)
+        conn.executemany(statement, records(df))
+    changed_rows = conn.total_changes - before
+    telemetry.record(rows_written=changed_rows)
+    return changed_rows
+
+
+def query_plan(conn: sqlite3.Connection, statement: str, params: Sequence = ()) -> List[str]:
+    """``EXPLAIN QUERY PLAN`` of ``statement`` as its detail lines."""
+
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {statement}", tuple(params))]
+
+
+def _scans(plan: Sequence[str]) -> List[str]:
+    # "SCAN Games" reads the whole table; "SEARCH ... USING INDEX" and a scan of a
+    # covering index (e.g. for MAX) do not.
+    return [line for line in plan if line.startswith("SCAN ") and "INDEX" not in line]
+
+
+def check_plans(conn: sqlite3.Connection) -> Dict[str, List[str]]:
+    """Plans of the ``HOT_QUERIES`` that scan a table, ``{label: plan}`` (empty when all use indexes).
+
+    Queries on tables missing from the database are skipped.
+    """
+
+    failures = {}
+    for label, statement, params in HOT_QUERIES:
+        try:
+            plan = query_plan(conn, statement, params)
+        except sqlite3.OperationalError:  # table or column not created yet
+            continue
+        if _scans(plan):
+            failures[label] = plan
+    return failures
+
+
+def optimize(path: str = DEFAULT_DB_PATH) -> Dict[str, List[str]]:
+    """Bring the tables up to ``COLUMN_TYPES`` and ``INDEXES``, refresh statistics and check the hot plans.
+
+    Returns ``check_plans``; tables without a primary key yet are retyped on their next ``upsert``.
+    """
+
+    conn = connect(path)
+    try:
+        tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        with conn:
+            for table in tables:
+                key = [name for name, pk in sorted(table_columns(conn, table).items(), key=lambda item: item[1]) if pk]
+                if key:
+                    ensure_table(conn, table, {}, key)
+                else:
+                    ensure_indexes(conn, table)
+        conn.execute("ANALYZE")
+        return check_plans(conn)
+    finally:
+        conn.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Index, analyze and check the query plans of nfl.db")
+    parser.add_argument("path", nargs="?", default=DEFAULT_DB_PATH)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.path):
+        parser.error(f"{args.path} does not exist")
+    failures = optimize(args.path)
+    conn = connect(args.path)
+    try:
+        for label, statement, params in HOT_QUERIES:
+            try:
+                plan = query_plan(conn, statement, params)
+                started = time.perf_counter()
+                conn.execute(statement, params).fetchall()
+            except sqlite3.OperationalError as exc:
+                print(f"{label:<20} skipped ({exc})")
+                continue
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"{label:<20} {elapsed:7.2f} ms  {' | '.join(plan)}")
+    finally:
+        conn.close()
+    for label in failures:
+        print(f"FULL SCAN: {label}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
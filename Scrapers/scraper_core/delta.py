@@ -0,0 +1,183 @@
+"""Per-stage watermarks for the ``--delta`` scrape mode.
+
+After a PFR stage completes, the final score of every game it has covered is
+stored in ``data/watermarks.json``. With ``--delta`` the next run compares
+``data/games.csv`` with that snapshot and hands the stage only the games that
+became final since (``new``), the games whose final score changed (stat
+corrections) and the team-seasons those games belong to, so a Monday-night
+refresh fetches a few dozen pages instead of sweeping every season.
+
+A stage without a watermark yet runs its normal full sweep and records one.
+Games whose pages a stage could not get are left out of its watermark
+(``commit(stage, missed=...)``), so the next ``--delta`` run asks for them again.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+DEFAULT_WATERMARK_PATH = os.path.join("data", "watermarks.json")
+DEFAULT_GAMES_PATH = os.path.join("data", "games.csv")
+
+# nflverse team codes (as standardized in games.csv) -> PFR team page slugs
+PFR_TEAM_SLUGS = {
+    "ARI": "crd", "ATL": "atl", "BAL": "rav", "BUF": "buf", "CAR": "car", "CHI": "chi",
+    "CIN": "cin", "CLE": "cle", "DAL": "dal", "DEN": "den", "DET": "det", "GB": "gnb",
+    "HOU": "htx", "IND": "clt", "JAX": "jax", "KC": "kan", "LAC": "sdg", "LAR": "ram",
+    "LVR": "rai", "MIA": "mia", "MIN": "min", "NE": "nwe", "NO": "nor", "NYG": "nyg",
+    "NYJ": "nyj", "PHI": "phi", "PIT": "pit", "SEA": "sea", "SF": "sfo", "TB": "tam",
+    "TEN": "oti", "WAS": "was",
+}
+
+
+def load_games(path: str = DEFAULT_GAMES_PATH) -> List[Dict[str, str]]:
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def is_final(row: Dict[str, str]) -> bool:
+    return bool(row.get("home_score")) and bool(row.get("away_score"))
+
+
+def game_fingerprint(row: Dict[str, str]) -> str:
+    return f"{row.get('away_score', '')}|{row.get('home_score', '')}|{row.get('overtime', '')}"
+
+
+def played_games(games: Iterable[Dict[str, str]], season: int, now: Optional[datetime] = None) -> List[Dict[str, str]]:
+    """Rows of ``season`` dated on or before ``now`` (the full-sweep target list)."""
+
+    now = now or datetime.now()
+    rows = []
+    for row in games:
+        try:
+            game_dt = datetime.fromisoformat(row["date"])
+        except Exception:
+            continue
+        if row["season"] == str(season) and game_dt <= now:
+            rows.append(row)
+    return rows
+
+
+def team_season_games(games: Iterable[Dict[str, str]], season: int, slug: str) -> Set[str]:
+    """``game_id`` of the games of ``season`` played by the team with PFR slug ``slug``."""
+
+    return {row["game_id"] for row in games
+            if row["season"] == str(season) and slug in (PFR_TEAM_SLUGS.get(row["home_team"]),
+                                                         PFR_TEAM_SLUGS.get(row["away_team"]))}
+
+
+@dataclass
+class GameDelta:
+    """Games a stage has to (re)scrape since its watermark."""
+
+    new: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    corrected: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+    @property
+    def games(self) -> Dict[str, Dict[str, str]]:
+        return {**self.new, **self.corrected}
+
+    def seasons(self) -> List[int]:
+        return sorted({int(row["season"]) for row in self.games.values()})
+
+    def season_games(self, season: int) -> List[Dict[str, str]]:
+        return [row for row in self.games.values() if row["season"] == str(season)]
+
+    def corrected_in(self, season: int, column: str = "game_id") -> Set[str]:
+        return {row[column] for row in self.corrected.values() if row["season"] == str(season)}
+
+    def team_seasons(self) -> Set[Tuple[int, str]]:
+        """``(season, PFR slug)`` for both teams of every game in the delta."""
+
+        pairs = set()
+        for row in self.games.values():
+            for team in (row["home_team"], row["away_team"]):
+                if team in PFR_TEAM_SLUGS:
+                    pairs.add((int(row["season"]), PFR_TEAM_SLUGS[team]))
+        return pairs
+
+    def __len__(self) -> int:
+        return len(self.new) + len(self.corrected)
+
+
+class Watermarks:
+    """Snapshot of the final games each stage has covered."""
+
+    def __init__(self, path: str = DEFAULT_WATERMARK_PATH, enabled: bool = False):
+        self.path = path
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.stages: Dict[str, Dict] = {}
+        self._pending: Dict[str, Dict[str, str]] = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.stages = json.load(f)
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.stages, f)
+        os.replace(tmp_path, self.path)
+
+    def delta(self, stage: str, games: Iterable[Dict[str, str]]) -> Optional[GameDelta]:
+        """Delta for ``stage`` against ``games``; ``None`` means run the full sweep.
+
+        The current snapshot is kept until ``commit(stage)`` so a stage that
+        fails keeps its old watermark and retries the same games next run; games
+        it passes to ``commit`` as ``missed`` are retried the same way.
+        """
+
+        games = list(games)
+        current = {row["game_id"]: game_fingerprint(row) for row in games if is_final(row)}
+        rows = {row["game_id"]: row for row in games}
+        with self.lock:
+            self._pending[stage] = current
+            mark = self.stages.get(stage)
+        if not self.enabled:
+            return None
+        if not mark:
+            print(f"{stage}: no watermark yet; running the full sweep")
+            return None
+        seen = mark["games"]
+        delta = GameDelta()
+        for game_id, fingerprint in current.items():
+            if game_id not in seen:
+                delta.new[game_id] = rows[game_id]
+            elif seen[game_id] != fingerprint:
+                delta.corrected[game_id] = rows[game_id]
+        print(f"{stage}: {len(delta.new)} newly final and {len(delta.corrected)} corrected games since "
+              f"{mark['updated_at']} ({len(delta.team_seasons())} team-seasons)")
+        return delta
+
+    def commit(self, stage: str, missed: Iterable[str] = ()) -> None:
+        """Record the games ``delta`` saw for ``stage`` as covered, except ``missed``.
+
+        ``missed`` are the game ids whose pages the stage did not get this run:
+        they keep their previous fingerprint, or stay unseen, so the next
+        ``--delta`` run hands them to the stage again.
+        """
+
+        with self.lock:
+            current = self._pending.pop(stage, None)
+            if current is None:
+                return
+            previous = self.stages.get(stage, {}).get("games", {})
+            games = dict(current)
+            for game_id in missed:
+                if game_id in previous:
+                    games[game_id] = previous[game_id]
+                else:
+                    games.pop(game_id, None)
+            self.stages[stage] = {
+                "updated_at": datetime.now().isoformat(timespec="seconds"),
+                "games": games,
+            }
+            self._save()
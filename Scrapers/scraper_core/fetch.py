@@ -0,0 +1,263 @@
+"""Concurrent HTTP fetch engine with a per-host request budget.
+
+A single ``FetchEngine`` keeps a bounded number of requests in flight on a
+thread pool while every host is throttled by its own token bucket. A 429 from
+a host pauses that host's bucket for the ``Retry-After`` interval so all
+workers back off together instead of each sleeping on its own.
+
+With ``SCRAPER_MIRROR=http://host:port`` PFR requests go to that server instead
+(the offline replay server of ``scraper_core.replay``); telemetry, the archive
+and the parsers still see the original URLs.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+
+from . import telemetry
+
+if TYPE_CHECKING:
+    from .archive import PageArchive
+
+
+UA = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/126 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+PFR_HOST = "www.pro-football-reference.com"
+# Hosts redirected to SCRAPER_MIRROR when it is set.
+MIRRORED_HOSTS = (PFR_HOST,)
+
+# Sports-Reference allows roughly 20 requests per minute before it starts
+# answering 429 and temporarily blocking the client.
+DEFAULT_HOST_RATES = {
+    PFR_HOST: 20 / 60,
+}
+DEFAULT_RATE = 10.0
+DEFAULT_WORKERS = 8
+
+
+class TokenBucket:
+    """Thread-safe token bucket that can be paused after a 429."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                else:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        with self.lock:
+            resume_at = time.monotonic() + seconds
+            if resume_at > self.paused_until:
+                self.paused_until = resume_at
+                self.updated = resume_at
+                self.tokens = 0.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return the delay in seconds from a ``Retry-After`` header, if any."""
+
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _rates_from_env() -> Dict[str, float]:
+    rates = dict(DEFAULT_HOST_RATES)
+    delay = os.environ.get("SCRAPER_DELAY")
+    if delay:
+        try:
+            rates[PFR_HOST] = 1 / max(float(delay), 0.01)
+        except ValueError:
+            pass
+    return rates
+
+
+class FetchEngine:
+    """Bounded-concurrency fetcher shared by every scraping stage."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        host_rates: Optional[Dict[str, float]] = None,
+        default_rate: float = DEFAULT_RATE,
+        max_retries: int = 4,
+        backoff: float = 10.0,
+        session: Optional[requests.Session] = None,
+        archive: Optional["PageArchive"] = None,
+        mirror: Optional[str] = None,
+    ):
+        self.max_workers = max_workers or int(os.environ.get("SCRAPER_WORKERS", DEFAULT_WORKERS))
+        self.host_rates = host_rates if host_rates is not None else _rates_from_env()
+        self.default_rate = default_rate
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.session = session or self._build_session()
+        self.archive = archive
+        self.mirror = (mirror or os.environ.get("SCRAPER_MIRROR") or "").rstrip("/") or None
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(UA)
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers,
+            # 429s are handled by the engine so the whole host backs off.
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1.5,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=frozenset(["GET"]),
+                raise_on_status=False,
+                respect_retry_after_header=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._buckets_lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.host_rates.get(host, self.default_rate))
+            return self._buckets[host]
+
+    def _is_cached(self, url: str) -> bool:
+        cache = getattr(self.session, "cache", None)
+        if cache is None:
+            return False
+        try:
+            return bool(cache.contains(url=url))
+        except Exception:
+            return False
+
+    def request_url(self, url: str) -> str:
+        """``url`` rewritten onto the mirror for mirrored hosts, otherwise unchanged."""
+
+        parts = urlparse(url)
+        if self.mirror is None or parts.netloc not in MIRRORED_HOSTS:
+            return url
+        mirror = urlparse(self.mirror)
+        return parts._replace(scheme=mirror.scheme, netloc=mirror.netloc).geturl()
+
+    def get(self, url: str, timeout: float = 30, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """Fetch ``url`` within its host budget; raise on a final failure."""
+
+        host = urlparse(url).netloc
+        if self.archive is not None and self.archive.offline and self.archive.archives(url):
+            response = self.archive.response(url)
+            if response is None:
+                telemetry.record(host, errors=1)
+                raise RequestException(f"{url} is not in the page archive")
+            telemetry.record(host, requests=1, cache_hits=1)
+            return response
+        bucket = self.bucket(host)
+        last_error: Optional[Exception] = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                telemetry.record(host, retries=1)
+            if not self._is_cached(url):
+                waited = time.monotonic()
+                bucket.acquire()
+                telemetry.record(host, wait_seconds=time.monotonic() - waited)
+            try:
+                response = self.session.get(self.request_url(url), timeout=timeout, headers=headers)
+            except RequestException as e:
+                telemetry.record(host, requests=1, errors=1)
+                last_error = e
+                time.sleep(min(self.backoff * 2 ** attempt, 120))
+                continue
+            # A 304 means the caller's copy is current, so it counts as a cache hit.
+            cached = getattr(response, "from_cache", False) or response.status_code == 304
+            telemetry.record(host, requests=1, bytes=len(response.content), cache_hits=int(cached))
+            if response.status_code == 429:
+                telemetry.record(host, rate_limited=1)
+                delay = parse_retry_after(response.headers.get("Retry-After"))
+                if delay is None:
+                    delay = self.backoff * 2 ** attempt
+                print(f"Rate limited at {url}; pausing {host} for {delay:.0f}s")
+                bucket.pause(delay)
+                last_error = requests.HTTPError(f"429 Too Many Requests: {url}", response=response)
+                continue
+            if response.status_code >= 400:
+                telemetry.record(host, errors=1)
+            response.raise_for_status()
+            if self.archive is not None and self.archive.archives(url):
+                self.archive.put(url, response.content)
+            return response
+        raise last_error or RequestException(f"Failed to fetch {url}")
+
+    def fetch(self, url: str, timeout: float = 30) -> Optional[requests.Response]:
+        """Like ``get`` but report the error and return ``None`` on failure."""
+
+        try:
+            return self.get(url, timeout=timeout)
+        except Exception as e:
+            print(f"Error retrieving {url}: {e}")
+            return None
+
+    def map(self, urls: Iterable[str], timeout: float = 30) -> Iterator[Tuple[str, Optional[requests.Response]]]:
+        """Yield ``(url, response)`` in input order with bounded requests in flight."""
+
+        pending_urls = iter(urls)
+        window = self.max_workers * 2
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            in_flight = deque()
+            for url in pending_urls:
+                in_flight.append((url, pool.submit(contextvars.copy_context().run, self.fetch, url, timeout)))
+                if len(in_flight) >= window:
+                    break
+            while in_flight:
+                url, future = in_flight.popleft()
+                yield url, future.result()
+                next_url = next(pending_urls, None)
+                if next_url is not None:
+                    in_flight.append((next_url, pool.submit(contextvars.copy_context().run, self.fetch, next_url, timeout)))
@@ -0,0 +1,121 @@
+"""Process memory readings and the memory ceiling of low-memory runs.
+
+The Raspberry Pi scraper runs on 1-2 GB boards. Its ``--low-memory`` mode (or
+``SCRAPER_LOW_MEMORY=1``) keeps no parsed pages between sections and merges CSVs
+chunk by chunk; ``--max-memory-mb N`` (or ``SCRAPER_MAX_MEMORY_MB``) sets the
+ceiling those chunks are sized against and implies ``--low-memory``::
+
+    budget = MemoryBudget.from_args()
+    for chunk in stream.iter_csv(path, budget):
+        ...
+
+Peak RSS of the run (and of the parse workers) ends up in the run report.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import sys
+from typing import Iterable, Optional
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+DEFAULT_LOW_MEMORY_MB = 512.0
+DEFAULT_CHUNK_ROWS = 50_000
+MIN_CHUNK_ROWS = 1_000
+# Parsed text rows take several times their on-disk size once they are pandas objects.
+IN_MEMORY_FACTOR = 8
+# Share of the ceiling one chunk may take; the rest is the interpreter, pandas and the pools.
+CHUNK_SHARE = 0.1
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process in MB (0 where it cannot be read)."""
+
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, IndexError, AttributeError):
+        return peak_rss_mb()
+
+
+def peak_rss_mb(children: bool = False) -> float:
+    """Peak RSS of this process, or of its largest finished child (the parse workers)."""
+
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # ru_maxrss is in KB on Linux and in bytes on macOS.
+    return usage.ru_maxrss / (2 ** 20 if sys.platform == "darwin" else 2 ** 10)
+
+
+def _flag_value(argv: Iterable[str], flag: str) -> Optional[str]:
+    argv = list(argv)
+    for i, arg in enumerate(argv):
+        if arg == flag and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(flag + "="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+class MemoryBudget:
+    """Memory ceiling (MB) that chunked readers size themselves against; disabled when ``None``."""
+
+    def __init__(self, limit_mb: Optional[float] = None, max_chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        self.limit_mb = limit_mb
+        self.max_chunk_rows = max_chunk_rows
+        self.over_limit = 0
+
+    @classmethod
+    def from_args(cls, argv: Optional[Iterable[str]] = None) -> "MemoryBudget":
+        """Budget from ``--low-memory`` / ``--max-memory-mb N`` or their environment variables."""
+
+        argv = sys.argv[1:] if argv is None else list(argv)
+        limit = _flag_value(argv, "--max-memory-mb") or os.environ.get("SCRAPER_MAX_MEMORY_MB")
+        if limit:
+            return cls(float(limit))
+        if "--low-memory" in argv or os.environ.get("SCRAPER_LOW_MEMORY") == "1":
+            return cls(DEFAULT_LOW_MEMORY_MB)
+        return cls(None)
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit_mb is not None
+
+    def chunk_rows(self, path: str, sample_bytes: int = 64 * 1024) -> int:
+        """Rows per chunk for ``path`` so one parsed chunk stays within ``CHUNK_SHARE`` of the ceiling."""
+
+        if not self.enabled:
+            return self.max_chunk_rows
+        try:
+            with open(path, "rb") as f:
+                sample = f.read(sample_bytes)
+        except OSError:
+            return self.max_chunk_rows
+        lines = max(sample.count(b"\n"), 1)
+        bytes_per_row = max(len(sample) / lines, 1.0) * IN_MEMORY_FACTOR
+        rows = int(self.limit_mb * CHUNK_SHARE * 2 ** 20 / bytes_per_row)
+        return max(MIN_CHUNK_ROWS, min(self.max_chunk_rows, rows))
+
+    def exceeded(self) -> bool:
+        """True (after a collection) when RSS is still over the ceiling."""
+
+        if not self.enabled or rss_mb() <= self.limit_mb:
+            return False
+        gc.collect()
+        if rss_mb() <= self.limit_mb:
+            return False
+        self.over_limit += 1
+        return True
+
+    def describe(self) -> str:
+        if not self.enabled:
+            return "unbounded"
+        return f"{self.limit_mb:.0f} MB ceiling"
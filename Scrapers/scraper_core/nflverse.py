@@ -0,0 +1,103 @@
+"""Season files from the nflverse-data releases (player stats, rosters).
+
+Each dataset is published as one CSV per season. ``fetch_seasons`` brings the
+local copies up to date through one concurrent batch of conditional downloads:
+the current season is always re-checked, earlier seasons only once their last
+check is older than ``NFLVERSE_RECHECK_DAYS`` (default 7). ``read_seasons``
+parses the files in parallel with fixed dtypes for the text and key columns
+(no per-file type inference, no ids read back as floats) and concatenates
+them once::
+
+    changed, paths = fetch_seasons(nflverse, 'player_stats', range(2010, 2025))
+    df = read_seasons(paths, PLAYER_STATS_DTYPES, exclude=['opponent_team'])
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from .conditional import ConditionalDownloader
+
+
+RELEASES = "https://github.com/nflverse/nflverse-data/releases/download"
+# dataset: (release file name, local directory)
+DATASETS: Dict[str, Tuple[str, str]] = {
+    "player_stats": ("player_stats/player_stats_{season}.csv", os.path.join("data", "player-stats")),
+    "rosters": ("rosters/roster_{season}.csv", os.path.join("data", "rosters")),
+}
+RECHECK_SECONDS = float(os.environ.get("NFLVERSE_RECHECK_DAYS", 7)) * 86400
+
+PLAYER_STATS_DTYPES: Dict[str, str] = {
+    "player_id": "str", "player_name": "str", "player_display_name": "str", "position": "str",
+    "position_group": "str", "headshot_url": "str", "recent_team": "str", "opponent_team": "str",
+    "season_type": "str", "season": "int64", "week": "int64",
+}
+ROSTER_DTYPES: Dict[str, str] = {
+    "season": "int64", "team": "str", "position": "str", "depth_chart_position": "str", "status": "str",
+    "full_name": "str", "first_name": "str", "last_name": "str", "birth_date": "str", "college": "str",
+    "gsis_id": "str", "espn_id": "str", "sportradar_id": "str", "yahoo_id": "str", "rotowire_id": "str",
+    "pff_id": "str", "pfr_id": "str", "fantasy_data_id": "str", "sleeper_id": "str", "headshot_url": "str",
+    "ngs_position": "str", "game_type": "str", "status_description_abbr": "str", "football_name": "str",
+    "esb_id": "str", "gsis_it_id": "str", "smart_id": "str", "draft_club": "str",
+}
+
+
+def season_path(dataset: str, season: int) -> str:
+    name, directory = DATASETS[dataset]
+    return os.path.join(directory, os.path.basename(name.format(season=season)))
+
+
+def fetch_seasons(
+    downloader: "ConditionalDownloader",
+    dataset: str,
+    seasons: Iterable[int],
+    recheck: float = RECHECK_SECONDS,
+) -> Tuple[bool, List[str]]:
+    """Download the missing or stale season files; return (any changed, local paths in season order)."""
+
+    seasons = list(seasons)
+    current = max(seasons)
+    name, _ = DATASETS[dataset]
+    items = [
+        (f"{RELEASES}/{name.format(season=season)}", season_path(dataset, season),
+         None if season == current else recheck)
+        for season in seasons
+    ]
+    results = downloader.download_many(items)
+    any_changed = False
+    paths = []
+    for season, (_, path, _) in zip(seasons, items):
+        result = results[path]
+        if isinstance(result, Exception):
+            print(f"Failed to download data for the year {season}: {result}")
+        elif result:
+            any_changed = True
+            print(f"Downloaded and saved {os.path.basename(path)}")
+        if os.path.exists(path):
+            paths.append(path)
+    return any_changed, paths
+
+
+def read_seasons(
+    paths: List[str],
+    dtype: Dict[str, str],
+    exclude: Iterable[str] = (),
+    workers: Optional[int] = None,
+) -> Optional[pd.DataFrame]:
+    """Parse the season files concurrently and concatenate them once (None if there are none)."""
+
+    if not paths:
+        return None
+    exclude = set(exclude)
+
+    def read(path: str) -> pd.DataFrame:
+        return pd.read_csv(path, dtype=dtype, usecols=lambda column: column not in exclude)
+
+    with ThreadPoolExecutor(max_workers=min(len(paths), workers or os.cpu_count() or 4)) as pool:
+        frames = list(pool.map(read, paths))
+    return pd.concat(frames, ignore_index=True, sort=False)
@@ -0,0 +1,76 @@
+"""Betting outcomes for every game, derived in one columnar pass.
+
+``game_outcomes`` turns the nflverse lines and scores (``spread_line`` is the
+number of points the home team is favoured by, ``total_line`` the over/under)
+into the columns the apps used to recompute row by row:
+
+- ``home_spread`` / ``away_spread``: the line from each side, e.g. ``-3.5`` / ``+3.5``
+- ``team_favorite``: the team laying points
+- ``ats_margin``: home margin minus the spread (> 0 home covered, < 0 away covered)
+- ``team_covered``: the team that covered, or ``Push``
+- ``home_ats`` / ``away_ats``: ``Cover``, ``No Cover`` or ``Push`` from each side
+- ``ou_margin`` / ``ou_result``: combined score minus the total; ``Over``, ``Under`` or ``Push``
+- ``home_implied_total`` / ``away_implied_total``: points implied by the spread and total
+
+Spreads and favourites are filled as soon as a line exists; results stay
+empty (``N/A`` for the legacy text columns) until both scores are in.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+OUTCOME_COLUMNS = [
+    "home_spread", "away_spread", "team_favorite", "team_covered", "ats_margin", "home_ats", "away_ats",
+    "ou_margin", "ou_result", "home_implied_total", "away_implied_total",
+]
+
+
+def _label(values: pd.Series, positive: object, negative: object, zero: object, valid: pd.Series) -> np.ndarray:
+    return np.select(
+        [~valid, values > 0, values < 0],
+        [None, positive, negative],
+        default=zero,
+    )
+
+
+def game_outcomes(games: pd.DataFrame) -> pd.DataFrame:
+    """Outcome columns for ``games`` (same index); needs teams, scores and lines."""
+
+    spread = pd.to_numeric(games["spread_line"], errors="coerce")
+    total_line = pd.to_numeric(games["total_line"], errors="coerce")
+    home_score = pd.to_numeric(games["home_score"], errors="coerce")
+    away_score = pd.to_numeric(games["away_score"], errors="coerce")
+    has_spread = spread.notna()
+    home_favored = spread > 0
+    final = home_score.notna() & away_score.notna()
+    points = spread.abs().astype(str)
+
+    out = pd.DataFrame(index=games.index)
+    out["home_spread"] = ("-" + points).where(home_favored, "+" + points).where(has_spread, "N/A")
+    out["away_spread"] = ("+" + points).where(home_favored, "-" + points).where(has_spread, "N/A")
+    out["team_favorite"] = games["home_team"].where(home_favored, games["away_team"]).where(has_spread, "N/A")
+
+    ats_margin = (home_score - away_score - spread).where(final & has_spread)
+    ats_known = ats_margin.notna()
+    out["ats_margin"] = ats_margin
+    covered = np.select([ats_margin > 0, ats_margin < 0], [games["home_team"], games["away_team"]], default="Push")
+    out["team_covered"] = pd.Series(covered, index=games.index).where(ats_known, "N/A")
+    out["home_ats"] = _label(ats_margin, "Cover", "No Cover", "Push", ats_known)
+    out["away_ats"] = _label(ats_margin, "No Cover", "Cover", "Push", ats_known)
+
+    ou_margin = (home_score + away_score - total_line).where(final & total_line.notna())
+    out["ou_margin"] = ou_margin
+    out["ou_result"] = _label(ou_margin, "Over", "Under", "Push", ou_margin.notna())
+
+    out["home_implied_total"] = (total_line + spread) / 2
+    out["away_implied_total"] = (total_line - spread) / 2
+    return out[OUTCOME_COLUMNS]
+
+
+def add_game_outcomes(games: pd.DataFrame) -> pd.DataFrame:
+    """``games`` with the outcome columns added (or replaced)."""
+
+    return pd.concat([games.drop(columns=OUTCOME_COLUMNS, errors="ignore"), game_outcomes(games)], axis=1)
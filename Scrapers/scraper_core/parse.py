@@ -0,0 +1,91 @@
+"""Process pool for CPU-bound page parsing.
+
+``FetchEngine.map`` keeps requests in flight on threads; ``ParsePool.map``
+consumes its ``(url, response)`` pairs and hands each body to a parse function
+in a worker process, so parsing overlaps with I/O and uses every core instead
+of competing for the GIL on the fetch threads.
+
+Workers are forked when the pool is created. Create it at startup, before the
+pipeline starts any threads, so no lock is held by another thread at fork time.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from collections import deque
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+from . import telemetry
+
+
+def _timed(parse: Callable[[bytes], Any], content: bytes) -> Tuple[float, Any]:
+    started = time.perf_counter()
+    result = parse(content)
+    return time.perf_counter() - started, result
+
+
+class ParsePool:
+    """Fork-based worker pool; runs parsers inline with ``workers <= 1``."""
+
+    def __init__(self, workers: Optional[int] = None, window: int = 64):
+        self.workers = workers or int(os.environ.get("SCRAPER_PARSE_WORKERS", os.cpu_count() or 1))
+        self.window = window
+        self.pool = None
+        if self.workers > 1:
+            try:
+                self.pool = multiprocessing.get_context("fork").Pool(self.workers)
+            except (ValueError, OSError):  # no fork on this platform
+                self.workers = 1
+
+    def map(
+        self,
+        fetched: Iterable[Tuple[str, Any]],
+        parse: Callable[[bytes], Any],
+    ) -> Iterator[Tuple[str, Any]]:
+        """Yield ``(url, parse(response.content))`` in input order; ``None`` on failure."""
+
+        if self.pool is None:
+            for url, response in fetched:
+                yield url, self._run_inline(url, response, parse)
+            return
+        pending = deque()
+        for url, response in fetched:
+            result = self.pool.apply_async(_timed, (parse, response.content)) if response is not None else None
+            pending.append((url, result))
+            while pending and (len(pending) > self.window or pending[0][1] is None or pending[0][1].ready()):
+                yield self._collect(*pending.popleft())
+        while pending:
+            yield self._collect(*pending.popleft())
+
+    @staticmethod
+    def _run_inline(url: str, response: Any, parse: Callable[[bytes], Any]) -> Any:
+        if response is None:
+            return None
+        try:
+            seconds, result = _timed(parse, response.content)
+        except Exception as e:
+            print(f"Error parsing {url}: {e}")
+            return None
+        telemetry.record(urlparse(url).netloc, parsed=1, parse_seconds=seconds)
+        return result
+
+    @staticmethod
+    def _collect(url: str, result: Any) -> Tuple[str, Any]:
+        if result is None:
+            return url, None
+        try:
+            seconds, value = result.get()
+        except Exception as e:
+            print(f"Error parsing {url}: {e}")
+            return url, None
+        telemetry.record(urlparse(url).netloc, parsed=1, parse_seconds=seconds)
+        return url, value
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
@@ -0,0 +1,192 @@
+"""Specs for the Pro-Football-Reference tables the scrapers read.
+
+Game-page specs (``LINESCORE``, ``SCORING``, ``PLAYER_OFFENSE``,
+``PLAYER_DEFENSE``) take the game as context: a games.csv row with a
+``game_id`` or the game id itself. Team-page specs (``TEAM_STATS``,
+``TEAM_CONVERSIONS``) take the PFR team slug and the game logs take the team name.
+Season pages (``SEASON_GAMES``, ``FANTASY``) and ``ROSTER`` are read as records
+keyed by each cell's ``data-stat`` (see ``stat_names``).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, List, Mapping, Optional
+
+from .specs import TableSpec
+from .tables import Row
+
+
+BASE_URL = "https://www.pro-football-reference.com"
+
+
+def boxscore_url(pfr_id: str) -> str:
+    return f"{BASE_URL}/boxscores/{pfr_id}.htm"
+
+
+def team_url(slug: str, year: int) -> str:
+    return f"{BASE_URL}/teams/{slug}/{year}.htm"
+
+
+def gamelog_url(slug: str, year: int) -> str:
+    return f"{BASE_URL}/teams/{slug}/{year}/gamelog/"
+
+
+def roster_url(slug: str, year: int) -> str:
+    return f"{BASE_URL}/teams/{slug}/{year}_roster.htm"
+
+
+def season_url(year: int, page: str) -> str:
+    """A league season page, e.g. ``season_url(2024, "games")`` or ``"fantasy"``."""
+
+    return f"{BASE_URL}/years/{year}/{page}.htm"
+
+
+def stat_names(tr: Row, fallback: Callable[[int], str] = "col_{}".format) -> List[str]:
+    """Column names from a data row's ``data-stat`` attributes, ``fallback(i)`` where missing."""
+
+    return [cell.stat or fallback(i) for i, cell in enumerate(tr.cells)]
+
+
+def game_id(context: Any) -> str:
+    return str(context["game_id"]) if isinstance(context, Mapping) else str(context)
+
+
+def _linescore_row(tr: Row, context: Any) -> Optional[List[str]]:
+    cells = tr.values(["td"])
+    if len(cells) < 2:
+        return None
+    url = context["pfr_url"] if isinstance(context, Mapping) else str(context)
+    return [url, cells[1], *cells[2:]]
+
+
+def _with_game_id(tr: Row, context: Any) -> List[str]:
+    return tr.values() + [game_id(context)]
+
+
+def _offense_row(tr: Row, context: Any) -> Optional[List[str]]:
+    player = tr.first("th")
+    if player is None:
+        return None
+    player_id = player.href.split("/")[-1] if player.href else ""
+    return [player.text.strip(), player_id, *tr.values(["td"]), game_id(context)]
+
+
+def _defense_row(tr: Row, context: Any) -> List[str]:
+    player = tr.first("th")
+    return [player.text.strip() if player else "", *tr.values(["td"]), game_id(context)]
+
+
+def _with_team(tr: Row, context: Any) -> List[str]:
+    return tr.values() + [str(context)]
+
+
+# Quarter-by-quarter score; the context may also be the box score URL itself.
+LINESCORE = TableSpec(
+    "linescore",
+    class_="linescore",
+    header=("URL", "Team", "1", "2", "3", "4", "OT1", "OT2", "OT3", "OT4", "Final"),
+    row=_linescore_row,
+    fit=True,
+)
+
+SCORING = TableSpec(
+    "scoring",
+    table_id="scoring",
+    header=("Quarter", "Time", "Team", "Detail", "Team_1", "Team_2", "Game_ID"),
+    row=_with_game_id,
+    fill_down=(0,),
+)
+
+PLAYER_OFFENSE = TableSpec(
+    "player_offense",
+    table_id="player_offense",
+    header=(
+        "player", "player_id", "team", "pass_cmp", "pass_att", "pass_yds", "pass_td", "pass_int",
+        "pass_sacked", "pass_sacked_yds", "pass_long", "pass_rating", "rush_att", "rush_yds", "rush_td",
+        "rush_long", "targets", "rec", "rec_yds", "rec_td", "rec_long", "fumbles", "fumbles_lost", "game_id",
+    ),
+    row=_offense_row,
+)
+
+PLAYER_DEFENSE = TableSpec(
+    "player_defense",
+    table_id="player_defense",
+    header=(
+        "player", "team", "def_int", "def_int_yds", "def_int_td", "def_int_long", "pass_defended", "sacks",
+        "tackles_combined", "tackles_solo", "tackles_assists", "tackles_loss", "qb_hits", "fumbles_rec",
+        "fumbles_rec_yds", "fumbles_rec_td", "fumbles_forced", "game_id",
+    ),
+    row=_defense_row,
+)
+
+TEAM_STATS = TableSpec(
+    "team_stats",
+    table_id="team_stats",
+    header=(
+        "Player", "PF", "Yds", "Ply", "Y/P", "TO", "FL", "1stD", "Cmp", "Att", "Yds", "TD", "Int", "NY/A",
+        "1stD", "Att", "Yds", "TD", "Y/A", "1stD", "Pen", "Yds", "1stPy", "#Dr", "Sc%", "TO%", "Start", "Time",
+        "Plays", "Yds", "Pts", "Team",
+    ),
+    row=_with_team,
+)
+
+TEAM_CONVERSIONS = TableSpec(
+    "team_conversions",
+    table_id="team_conversions",
+    header=("Player", "3DAtt", "3DConv", "4DAtt", "4DConv", "4D%", "RZAtt", "RZTD", "RZPct", "Team"),
+    row=_with_team,
+)
+
+# A team's schedule and results on its season page (the week number is the row's th).
+TEAM_SCHEDULE = TableSpec(
+    "games",
+    table_id="games",
+    header=(
+        "Week", "Day", "Date", "Time", "Boxscore", "Outcome", "OT", "Rec", "Home/Away", "Opp",
+        "Tm", "OppPts", "1stD", "TotYd", "PassY", "RushY", "TO_lost",
+        "Opp1stD", "OppTotYd", "OppPassY", "OppRushY", "TO_won",
+        "Offense", "Defense", "Sp. Tms",
+    ),
+    fit=True,
+)
+
+# Keyed by data-stat rather than a fixed header.
+SEASON_GAMES = TableSpec("season_games", table_id="games")
+FANTASY = TableSpec("fantasy", table_id="fantasy")
+ROSTER = TableSpec("roster", table_id="roster")
+
+GAME_LOG_HEADER = (
+    "rk", "gtm", "week", "date", "day", "game_location", "opp", "result", "pts", "pts_opp", "ot",
+    "pass_cmp", "pass_att", "pass_cmp_pct", "pass_yds", "pass_td", "pass_ya", "pass_aya", "pass_rate",
+    "pass_sk", "pass_sk_yds", "rush_att", "rush_yds", "rush_td", "rush_ya", "plays", "total_yds", "ypp",
+    "fga", "fgm", "xpa", "xpm", "punt", "punt_yds", "first_downs_pass", "first_downs_rush", "first_downs_pen",
+    "first_downs_total", "third_down_conv", "third_down_att", "fourth_down_conv", "fourth_down_att",
+    "pen", "pen_yds", "fumbles_lost", "turnovers_int", "turnovers_total", "time_of_poss",
+)
+
+
+def _game_log_row(tr: Row, context: Any) -> List[str]:
+    values = tr.values()
+    return (values + [""] * len(GAME_LOG_HEADER))[:len(GAME_LOG_HEADER)] + [str(context)]
+
+
+TEAM_GAME_LOG = TableSpec(
+    "team_game_log",
+    table_id="table_pfr_team-year_game-logs_team-year-regular-season-game-log",
+    header=GAME_LOG_HEADER + ("team_name",),
+    row=_game_log_row,
+)
+
+OPPONENT_GAME_LOG = TableSpec(
+    "opponent_game_log",
+    table_id="table_pfr_team-year_game-logs_team-year-regular-season-opponent-game-log",
+    header=GAME_LOG_HEADER + ("team_name",),
+    row=_game_log_row,
+)
+
+TEAM_PLAYOFF_GAME_LOG = TableSpec(
+    "team_playoff_game_log",
+    table_id="table_pfr_team-year_game-logs_team-year-playoffs-game-log",
+    header=GAME_LOG_HEADER + ("team_name",),
+    row=_game_log_row,
+)
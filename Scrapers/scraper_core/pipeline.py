@@ -0,0 +1,228 @@
+"""Named scraper stages with dependencies, checkpoints and parallel execution.
+
+Stages register with ``@pipeline.task(...)`` and declare the stages they
+depend on, the files they read and the files they produce. Independent stages
+run concurrently; stages that share a resource (``nfl.db``) are serialized.
+After each stage a checkpoint with a fingerprint of its inputs is written, so
+``--resume`` skips every stage that already completed against the same inputs.
+
+A stage may return ``UNCHANGED`` when its upstream data did not change (e.g. a
+304 from nflverse). Stages registered with ``pure=True`` are derived only from
+their dependencies and are skipped when every dependency reported
+``UNCHANGED``, which short-circuits the whole chain on a quiet rerun.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from . import telemetry
+
+
+DEFAULT_STATE_PATH = ".pipeline_state.json"
+UNCHANGED = "unchanged"
+
+
+@dataclass
+class Task:
+    """One pipeline stage."""
+
+    name: str
+    func: Callable[[], None]
+    deps: Tuple[str, ...] = ()
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    resources: Tuple[str, ...] = ()
+    pure: bool = False
+
+
+def fingerprint(paths: Iterable[str]) -> Dict[str, List]:
+    """Size and mtime of every input file (directories are walked)."""
+
+    result = {}
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    file_path = os.path.join(root, name)
+                    stat = os.stat(file_path)
+                    result[file_path] = [stat.st_size, stat.st_mtime_ns]
+        elif os.path.exists(path):
+            stat = os.stat(path)
+            result[path] = [stat.st_size, stat.st_mtime_ns]
+        else:
+            result[path] = None
+    return result
+
+
+def add_pipeline_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    parser.add_argument("--only", help="comma-separated stages to run (dependencies are not run)")
+    parser.add_argument("--from", dest="start", help="run this stage and every stage downstream of it")
+    parser.add_argument("--resume", action="store_true", help="skip stages checkpointed with unchanged inputs")
+    parser.add_argument("--jobs", type=int, default=int(os.environ.get("SCRAPER_STAGES", 4)),
+                        help="maximum number of stages running at once")
+    parser.add_argument("--list", action="store_true", help="list stages and exit")
+    return parser
+
+
+class Pipeline:
+    """Registry and scheduler for scraper stages."""
+
+    def __init__(self, state_path: str = DEFAULT_STATE_PATH):
+        self.state_path = state_path
+        self.tasks: Dict[str, Task] = {}
+        self._state_lock = threading.Lock()
+        self._resource_locks: Dict[str, threading.Lock] = {}
+        self.status: Dict[str, str] = {}
+
+    def task(
+        self,
+        name: str,
+        deps: Sequence[str] = (),
+        inputs: Sequence[str] = (),
+        outputs: Sequence[str] = (),
+        resources: Sequence[str] = (),
+        pure: bool = False,
+    ) -> Callable[[Callable[[], None]], Callable[[], None]]:
+        def register(func: Callable[[], None]) -> Callable[[], None]:
+            unknown = [dep for dep in deps if dep not in self.tasks]
+            if unknown:
+                raise ValueError(f"Stage {name} depends on unregistered stages: {unknown}")
+            self.tasks[name] = Task(name, func, tuple(deps), tuple(inputs), tuple(outputs), tuple(resources), pure)
+            for resource in resources:
+                self._resource_locks.setdefault(resource, threading.Lock())
+            return func
+        return register
+
+    def downstream(self, start: str) -> Set[str]:
+        selected = {start}
+        for name, task in self.tasks.items():  # registration order is topological
+            if any(dep in selected for dep in task.deps):
+                selected.add(name)
+        return selected
+
+    def select(self, only: Optional[str] = None, start: Optional[str] = None) -> List[str]:
+        if only:
+            names = {name.strip() for name in only.split(",") if name.strip()}
+        elif start:
+            names = self.downstream(start)
+        else:
+            names = set(self.tasks)
+        unknown = names - set(self.tasks)
+        if unknown:
+            raise SystemExit(f"Unknown stage(s): {', '.join(sorted(unknown))}. Known: {', '.join(self.tasks)}")
+        return [name for name in self.tasks if name in names]
+
+    def _load_state(self) -> Dict:
+        if not os.path.exists(self.state_path):
+            return {"tasks": {}}
+        with open(self.state_path) as f:
+            return json.load(f)
+
+    def _save_state(self, state: Dict) -> None:
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def is_fresh(self, task: Task, state: Dict) -> bool:
+        checkpoint = state["tasks"].get(task.name)
+        if not checkpoint:
+            return False
+        if not all(os.path.exists(path) for path in task.outputs):
+            return False
+        return checkpoint.get("inputs") == fingerprint(task.inputs)
+
+    def unchanged(self, *names: str) -> bool:
+        """True if every named stage ran in this run and reported ``UNCHANGED``."""
+
+        return all(self.status.get(name) == UNCHANGED for name in names)
+
+    def _checkpoint(self, task: Task, state: Dict, inputs: Dict, elapsed: float) -> None:
+        with self._state_lock:
+            state["tasks"][task.name] = {
+                "finished_at": datetime.now().isoformat(timespec="seconds"),
+                "seconds": round(elapsed, 1),
+                "inputs": inputs,
+            }
+            self._save_state(state)
+
+    def _run_task(self, task: Task, state: Dict) -> str:
+        locks = [self._resource_locks[r] for r in sorted(task.resources)]
+        for lock in locks:
+            lock.acquire()
+        try:
+            inputs = fingerprint(task.inputs)
+            started = time.monotonic()
+            print(f"\n▶ Stage {task.name} started")
+            with telemetry.stage(task.name):
+                result = task.func()
+            elapsed = time.monotonic() - started
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+        self._checkpoint(task, state, inputs, elapsed)
+        if result == UNCHANGED:
+            print(f"✔ Stage {task.name} finished in {elapsed:.1f}s (upstream unchanged)")
+            return UNCHANGED
+        print(f"✔ Stage {task.name} finished in {elapsed:.1f}s")
+        return "done"
+
+    def run(
+        self,
+        only: Optional[str] = None,
+        start: Optional[str] = None,
+        resume: bool = False,
+        jobs: int = 4,
+    ) -> Dict[str, str]:
+        """Run the selected stages; return ``{stage: status}``."""
+
+        selected = self.select(only, start)
+        state = self._load_state() if resume else {"tasks": {}}
+        if not resume:
+            self._save_state(state)
+        status = self.status = {}
+        for name in selected:
+            if resume and self.is_fresh(self.tasks[name], state):
+                print(f"Skipping stage {name}; checkpoint is up to date.")
+                status[name] = "skipped"
+        pending = [name for name in selected if name not in status]
+        running = {}
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            while pending or running:
+                for name in list(pending):
+                    deps = [dep for dep in self.tasks[name].deps if dep in selected]
+                    if any(status.get(dep) == "failed" or status.get(dep) == "blocked" for dep in deps):
+                        print(f"Not running stage {name}; an upstream stage failed.")
+                        status[name] = "blocked"
+                        pending.remove(name)
+                    elif all(status.get(dep) in ("done", "skipped", UNCHANGED) for dep in deps):
+                        task = self.tasks[name]
+                        pending.remove(name)
+                        if task.pure and task.deps and all(status.get(dep) == UNCHANGED for dep in task.deps):
+                            print(f"Skipping stage {name}; everything it depends on is unchanged.")
+                            self._checkpoint(task, state, fingerprint(task.inputs), 0.0)
+                            status[name] = UNCHANGED
+                            continue
+                        running[pool.submit(self._run_task, task, state)] = name
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        status[name] = future.result()
+                    except Exception:
+                        print(f"✖ Stage {name} failed:")
+                        traceback.print_exc()
+                        status[name] = "failed"
+        return status
@@ -0,0 +1,347 @@
+"""Offline PFR replay server and scraper throughput benchmark.
+
+Measuring a concurrency or parser change against pro-football-reference.com
+costs hours of throttled requests and risks a 429 block. ``ReplayServer`` serves
+the pages of a ``PageArchive`` (every page a live run fetched: box scores with
+their commented-out tables, team pages, game logs, red zone pages, ...) over
+local HTTP, with optional latency, injected 5xx errors and a request rate limit
+answered with 429 and ``Retry-After`` like the real site.
+
+``bench`` starts a server, runs a scraper script against it in a scratch
+directory (``SCRAPER_MIRROR`` points the fetch engine at the server) and reports
+pages/sec, CPU time per page and peak memory from the script's run report::
+
+    python -m scraper_core.replay serve --archive pfr-archive --latency 0.2 --rate 5
+    python -m scraper_core.replay bench --archive pfr-archive ScraperFinal.py --only box_scores,scoring_tables
+    python -m scraper_core.replay bench --archive FINAL/pfr-archive --latency 0.1 DockerRPi/ScraperMasterPFR.py
+
+Pages missing from the archive are answered with 404 and counted, so a
+benchmark on an incomplete corpus shows how much of it was really exercised.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, Mapping, Optional, Sequence
+
+from .archive import DEFAULT_ARCHIVE_DIR, PageArchive
+from .fetch import PFR_HOST
+from .memory import peak_rss_mb
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+DEFAULT_PORT = 8765
+SERVER_COUNTERS = ("requests", "served", "bytes", "not_found", "errors_injected", "rate_limited")
+# Inputs the PFR stages of ScraperFinal read; copied into the scratch directory when present.
+DEFAULT_COPY = (os.path.join("data", "games.csv"), os.path.join("data", "rosters.csv"))
+
+
+class ReplayServer:
+    """Threaded HTTP server answering PFR paths from a page archive."""
+
+    def __init__(
+        self,
+        archive: PageArchive,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        rate: Optional[float] = None,
+        burst: int = 1,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: Optional[int] = None,
+        upstream: str = f"https://{PFR_HOST}",
+    ):
+        self.archive = archive
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.upstream = upstream.rstrip("/")
+        self.random = random.Random(seed)
+        self.counts: Dict[str, float] = dict.fromkeys(SERVER_COUNTERS, 0)
+        self.lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, **counts: float) -> None:
+        with self.lock:
+            for name, value in counts.items():
+                self.counts[name] += value
+
+    def admit(self) -> Optional[float]:
+        """``None`` if a request may be served now, else the seconds until it could be."""
+
+        if not self.rate:
+            return None
+        with self.lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return None
+            return (1 - self._tokens) / self.rate
+
+    def respond(self, path: str):
+        """``(status, headers, body)`` for a request of ``path``."""
+
+        self.count(requests=1)
+        wait = self.admit()
+        if wait is not None:
+            self.count(rate_limited=1)
+            return 429, {"Retry-After": str(math.ceil(wait))}, b"Too Many Requests"
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+        if self.error_rate and self.random.random() < self.error_rate:
+            self.count(errors_injected=1)
+            return self.error_status, {}, b"Injected error"
+        content = self.archive.get(self.upstream + path)
+        if content is None:
+            self.count(not_found=1)
+            return 404, {}, b"Not in the replay archive"
+        self.count(served=1, bytes=len(content))
+        return 200, {"Content-Type": "text/html; charset=utf-8"}, content
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                status, headers, body = server.respond(self.path)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def _cpu_seconds() -> float:
+    """User + system CPU of the finished child processes (and the parse workers they reaped)."""
+
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def latest_report(directory: str) -> Optional[Dict]:
+    """Newest run report written anywhere under ``directory``."""
+
+    paths = glob.glob(os.path.join(directory, "**", "run-reports", "*.json"), recursive=True)
+    if not paths:
+        return None
+    with open(max(paths, key=os.path.getmtime)) as f:
+        return json.load(f)
+
+
+def run_benchmark(
+    server: ReplayServer,
+    script: str,
+    script_args: Sequence[str] = (),
+    workdir: Optional[str] = None,
+    copy: Iterable[str] = DEFAULT_COPY,
+    env: Optional[Mapping[str, str]] = None,
+) -> Dict:
+    """Run ``script`` against the started ``server`` in a scratch directory and measure it."""
+
+    script = os.path.abspath(script)
+    workdir = workdir or tempfile.mkdtemp(prefix="pfr-bench-")
+    for path in copy:
+        if os.path.exists(path):
+            target = os.path.join(workdir, path)
+            os.makedirs(os.path.dirname(target) or workdir, exist_ok=True)
+            shutil.copyfile(path, target)
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    child_env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [package_root, os.environ.get("PYTHONPATH")])),
+        "SCRAPER_MIRROR": server.url,
+        **(env or {}),
+    }
+    child_env.pop("SCRAPER_REPARSE", None)
+    log_path = os.path.join(workdir, "bench.log")
+    cpu_before = _cpu_seconds()
+    started = time.monotonic()
+    with open(log_path, "w") as log:
+        returncode = subprocess.call([sys.executable, "-u", script, *script_args], cwd=workdir, env=child_env,
+                                     stdout=log, stderr=subprocess.STDOUT)
+    seconds = time.monotonic() - started
+    cpu = _cpu_seconds() - cpu_before
+
+    report = latest_report(workdir) or {}
+    pages = server.counts["served"]
+    stages = {}
+    for name, stage in report.get("stages", {}).items():
+        if name == "-":  # scripts without sections record everything here with no stage time
+            continue
+        fetched = stage.get("requests", 0) - stage.get("retries", 0)
+        parsed = stage.get("parsed", 0)
+        stages[name] = {
+            "seconds": stage.get("seconds", 0.0),
+            "pages": fetched,
+            "pages_per_sec": round(fetched / stage["seconds"], 2) if stage.get("seconds") else 0.0,
+            "parse_ms_per_page": round(1000 * stage.get("parse_seconds", 0) / parsed, 1) if parsed else 0.0,
+            "rate_limited": stage.get("rate_limited", 0),
+            "errors": stage.get("errors", 0),
+        }
+    return {
+        "script": os.path.basename(script),
+        "args": list(script_args),
+        "returncode": returncode,
+        "workdir": workdir,
+        "log": log_path,
+        "server": {**server.counts, "latency": server.latency, "jitter": server.jitter,
+                   "error_rate": server.error_rate, "rate": server.rate},
+        "seconds": round(seconds, 2),
+        "pages": pages,
+        "pages_per_sec": round(pages / seconds, 2) if seconds else 0.0,
+        "cpu_seconds": round(cpu, 2),
+        "cpu_ms_per_page": round(1000 * cpu / pages, 1) if pages else 0.0,
+        "peak_rss_mb": max(report.get("peak_rss_mb", 0.0), round(peak_rss_mb(children=True), 1)),
+        "peak_worker_rss_mb": report.get("peak_worker_rss_mb", 0.0),
+        "stages": stages,
+    }
+
+
+def summary_lines(result: Mapping) -> list:
+    server = result["server"]
+    lines = [
+        f"{result['script']} {' '.join(result['args'])} -> exit {result['returncode']} (log: {result['log']})",
+        f"Served {server['served']:.0f} pages, {server['not_found']:.0f} not in the archive, "
+        f"{server['errors_injected']:.0f} injected errors, {server['rate_limited']:.0f} rate limited",
+        f"{result['pages_per_sec']:.2f} pages/sec over {result['seconds']:.1f}s; "
+        f"CPU {result['cpu_ms_per_page']:.1f} ms/page ({result['cpu_seconds']:.1f}s total); "
+        f"peak RSS {result['peak_rss_mb']:.0f} MB (parse worker {result['peak_worker_rss_mb']:.0f} MB)",
+    ]
+    if result["stages"]:
+        lines.append(f"{'stage':<26} {'wall s':>8} {'pages':>7} {'pages/s':>8} {'parse ms':>9} {'429':>5} {'errors':>7}")
+        for name, stage in result["stages"].items():
+            lines.append(
+                f"{name:<26} {stage['seconds']:>8.1f} {stage['pages']:>7.0f} {stage['pages_per_sec']:>8.2f} "
+                f"{stage['parse_ms_per_page']:>9.1f} {stage['rate_limited']:>5.0f} {stage['errors']:>7.0f}"
+            )
+    return lines
+
+
+def _add_server_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--archive", default=DEFAULT_ARCHIVE_DIR, help="page archive to replay")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with --error-status")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--rate", type=float, help="requests/sec served before answering 429 (default: unlimited)")
+    parser.add_argument("--burst", type=int, default=1, help="requests allowed back to back under --rate")
+    parser.add_argument("--seed", type=int, help="seed for the latency jitter and error injection")
+
+
+def _server(args: argparse.Namespace, port: int = 0) -> ReplayServer:
+    if not os.path.exists(os.path.join(args.archive, "manifest.db")):
+        raise SystemExit(f"No page archive at {args.archive}")
+    archive = PageArchive(args.archive, offline=True)
+    return ReplayServer(archive, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                        error_status=args.error_status, rate=args.rate, burst=args.burst, port=port, seed=args.seed)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay archived PFR pages and benchmark scrapers against them")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="serve the archive until interrupted")
+    _add_server_arguments(serve)
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    bench = commands.add_parser("bench", help="run a scraper script against a replay server and measure it")
+    _add_server_arguments(bench)
+    bench.add_argument("--delay", type=float, default=0.0,
+                       help="client-side SCRAPER_DELAY between PFR requests (default: no client throttle)")
+    bench.add_argument("--workers", type=int, help="SCRAPER_WORKERS for the run")
+    bench.add_argument("--parse-workers", type=int, help="SCRAPER_PARSE_WORKERS for the run")
+    bench.add_argument("--copy", nargs="*", default=list(DEFAULT_COPY),
+                       help="input files copied into the scratch directory (relative to the current directory)")
+    bench.add_argument("--workdir", help="scratch directory (default: a new temporary directory)")
+    bench.add_argument("-o", "--output", help="write the result as JSON here")
+    bench.add_argument("script", help="scraper script, e.g. ScraperFinal.py")
+    bench.add_argument("script_args", nargs=argparse.REMAINDER, help="arguments for the script, e.g. --only box_scores")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        server = _server(args, args.port)
+        print(f"Replaying {args.archive} ({server.archive.stats()['pages']} pages) at {server.url}")
+        print(f"Point a scraper at it with SCRAPER_MIRROR={server.url} SCRAPER_DELAY=0")
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        server.httpd.server_close()
+        print(", ".join(f"{name} {value:.0f}" for name, value in server.counts.items()))
+        return 0
+
+    env = {"SCRAPER_DELAY": str(args.delay)}
+    if args.workers:
+        env["SCRAPER_WORKERS"] = str(args.workers)
+    if args.parse_workers:
+        env["SCRAPER_PARSE_WORKERS"] = str(args.parse_workers)
+    with _server(args) as server:
+        result = run_benchmark(server, args.script, args.script_args, args.workdir, args.copy, env)
+    print("\n".join(summary_lines(result)))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"Benchmark written to {args.output}")
+    return result["returncode"]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,232 @@
+"""Dated table snapshots stored as deltas.
+
+``final_data/`` used to receive a complete copy of Games, PlayerStats, Rosters
+and Teams on every run, dozens of near-identical files per season. A
+``SnapshotStore`` keeps one full base per table and, for every later run, only
+the rows that were added, changed or removed (by key) since the previous
+snapshot::
+
+    final_data/snapshots/Games/manifest.json
+    final_data/snapshots/Games/2025-09-02.base.csv.gz
+    final_data/snapshots/Games/2025-09-09.delta.csv.gz
+
+``materialize(table, as_of)`` rebuilds the table as it was on a date from the
+last base before it plus the deltas after that base; a new base is written
+every ``checkpoint_every`` deltas (or when a delta would be most of the table)
+so a read never replays a long chain. From the command line::
+
+    python -m scraper_core.snapshots history Games
+    python -m scraper_core.snapshots materialize Games --as-of 2025-10-01 -o Games.csv
+    python -m scraper_core.snapshots import Games final_data/Games_*.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import re
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import pandas as pd
+
+
+DEFAULT_ROOT = os.path.join("final_data", "snapshots")
+OP = "_op"
+OCCURRENCE = "_n"
+# Keys of the tables the final export snapshots.
+TABLE_KEYS: Dict[str, List[str]] = {
+    "Games": ["game_id"],
+    "PlayerStats": ["player_id", "season", "week"],
+    "Rosters": ["season", "team", "full_name", "position"],
+    "Teams": ["TeamID"],
+}
+_LEGACY_DATE_RE = re.compile(r"_([A-Z]{3}_\d{2}_\d{4})\.csv$")
+
+
+def _as_text(df: pd.DataFrame) -> pd.DataFrame:
+    """Every value as the text ``to_csv`` would write (empty for missing)."""
+
+    return pd.read_csv(io.StringIO(df.to_csv(index=False)), dtype=str, keep_default_na=False)
+
+
+def _with_occurrence(df: pd.DataFrame, key: Sequence[str]) -> pd.DataFrame:
+    # Repeated keys are kept apart by their position among the duplicates.
+    df = df.copy()
+    df[OCCURRENCE] = df.groupby(list(key), sort=False).cumcount().astype(str)
+    return df
+
+
+class SnapshotStore:
+    """Base + delta history of keyed tables under ``root``."""
+
+    def __init__(self, root: str = DEFAULT_ROOT, checkpoint_every: int = 30):
+        self.root = root
+        self.checkpoint_every = checkpoint_every
+
+    def _dir(self, table: str) -> str:
+        return os.path.join(self.root, table)
+
+    def manifest(self, table: str) -> Dict:
+        path = os.path.join(self._dir(table), "manifest.json")
+        if not os.path.exists(path):
+            return {"key": TABLE_KEYS.get(table, []), "versions": []}
+        with open(path) as f:
+            return json.load(f)
+
+    def _save_manifest(self, table: str, manifest: Dict) -> None:
+        path = os.path.join(self._dir(table), "manifest.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp_path, path)
+
+    def _read(self, table: str, version: Dict) -> pd.DataFrame:
+        return pd.read_csv(os.path.join(self._dir(table), version["file"]), dtype=str, keep_default_na=False)
+
+    def _state(self, table: str, versions: List[Dict], key: Sequence[str]) -> Optional[pd.DataFrame]:
+        """Text frame indexed by key (+ occurrence) after replaying ``versions``."""
+
+        bases = [i for i, version in enumerate(versions) if version["kind"] == "base"]
+        if not bases:
+            return None
+        index = [*key, OCCURRENCE]
+        state = self._read(table, versions[bases[-1]]).set_index(index)
+        for version in versions[bases[-1] + 1:]:
+            delta = self._read(table, version).set_index(index)
+            ops = delta.pop(OP)
+            for column in delta.columns.difference(state.columns):
+                state[column] = ""
+            state = state.drop(delta.index[ops == "removed"], errors="ignore")
+            upserts = delta[ops != "removed"].reindex(columns=state.columns, fill_value="")
+            changed = upserts.index.intersection(state.index)
+            state.loc[changed] = upserts.loc[changed]
+            state = pd.concat([state, upserts.drop(changed)])
+            state = state[[column for column in version["columns"] if column not in index]]
+        return state
+
+    def materialize(self, table: str, as_of: Optional[str] = None, raw: bool = False) -> pd.DataFrame:
+        """``table`` as of ``as_of`` (YYYY-MM-DD, default latest).
+
+        Values come back typed the way ``pd.read_csv`` reads the old full
+        copies; ``raw=True`` keeps them as text.
+        """
+
+        manifest = self.manifest(table)
+        versions = [v for v in manifest["versions"] if as_of is None or v["as_of"] <= as_of]
+        state = self._state(table, versions, manifest["key"])
+        if state is None:
+            raise LookupError(f"No snapshot of {table} on or before {as_of or 'today'} in {self._dir(table)}")
+        frame = state.reset_index().drop(columns=[OCCURRENCE])[versions[-1]["columns"]]
+        return frame if raw else pd.read_csv(io.StringIO(frame.to_csv(index=False)))
+
+    def write(self, table: str, df: pd.DataFrame, key: Optional[Sequence[str]] = None,
+              as_of: Optional[str] = None) -> Dict:
+        """Record ``df`` as the ``as_of`` (default today) version of ``table``; return its manifest entry.
+
+        A second write on the same date replaces that date's version.
+        """
+
+        as_of = as_of or date.today().isoformat()
+        manifest = self.manifest(table)
+        key = list(key or manifest["key"] or TABLE_KEYS[table])
+        os.makedirs(self._dir(table), exist_ok=True)
+        versions = manifest["versions"]
+        if versions and versions[-1]["as_of"] > as_of:
+            raise ValueError(f"{table} already has a snapshot for {versions[-1]['as_of']}, after {as_of}")
+        if versions and versions[-1]["as_of"] == as_of:
+            replaced = versions.pop()
+            os.remove(os.path.join(self._dir(table), replaced["file"]))
+
+        columns = list(df.columns)
+        current = _with_occurrence(_as_text(df), key).set_index([*key, OCCURRENCE])
+        previous = self._state(table, versions, key) if key == manifest["key"] else None
+        deltas_since_base = len(versions) - 1 - max((i for i, v in enumerate(versions) if v["kind"] == "base"), default=-1)
+
+        entry = {"as_of": as_of, "columns": columns, "rows": len(current)}
+        if previous is not None:
+            union = previous.columns.union(current.columns, sort=False)
+            previous = previous.reindex(columns=union, fill_value="")
+            aligned = current.reindex(columns=union, fill_value="")
+            added = aligned.index.difference(previous.index)
+            removed = previous.index.difference(aligned.index)
+            common = aligned.index.intersection(previous.index)
+            differs = (aligned.loc[common] != previous.loc[common]).any(axis=1)
+            changed = common[differs.to_numpy()]
+            entry.update(added=len(added), changed=len(changed), removed=len(removed))
+            size = len(added) + len(changed) + len(removed)
+            if size == 0 and columns == versions[-1]["columns"]:
+                print(f"{table}: unchanged since {versions[-1]['as_of']}; no snapshot written")
+                self._save_manifest(table, {"key": key, "versions": versions})
+                return versions[-1]
+            if deltas_since_base < self.checkpoint_every and size < len(current) // 2:
+                delta = pd.concat([
+                    current.loc[added].assign(**{OP: "added"}),
+                    current.loc[changed].assign(**{OP: "changed"}),
+                    pd.DataFrame({OP: "removed"}, index=removed),
+                ])
+                entry.update(kind="delta", file=f"{as_of}.delta.csv.gz")
+                delta.reset_index().to_csv(os.path.join(self._dir(table), entry["file"]), index=False)
+                versions.append(entry)
+                self._save_manifest(table, {"key": key, "versions": versions})
+                print(f"{table}: snapshot {as_of} stored as a delta "
+                      f"(+{len(added)} ~{len(changed)} -{len(removed)} of {len(current)} rows)")
+                return entry
+
+        entry.update(kind="base", file=f"{as_of}.base.csv.gz")
+        current.reset_index().to_csv(os.path.join(self._dir(table), entry["file"]), index=False)
+        versions.append(entry)
+        self._save_manifest(table, {"key": key, "versions": versions})
+        print(f"{table}: snapshot {as_of} stored as a full base ({len(current)} rows)")
+        return entry
+
+    def history(self, table: str) -> List[Dict]:
+        return self.manifest(table)["versions"]
+
+    def import_copies(self, table: str, paths: Iterable[str], key: Optional[Sequence[str]] = None) -> int:
+        """Fold old full copies (``<Table>_OCT_17_2025.csv``) into the store, oldest first."""
+
+        dated = []
+        for path in paths:
+            match = _LEGACY_DATE_RE.search(os.path.basename(path))
+            if match:
+                dated.append((datetime.strptime(match.group(1).title(), "%b_%d_%Y").date().isoformat(), path))
+        for as_of, path in sorted(dated):
+            self.write(table, pd.read_csv(path), key=key, as_of=as_of)
+        return len(dated)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect and export dated table snapshots")
+    parser.add_argument("--root", default=DEFAULT_ROOT)
+    commands = parser.add_subparsers(dest="command", required=True)
+    history = commands.add_parser("history", help="list the stored versions of a table")
+    history.add_argument("table")
+    export = commands.add_parser("materialize", help="write a table as of a date to CSV")
+    export.add_argument("table")
+    export.add_argument("--as-of", help="YYYY-MM-DD (default: latest)")
+    export.add_argument("-o", "--output", help="CSV path (default: <table>_<as-of>.csv)")
+    legacy = commands.add_parser("import", help="fold old full dated copies into the store")
+    legacy.add_argument("table")
+    legacy.add_argument("paths", nargs="+")
+    args = parser.parse_args(argv)
+
+    store = SnapshotStore(args.root)
+    if args.command == "history":
+        for version in store.history(args.table):
+            counts = f"+{version.get('added', 0)} ~{version.get('changed', 0)} -{version.get('removed', 0)}"
+            print(f"{version['as_of']}  {version['kind']:<5}  {version['rows']:>8} rows  {counts if version['kind'] == 'delta' else ''}")
+    elif args.command == "materialize":
+        df = store.materialize(args.table, args.as_of)
+        output = args.output or f"{args.table}_{args.as_of or 'latest'}.csv"
+        df.to_csv(output, index=False)
+        print(f"Wrote {len(df)} rows of {args.table} to {output}")
+    else:
+        print(f"Imported {store.import_copies(args.table, args.paths)} copies of {args.table}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,152 @@
+"""Table specs and the scraping runtime shared by every entry point.
+
+Each PFR table a scraper reads is declared once as a ``TableSpec``: where it
+sits on the page (id or class), the output header and, when the cell text is
+not enough, how one ``<tr>`` becomes an output row. ``Scraper`` bundles what an
+entry point needs: the pooled, per-host rate-limited ``FetchEngine`` backed by
+the page archive (``--reparse`` reads it instead of the network), the
+``ParsePool`` and the run telemetry. ``Scraper.rows`` replaces the
+fetch/retry/sleep/parse loop the scripts used to copy::
+
+    scraper = Scraper('box-scores-pfr')
+    for url, game, rows in scraper.rows(LINESCORE, {game['url']: game for game in games}):
+        writer.writerows(rows or [])
+    scraper.close()
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .archive import DEFAULT_ARCHIVE_DIR, PageArchive, reparse_requested
+from .fetch import FetchEngine
+from .parse import ParsePool
+from .tables import Row, Table, find_table_html, parse_table
+from .telemetry import DEFAULT_REPORT_DIR, Telemetry
+
+
+# Rows PFR repeats inside tbody (header repeats, spacers between weeks).
+SKIP_CLASSES = frozenset({"thead", "over_header", "spacer", "divider"})
+
+
+def data_rows(table: Table) -> List[Row]:
+    """Body rows of ``table`` without the repeated header and spacer rows."""
+
+    return [tr for tr in table.body if not SKIP_CLASSES.intersection(tr.classes)]
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """One PFR table type: its locator, header and row builder."""
+
+    name: str
+    table_id: Optional[str] = None
+    class_: Optional[str] = None
+    header: Sequence[str] = ()
+    # ``row(tr, context)`` -> output row or None to drop it; default is the cell text.
+    row: Optional[Callable[[Row, Any], Optional[List[str]]]] = None
+    # Pad or trim every row to the header width.
+    fit: bool = False
+    # Columns that repeat the value above when left blank (e.g. the scoring quarter).
+    fill_down: Sequence[int] = ()
+
+    @property
+    def locator(self) -> Tuple[str, Optional[str], Optional[str]]:
+        return self.name, self.table_id, self.class_
+
+    def rows(self, table: Table, context: Any = None) -> List[List[str]]:
+        out = []
+        last: Dict[int, str] = {}
+        for tr in data_rows(table):
+            row = self.row(tr, context) if self.row is not None else tr.values()
+            if not row or not any(str(value).strip() for value in row):
+                continue
+            row = list(row)
+            if self.fit and self.header:
+                row = (row + [""] * len(self.header))[:len(self.header)]
+            for column in self.fill_down:
+                if row[column]:
+                    last[column] = row[column]
+                else:
+                    row[column] = last.get(column, "")
+            out.append(row)
+        return out
+
+
+def extract_spec_tables(locators: Sequence[Tuple[str, Optional[str], Optional[str]]], html: bytes) -> Dict[str, Table]:
+    """``{spec name: Table}`` for the located tables found in ``html`` (runs in parse workers)."""
+
+    found = {}
+    for name, table_id, class_ in locators:
+        fragment = find_table_html(html, table_id=table_id, class_=class_)
+        if fragment is not None:
+            found[name] = parse_table(fragment, name)
+    return found
+
+
+class Scraper:
+    """Fetch engine, parse pool, page archive and telemetry for one script."""
+
+    def __init__(
+        self,
+        script: str,
+        offline: Optional[bool] = None,
+        archive_root: str = DEFAULT_ARCHIVE_DIR,
+        workers: Optional[int] = None,
+        parse_workers: Optional[int] = None,
+        report_dir: str = DEFAULT_REPORT_DIR,
+    ):
+        # The parse pool forks its workers, so it is created before any fetch thread starts.
+        self.parse_pool = ParsePool(parse_workers)
+        self.archive = PageArchive(archive_root, offline=reparse_requested() if offline is None else offline)
+        self.fetcher = FetchEngine(max_workers=workers, archive=self.archive)
+        self.telemetry = Telemetry(script, report_dir).install()
+
+    @property
+    def offline(self) -> bool:
+        return self.archive.offline
+
+    def get(self, url: str, timeout: float = 30):
+        """One page through the shared session; ``None`` after the final failed attempt."""
+
+        return self.fetcher.fetch(url, timeout=timeout)
+
+    def tables(
+        self,
+        specs: Sequence[TableSpec],
+        targets: Mapping[str, Any],
+        timeout: float = 30,
+    ) -> Iterator[Tuple[str, Any, Optional[Dict[str, Table]]]]:
+        """Yield ``(url, context, {spec name: Table})`` per target; ``None`` if the page failed."""
+
+        parse = partial(extract_spec_tables, tuple(spec.locator for spec in specs))
+        for url, found in self.parse_pool.map(self.fetcher.map(targets, timeout=timeout), parse):
+            yield url, targets[url], found
+
+    def archived_tables(
+        self,
+        specs: Sequence[TableSpec],
+        urls: Iterable[str],
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Table]]]]:
+        """Yield ``(url, {spec name: Table})`` re-parsed from the archive; ``None`` if a page is not archived."""
+
+        parse = partial(extract_spec_tables, tuple(spec.locator for spec in specs))
+        yield from self.parse_pool.map(((url, self.archive.response(url)) for url in urls), parse)
+
+    def rows(
+        self,
+        spec: TableSpec,
+        targets: Mapping[str, Any],
+        timeout: float = 30,
+    ) -> Iterator[Tuple[str, Any, Optional[List[List[str]]]]]:
+        """Yield ``(url, context, rows)`` per target; ``None`` if the page or table is missing."""
+
+        for url, context, found in self.tables([spec], targets, timeout=timeout):
+            table = (found or {}).get(spec.name)
+            yield url, context, spec.rows(table, context) if table is not None else None
+
+    def close(self, status: Optional[Mapping[str, str]] = None) -> Dict:
+        self.parse_pool.close()
+        return self.telemetry.report(status)
@@ -0,0 +1,133 @@
+"""Chunked CSV reading and merging for bounded-memory runs.
+
+The merge steps of the scrapers used to ``pd.concat`` every per-season or
+per-team CSV of a directory and write the result, so peak memory grew with the
+number of seasons. ``concat_csv`` streams the same merge a chunk at a time with
+the chunk size taken from a :class:`scraper_core.memory.MemoryBudget`, halving it
+whenever the process goes over the ceiling. Values are read as text so a merge
+writes them back exactly as scraped (no ``3`` -> ``3.0`` from a chunk that
+happened to hold a blank).
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+import pandas as pd
+
+from .memory import MIN_CHUNK_ROWS, MemoryBudget
+
+
+def csv_header(path: str) -> List[str]:
+    """Column names as ``pd.read_csv`` reports them (repeated names become ``Yds.1``)."""
+
+    if os.path.getsize(path) == 0:
+        return []
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def iter_csv(path: str, budget: Optional[MemoryBudget] = None, **read_csv_kwargs: Any) -> Iterator[pd.DataFrame]:
+    """``path`` in chunks sized by ``budget`` (text values unless ``dtype`` is given)."""
+
+    budget = budget or MemoryBudget()
+    if os.path.getsize(path) == 0:
+        return
+    read_csv_kwargs.setdefault("dtype", str)
+    read_csv_kwargs.setdefault("keep_default_na", False)
+    rows = budget.chunk_rows(path)
+    with pd.read_csv(path, iterator=True, **read_csv_kwargs) as reader:
+        while True:
+            try:
+                chunk = reader.get_chunk(rows)
+            except StopIteration:
+                return
+            yield chunk
+            del chunk
+            if budget.exceeded() and rows > MIN_CHUNK_ROWS:
+                rows = max(MIN_CHUNK_ROWS, rows // 2)
+                print(f"Memory over the {budget.limit_mb:.0f} MB ceiling; reading {os.path.basename(path)} "
+                      f"{rows} rows at a time")
+
+
+def iter_records(path: str, budget: Optional[MemoryBudget] = None, **read_csv_kwargs: Any) -> Iterator[Dict[str, Any]]:
+    """Rows of ``path`` as dicts, one chunk in memory at a time."""
+
+    for chunk in iter_csv(path, budget, **read_csv_kwargs):
+        yield from chunk.to_dict("records")
+
+
+def concat_csv(
+    paths: Sequence[str],
+    output: str,
+    budget: Optional[MemoryBudget] = None,
+    assign: Optional[Callable[[str], Mapping[str, Any]]] = None,
+    keep: Optional[Callable[[pd.DataFrame], Any]] = None,
+    columns: Sequence[str] = (),
+) -> int:
+    """Append the CSVs in ``paths`` to a new ``output`` chunk by chunk; return the rows written.
+
+    Columns are ``columns`` followed by the rest of the inputs' headers in
+    first-seen order (so an empty ``paths`` still writes a header).
+    ``assign(path)`` gives constant columns for a file (e.g. its season) and
+    ``keep(chunk)`` a boolean row mask.
+    """
+
+    extra = {path: dict(assign(path)) if assign else {} for path in paths}
+    columns = list(columns)
+    for path in paths:
+        for column in [*csv_header(path), *extra[path]]:
+            if column not in columns:
+                columns.append(column)
+    written = 0
+    tmp_path = f"{output}.tmp"
+    with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerow(columns)
+        for path in paths:
+            for chunk in iter_csv(path, budget):
+                if keep is not None:
+                    chunk = chunk[keep(chunk)]
+                chunk = chunk.assign(**extra[path]).reindex(columns=columns, fill_value="")
+                chunk.to_csv(f, header=False, index=False)
+                written += len(chunk)
+    os.replace(tmp_path, output)
+    return written
+
+
+def filter_csv(path: str, keep: Callable[[pd.DataFrame], Any], budget: Optional[MemoryBudget] = None) -> int:
+    """Rewrite ``path`` in place with only the rows ``keep`` selects; return the rows kept."""
+
+    return concat_csv([path], path, budget, keep=keep)
+
+
+def compact_dtypes(df: pd.DataFrame, categories: Iterable[str] = ()) -> pd.DataFrame:
+    """Downcast numeric columns to the smallest type that holds them; ``categories`` become categoricals.
+
+    Categories are opt-in: concatenating or grouping on a categorical column
+    behaves differently from text, so only label columns that are just compared
+    and written back should be listed.
+    """
+
+    out = df.copy()
+    for column in out.columns:
+        series = out[column]
+        if pd.api.types.is_integer_dtype(series):
+            out[column] = pd.to_numeric(series, downcast="integer")
+        elif pd.api.types.is_float_dtype(series):
+            out[column] = pd.to_numeric(series, downcast="float")
+    for column in categories:
+        if column in out.columns:
+            out[column] = out[column].astype("category")
+    return out
+
+
+def paths_in(directory: str, suffix: str = ".csv", exclude: Iterable[str] = ()) -> List[str]:
+    """Sorted CSV paths in ``directory`` (the merge order no longer depends on ``os.listdir``)."""
+
+    exclude = set(exclude)
+    return [
+        os.path.join(directory, name)
+        for name in sorted(os.listdir(directory))
+        if name.endswith(suffix) and name not in exclude
+    ]
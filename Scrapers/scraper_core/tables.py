@@ -0,0 +1,148 @@
+"""Fast extraction of stat tables from PFR pages.
+
+PFR ships most stat tables inside HTML comments, which forces a full
+BeautifulSoup tree, a search for ``Comment`` nodes and a second parse of each
+comment. Here the raw markup is scanned once for the wanted ``<table>`` (the
+scan does not care whether it sits in a comment) and only that fragment is
+parsed with lxml. Results are plain, picklable rows so parsing can run in the
+worker processes of :class:`scraper_core.parse.ParsePool`.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Union
+
+import lxml.html
+
+
+@dataclass
+class Cell:
+    tag: str
+    text: str
+    stat: Optional[str] = None
+    href: Optional[str] = None
+    span: int = 1
+    # Every link in the cell when there is more than one (e.g. several colleges).
+    hrefs: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Row:
+    section: str
+    cells: List[Cell] = field(default_factory=list)
+    classes: List[str] = field(default_factory=list)
+
+    def values(self, tags: Iterable[str] = ("th", "td"), strip: bool = True) -> List[str]:
+        tags = tuple(tags)
+        return [cell.text.strip() if strip else cell.text for cell in self.cells if cell.tag in tags]
+
+    def of(self, tag: str) -> List[Cell]:
+        return [cell for cell in self.cells if cell.tag == tag]
+
+    def first(self, tag: str, stat: Optional[str] = None) -> Optional[Cell]:
+        for cell in self.cells:
+            if cell.tag == tag and (stat is None or cell.stat == stat):
+                return cell
+        return None
+
+
+@dataclass
+class Table:
+    key: str
+    rows: List[Row] = field(default_factory=list)
+
+    def section(self, name: str) -> List[Row]:
+        return [row for row in self.rows if row.section == name]
+
+    @property
+    def body(self) -> List[Row]:
+        return self.section("tbody")
+
+    def header(self, sep: str = "_") -> List[str]:
+        """Column names from the ``thead`` rows, over-headers joined like a flattened ``read_html``."""
+
+        levels = []
+        for row in self.section("thead"):
+            names: List[str] = []
+            for cell in row.cells:
+                names.extend([cell.text.strip()] * cell.span)
+            levels.append(names)
+        if not levels:
+            return []
+        return [
+            sep.join(level[i] for level in levels if i < len(level) and level[i])
+            for i in range(len(levels[-1]))
+        ]
+
+
+def _decode(html: Union[bytes, str]) -> str:
+    return html.decode("utf-8", errors="replace") if isinstance(html, bytes) else html
+
+
+def _table_start(html: str, attr: str, value: str) -> Optional[int]:
+    if attr == "id":
+        pattern = r'<table\b[^>]*\bid="%s"' % re.escape(value)
+    else:
+        pattern = r'<table\b[^>]*\bclass="(?:[^"]*\s)?%s(?:\s[^"]*)?"' % re.escape(value)
+    match = re.search(pattern, html)
+    return match.start() if match else None
+
+
+def find_table_html(html: Union[bytes, str], table_id: Optional[str] = None, class_: Optional[str] = None) -> Optional[str]:
+    """Raw ``<table>...</table>`` markup for a table id or class, comment-wrapped or not."""
+
+    html = _decode(html)
+    start = _table_start(html, "id", table_id) if table_id else _table_start(html, "class", class_)
+    if start is None:
+        return None
+    end = html.find("</table>", start)
+    if end == -1:
+        return None
+    return html[start:end + len("</table>")]
+
+
+def parse_table(fragment: str, key: str) -> Table:
+    element = lxml.html.fragment_fromstring(fragment)
+    table = Table(key)
+    for tr in element.iter("tr"):
+        parent = tr.getparent()
+        row = Row(parent.tag if parent is not None and parent.tag != "table" else "tbody",
+                  classes=tr.get("class", "").split())
+        for cell in tr:
+            if cell.tag not in ("th", "td"):
+                continue
+            links = [a.get("href", "") for a in cell.iter("a")]
+            span = cell.get("colspan", "1")
+            row.cells.append(Cell(cell.tag, cell.text_content(), cell.get("data-stat"),
+                                  links[0] if links else None,
+                                  int(span) if span.isdigit() else 1,
+                                  links if len(links) > 1 else []))
+        table.rows.append(row)
+    return table
+
+
+def extract_tables(
+    html: Union[bytes, str],
+    ids: Iterable[str] = (),
+    classes: Iterable[str] = (),
+) -> Dict[str, Table]:
+    """``{id or class: Table}`` for every requested table found on the page."""
+
+    html = _decode(html)
+    found = {}
+    for table_id in ids:
+        fragment = find_table_html(html, table_id=table_id)
+        if fragment is not None:
+            found[table_id] = parse_table(fragment, table_id)
+    for class_ in classes:
+        fragment = find_table_html(html, class_=class_)
+        if fragment is not None:
+            found[class_] = parse_table(fragment, class_)
+    return found
+
+
+def extract_table(html: Union[bytes, str], table_id: Optional[str] = None, class_: Optional[str] = None) -> Optional[Table]:
+    fragment = find_table_html(html, table_id=table_id, class_=class_)
+    return parse_table(fragment, table_id or class_) if fragment is not None else None
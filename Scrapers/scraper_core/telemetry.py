@@ -0,0 +1,241 @@
+"""Per-stage and per-host counters for a scraper run, plus a run report.
+
+The fetch engine, parse pool, CSV writer and ``db.upsert`` report into the
+installed ``Telemetry`` through ``record()``; counters are keyed by the stage
+that is running (a context variable set by the pipeline, or by ``section()`` in
+the sequential scripts) and by host. Nothing is collected until a script calls
+``Telemetry(...).install()``.
+
+At the end of a run ``report()`` writes ``data/run-reports/<script>-<time>.json``
+and ``.csv`` (with the run's peak RSS), prints a summary table and compares every stage with the previous
+report of the same script, so a stage that got slower or started hitting 429s
+stands out.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import csv
+import glob
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .memory import peak_rss_mb
+
+
+DEFAULT_REPORT_DIR = os.path.join("data", "run-reports")
+COUNTERS = (
+    "requests",
+    "retries",
+    "rate_limited",
+    "errors",
+    "cache_hits",
+    "bytes",
+    "wait_seconds",
+    "parsed",
+    "parse_seconds",
+    "rows_written",
+)
+# A stage is flagged when it is this much slower than last run (and at least MIN_SLOWER_SECONDS).
+SLOWER_RATIO = 1.25
+MIN_SLOWER_SECONDS = 10.0
+
+STAGE: contextvars.ContextVar[str] = contextvars.ContextVar("scraper_stage", default="-")
+_active: Optional["Telemetry"] = None
+
+
+def current_stage() -> str:
+    return STAGE.get()
+
+
+def record(host: Optional[str] = None, **counts: float) -> None:
+    """Add ``counts`` to the current stage and ``host`` (no-op without an installed run)."""
+
+    if _active is not None:
+        _active.add(STAGE.get(), host or "-", counts)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Attribute everything recorded inside the block to stage ``name``."""
+
+    token = STAGE.set(name)
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        STAGE.reset(token)
+        if _active is not None:
+            _active.add_time(name, time.monotonic() - started)
+
+
+def section(name: str) -> None:
+    """Start stage ``name`` in a sequential script, closing the previous one."""
+
+    if _active is not None:
+        _active.switch(name)
+    else:
+        STAGE.set(name)
+
+
+class Telemetry:
+    """Counters for one run of a scraper script."""
+
+    def __init__(self, script: str, report_dir: str = DEFAULT_REPORT_DIR):
+        self.script = script
+        self.report_dir = report_dir
+        self.started_at = datetime.now()
+        self._started = time.monotonic()
+        self.lock = threading.Lock()
+        self.counters: Dict[Tuple[str, str], Dict[str, float]] = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self._section: Optional[Tuple[str, float]] = None
+
+    def install(self) -> "Telemetry":
+        global _active
+        _active = self
+        return self
+
+    def add(self, stage_name: str, host: str, counts: Mapping[str, float]) -> None:
+        with self.lock:
+            row = self.counters[(stage_name, host)]
+            for name, value in counts.items():
+                row[name] = row.get(name, 0) + value
+
+    def add_time(self, stage_name: str, seconds: float) -> None:
+        with self.lock:
+            self.seconds[stage_name] += seconds
+
+    def switch(self, name: Optional[str]) -> None:
+        if self._section is not None:
+            previous, started = self._section
+            self.add_time(previous, time.monotonic() - started)
+        self._section = (name, time.monotonic()) if name else None
+        STAGE.set(name or "-")
+
+    def stage_totals(self) -> Dict[str, Dict[str, float]]:
+        totals: Dict[str, Dict[str, float]] = {}
+        for name in self.seconds:
+            totals[name] = dict.fromkeys(COUNTERS, 0)
+        for (stage_name, _), row in self.counters.items():
+            total = totals.setdefault(stage_name, dict.fromkeys(COUNTERS, 0))
+            for key, value in row.items():
+                total[key] = total.get(key, 0) + value
+        for name, total in totals.items():
+            total["seconds"] = round(self.seconds.get(name, 0.0), 2)
+        return totals
+
+    def host_totals(self) -> Dict[str, Dict[str, float]]:
+        totals: Dict[str, Dict[str, float]] = {}
+        for (_, host), row in self.counters.items():
+            if host == "-":
+                continue
+            total = totals.setdefault(host, dict.fromkeys(COUNTERS, 0))
+            for key, value in row.items():
+                total[key] = total.get(key, 0) + value
+        return totals
+
+    def as_dict(self, status: Optional[Mapping[str, str]] = None) -> Dict:
+        stages = self.stage_totals()
+        for name, result in (status or {}).items():
+            stages.setdefault(name, {**dict.fromkeys(COUNTERS, 0), "seconds": 0.0})["status"] = result
+        return {
+            "script": self.script,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "seconds": round(time.monotonic() - self._started, 2),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+            "peak_worker_rss_mb": round(peak_rss_mb(children=True), 1),
+            "stages": stages,
+            "hosts": self.host_totals(),
+            "detail": [
+                {"stage": stage_name, "host": host, **row}
+                for (stage_name, host), row in sorted(self.counters.items())
+            ],
+        }
+
+    def previous_report(self) -> Optional[Dict]:
+        paths = sorted(glob.glob(os.path.join(self.report_dir, f"{self.script}-*.json")))
+        if not paths:
+            return None
+        try:
+            with open(paths[-1]) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def write(self, report: Dict) -> str:
+        os.makedirs(self.report_dir, exist_ok=True)
+        base = os.path.join(self.report_dir, f"{self.script}-{self.started_at:%Y%m%d-%H%M%S}")
+        with open(f"{base}.json", "w") as f:
+            json.dump(report, f, indent=2)
+        with open(f"{base}.csv", "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["stage", "host", "stage_seconds", "status", *COUNTERS])
+            for row in report["detail"]:
+                stage_info = report["stages"].get(row["stage"], {})
+                writer.writerow([row["stage"], row["host"], stage_info.get("seconds", ""), stage_info.get("status", ""),
+                                 *(round(row.get(key, 0), 3) for key in COUNTERS)])
+        return f"{base}.json"
+
+    def report(self, status: Optional[Mapping[str, str]] = None) -> Dict:
+        """Write the run report, print the summary and the comparison with the last run."""
+
+        if self._section is not None:
+            self.switch(None)
+        previous = self.previous_report()
+        report = self.as_dict(status)
+        path = self.write(report)
+        print("\n" + "\n".join(summary_lines(report, previous)))
+        print(f"\nRun report written to {path}")
+        return report
+
+
+def _cache_ratio(row: Mapping[str, float]) -> str:
+    return f"{100 * row.get('cache_hits', 0) / row['requests']:.0f}%" if row.get("requests") else "-"
+
+
+def summary_lines(report: Dict, previous: Optional[Dict] = None) -> List[str]:
+    """Stage and host tables; the delta column compares with ``previous``."""
+
+    before = (previous or {}).get("stages", {})
+    lines = [
+        f"{'stage':<26} {'status':<10} {'wall s':>8} {'vs last':>8} {'reqs':>6} {'retry':>6} {'429':>5} "
+        f"{'MB':>8} {'cache':>6} {'wait s':>8} {'parse s':>8} {'rows':>8}",
+    ]
+    slower = []
+    for name, row in report["stages"].items():
+        seconds = row.get("seconds", 0.0)
+        delta = "-"
+        if name in before and before[name].get("seconds"):
+            change = seconds - before[name]["seconds"]
+            delta = f"{change:+.0f}"
+            if seconds > before[name]["seconds"] * SLOWER_RATIO and change >= MIN_SLOWER_SECONDS:
+                slower.append(f"{name} ({before[name]['seconds']:.0f}s -> {seconds:.0f}s)")
+        lines.append(
+            f"{name:<26} {row.get('status', '-'):<10} {seconds:>8.1f} {delta:>8} {int(row['requests']):>6} "
+            f"{int(row['retries']):>6} {int(row['rate_limited']):>5} {row['bytes'] / 1e6:>8.1f} {_cache_ratio(row):>6} "
+            f"{row['wait_seconds']:>8.1f} {row['parse_seconds']:>8.1f} {int(row['rows_written']):>8}"
+        )
+    if report["hosts"]:
+        lines.append("")
+        lines.append(f"{'host':<40} {'reqs':>6} {'retry':>6} {'429':>5} {'errors':>6} {'MB':>8} {'cache':>6} {'wait s':>8}")
+        for host, row in sorted(report["hosts"].items()):
+            lines.append(
+                f"{host:<40} {int(row['requests']):>6} {int(row['retries']):>6} {int(row['rate_limited']):>5} "
+                f"{int(row['errors']):>6} {row['bytes'] / 1e6:>8.1f} {_cache_ratio(row):>6} {row['wait_seconds']:>8.1f}"
+            )
+    if report.get("peak_rss_mb"):
+        lines.append("")
+        lines.append(f"Peak RSS {report['peak_rss_mb']:.0f} MB (largest parse worker {report.get('peak_worker_rss_mb', 0):.0f} MB)")
+    if previous:
+        lines.append("")
+        lines.append(f"Total {report['seconds']:.0f}s (last run {previous.get('seconds', 0):.0f}s, started {previous.get('started_at', '?')})")
+        if slower:
+            lines.append("Slower than last run: " + ", ".join(slower))
+    return lines
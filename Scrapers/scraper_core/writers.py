@@ -0,0 +1,161 @@
+"""Append-only CSV writer with keyed de-duplication.
+
+The per-season PFR CSVs used to be re-read with pandas, filtered and written
+back for every team that was re-scraped, so the I/O grew with the square of
+the file. ``AppendOnlyCSV`` reads a file once to build an in-memory index of
+``key -> row digest``, appends only rows that are new or changed, and on
+``close()`` rewrites the file a single time: the last row per key wins and rows
+are sorted by key.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from . import telemetry
+
+
+_NUMBER_RE = re.compile(r"^-?\d+(?:\.\d+)?$")
+
+
+def natural_key(values: Sequence[str]) -> Tuple:
+    """Sort numbers numerically and text alphabetically (weeks 2 < 10, bye/playoff rows last)."""
+
+    return tuple((0, float(v), "") if _NUMBER_RE.match(v) else (1, 0.0, v) for v in values)
+
+
+def drop_rows(path: str, column: str, values: Iterable[str]) -> int:
+    """Remove rows whose ``column`` is in ``values`` (e.g. games being re-scraped); return rows removed."""
+
+    values = set(values)
+    if not values or not os.path.exists(path):
+        return 0
+    removed = 0
+    tmp_path = f"{path}.tmp"
+    with open(path, newline="", encoding="utf-8") as src, open(tmp_path, "w", newline="", encoding="utf-8") as dst:
+        reader = csv.reader(src)
+        writer = csv.writer(dst)
+        header = next(reader, None)
+        if header is None or column not in header:
+            dst.close()
+            os.remove(tmp_path)
+            return 0
+        position = header.index(column)
+        writer.writerow(header)
+        for row in reader:
+            if position < len(row) and row[position] in values:
+                removed += 1
+                continue
+            writer.writerow(row)
+    os.replace(tmp_path, path)
+    return removed
+
+
+class AppendOnlyCSV:
+    """Streaming writer for one CSV file keyed by ``key`` columns."""
+
+    def __init__(self, path: str, header: Sequence[str], key: Sequence[str], replace: bool = False):
+        self.path = path
+        self.header = list(header)
+        self.key = list(key)
+        self._key_idx = [self.header.index(name) for name in self.key]
+        self._digests: Dict[Tuple[str, ...], int] = {}
+        self._handle = None
+        self._writer = None
+        self.appended = 0
+        self.superseded = 0
+        self.fresh = replace or not os.path.exists(path) or os.path.getsize(path) == 0
+        if not self.fresh:
+            self._load()
+
+    def _row_key(self, row: Sequence[str]) -> Tuple[str, ...]:
+        return tuple(str(row[i]) if i < len(row) else "" for i in self._key_idx)
+
+    @staticmethod
+    def _digest(row: Sequence[str]) -> int:
+        return hash(tuple(str(value) for value in row))
+
+    def _load(self) -> None:
+        with open(self.path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            if next(reader, None) != self.header:
+                print(f"{self.path} has a different header; it will be rewritten")
+                self.fresh = True
+                return
+            for row in reader:
+                self._digests[self._row_key(row)] = self._digest(row)
+
+    def __contains__(self, key: Tuple[str, ...]) -> bool:
+        return tuple(key) in self._digests
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def distinct(self, column: str) -> Set[str]:
+        """Values of a key column present in the file (e.g. teams already scraped)."""
+
+        position = self.key.index(column)
+        return {key[position] for key in self._digests}
+
+    def _open(self):
+        if self._writer is None:
+            mode = "w" if self.fresh else "a"
+            self._handle = open(self.path, mode, newline="", encoding="utf-8")
+            self._writer = csv.writer(self._handle)
+            if self.fresh:
+                self._writer.writerow(self.header)
+                self.fresh = False
+        return self._writer
+
+    def write(self, row: Sequence[str]) -> bool:
+        """Append ``row`` unless an identical row is already stored under its key."""
+
+        key = self._row_key(row)
+        digest = self._digest(row)
+        previous = self._digests.get(key)
+        if previous == digest:
+            return False
+        if previous is not None:
+            self.superseded += 1
+        self._open().writerow(row)
+        self._digests[key] = digest
+        self.appended += 1
+        return True
+
+    def writerows(self, rows: Iterable[Sequence[str]]) -> int:
+        return sum(self.write(row) for row in rows)
+
+    def close(self, sort: bool = True) -> None:
+        """Flush and, if anything was appended, compact the file once."""
+
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = self._writer = None
+        if self.appended:
+            telemetry.record(rows_written=self.appended)
+            self.compact(sort=sort)
+
+    def compact(self, sort: bool = True) -> None:
+        rows: Dict[Tuple[str, ...], List[str]] = {}
+        with open(self.path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            for row in reader:
+                rows[self._row_key(row)] = row
+        ordered = sorted(rows, key=natural_key) if sort else list(rows)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.header)
+            writer.writerows(rows[key] for key in ordered)
+        os.replace(tmp_path, self.path)
+
+    def __enter__(self) -> "AppendOnlyCSV":
+        return self
+
+    def __exit__(self, *exc) -> Optional[bool]:
+        self.close()
+        return None
@@ -6,11 +6,17 @@ NFL Data Cleaner - Team Abbreviation Standardization
 This script standardizes team abbreviations across all CSV files to ensure consistency.
 It maps various team name formats to standardized 3-letter abbreviations.
 
+Each file is read once, every team column is mapped once per distinct value
+(as a categorical) and checked in the same pass, and the file is rewritten
+atomically only if something changed. Run with --backup to keep a snapshot of
+each rewritten file in backups/ (a hard link, so it costs no copy).
+
 Standard Team Abbreviations:
 ARI, ATL, BAL, BUF, CAR, CHI, CIN, CLE, DAL, DEN, DET, GB, HOU, IND, JAX, KC, 
 LAC, LAR, LVR, MIA, MIN, NE, NO, NYG, NYJ, PHI, PIT, SEA, SF, TB, TEN, WAS
 """
 
+import argparse
 import pandas as pd
 import os
 import shutil
@@ -148,268 +154,115 @@ TEAM_MAPPING = {
     'STL': 'LAR'   # St. Louis Rams (uppercase)
 }
 
-def create_backup(file_path):
-    """Create a backup of the original file"""
-    backup_path = f"{file_path}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    shutil.copy2(file_path, backup_path)
+STANDARD_TEAMS = set(TEAM_MAPPING.values())
+
+# (file, label, team columns); None = every column with "team" in its name, () = check only
+FILES = [
+    ('all_box_scores.csv', 'Box Scores', ['Team']),
+    ('all_scoring_tables.csv', 'Scoring Tables', ['Team']),
+    ('all_team_game_logs.csv', 'Team Game Logs', ()),
+    ('all_team_stats.csv', 'Team Stats', ['Team']),
+    ('all_team_conversions.csv', 'Team Conversions', ['Team']),
+    ('all_passing_rushing_receiving.csv', 'Passing/Rushing/Receiving', None),
+    ('all_defense-game-logs.csv', 'Defense Game Logs', None),
+]
+
+def create_backup(file_path, backup_dir='backups'):
+    """Snapshot the file as a hard link (no copy); the cleaned file is written to a new inode"""
+    os.makedirs(backup_dir, exist_ok=True)
+    backup_path = os.path.join(backup_dir, f"{os.path.basename(file_path)}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    try:
+        os.link(file_path, backup_path)
+    except OSError:  # other filesystem, or no hard links
+        shutil.copy2(file_path, backup_path)
     print(f"   Backup created: {backup_path}")
     return backup_path
 
 def standardize_team_names(df, team_column, file_name):
-    """Standardize team names in a dataframe"""
-    print(f"   Processing {file_name}...")
-    
-    # Check if team column exists
-    if team_column not in df.columns:
-        print(f"     Warning: Column '{team_column}' not found in {file_name}")
-        return df
-    
-    # Count unique teams before standardization
-    unique_teams_before = df[team_column].nunique()
-    
-    # Create a copy to avoid modifying original
-    df_clean = df.copy()
-    
-    # Standardize team names
-    df_clean[team_column] = df_clean[team_column].map(TEAM_MAPPING).fillna(df_clean[team_column])
-    
-    # Count unique teams after standardization
-    unique_teams_after = df_clean[team_column].nunique()
-    
-    # Check for unmapped teams
-    unmapped_teams = df_clean[df_clean[team_column].isin(TEAM_MAPPING.values()) == False][team_column].unique()
-    
-    print(f"     Teams before: {unique_teams_before}, after: {unique_teams_after}")
-    if len(unmapped_teams) > 0:
-        print(f"     Warning: {len(unmapped_teams)} unmapped teams: {unmapped_teams}")
-    
-    return df_clean
-
-def clean_box_scores():
-    """Clean box scores file"""
-    print("\n1. Cleaning Box Scores...")
-    file_path = 'data/all_box_scores.csv'
-    
-    if not os.path.exists(file_path):
-        print(f"   File not found: {file_path}")
-        return
-    
-    # Create backup
-    backup_path = create_backup(file_path)
-    
-    # Load and clean data
-    df = pd.read_csv(file_path)
-    df_clean = standardize_team_names(df, 'Team', 'Box Scores')
-    
-    # Save cleaned data
-    df_clean.to_csv(file_path, index=False)
-    print(f"   Cleaned data saved to: {file_path}")
-
-def clean_scoring_tables():
-    """Clean scoring tables file"""
-    print("\n2. Cleaning Scoring Tables...")
-    file_path = 'data/all_scoring_tables.csv'
-    
-    if not os.path.exists(file_path):
-        print(f"   File not found: {file_path}")
-        return
-    
-    # Create backup
-    backup_path = create_backup(file_path)
-    
-    # Load and clean data
-    df = pd.read_csv(file_path)
-    df_clean = standardize_team_names(df, 'Team', 'Scoring Tables')
-    
-    # Save cleaned data
-    df_clean.to_csv(file_path, index=False)
-    print(f"   Cleaned data saved to: {file_path}")
-
-def clean_team_game_logs():
-    """Clean team game logs file"""
-    print("\n3. Cleaning Team Game Logs...")
-    file_path = 'data/all_team_game_logs.csv'
-    
-    if not os.path.exists(file_path):
-        print(f"   File not found: {file_path}")
-        return
-    
-    # Create backup
-    backup_path = create_backup(file_path)
-    
-    # Load and clean data
-    df = pd.read_csv(file_path)
-    
-    # This file should already have standardized team IDs, but let's verify
-    if 'home_team_id' in df.columns and 'away_team_id' in df.columns:
-        print("   File already has standardized team IDs (home_team_id, away_team_id)")
-        return
-    
-    print(f"   File structure: {list(df.columns)}")
-    print("   No team name standardization needed for this file")
-
-def clean_team_stats():
-    """Clean team stats file"""
-    print("\n4. Cleaning Team Stats...")
-    file_path = 'data/all_team_stats.csv'
-    
-    if not os.path.exists(file_path):
-        print(f"   File not found: {file_path}")
-        return
-    
-    # Create backup
-    backup_path = create_backup(file_path)
-    
-    # Load and clean data
-    df = pd.read_csv(file_path)
-    df_clean = standardize_team_names(df, 'Team', 'Team Stats')
-    
-    # Save cleaned data
-    df_clean.to_csv(file_path, index=False)
-    print(f"   Cleaned data saved to: {file_path}")
+    """Map a team column through TEAM_MAPPING once per distinct value; return (changed, teams after)"""
+    teams = df[team_column].astype('category')
+    mapped = teams.map(lambda team: TEAM_MAPPING.get(team, team))
+    before, after = set(teams.cat.categories), set(mapped.dropna().unique())
+    changed = before != after or (teams != mapped).any()
+    df[team_column] = mapped
+    print(f"   {file_name} ({team_column}): teams before: {len(before)}, after: {len(after)}")
+    unmapped = sorted(after - STANDARD_TEAMS - {''})
+    if unmapped:
+        print(f"     Warning: {len(unmapped)} unmapped teams: {unmapped}")
+    return changed, after
 
-def clean_team_conversions():
-    """Clean team conversions file"""
-    print("\n5. Cleaning Team Conversions...")
-    file_path = 'data/all_team_conversions.csv'
-    
-    if not os.path.exists(file_path):
-        print(f"   File not found: {file_path}")
-        return
-    
-    # Create backup
-    backup_path = create_backup(file_path)
-    
-    # Load and clean data
-    df = pd.read_csv(file_path)
-    df_clean = standardize_team_names(df, 'Team', 'Team Conversions')
-    
-    # Save cleaned data
-    df_clean.to_csv(file_path, index=False)
-    print(f"   Cleaned data saved to: {file_path}")
+def write_atomically(df, file_path):
+    tmp_path = f"{file_path}.tmp"
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, file_path)
 
-def clean_passing_rushing_receiving():
-    """Clean passing/rushing/receiving file"""
-    print("\n6. Cleaning Passing/Rushing/Receiving...")
-    file_path = 'data/all_passing_rushing_receiving.csv'
-    
+def clean_file(file_path, label, team_columns, backup=False):
+    """Standardize one file in a single read/write; return the team codes found (None if not cleaned)"""
     if not os.path.exists(file_path):
         print(f"   File not found: {file_path}")
-        return
-    
-    # Create backup
-    backup_path = create_backup(file_path)
-    
-    # Load and clean data
-    df = pd.read_csv(file_path)
-    
-    # Check for team columns
-    team_columns = [col for col in df.columns if 'team' in col.lower()]
-    if team_columns:
-        print(f"   Found team columns: {team_columns}")
-        for col in team_columns:
-            df = standardize_team_names(df, col, f'Passing/Rushing/Receiving ({col})')
-    else:
-        print("   No team columns found")
-    
-    # Save cleaned data
-    df.to_csv(file_path, index=False)
-    print(f"   Cleaned data saved to: {file_path}")
+        return None
+    if team_columns == ():
+        columns = list(pd.read_csv(file_path, nrows=0).columns)
+        if 'home_team_id' in columns and 'away_team_id' in columns:
+            print("   File already has standardized team IDs (home_team_id, away_team_id)")
+        else:
+            print("   No team name standardization needed for this file")
+        return None
 
-def clean_defense_game_logs():
-    """Clean defense game logs file"""
-    print("\n7. Cleaning Defense Game Logs...")
-    file_path = 'data/all_defense-game-logs.csv'
-    
-    if not os.path.exists(file_path):
-        print(f"   File not found: {file_path}")
-        return
-    
-    # Create backup
-    backup_path = create_backup(file_path)
-    
-    # Load and clean data
-    df = pd.read_csv(file_path)
-    
-    # Check for team columns
-    team_columns = [col for col in df.columns if 'team' in col.lower()]
-    if team_columns:
-        print(f"   Found team columns: {team_columns}")
-        for col in team_columns:
-            df = standardize_team_names(df, col, f'Defense Game Logs ({col})')
-    else:
-        print("   No team columns found")
-    
-    # Save cleaned data
-    df.to_csv(file_path, index=False)
+    # Text in, text out: values other than team names are written back exactly as read
+    df = pd.read_csv(file_path, dtype=str, keep_default_na=False)
+    if team_columns is None:
+        team_columns = [col for col in df.columns if 'team' in col.lower()]
+        print(f"   Found team columns: {team_columns}" if team_columns else "   No team columns found")
+    teams = set()
+    changed = False
+    for col in team_columns:
+        if col not in df.columns:
+            print(f"     Warning: Column '{col}' not found in {label}")
+            continue
+        col_changed, col_teams = standardize_team_names(df, col, label)
+        changed |= col_changed
+        teams |= col_teams
+    if not changed:
+        print(f"   Already standardized, left as is: {file_path}")
+        return teams
+    if backup:
+        create_backup(file_path)
+    write_atomically(df, file_path)
     print(f"   Cleaned data saved to: {file_path}")
-
-def validate_standardization():
-    """Validate that all files now have consistent team abbreviations"""
-    print("\n=== VALIDATION ===\n")
-    
-    files_to_check = [
-        ('data/all_box_scores.csv', 'Team'),
-        ('data/all_scoring_tables.csv', 'Team'),
-        ('data/all_team_stats.csv', 'Team'),
-        ('data/all_team_conversions.csv', 'Team')
-    ]
-    
-    all_teams = set()
-    
-    for file_path, team_column in files_to_check:
-        if os.path.exists(file_path):
-            try:
-                df = pd.read_csv(file_path)
-                if team_column in df.columns:
-                    teams = set(df[team_column].unique())
-                    all_teams.update(teams)
-                    print(f"{file_path}: {len(teams)} unique teams")
-                    print(f"  Sample teams: {sorted(list(teams))[:5]}")
-                else:
-                    print(f"{file_path}: Column '{team_column}' not found")
-            except Exception as e:
-                print(f"{file_path}: Error reading file - {e}")
-        else:
-            print(f"{file_path}: File not found")
-    
-    print(f"\nTotal unique team abbreviations across all files: {len(all_teams)}")
-    print(f"All team abbreviations: {sorted(list(all_teams))}")
-    
-    # Check if all are in our standard set
-    standard_teams = set(TEAM_MAPPING.values())
-    non_standard = all_teams - standard_teams
-    if non_standard:
-        print(f"Warning: Non-standard team abbreviations found: {non_standard}")
-    else:
-        print("✅ All team abbreviations are now standardized!")
+    return teams
 
 def main():
     """Main function to run the data cleaning process"""
+    parser = argparse.ArgumentParser(description="Standardize team abbreviations in the scraped CSVs")
+    parser.add_argument('--data-dir', default='data')
+    parser.add_argument('--backup', action='store_true', help="keep a hard-link snapshot of each file in backups/ before rewriting it")
+    args = parser.parse_args()
+
     print("NFL Data Cleaner - Team Abbreviation Standardization")
     print("=" * 60)
     print(f"Started at: {datetime.now()}")
-    
-    # Create backups directory if it doesn't exist
-    if not os.path.exists('backups'):
-        os.makedirs('backups')
-    
+
     try:
-        # Clean all files
-        clean_box_scores()
-        clean_scoring_tables()
-        clean_team_game_logs()
-        clean_team_stats()
-        clean_team_conversions()
-        clean_passing_rushing_receiving()
-        clean_defense_game_logs()
-        
-        # Validate the standardization
-        validate_standardization()
-        
+        # Clean and validate every file in one pass over it
+        all_teams = set()
+        for i, (file_name, label, team_columns) in enumerate(FILES, 1):
+            print(f"\n{i}. Cleaning {label}...")
+            teams = clean_file(os.path.join(args.data_dir, file_name), label, team_columns, args.backup)
+            if teams is not None:
+                all_teams |= teams - {''}
+
+        print("\n=== VALIDATION ===\n")
+        print(f"Total unique team abbreviations across all files: {len(all_teams)}")
+        print(f"All team abbreviations: {sorted(all_teams)}")
+        non_standard = all_teams - STANDARD_TEAMS
+        if non_standard:
+            print(f"Warning: Non-standard team abbreviations found: {non_standard}")
+        else:
+            print("✅ All team abbreviations are now standardized!")
+
         print(f"\n✅ Data cleaning completed successfully at: {datetime.now()}")
-        print("All files have been backed up and standardized team abbreviations.")
-        
+
     except Exception as e:
         print(f"\n❌ Error during data cleaning: {e}")
         import traceback
@@ -0,0 +1,43 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from scraper_core.delta import Watermarks, team_season_games  # noqa: E402
+
+
+def game(game_id, home_score="", away_score="", home_team="KC", away_team="BUF"):
+    return {"game_id": game_id, "season": "2025", "home_team": home_team, "away_team": away_team,
+            "home_score": home_score, "away_score": away_score, "overtime": "0"}
+
+
+def test_missed_game_is_retried_next_delta(tmp_path):
+    path = str(tmp_path / "watermarks.json")
+    week1 = [game("2025_01_BUF_KC", "27", "20"), game("2025_01_DAL_PHI", "24", "20", "PHI", "DAL")]
+    marks = Watermarks(path, enabled=True)
+    assert marks.delta("defense", week1) is None
+    marks.commit("defense")
+
+    # Week 2 becomes final; one of its pages fails, and a week 1 stat correction fails too
+    week2 = [game("2025_01_BUF_KC", "27", "23"), game("2025_01_DAL_PHI", "24", "20", "PHI", "DAL"),
+             game("2025_02_KC_LAC", "17", "21", "LAC", "KC"), game("2025_02_NYG_WAS", "10", "13", "WAS", "NYG")]
+    marks = Watermarks(path, enabled=True)
+    delta = marks.delta("defense", week2)
+    assert set(delta.new) == {"2025_02_KC_LAC", "2025_02_NYG_WAS"}
+    assert set(delta.corrected) == {"2025_01_BUF_KC"}
+    marks.commit("defense", missed={"2025_02_NYG_WAS", "2025_01_BUF_KC"})
+
+    marks = Watermarks(path, enabled=True)
+    delta = marks.delta("defense", week2)
+    assert set(delta.new) == {"2025_02_NYG_WAS"}
+    assert set(delta.corrected) == {"2025_01_BUF_KC"}
+    marks.commit("defense")
+
+    marks = Watermarks(path, enabled=True)
+    assert len(marks.delta("defense", week2)) == 0
+
+
+def test_team_season_games():
+    games = [game("2025_01_BUF_KC"), game("2025_01_DAL_PHI", home_team="PHI", away_team="DAL")]
+    assert team_season_games(games, 2025, "kan") == {"2025_01_BUF_KC"}
+    assert team_season_games(games, 2024, "kan") == set()
@@ -1,6 +1,9 @@
 import shutil
-from PIL import Image
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from asset_pipeline import build_assets
 
 # Copy nfl.db from ../Scrapers to data/
 shutil.copy("../Scrapers/nfl.db", "data/")
@@ -12,19 +15,12 @@ image_folder = "assets/"
 # Desired size (width, height)
 target_size = (150, 100)
 
-# Function to resize an image while maintaining its aspect ratio
-def resize_image(input_path, target_size):
-    with Image.open(input_path) as img:
-        img.thumbnail(target_size, Image.Resampling.LANCZOS)  # Resize with aspect ratio
-        img.save(input_path)  # Overwrite the original image
-
-# Loop through all the files in the assets folder
-for filename in os.listdir(image_folder):
-    if filename.lower().endswith(('.png', '.jpg', '.jpeg')):
-        input_path = os.path.join(image_folder, filename)
-
-        resize_image(input_path, target_size)
-        print(f"Resized {filename} and saved to {input_path}")
+# Player images are resized once into assets/variants/ (WebP/PNG + manifest.json, served
+# by Dash at /assets/variants/); the originals in assets/ are left untouched
+players = {os.path.splitext(filename)[0]: os.path.join(image_folder, filename)
+           for filename in sorted(os.listdir(image_folder))
+           if filename.lower().endswith(('.png', '.jpg', '.jpeg'))}
+build_assets(os.path.join(image_folder, 'variants'), players, variants={'player': target_size})
 
 print("Resizing completed!")
 
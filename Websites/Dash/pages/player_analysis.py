@@ -20,13 +20,24 @@ import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
 import pandas as pd
 import sqlite3
+import json
+import os
+import sys
 from dash import dash_table
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+import nfl_data  # noqa: E402
+
 # Register the Team Analysis page
 dash.register_page(__name__, path="/player-analysis")
 
-# Set the hardcoded path for images
-image_folder = '/assets/'
+# Player images resized by data.py (assets/variants/manifest.json, served under /assets/variants/)
+image_folder = '/assets/variants/'
+try:
+    with open(os.path.join('assets', 'variants', 'manifest.json')) as f:
+        player_images = json.load(f)['images']
+except (OSError, ValueError, KeyError):
+    player_images = {}
 
 # Fetch player names
 def fetch_player_names():
@@ -43,10 +54,10 @@ def fetch_player_names():
 
 # Check if a player's image exists
 def get_player_image(player_name):
-    first_name, last_name = player_name.lower().split(' ')
-    for ext in ['png', 'jpg', 'jpeg']:
-        image_path = f"{image_folder}{first_name}_{last_name}.{ext}"
-        return image_path
+    entry = player_images.get(player_name.lower().replace(' ', '_')) if player_name else None
+    if entry is None:
+        return None
+    return f"{image_folder}{entry['variants']['player']['webp']}"
 
 # Fetch last 6 games for the selected player
 def fetch_last_6_games(player_name):
@@ -135,7 +146,8 @@ def fetch_next_opponent(player_name):
 
 # Get player's longest reception stats
 def get_player_longest_reception_stats(player_name, opponent_team=None):
-    all_stats_df = pd.read_csv('data/all_passing_rushing_receiving.csv')
+    # Parsed once per process, not on every callback
+    all_stats_df = nfl_data.load('passing_rushing_receiving')
 
     player_data = all_stats_df[all_stats_df['player'] == player_name]
 
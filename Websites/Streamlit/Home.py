@@ -7,6 +7,7 @@ from streamlit_lottie import st_lottie
 from PIL import Image
 import os
 from utils.footer import render_footer
+from utils.tables import load_table
 
 # Configure page
 st.set_page_config(page_title="NFL AI", page_icon="🏈", layout="wide")
@@ -34,7 +35,7 @@ csv_file_path_schedule_and_game_results = os.path.join(BASE_DIR, 'data/all_teams
 csv_file_path_all_passing_rushing_receiving = os.path.join(BASE_DIR, 'data/all_passing_rushing_receiving.csv')
 
 try:
-    df_all_team_game_logs = pd.read_csv(csv_file_path_all_team_game_logs)
+    df_all_team_game_logs = load_table('team_game_logs')
 except FileNotFoundError:
     st.error(f"File not found: {csv_file_path_all_team_game_logs}. Please ensure the file exists.")
     df_all_team_game_logs = pd.DataFrame()
@@ -64,13 +65,13 @@ except FileNotFoundError:
     df_nfl_odds_movements_circa = pd.DataFrame()
 
 try:
-    df_teams = pd.read_csv(csv_file_path_teams)
+    df_teams = load_table('teams')
 except FileNotFoundError:
     st.error(f"File not found: {csv_file_path_teams}. Please ensure the file exists.")
     df_teams = pd.DataFrame()
 
 try:
-    df_games = pd.read_csv(csv_file_path_games)
+    df_games = load_table('games')
 except FileNotFoundError:
     st.error(f"File not found: {csv_file_path_games}. Please ensure the file exists.")
     df_games = pd.DataFrame()
@@ -84,13 +85,13 @@ except FileNotFoundError:
 df_playerstats = pd.DataFrame()  # Empty DataFrame for compatibility
 
 try:
-    df_schedule_and_game_results = pd.read_csv(csv_file_path_schedule_and_game_results)
+    df_schedule_and_game_results = load_table('schedule')
 except FileNotFoundError:
     st.error(f"File not found: {csv_file_path_schedule_and_game_results}. Please ensure the file exists.")
     df_schedule_and_game_results = pd.DataFrame()
 
 try:
-    df_all_passing_rushing_receiving = pd.read_csv(csv_file_path_all_passing_rushing_receiving)
+    df_all_passing_rushing_receiving = load_table('passing_rushing_receiving')
 except FileNotFoundError:
     st.error(f"File not found: {csv_file_path_all_passing_rushing_receiving}. Please ensure the file exists.")
     df_all_passing_rushing_receiving = pd.DataFrame()
@@ -383,7 +384,7 @@ if os.path.exists(roster_dir):
     for roster_file in os.listdir(roster_dir):
         if roster_file.endswith('.csv'):
             try:
-                roster_df = pd.read_csv(os.path.join(roster_dir, roster_file))
+                roster_df = load_table('rosters', path=os.path.join(roster_dir, roster_file))
                 player_sources.append(roster_df)
             except:
                 pass
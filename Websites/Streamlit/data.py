@@ -4,6 +4,7 @@ import os
 import shutil
 import requests
 import re
+import sys
 # os.remove('nfl.db')
 shutil.rmtree('data', ignore_errors=True)
 shutil.copytree('/Users/td/Code/nfl-ai/Scrapers/data', 'data')
@@ -48,8 +49,9 @@ for root, dirs, files in os.walk(data_directory):
 ### Retrieve Next Week's Games ###
 db_path = 'data/nfl.db'
 conn = sqlite3.connect(db_path)
+# week is an INTEGER column in nfl.db, so both lookups search the (season, week) index
 current_week_query = """
-    SELECT MAX(CAST(week AS INTEGER)) as current_week
+    SELECT MAX(week) as current_week
     FROM Games
     WHERE season = 2024 AND home_score IS NOT NULL AND away_score IS NOT NULL
 """
@@ -57,12 +59,12 @@ current_week_df = pd.read_sql(current_week_query, conn)
 current_week = current_week_df.iloc[0]['current_week']
 if pd.isnull(current_week):
     current_week = 0
-next_week_query = f"""
+next_week_query = """
     SELECT *
     FROM Games
-    WHERE season = 2024 AND CAST(week AS INTEGER) = {current_week + 1} AND home_score IS NULL AND away_score IS NULL
+    WHERE season = 2024 AND week = ? AND home_score IS NULL AND away_score IS NULL
 """
-next_week_games_df = pd.read_sql(next_week_query, conn)
+next_week_games_df = pd.read_sql(next_week_query, conn, params=(int(current_week) + 1,))
 output_dir = 'data/'
 os.makedirs(output_dir, exist_ok=True)
 if next_week_games_df.empty:
@@ -101,43 +103,6 @@ conn.close()
 #     download_image(team_code, team_name)
 # print("All team logos downloaded successfully.")
 
-### Player Headshots Download ###
-# COMMENTED OUT TO PRESERVE EXISTING PLAYER HEADSHOT IMAGES
-# df_player_stats = pd.read_csv('data/player_stats.csv')
-# unique_qbs_with_urls = df_player_stats[df_player_stats['headshot_url'].notna()] \
-#                         .drop_duplicates(subset=['player_display_name'])
-# image_folder = 'images/player-headshots'
-# os.makedirs(image_folder, exist_ok=True)
-
-# downloaded_count = 0
-# skipped_count = 0
-# total_qbs = len(unique_qbs_with_urls)
-
-# for index, row in unique_qbs_with_urls.iterrows():
-#     player_name = row['player_display_name'].lower().replace(' ', '_')
-#     headshot_url = row['headshot_url']
-#     image_path = os.path.join(image_folder, f"{player_name}.png")
-    
-#     # Skip if image already exists
-#     if os.path.exists(image_path):
-#         skipped_count += 1
-#         continue
-        
-#     try:
-#         response = requests.get(headshot_url)
-#         if response.status_code == 200:
-#             with open(image_path, 'wb') as file:
-#                 file.write(response.content)
-#             downloaded_count += 1
-#             print(f"Downloaded {player_name}'s headshot ({downloaded_count} new, {skipped_count} existing).")
-#         else:
-#             print(f"Failed to download {player_name}'s headshot (Status code: {response.status_code}).")
-#     except Exception as e:
-#         print(f"Error downloading {player_name}'s headshot: {e}")
-
-# print(f"Download complete: {downloaded_count} new images downloaded, {skipped_count} already existed.")
-
-
 ### Connect to the copied SQLite database and export tables to CSV ###
 if os.path.exists('data/games.csv'): os.remove('data/games.csv')
 if os.path.exists('data/player_stats.csv'): os.remove('data/player_stats.csv')
@@ -156,6 +121,23 @@ for table_name_tuple in tables:
 conn.close()
 print("All tables have been saved to CSV files.")
 
+### Team Logos & Player Headshots ###
+# Resized once here into WebP/PNG variants plus a manifest.json the pages read
+# (images/team-logos/variants/ is committed; images/player-headshots/ is local only,
+# the Player Dashboard falls back to the headshot URL without it)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from asset_pipeline import build_assets
+
+logo_dir = 'images/team-logos'
+build_assets(f'{logo_dir}/variants',
+             {name[:-4]: os.path.join(logo_dir, name) for name in sorted(os.listdir(logo_dir)) if name.endswith('.png')},
+             variants={'logo': (100, 100)}, inline=('png',))
+
+df_rosters = pd.read_csv('data/Rosters.csv', usecols=['full_name', 'status', 'headshot_url'])
+df_rosters = df_rosters[~df_rosters['status'].isin(['CUT', 'RET']) & df_rosters['headshot_url'].notna() & df_rosters['full_name'].notna()]
+headshots = dict(zip(df_rosters['full_name'].str.strip(), df_rosters['headshot_url'].str.strip()))
+build_assets('images/player-headshots', headshots, variants={'card': (350, 350)})
+
 # os.rename('data/games.csv', 'data/Games.csv'); print("Renamed 'data/games.csv' to 'data/Games.csv'.")
 # os.rename('data/teams.csv', 'data/Teams.csv'); print("Renamed 'data/teams.csv' to 'data/Teams.csv'.")
 # os.rename('data/rosters.csv', 'data/Rosters.csv'); print("Renamed 'data/rosters.csv' to 'data/Rosters.csv'.")
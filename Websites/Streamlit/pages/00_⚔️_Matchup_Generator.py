@@ -3,8 +3,9 @@ import pandas as pd
 import os
 import plotly.express as px
 import numpy as np
-import base64
+from utils.assets import asset_data_uri, asset_path
 from utils.footer import render_footer
+from utils.tables import load_table, run_query
 
 # NFL team color mapping (primary colors)
 TEAM_COLORS = {
@@ -95,10 +96,10 @@ st.markdown(
 # Load data files directly if not in session state
 if 'df_games' not in st.session_state:
     current_dir = os.path.dirname(os.path.abspath(__file__))
-    df_games = pd.read_csv(os.path.join(current_dir, '../data', 'Games.csv'))
+    df_games = load_table('games')
     # df_playerstats = pd.read_csv(os.path.join(current_dir, '../data', 'PlayerStats.csv'))  # COMMENTED OUT - Missing 2025 data
     # Load all_passing_rushing_receiving.csv (has 2010-2025 data)
-    df_playerstats = pd.read_csv(os.path.join(current_dir, '../data', 'all_passing_rushing_receiving.csv'))
+    df_playerstats = load_table('passing_rushing_receiving')
     # Map columns to match expected format
     df_playerstats['player_display_name'] = df_playerstats['player']
     df_playerstats['player_current_team'] = df_playerstats['team']
@@ -121,18 +122,18 @@ if 'df_games' not in st.session_state:
     df_playerstats['away_team'] = game_id_parts[2]
     df_playerstats['home_team'] = game_id_parts[3]
     # Load 2025 roster as source of truth for current players
-    df_roster2025 = pd.read_csv(os.path.join(current_dir, '../data/rosters', 'roster_2025.csv'))
+    df_roster2025 = load_table('rosters', path=os.path.join(current_dir, '../data/rosters', 'roster_2025.csv'))
     # Normalize team abbreviations: roster uses 'LV' and 'LA', but we need 'LVR' and 'LAR' to match Games.csv
     if 'team' in df_roster2025.columns:
         roster_to_games_team_map = {'LV': 'LVR', 'LA': 'LAR'}
         df_roster2025['team'] = df_roster2025['team'].map(lambda x: roster_to_games_team_map.get(x, x))
     # Additional logs for defensive metrics
     try:
-        df_team_game_logs = pd.read_csv(os.path.join(current_dir, '../data', 'all_team_game_logs.csv'))
+        df_team_game_logs = load_table('team_game_logs')
     except Exception:
         df_team_game_logs = pd.DataFrame()
     try:
-        df_defense_logs = pd.read_csv(os.path.join(current_dir, '../data', 'all_defense-game-logs.csv'))
+        df_defense_logs = load_table('defense')
         # Normalize team abbreviations: defense logs use old abbreviations that need to match Games.csv format
         if 'team' in df_defense_logs.columns:
             defense_to_games_team_map = {
@@ -148,7 +149,7 @@ if 'df_games' not in st.session_state:
     except Exception:
         df_defense_logs = pd.DataFrame()
     try:
-        df_redzone = pd.read_csv(os.path.join(current_dir, '../data', 'all_redzone.csv'))
+        df_redzone = load_table('redzone')
     except Exception:
         df_redzone = pd.DataFrame()
     
@@ -165,7 +166,7 @@ else:
     # If df_playerstats doesn't have mapped columns, reload and map from all_passing_rushing_receiving.csv
     if df_playerstats is None or 'player_display_name' not in df_playerstats.columns:
         current_dir = os.path.dirname(os.path.abspath(__file__))
-        df_playerstats = pd.read_csv(os.path.join(current_dir, '../data', 'all_passing_rushing_receiving.csv'))
+        df_playerstats = load_table('passing_rushing_receiving')
         # Map columns to match expected format
         df_playerstats['player_display_name'] = df_playerstats['player']
         df_playerstats['player_current_team'] = df_playerstats['team']
@@ -194,7 +195,7 @@ else:
     df_redzone = st.session_state.get('df_redzone')
     if df_roster2025 is None:
         current_dir = os.path.dirname(os.path.abspath(__file__))
-        df_roster2025 = pd.read_csv(os.path.join(current_dir, '../data/rosters', 'roster_2025.csv'))
+        df_roster2025 = load_table('rosters', path=os.path.join(current_dir, '../data/rosters', 'roster_2025.csv'))
     # Always normalize team abbreviations: roster uses 'LV' and 'LA', but we need 'LVR' and 'LAR' to match Games.csv
     if df_roster2025 is not None and 'team' in df_roster2025.columns:
         roster_to_games_team_map = {'LV': 'LVR', 'LA': 'LAR'}
@@ -204,14 +205,14 @@ else:
     if df_team_game_logs is None:
         current_dir = os.path.dirname(os.path.abspath(__file__))
         try:
-            df_team_game_logs = pd.read_csv(os.path.join(current_dir, '../data', 'all_team_game_logs.csv'))
+            df_team_game_logs = load_table('team_game_logs')
         except Exception:
             df_team_game_logs = pd.DataFrame()
         st.session_state['df_team_game_logs'] = df_team_game_logs
     if df_defense_logs is None:
         current_dir = os.path.dirname(os.path.abspath(__file__))
         try:
-            df_defense_logs = pd.read_csv(os.path.join(current_dir, '../data', 'all_defense-game-logs.csv'))
+            df_defense_logs = load_table('defense')
             # Normalize team abbreviations: defense logs use old abbreviations that need to match Games.csv format
             if 'team' in df_defense_logs.columns:
                 defense_to_games_team_map = {
@@ -230,25 +231,14 @@ else:
     if df_redzone is None:
         current_dir = os.path.dirname(os.path.abspath(__file__))
         try:
-            df_redzone = pd.read_csv(os.path.join(current_dir, '../data', 'all_redzone.csv'))
+            df_redzone = load_table('redzone')
         except Exception:
             df_redzone = pd.DataFrame()
         st.session_state['df_redzone'] = df_redzone
 
 # Helper functions (module scope) so they can be used anywhere on the page
 def display_team_logo(team_abbrev, size=100):
-    fname = f"{team_abbrev}.png"
-    # Path relative to this file (pages/ -> ../images/team-logos/TEAM.png)
-    script_relative_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'images', 'team-logos', fname))
-    # Repo-root relative path (works when CWD is project root)
-    repo_relative_path = os.path.join('images', 'team-logos', fname)
-
-    logo_path = None
-    if os.path.exists(script_relative_path):
-        logo_path = script_relative_path
-    elif os.path.exists(repo_relative_path):
-        logo_path = repo_relative_path
-
+    logo_path = asset_path("team-logos", team_abbrev, "logo")
     if logo_path:
         st.image(logo_path, width=size)
     else:
@@ -1189,35 +1179,15 @@ def generate_html_report(team1, team2, report_data):
     return html_content
 
 def _get_team_logo_html(team_abbrev):
-    """Return an <img> tag with a base64-embedded team logo so the HTML is self-contained.
+    """Return an <img> tag with the team logo embedded as a data URI so the HTML is self-contained.
 
-    Falls back to a styled abbreviation box when the logo file isn't available.
+    The data URI is prepared by data.py (utils/assets.py); falls back to a styled
+    abbreviation box when the logo isn't available.
     """
-    fname = f"{team_abbrev}.png"
-    # Resolve potential locations
-    script_relative_path = os.path.abspath(
-        os.path.join(os.path.dirname(__file__), '..', 'images', 'team-logos', fname)
-    )
-    repo_relative_path = os.path.join('images', 'team-logos', fname)
-
-    logo_path = None
-    if os.path.exists(script_relative_path):
-        logo_path = script_relative_path
-    elif os.path.exists(repo_relative_path):
-        # When running in repo root the relative path may work; but for download we embed anyway
-        logo_path = repo_relative_path
-
-    if logo_path and os.path.exists(logo_path):
-        try:
-            with open(logo_path, 'rb') as f:
-                encoded = base64.b64encode(f.read()).decode('ascii')
-            data_uri = f"data:image/png;base64,{encoded}"
-            return f'<div class="team-logo"><img src="{data_uri}" alt="{team_abbrev}" /></div>'
-        except Exception:
-            # If anything goes wrong, use fallback
-            return f'<div class="team-logo-fallback">{team_abbrev}</div>'
-    else:
-        return f'<div class="team-logo-fallback">{team_abbrev}</div>'
+    data_uri = asset_data_uri("team-logos", team_abbrev, "logo")
+    if data_uri:
+        return f'<div class="team-logo"><img src="{data_uri}" alt="{team_abbrev}" /></div>'
+    return f'<div class="team-logo-fallback">{team_abbrev}</div>'
 
 def _generate_player_html(historical_df, team_name, opponent_name):
     """Generate HTML for player section with expanded details."""
@@ -1442,39 +1412,24 @@ def _parse_games_datetime(df: pd.DataFrame) -> pd.DataFrame:
         df.loc[:, 'date'] = pd.to_datetime(df['date'], format='%Y-%m-%d %H:%M:%S', errors='coerce')
     return df
 
-def _get_team_points(row: pd.Series, team_abbrev: str) -> tuple[float, float, float]:
-    if row['home_team'] == team_abbrev:
-        home_score = row.get('home_score', np.nan)
-        away_score = row.get('away_score', np.nan)
-        home_spread = row.get('home_spread', np.nan)
-    else:
-        away_score = row.get('away_score', np.nan)
-        home_score = row.get('home_score', np.nan)
-        home_spread = row.get('away_spread', np.nan)
-    
-    # Convert to numeric, handling non-numeric values
-    try:
-        team_score = float(home_score) if pd.notna(home_score) else np.nan
-    except (ValueError, TypeError):
-        team_score = np.nan
-    
-    try:
-        opp_score = float(away_score) if pd.notna(away_score) else np.nan
-    except (ValueError, TypeError):
-        opp_score = np.nan
-    
-    try:
-        spread = float(home_spread) if pd.notna(home_spread) else np.nan
-    except (ValueError, TypeError):
-        spread = np.nan
-    
-    return team_score, opp_score, spread
-
-def compute_head_to_head_bets(df_games: pd.DataFrame, team1: str, team2: str, limit: int = 10) -> dict:
-    df_games = _parse_games_datetime(df_games)
-    mask_matchup = ((df_games['home_team'] == team1) & (df_games['away_team'] == team2)) | \
-                   ((df_games['home_team'] == team2) & (df_games['away_team'] == team1))
-    games = df_games.loc[mask_matchup].dropna(subset=['home_score','away_score']).sort_values('date', ascending=False).head(limit)
+def _team_outcomes(games: pd.DataFrame, team_abbrev: str) -> pd.DataFrame:
+    """Per-game results from one team's side, read from the outcome columns precomputed in Games."""
+    is_home = games['home_team'] == team_abbrev
+    ats_margin = pd.to_numeric(games['ats_margin'], errors='coerce')
+    return pd.DataFrame({
+        'pts': pd.to_numeric(games['home_score'].where(is_home, games['away_score']), errors='coerce'),
+        'opp_pts': pd.to_numeric(games['away_score'].where(is_home, games['home_score']), errors='coerce'),
+        'spread': pd.to_numeric(games['home_spread'].where(is_home, games['away_spread']), errors='coerce'),
+        'ats': games['home_ats'].where(is_home, games['away_ats']),
+        'ats_margin': ats_margin.where(is_home, -ats_margin),
+    }, index=games.index)
+
+def _result_counts(results: pd.Series, labels: tuple) -> tuple:
+    counts = results.value_counts()
+    return tuple(int(counts.get(label, 0)) for label in labels)
+
+def compute_head_to_head_bets(games: pd.DataFrame, team1: str, team2: str) -> dict:
+    """ATS, totals and favorite counts over the rows of the head_to_head query for team1 vs team2."""
     if games.empty:
         return {
             'games': games,
@@ -1483,62 +1438,20 @@ def compute_head_to_head_bets(df_games: pd.DataFrame, team1: str, team2: str, li
             'fav_dog': {'team1_fav': 0, 'team1_dog': 0, 'team2_fav': 0, 'team2_dog': 0}
         }
 
-    # ATS tallies using team_covered where available, else compute via margin
-    team1_covers = int((games.get('team_covered') == team1).sum()) if 'team_covered' in games.columns else 0
-    team2_covers = int((games.get('team_covered') == team2).sum()) if 'team_covered' in games.columns else 0
-    pushes = int((games.get('team_covered') == 'Push').sum()) if 'team_covered' in games.columns else 0
-
-    # Compute cover margins and O/U
-    t1_margins, t2_margins = [], []
-    overs = unders = ou_pushes = 0
-    t1_fav = t1_dog = t2_fav = t2_dog = 0
-    for _, row in games.iterrows():
-        # Over/Under
-        line_total = row['total_line'] if 'total_line' in row.index else np.nan
-        if pd.notna(line_total):
-            game_total = float(row['home_score']) + float(row['away_score'])
-            if game_total > line_total: overs += 1
-            elif game_total < line_total: unders += 1
-            else: ou_pushes += 1
-
-        # Favorite/dog counts
-        fav = row['team_favorite'] if 'team_favorite' in row.index else None
-        if isinstance(fav, str):
-            if fav == team1: t1_fav += 1
-            elif fav == team2: t2_fav += 1
-            elif fav.lower() in ('pick','pk','pickem','pck'): pass
-        if isinstance(fav, str):
-            if fav == team1: t2_dog += 1
-            elif fav == team2: t1_dog += 1
-
-        # Cover margins
-        t1_pts, t2_pts, t1_spread = _get_team_points(row, team1)
-        _, _, t2_spread = _get_team_points(row, team2)
-        if pd.notna(t1_pts) and pd.notna(t1_spread):
-            try:
-                t1_margins.append(float(t1_pts) - float(t2_pts) + float(t1_spread))
-            except (ValueError, TypeError):
-                pass  # Skip this game if spread can't be converted to float
-        if pd.notna(t2_pts) and pd.notna(t2_spread):
-            try:
-                t2_margins.append(float(t2_pts) - float(t1_pts) + float(t2_spread))
-            except (ValueError, TypeError):
-                pass  # Skip this game if spread can't be converted to float
-
-    # If team_covered not present, infer ATS from margins
-    if 'team_covered' not in games.columns:
-        team1_covers = sum(1 for m in t1_margins if m > 0)
-        team2_covers = sum(1 for m in t2_margins if m > 0)
-        pushes = sum(1 for m in t1_margins if m == 0)
+    # ATS, O/U and favorite come straight from the Games outcome columns
+    team1_covers, team2_covers, pushes = _result_counts(games['team_covered'], (team1, team2, 'Push'))
+    t1_fav, t2_fav = _result_counts(games['team_favorite'], (team1, team2))
+    t1_margins = games['team1_ats_margin'].dropna()
+    t1_avg_margin = float(t1_margins.mean()) if len(t1_margins) else 0.0
 
     return {
         'games': games,
         'team1_ats': (team1_covers, team2_covers, pushes),
         'team2_ats': (team2_covers, team1_covers, pushes),
-        'ou': (overs, unders, ou_pushes),
-        'team1_avg_cover_margin': float(np.nanmean(t1_margins)) if len(t1_margins) else 0.0,
-        'team2_avg_cover_margin': float(np.nanmean(t2_margins)) if len(t2_margins) else 0.0,
-        'fav_dog': {'team1_fav': t1_fav, 'team1_dog': t1_dog, 'team2_fav': t2_fav, 'team2_dog': t2_dog}
+        'ou': _result_counts(games['ou_result'], ('Over', 'Under', 'Push')),
+        'team1_avg_cover_margin': t1_avg_margin,
+        'team2_avg_cover_margin': -t1_avg_margin if len(t1_margins) else 0.0,
+        'fav_dog': {'team1_fav': t1_fav, 'team1_dog': t2_fav, 'team2_fav': t2_fav, 'team2_dog': t1_fav}
     }
 
 def compute_recent_form(df_games: pd.DataFrame, team: str, n: int = 8) -> dict:
@@ -1547,35 +1460,15 @@ def compute_recent_form(df_games: pd.DataFrame, team: str, n: int = 8) -> dict:
     games = df_games.loc[mask_team].dropna(subset=['home_score','away_score']).sort_values('date', ascending=False).head(n)
     if games.empty:
         return {'su': (0,0), 'ats': (0,0,0), 'ou': (0,0,0), 'avg_mov': 0.0, 'avg_ats_margin': 0.0}
-    su_wins = su_losses = ats_w = ats_l = ats_p = over = under = ou_p = 0
-    movs, ats_margins = [], []
-    for _, row in games.iterrows():
-        t_pts, o_pts, spr = _get_team_points(row, team)
-        if pd.isna(t_pts) or pd.isna(o_pts):
-            continue
-        # SU
-        if t_pts > o_pts: su_wins += 1
-        elif t_pts < o_pts: su_losses += 1
-        # ATS
-        if pd.notna(spr):
-            margin = (float(t_pts) - float(o_pts) + float(spr))
-            ats_margins.append(margin)
-            if margin > 0: ats_w += 1
-            elif margin < 0: ats_l += 1
-            else: ats_p += 1
-        # O/U
-        if 'total_line' in row.index and pd.notna(row['total_line']):
-            total_pts = float(row['home_score']) + float(row['away_score'])
-            if total_pts > row['total_line']: over += 1
-            elif total_pts < row['total_line']: under += 1
-            else: ou_p += 1
-        movs.append(float(t_pts) - float(o_pts))
+    view = _team_outcomes(games, team)
+    movs = view['pts'] - view['opp_pts']
+    ats_margins = view['ats_margin'].dropna()
     return {
-        'su': (su_wins, su_losses),
-        'ats': (ats_w, ats_l, ats_p),
-        'ou': (over, under, ou_p),
-        'avg_mov': float(np.nanmean(movs)) if len(movs) else 0.0,
-        'avg_ats_margin': float(np.nanmean(ats_margins)) if len(ats_margins) else 0.0
+        'su': (int((movs > 0).sum()), int((movs < 0).sum())),
+        'ats': _result_counts(view['ats'], ('Cover', 'No Cover', 'Push')),
+        'ou': _result_counts(games['ou_result'], ('Over', 'Under', 'Push')),
+        'avg_mov': float(movs.mean()) if len(movs) else 0.0,
+        'avg_ats_margin': float(ats_margins.mean()) if len(ats_margins) else 0.0
     }
 
 # Clear any stale report results on page load so returning to this page doesn't show previous player tables
@@ -1603,54 +1496,28 @@ with col2:
 
     if generate_clicked:
         
-        # Filter for recent matchups between the two teams (already sorted by date, most recent first)
-        team_matchups = df_games[((df_games['home_team'] == team1) & (df_games['away_team'] == team2)) |
-                                 ((df_games['home_team'] == team2) & (df_games['away_team'] == team1))]
-        
-        # Filter out unplayed games (NaN scores) FIRST, then take the 10 most recent completed games
-        completed_matchups = team_matchups.dropna(subset=['home_score', 'away_score'])
-        last_10_games = completed_matchups.sort_values(by='date', ascending=False).head(10)
+        # The 10 most recent completed games between the two teams from team1's side, most recent first
+        last_10_games = run_query('head_to_head', team1=team1, team2=team2, limit=10)
 
         if last_10_games.empty:
             st.write(f"No recent games found between {team1} and {team2}.")
         else:
             # Team-level statistics (using only completed games)
-            total_points = last_10_games['home_score'] + last_10_games['away_score']
+            total_points = last_10_games['total_points']
             average_total_points = total_points.mean()
-            team1_wins = int(((last_10_games['home_team'] == team1) & (last_10_games['home_score'] > last_10_games['away_score'])).sum() +
-                         ((last_10_games['away_team'] == team1) & (last_10_games['away_score'] > last_10_games['home_score'])).sum())
-            team2_wins = int(((last_10_games['home_team'] == team2) & (last_10_games['home_score'] > last_10_games['away_score'])).sum() +
-                         ((last_10_games['away_team'] == team2) & (last_10_games['away_score'] > last_10_games['home_score'])).sum())
-
-            team1_scores = last_10_games.loc[last_10_games['home_team'] == team1, 'home_score'].sum() + \
-                           last_10_games.loc[last_10_games['away_team'] == team1, 'away_score'].sum()
-            team2_scores = last_10_games.loc[last_10_games['home_team'] == team2, 'home_score'].sum() + \
-                           last_10_games.loc[last_10_games['away_team'] == team2, 'away_score'].sum()
+            team1_wins = int((last_10_games['team1_margin'] > 0).sum())
+            team2_wins = int((last_10_games['team1_margin'] < 0).sum())
 
             # Average points per game across these head-to-head matchups
-            num_h2h_games = len(last_10_games)
-            team1_ppg = float(team1_scores) / num_h2h_games if num_h2h_games > 0 else 0.0
-            team2_ppg = float(team2_scores) / num_h2h_games if num_h2h_games > 0 else 0.0
+            team1_ppg = float(last_10_games['team1_score'].mean())
+            team2_ppg = float(last_10_games['team2_score'].mean())
 
             over_50_points_games = int((total_points > 50).sum())
 
             # Only here: compute and show streak, winner_team, and center-stats block
-            recent_games_for_streak = last_10_games.sort_values(by='date', ascending=False)
-            most_recent = recent_games_for_streak.iloc[0]
-            if most_recent['home_score'] > most_recent['away_score']:
-                winner_team = most_recent['home_team']
-            else:
-                winner_team = most_recent['away_team']
-
-            streak = 0
-            for _, g in recent_games_for_streak.iterrows():
-                home_win = g['home_score'] > g['away_score']
-                away_win = g['away_score'] > g['home_score']
-                team_won = (home_win and g['home_team'] == winner_team) or (away_win and g['away_team'] == winner_team)
-                if team_won:
-                    streak += 1
-                else:
-                    break
+            results = np.sign(last_10_games['team1_margin'])
+            winner_team = team1 if results.iloc[0] > 0 else team2
+            streak = int(results.eq(results.iloc[0]).cummin().sum()) if results.iloc[0] != 0 else 0
 
 
             st.markdown(f"<div style='text-align: center;'><small><i>{len(last_10_games)} most recent games analyzed</i></small></div>", unsafe_allow_html=True)
@@ -1674,7 +1541,7 @@ with col2:
 
             # -------------------- Head-to-Head ATS & Totals --------------------
             st.write("")
-            h2h = compute_head_to_head_bets(df_games, team1, team2, limit=10)
+            h2h = compute_head_to_head_bets(last_10_games, team1, team2)
             ats_t1_w, ats_t1_l, ats_push = h2h['team1_ats']
             ats_t2_w, ats_t2_l, ats_t2_p = h2h['team2_ats']
             ou_over, ou_under, ou_push = h2h['ou']
@@ -1707,53 +1574,19 @@ with col2:
             st.write("")
 
             # Build per-game outcomes for interactive view
-            games = h2h['games'].copy()
+            games = h2h['games']
             if not games.empty:
-                cols_needed = ['date','home_team','away_team','home_score','away_score','home_spread','away_spread','total_line','team_favorite']
-                for c in cols_needed:
-                    if c not in games.columns:
-                        games[c] = np.nan
-                games['date'] = pd.to_datetime(games['date'], format='%Y-%m-%d %H:%M:%S', errors='coerce')
-                games = games.sort_values('date', ascending=False)
-
-                def game_row_outcomes(row):
-                    total_pts = float(row['home_score']) + float(row['away_score']) if pd.notna(row['home_score']) and pd.notna(row['away_score']) else np.nan
-                    ou_result = 'Over' if pd.notna(row['total_line']) and total_pts > float(row['total_line']) else ('Under' if pd.notna(row['total_line']) and total_pts < float(row['total_line']) else 'Push')
-                    # ATS for each team perspective
-                    # team1
-                    t1_pts, t2_pts, t1_spread = _get_team_points(row, team1)
-                    t2_pts_b, t1_pts_b, t2_spread = _get_team_points(row, team2)
-                    def ats_result(pts, opp_pts, spread):
-                        if pd.isna(pts) or pd.isna(opp_pts) or pd.isna(spread):
-                            return 'N/A'
-                        margin = float(pts) - float(opp_pts) + float(spread)
-                        if margin > 0: return 'Cover'
-                        if margin < 0: return 'No Cover'
-                        return 'Push'
-                    t1_ats = ats_result(t1_pts, t2_pts, t1_spread)
-                    t2_ats = ats_result(t2_pts_b, t1_pts_b, t2_spread)
-                    return pd.Series({
-                        'Total Pts': total_pts,
-                        'O/U Result': ou_result,
-                        f'{team1} Spread': t1_spread,
-                        f'{team1} ATS': t1_ats,
-                        f'{team2} Spread': t2_spread,
-                        f'{team2} ATS': t2_ats,
-                    })
-
-                outcomes = games.apply(game_row_outcomes, axis=1)
-                # Prefer game_id if present; otherwise build a readable id from date and teams
-                if 'game_id' in games.columns:
-                    games['game_id_display'] = games['game_id'].astype(str)
-                else:
-                    def _mk_id(r):
-                        d = pd.to_datetime(r.get('date'), format='%Y-%m-%d %H:%M:%S', errors='coerce')
-                        dstr = d.strftime('%Y-%m-%d') if pd.notna(d) else ''
-                        return f"{dstr} {r.get('away_team','')} @ {r.get('home_team','')}"
-                    games['game_id_display'] = games.apply(_mk_id, axis=1)
-
-                show_df = pd.concat([games[['game_id_display','home_team','away_team','home_score','away_score','total_line','team_favorite']], outcomes], axis=1)
-                show_df.rename(columns={'total_line':'Total Line','team_favorite':'Favorite','game_id_display':'game_id'}, inplace=True)
+                outcomes = pd.DataFrame({
+                    'Total Pts': games['total_points'],
+                    'O/U Result': games['ou_result'].fillna('N/A'),
+                    f'{team1} Spread': games['team1_spread'],
+                    f'{team1} ATS': games['team1_ats'].fillna('N/A'),
+                    f'{team2} Spread': games['team2_spread'],
+                    f'{team2} ATS': games['team2_ats'].fillna('N/A'),
+                }, index=games.index)
+
+                show_df = pd.concat([games[['game_id','home_team','away_team','home_score','away_score','total_line','team_favorite']], outcomes], axis=1)
+                show_df.rename(columns={'total_line':'Total Line','team_favorite':'Favorite'}, inplace=True)
 
                 with st.expander("Per-game results", expanded=False):
                     df_display = show_df.copy()
@@ -8,7 +8,9 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from PIL import Image
 import sqlite3
+from utils.assets import asset_path
 from utils.footer import render_footer
+from utils.tables import load_table
 from utils.session_state import ensure_option_state, widget_key
 
 # Page configuration
@@ -37,18 +39,16 @@ st.markdown(f"""
 # Always use the most recent season available
 
 # Load data using cached function
-@st.cache_data(show_spinner=False)
 def load_data():
     """Load all required CSV files for the Player Dashboard"""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
     
     try:
-        df_teams = pd.read_csv(os.path.join(current_dir, '../data', 'Teams.csv'))
-        df_games = pd.read_csv(os.path.join(current_dir, '../data', 'Games.csv'))
+        df_teams = load_table('teams')
+        df_games = load_table('games')
         # df_playerstats = pd.read_csv(os.path.join(current_dir, '../data', 'PlayerStats.csv'))  # COMMENTED OUT - Missing 2025 data, not used in this page
-        df_team_game_logs = pd.read_csv(os.path.join(current_dir, '../data', 'all_team_game_logs.csv'))
-        df_schedule_and_game_results = pd.read_csv(os.path.join(current_dir, '../data', 'all_teams_schedule_and_game_results_merged.csv'))
-        df_all_passing_rushing_receiving = pd.read_csv(os.path.join(current_dir, '../data', 'all_passing_rushing_receiving.csv'))
+        df_team_game_logs = load_table('team_game_logs')
+        df_schedule_and_game_results = load_table('schedule')
+        df_all_passing_rushing_receiving = load_table('passing_rushing_receiving')
         
         return (df_teams, df_games, None, df_team_game_logs, 
                 df_schedule_and_game_results, df_all_passing_rushing_receiving)  # df_playerstats replaced with None
@@ -62,7 +62,7 @@ df_teams, df_games, _, df_team_game_logs, df_schedule_and_game_results, df_all_p
 # Load the comprehensive player data
 current_dir = os.path.dirname(os.path.abspath(__file__))
 csv_path = os.path.join(current_dir, '../data', 'all_passing_rushing_receiving.csv')
-df_player_data = pd.read_csv(csv_path)
+df_player_data = load_table('passing_rushing_receiving', path=csv_path)
 
 # Set the database path for headshots
 db_path = os.path.join(current_dir, '../data', 'nfl.db')
@@ -78,7 +78,7 @@ def load_headshot_map() -> dict[str, str]:
     roster_path = os.path.join(current_dir, '../data', 'Rosters.csv')
     
     try:
-        df_roster = pd.read_csv(roster_path)
+        df_roster = load_table('rosters', path=roster_path)
     except FileNotFoundError:
         return {}
     
@@ -375,7 +375,11 @@ with col1:
             st.info("No season data available for this player yet.")
             selected_season = None
 
-    if player_name is not None and pd.notna(headshot_url):  # Check if player_name and URL exist
+    # Prefer the headshot resized by data.py; fall back to the remote URL
+    local_headshot = asset_path("player-headshots", player_name, "card") if player_name is not None else None
+    if local_headshot:
+        st.image(local_headshot, caption=player_name, width='stretch')
+    elif player_name is not None and pd.notna(headshot_url):  # Check if player_name and URL exist
         try:
             st.image(headshot_url, caption=player_name, width='stretch')
         except Exception as e:
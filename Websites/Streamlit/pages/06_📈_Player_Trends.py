@@ -1,12 +1,11 @@
 import streamlit as st
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
 import altair as alt
-import os
 # from Home import df_teams, df_games, df_playerstats, df_team_game_logs, df_schedule_and_game_results
 from utils.footer import render_footer
+from utils.tables import load_table
 from utils.session_state import persistent_selectbox
 
 # Page configuration
@@ -40,19 +39,17 @@ st.markdown(f"""
 )
 
 # Load data using cached function
-@st.cache_data(show_spinner=False)
 def load_data():
     """Load all required CSV files for Player Trends"""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
     
     try:
-        df_teams = pd.read_csv(os.path.join(current_dir, '../data', 'Teams.csv'))
-        df_games = pd.read_csv(os.path.join(current_dir, '../data', 'Games.csv'))
+        df_teams = load_table('teams')
+        df_games = load_table('games')
         # df_playerstats = pd.read_csv(os.path.join(current_dir, '../data', 'PlayerStats.csv'))  # COMMENTED OUT - Missing 2025 data, not used in this page
-        df_team_game_logs = pd.read_csv(os.path.join(current_dir, '../data', 'all_team_game_logs.csv'))
-        df_schedule_and_game_results = pd.read_csv(os.path.join(current_dir, '../data', 'all_teams_schedule_and_game_results_merged.csv'))
+        df_team_game_logs = load_table('team_game_logs')
+        df_schedule_and_game_results = load_table('schedule')
         # Add the detailed passing/rushing/receiving data for 2025 trends
-        df_all_passing_rushing_receiving = pd.read_csv(os.path.join(current_dir, '../data', 'all_passing_rushing_receiving.csv'))
+        df_all_passing_rushing_receiving = load_table('passing_rushing_receiving')
         
         return df_teams, df_games, None, df_team_game_logs, df_schedule_and_game_results, df_all_passing_rushing_receiving  # df_playerstats replaced with None
     except FileNotFoundError as e:
@@ -2,10 +2,10 @@ import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 import sqlite3
-import os
 import altair as alt
 import plotly.express as px
 from utils.footer import render_footer
+from utils.tables import load_table
 from utils.session_state import persistent_selectbox
 
 # Page configuration
@@ -30,18 +30,16 @@ st.markdown(f"""
 )
 
 # Load data using cached function
-@st.cache_data(show_spinner=False)
 def load_data():
     """Load all required CSV files for Team Trends"""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
     
     try:
-        df_teams = pd.read_csv(os.path.join(current_dir, '../data', 'Teams.csv'))
-        df_games = pd.read_csv(os.path.join(current_dir, '../data', 'Games.csv'))
+        df_teams = load_table('teams')
+        df_games = load_table('games')
         # df_playerstats = pd.read_csv(os.path.join(current_dir, '../data', 'PlayerStats.csv'))  # COMMENTED OUT - Missing 2025 data, not used in this page
-        df_team_game_logs = pd.read_csv(os.path.join(current_dir, '../data', 'all_team_game_logs.csv'))
-        df_schedule_and_game_results = pd.read_csv(os.path.join(current_dir, '../data', 'all_teams_schedule_and_game_results_merged.csv'))
-        df_box_scores = pd.read_csv(os.path.join(current_dir, '../data', 'all_box_scores.csv'))
+        df_team_game_logs = load_table('team_game_logs')
+        df_schedule_and_game_results = load_table('schedule')
+        df_box_scores = load_table('box_scores')
         
         return (df_teams, df_games, None, df_team_game_logs, 
                 df_schedule_and_game_results, df_box_scores)  # df_playerstats replaced with None
@@ -5,6 +5,7 @@ import matplotlib.pyplot as plt
 import sqlite3
 import os
 from utils.footer import render_footer
+from utils.tables import load_table, run_query
 
 # Page configuration
 st.set_page_config(
@@ -32,8 +33,8 @@ selected_season = st.selectbox("Select Season:", list(range(2010, 2026))[::-1],
 # Load data files directly if not in session state
 if 'df_teams' not in st.session_state:
     current_dir = os.path.dirname(os.path.abspath(__file__))
-    df_teams = pd.read_csv(os.path.join(current_dir, '../data', 'Teams.csv'))
-    df_games = pd.read_csv(os.path.join(current_dir, '../data', 'Games.csv'))
+    df_teams = load_table('teams')
+    df_games = load_table('games')
     # df_playerstats = pd.read_csv(os.path.join(current_dir, '../data', 'PlayerStats.csv'))  # COMMENTED OUT - Missing 2025 data, not used in this page
     
     # Store in session state for future use
@@ -45,78 +46,42 @@ else:
     df_games = st.session_state['df_games'] 
     # df_playerstats = st.session_state['df_playerstats']  # COMMENTED OUT
 
+# Regular-season ATS and O/U counts per team and venue for the season
+teams = df_teams['TeamID'].tolist()
+season_splits = run_query('team_splits', since=selected_season, until=selected_season, game_types=['REG'])
+
+def split_records(columns, labels, venue=None):
+    """Per-team sums of the team_splits ``columns`` (one venue or both), renamed to ``labels``."""
+    rows = season_splits if venue is None else season_splits[season_splits['venue'] == venue]
+    records = rows.groupby('team')[columns].sum().reindex(teams, fill_value=0)
+    records.columns = labels
+    return records
+
 tab1, tab2 = st.tabs(["ATS", "Over/Under"])
 
 ### --- ATS Record (Overall, Home, Away) --- ###
 with tab1:
     st.header("ATS Stats (Reg Reason)")
         
-    teams = df_teams['TeamID'].tolist()
-
-    # Function to determine the ATS result for a game using actual scores and spread
-    def ats_result(row, team):
-        # Check if scores are available (not empty strings or NaN)
-        if pd.isna(row['home_score']) or pd.isna(row['away_score']) or row['home_score'] == '' or row['away_score'] == '':
-            return None  # Game not played yet
-        
-        spread = float(row['home_spread']) if row['home_team'] == team else float(row['away_spread'])
-        score_diff = row['home_score'] - row['away_score'] if row['home_team'] == team else row['away_score'] - row['home_score']
-        if score_diff > spread:
-            return 'Win'
-        elif score_diff < spread:
-            return 'Loss'
-        else:
-            return 'Push'
+    ATS_COLUMNS = ['ats_covers', 'ats_losses', 'ats_pushes']
+    ATS_LABELS = ['Win', 'Loss', 'Push']
+    overall_ats_records = split_records(ATS_COLUMNS, ATS_LABELS)
+    home_ats_records = split_records(ATS_COLUMNS, ATS_LABELS, 'home')
+    away_ats_records = split_records(ATS_COLUMNS, ATS_LABELS, 'away')
 
     # Dropdown button for single team stats
     selected_team = st.selectbox('Team:', (df_teams), key="ATS_selectbox", index=df_teams['TeamID'].tolist().index('DAL') if 'DAL' in df_teams['TeamID'].tolist() else 0)
     if selected_team:
-        # Filter the games for the selected team
-        relevant_columns = ['home_team', 'away_team', 'home_score', 'away_score', 'home_spread', 'away_spread']
-        team_games = df_games[
-            ((df_games['home_team'] == selected_team) | (df_games['away_team'] == selected_team)) & (df_games['season'] == selected_season) & (df_games['week'].between(1, 18))
-        ][relevant_columns]    
-        team_games['ATS_Result'] = team_games.apply(lambda row: ats_result(row, selected_team), axis=1)
-        # Filter out unplayed games (None values)
-        played_games = team_games.dropna(subset=['ATS_Result'])
-        overall_ats_record = played_games['ATS_Result'].value_counts().reindex(['Win', 'Loss', 'Push'], fill_value=0)
-        home_ats_record = played_games[played_games['home_team'] == selected_team]['ATS_Result'].value_counts().reindex(['Win', 'Loss', 'Push'], fill_value=0)
-        away_ats_record = played_games[played_games['away_team'] == selected_team]['ATS_Result'].value_counts().reindex(['Win', 'Loss', 'Push'], fill_value=0)
         st.write(f"ATS Record for {selected_team} in {selected_season} Season")
         ats_data = pd.DataFrame({
-            'Overall': overall_ats_record,
-            'Home': home_ats_record,
-            'Away': away_ats_record
+            'Overall': overall_ats_records.loc[selected_team],
+            'Home': home_ats_records.loc[selected_team],
+            'Away': away_ats_records.loc[selected_team]
         })
         st.table(ats_data)
 
     st.divider()
 
-    # DataFrames to store ATS results
-    overall_ats_records = pd.DataFrame(index=teams, columns=['Win', 'Loss', 'Push'], dtype='int64').fillna(0)
-    home_ats_records = pd.DataFrame(index=teams, columns=['Win', 'Loss', 'Push'], dtype='int64').fillna(0)
-    away_ats_records = pd.DataFrame(index=teams, columns=['Win', 'Loss', 'Push'], dtype='int64').fillna(0)
-
-    for team in teams:
-        relevant_columns = ['home_team', 'away_team', 'home_score', 'away_score', 'home_spread', 'away_spread']
-        team_games = df_games[
-        ((df_games['home_team'] == team) | (df_games['away_team'] == team)) & (df_games['season'] == selected_season) & (df_games['week'].between(1, 18))
-        ][relevant_columns]
-        team_games['ATS_Result'] = team_games.apply(lambda row: ats_result(row, team), axis=1)
-        # Filter out unplayed games (None values)
-        played_games = team_games.dropna(subset=['ATS_Result'])
-        # overall_ats_record = team_games['ATS_Result'].value_counts()
-        # home_ats_record = team_games[team_games['home_team'] == team]['ATS_Result'].value_counts()
-        # away_ats_record = team_games[team_games['away_team'] == team]['ATS_Result'].value_counts()
-        # st.write(f"{team} ATS Record for 2023 Season:")
-        # st.write("Overall:", overall_ats_record)
-        # st.write("Home:", home_ats_record)
-        # st.write("Away:", away_ats_record)
-        # st.divider()
-        overall_ats_records.loc[team] = played_games['ATS_Result'].value_counts()
-        home_ats_records.loc[team] = played_games[played_games['home_team'] == team]['ATS_Result'].value_counts()
-        away_ats_records.loc[team] = played_games[played_games['away_team'] == team]['ATS_Result'].value_counts()
-
     # Plotting Overall ATS Record
     st.subheader("Overall ATS Record")
     st.bar_chart(overall_ats_records, 
@@ -150,78 +115,28 @@ with tab1:
 with tab2:
     st.header("O/U Stats (Reg Reason)")
 
-    teams = df_teams['TeamID'].tolist()
-    games_selected = df_games[(df_games['season'] == selected_season) & (df_games['week'].between(1, 18))].copy()
-    
-    # Filter out unplayed games (games with empty or NaN scores)
-    games_selected = games_selected[
-        (games_selected['home_score'].notna()) & 
-        (games_selected['away_score'].notna()) & 
-        (games_selected['home_score'] != '') & 
-        (games_selected['away_score'] != '')
-    ].copy()
-    
-    games_selected['total_score'] = games_selected['home_score'] + games_selected['away_score']
-    games_selected['over_under_result'] = games_selected.apply(lambda row: 'over' if row['total_score'] > row['total_line'] else 'under' if row['total_score'] < row['total_line'] else 'push', axis=1)
+    OU_COLUMNS = ['overs', 'unders', 'ou_pushes']
+    OU_LABELS = ['over', 'under', 'push']
+    over_under_records = split_records(OU_COLUMNS, OU_LABELS)
+    home_over_under_records = split_records(OU_COLUMNS, OU_LABELS, 'home')
+    away_over_under_records = split_records(OU_COLUMNS, OU_LABELS, 'away')
 
     # Dropdown button for single team stats
     selected_team = st.selectbox('Team:', (df_teams), key="O/U_selectbox", index=df_teams['TeamID'].tolist().index('DAL') if 'DAL' in df_teams['TeamID'].tolist() else 0)
     if selected_team:
-        selected_team_games = games_selected[(games_selected['home_team'] == selected_team) | (games_selected['away_team'] == selected_team)]
-        over_count = selected_team_games['over_under_result'].value_counts().get('over', 0)
-        under_count = selected_team_games['over_under_result'].value_counts().get('under', 0)
-        push_count = selected_team_games['over_under_result'].value_counts().get('push', 0)
-        home_games = games_selected[games_selected['home_team'] == selected_team]
-        home_over_count = home_games['over_under_result'].value_counts().get('over', 0)
-        home_under_count = home_games['over_under_result'].value_counts().get('under', 0)
-        home_push_count = home_games['over_under_result'].value_counts().get('push', 0)
-        away_games = games_selected[games_selected['away_team'] == selected_team]
-        away_over_count = away_games['over_under_result'].value_counts().get('over', 0)
-        away_under_count = away_games['over_under_result'].value_counts().get('under', 0)
-        away_push_count = away_games['over_under_result'].value_counts().get('push', 0)
-        combined_record = pd.DataFrame({
-            'Type': ['Overall', 'Home', 'Away'],
-            'Over': [over_count, home_over_count, away_over_count],
-            'Under': [under_count, home_under_count, away_under_count],
-            'Push': [push_count, home_push_count, away_push_count]
-        })
+        combined_record = pd.DataFrame(
+            [over_under_records.loc[selected_team], home_over_under_records.loc[selected_team], away_over_under_records.loc[selected_team]]
+        ).reset_index(drop=True)
+        combined_record.columns = ['Over', 'Under', 'Push']
+        combined_record.insert(0, 'Type', ['Overall', 'Home', 'Away'])
         st.write(f"O/U Record for {selected_team} in {selected_season} Season")
         st.table(combined_record)
 
     st.divider()
 
-    over_under_stats = {}
-    home_over_under_stats = {}
-    away_over_under_stats = {}
-
-    for team in teams:
-        # Overall record
-        team_games = games_selected[(games_selected['home_team'] == team) | (games_selected['away_team'] == team)]
-        over_count = team_games['over_under_result'].value_counts().get('over', 0)
-        under_count = team_games['over_under_result'].value_counts().get('under', 0)
-        push_count = team_games['over_under_result'].value_counts().get('push', 0)
-        over_under_stats[team] = {'over': over_count, 'under': under_count, 'push': push_count}
-
-        # Home record
-        home_games = games_selected[games_selected['home_team'] == team]
-        home_over_count = home_games['over_under_result'].value_counts().get('over', 0)
-        home_under_count = home_games['over_under_result'].value_counts().get('under', 0)
-        home_push_count = home_games['over_under_result'].value_counts().get('push', 0)
-        home_over_under_stats[team] = {'over': home_over_count, 'under': home_under_count, 'push': home_push_count}
-
-        # Away record
-        away_games = games_selected[games_selected['away_team'] == team]
-        away_over_count = away_games['over_under_result'].value_counts().get('over', 0)
-        away_under_count = away_games['over_under_result'].value_counts().get('under', 0)
-        away_push_count = away_games['over_under_result'].value_counts().get('push', 0)
-        away_over_under_stats[team] = {'over': away_over_count, 'under': away_under_count, 'push': away_push_count}
-
-    over_under_df = pd.DataFrame.from_dict(over_under_stats, orient='index').reset_index() # Convert the dictionary to a DataFrame for easy plotting
-    over_under_df.columns = ['team', 'over', 'under', 'push']
-    home_over_under_df = pd.DataFrame.from_dict(home_over_under_stats, orient='index').reset_index()
-    home_over_under_df.columns = ['team', 'over', 'under', 'push']
-    away_over_under_df = pd.DataFrame.from_dict(away_over_under_stats, orient='index').reset_index()
-    away_over_under_df.columns = ['team', 'over', 'under', 'push']
+    over_under_df = over_under_records.rename_axis('team').reset_index()
+    home_over_under_df = home_over_under_records.rename_axis('team').reset_index()
+    away_over_under_df = away_over_under_records.rename_axis('team').reset_index()
 
     # Display overall bar chart
     st.subheader("Overall")
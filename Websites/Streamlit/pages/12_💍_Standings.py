@@ -2,8 +2,8 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import os
 from utils.footer import render_footer
+from utils.tables import load_table
 from utils.session_state import ensure_option_state, widget_key
 
 # Page configuration
@@ -32,14 +32,12 @@ st.markdown(f"""
 )
 
 # Load data using cached function
-@st.cache_data(show_spinner=False)
 def load_data():
     """Load all required CSV files for Standings"""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
     
     try:
-        df_teams = pd.read_csv(os.path.join(current_dir, '../data', 'Teams.csv'))
-        df_games = pd.read_csv(os.path.join(current_dir, '../data', 'Games.csv'))
+        df_teams = load_table('teams')
+        df_games = load_table('games')
         # df_playerstats = pd.read_csv(os.path.join(current_dir, '../data', 'PlayerStats.csv'))  # COMMENTED OUT - Missing 2025 data, not used in this page
         
         return df_teams, df_games, None  # df_playerstats replaced with None
@@ -0,0 +1,52 @@
+"""
+Lookups into the image manifests written by data.py (see ../asset_pipeline.py).
+
+Team logos and player headshots are resized into WebP/PNG variants when the
+data is refreshed; pages only look up a file path or a ready data URI here:
+
+    logo_path = asset_path("team-logos", "DAL", "logo")
+    logo_uri = asset_data_uri("team-logos", "DAL", "logo")
+    headshot = asset_path("player-headshots", "CeeDee Lamb", "card")
+"""
+
+import json
+import os
+from typing import Optional
+
+import streamlit as st
+
+IMAGES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "images")
+MANIFESTS = {
+    "team-logos": os.path.join(IMAGES_DIR, "team-logos", "variants", "manifest.json"),
+    "player-headshots": os.path.join(IMAGES_DIR, "player-headshots", "manifest.json"),
+}
+
+
+@st.cache_resource(show_spinner=False)
+def load_manifest(group: str) -> dict:
+    """The manifest of ``group`` ({} when it has not been built here)."""
+    try:
+        with open(MANIFESTS[group]) as f:
+            return json.load(f).get("images", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _variant(group: str, key: str, variant: str) -> Optional[dict]:
+    entry = load_manifest(group).get(key)
+    return entry["variants"].get(variant) if entry else None
+
+
+def asset_path(group: str, key: str, variant: str, fmt: str = "webp") -> Optional[str]:
+    """Absolute path of a prepared image, or None if it is not available."""
+    info = _variant(group, key, variant)
+    if not info or fmt not in info:
+        return None
+    path = os.path.join(os.path.dirname(MANIFESTS[group]), info[fmt])
+    return path if os.path.exists(path) else None
+
+
+def asset_data_uri(group: str, key: str, variant: str, fmt: str = "png") -> Optional[str]:
+    """Base64 data URI prepared for embedding the image in generated HTML."""
+    info = _variant(group, key, variant)
+    return info.get(f"{fmt}_data_uri") if info else None
@@ -0,0 +1,34 @@
+"""
+The app's tables, read through the shared nfl_data package (repository root).
+
+Every page asks for the same files; nfl_data parses each one once per process
+with its schema (typed ids, categorical team columns, parsed dates) and hands
+out column projections and season slices of that one frame:
+
+    df_games = load_table("games")
+    df_logs = load_table("passing_rushing_receiving", columns=["player", "team", "game_id"])
+
+``run_query`` answers the named aggregates of ``nfl_data.query`` straight
+from the files with duckdb:
+
+    h2h = run_query("head_to_head", team1="BUF", team2="MIA")
+"""
+
+import os
+import sys
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+sys.path.insert(0, os.path.join(DATA_DIR, "..", "..", ".."))
+
+import nfl_data  # noqa: E402
+from nfl_data import query  # noqa: E402
+
+
+def load_table(name: str, **kwargs):
+    """``nfl_data.load`` on the app's data directory (FileNotFoundError if the file is missing)."""
+    return nfl_data.load(name, data_dir=DATA_DIR, **kwargs)
+
+
+def run_query(name: str, **params):
+    """``nfl_data.query.run`` on the app's data directory (ImportError without duckdb)."""
+    return query.run(name, data_dir=DATA_DIR, **params)
@@ -0,0 +1,185 @@
+"""
+Image asset pipeline for the Streamlit and Dash apps.
+
+Images are prepared once, when data.py runs, instead of on every page render:
+
+    from asset_pipeline import build_assets
+    build_assets('images/team-logos/variants', {'ARI': 'images/team-logos/ARI.png', ...},
+                 variants={'logo': (100, 100)}, inline=('png',))
+
+- A source is a URL (player headshots) or a local original (team logos).
+  URLs already fetched by a previous build are not downloaded again; the
+  missing ones are downloaded concurrently.
+- Every original is identified by the SHA-256 of its bytes and its variants
+  are named after it, so an image shared by many keys (ESPN's placeholder
+  headshot) is resized and stored once, and an original whose bytes did not
+  change is not resized again.
+- Each variant is a LANCZOS thumbnail within the given (width, height), saved
+  as WebP and PNG. ``inline`` formats also get a base64 data URI in the
+  manifest for pages that embed images in generated HTML.
+
+The manifest (``manifest.json`` next to the variants) maps each key to its
+variant file names, relative to the manifest, and their sizes:
+
+    {"images": {"ARI": {"source": ..., "sha256": ...,
+                        "variants": {"logo": {"width": 100, "height": 100,
+                                              "webp": "3f2a...-logo.webp", "png": "3f2a...-logo.png"}}}}}
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+from PIL import Image
+
+DEFAULT_FORMATS = ('webp', 'png')
+SAVE_OPTIONS = {
+    'webp': {'format': 'WEBP', 'quality': 85, 'method': 6},
+    'png': {'format': 'PNG', 'optimize': True},
+}
+DOWNLOAD_WORKERS = 16
+RENDER_WORKERS = os.cpu_count() or 4
+_VARIANT_FILE = re.compile(r'^[0-9a-f]{16}-[\w-]+\.(webp|png)$')
+
+
+def is_url(source):
+    return source.startswith(('http://', 'https://'))
+
+
+def load_manifest(manifest_path):
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'images': {}}
+
+
+def _download(session, url):
+    try:
+        response = session.get(url, timeout=20)
+        response.raise_for_status()
+        return response.content
+    except requests.RequestException as e:
+        print(f"Failed to download {url}: {e}")
+        return None
+
+
+def render_variants(content, sha, output_dir, variants, formats=DEFAULT_FORMATS, inline=()):
+    """Write the variants of one original; return their manifest entries"""
+    prefix = sha[:16]
+    entries = {}
+    with Image.open(io.BytesIO(content)) as img:
+        img.load()
+        has_alpha = img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
+        img = img.convert('RGBA' if has_alpha else 'RGB')
+        for name, size in variants.items():
+            variant = img.copy()
+            variant.thumbnail(tuple(size), Image.Resampling.LANCZOS)
+            entry = {'width': variant.width, 'height': variant.height}
+            for fmt in formats:
+                buffer = io.BytesIO()
+                variant.save(buffer, **SAVE_OPTIONS[fmt])
+                data = buffer.getvalue()
+                filename = f"{prefix}-{name}.{fmt}"
+                with open(os.path.join(output_dir, filename), 'wb') as f:
+                    f.write(data)
+                entry[fmt] = filename
+                if fmt in inline:
+                    entry[f"{fmt}_data_uri"] = f"data:image/{fmt};base64,{base64.b64encode(data).decode('ascii')}"
+            entries[name] = entry
+    return entries
+
+
+def _variants_exist(output_dir, entry):
+    return all(
+        os.path.exists(os.path.join(output_dir, filename))
+        for variant in entry.get('variants', {}).values()
+        for key, filename in variant.items()
+        if key in SAVE_OPTIONS
+    )
+
+
+def build_assets(output_dir, sources, variants, formats=DEFAULT_FORMATS, inline=(), manifest_path=None):
+    """Bring ``output_dir`` and its manifest up to date with ``sources`` ({key: URL or path}); return counts"""
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = manifest_path or os.path.join(output_dir, 'manifest.json')
+    previous = load_manifest(manifest_path)
+    settings = {'variants': {name: list(size) for name, size in variants.items()},
+                'formats': list(formats), 'inline': list(inline)}
+    same_settings = all(previous.get(key) == value for key, value in settings.items())
+    done = {}
+    for key, entry in previous.get('images', {}).items():
+        if same_settings and _variants_exist(output_dir, entry):
+            done[entry['sha256']] = entry['variants']
+    reusable = {entry['source']: entry for entry in previous.get('images', {}).values()
+                if entry['sha256'] in done}
+
+    # Originals: local files are hashed every run (cheap); URLs only when not seen before
+    contents = {}
+    to_download = []
+    for key, source in sources.items():
+        if is_url(source):
+            if source in reusable:
+                contents[key] = (reusable[source]['sha256'], None)
+            else:
+                to_download.append((key, source))
+        elif os.path.exists(source):
+            with open(source, 'rb') as f:
+                content = f.read()
+            contents[key] = (hashlib.sha256(content).hexdigest(), content)
+        else:
+            print(f"Missing image for {key}: {source}")
+    counts = {'downloaded': 0, 'failed': 0, 'rendered': 0, 'reused': 0}
+    if to_download:
+        with requests.Session() as session, ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+            for (key, url), content in zip(to_download, pool.map(lambda item: _download(session, item[1]), to_download)):
+                if content is None:
+                    counts['failed'] += 1
+                    continue
+                contents[key] = (hashlib.sha256(content).hexdigest(), content)
+                counts['downloaded'] += 1
+
+    # Variants: once per distinct original that does not have them yet
+    pending = {sha: content for sha, content in contents.values() if sha not in done and content is not None}
+    with ThreadPoolExecutor(max_workers=RENDER_WORKERS) as pool:
+        rendered = pool.map(lambda item: (item[0], _render_or_none(item[1], item[0], output_dir, variants, formats, inline)),
+                            pending.items())
+        for sha, entries in rendered:
+            if entries is not None:
+                done[sha] = entries
+                counts['rendered'] += 1
+    counts['reused'] = sum(1 for sha, _ in contents.values() if sha not in pending)
+
+    images = {}
+    for key, (sha, _) in contents.items():
+        if sha in done:
+            images[key] = {'source': sources[key], 'sha256': sha, 'variants': done[sha]}
+    manifest = {'built': datetime.now().isoformat(timespec='seconds'), **settings, 'images': images}
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_path, manifest_path)
+
+    # Drop variant files no key refers to any more
+    referenced = {filename for entry in images.values() for variant in entry['variants'].values()
+                  for key, filename in variant.items() if key in SAVE_OPTIONS}
+    for filename in os.listdir(output_dir):
+        if _VARIANT_FILE.match(filename) and filename not in referenced:
+            os.remove(os.path.join(output_dir, filename))
+    print(f"{output_dir}: {len(images)} images, {counts['downloaded']} downloaded, {counts['rendered']} resized, "
+          f"{counts['reused']} unchanged, {counts['failed']} failed")
+    return counts
+
+
+def _render_or_none(content, sha, output_dir, variants, formats, inline):
+    try:
+        return render_variants(content, sha, output_dir, variants, formats, inline)
+    except (OSError, ValueError) as e:
+        print(f"Could not resize image {sha[:16]}: {e}")
+        return None
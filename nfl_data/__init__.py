@@ -0,0 +1,30 @@
+"""Typed, cached access to the scraped NFL tables for Models, Websites and Analysis.
+
+Every table (games, rosters, team game logs, the PFR player logs, ...) has one
+schema in ``schema.TABLES`` and is read through ``load``, which parses it once
+per process, compacted (categorical team codes, interned player names and game
+ids, int16/float32 stats), and hands out column projections and season slices
+of that frame (``python -m nfl_data.memory`` reports the savings)::
+
+    import nfl_data
+    games = nfl_data.load('games', columns=['game_id', 'week', 'home_team', 'away_team'], seasons=2025)
+    logs = nfl_data.load('passing_rushing_receiving', data_dir='Websites/Streamlit/data')
+
+``nfl_data.query`` runs SQL over the same files with DuckDB (optional), including
+named aggregates such as team splits and head-to-head history.
+
+Scripts outside the repository root put it on ``sys.path`` first, as they do
+for ``asset_pipeline``.
+"""
+
+from .loaders import clear_cache, compact, load, table_path
+from .schema import TABLES, Table
+
+__all__ = [
+    "TABLES",
+    "Table",
+    "clear_cache",
+    "compact",
+    "load",
+    "table_path",
+]
@@ -0,0 +1,217 @@
+"""Rolling-feature store for the player models.
+
+The model scripts all train on the same trailing features of the PFR player
+game logs (``player_stats_pfr.csv``): per-player means and medians of the
+previous 3/5/8/12 games and the career-to-date mean, always excluding the game
+being predicted. ``build`` computes every one of them in one vectorized pass
+(array operations over all players at once, no per-group Python lambdas) after each scrape and
+stores them keyed by ``(player_id, season, week)``, next to a per-team
+``(team, season, week)`` table of the same windows over the team totals::
+
+    python -m nfl_data.features final_data_pfr/player_stats_pfr.csv final_data_pfr/features
+
+Models read the store and merge the columns they need::
+
+    store = features.player_features("data/features", source="data/player_stats_pfr.csv")
+    hist = hist.merge(store[["player_id", "season", "week", "pass_yds_l5"]], on=features.PLAYER_KEY, how="left")
+
+The store records a hash of the game logs it was built from; when ``source``
+does not match (or the store is missing) it is rebuilt from ``source`` first.
+Column names are ``<stat>_l<w>`` (mean), ``<stat>_median_l<w>``, ``<stat>_career``
+(expanding mean) and ``games_prior``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import warnings
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # optional, the store is written as CSV
+    pq = None
+
+
+PLAYER_KEY = ["player_id", "season", "week"]
+TEAM_KEY = ["team", "season", "week"]
+WINDOWS: Tuple[int, ...] = (3, 5, 8, 12)
+PLAYER_STATS: Tuple[str, ...] = ("pass_att", "pass_cmp", "pass_yds", "pass_td", "rush_att", "rush_yds", "rush_td",
+                                 "targets", "rec", "rec_yds", "rec_td", "scoring_tds")
+TEAM_STATS: Tuple[str, ...] = ("pass_att", "pass_yds", "rush_att", "rush_yds", "targets", "rec_yds", "scoring_tds")
+MANIFEST = "manifest.json"
+# Bumped when the columns change, so stores written by older versions are rebuilt.
+VERSION = 1
+
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def game_logs(path: str) -> pd.DataFrame:
+    """The PFR player game logs at ``path`` with numeric stats, ``season``/``week`` and ``scoring_tds``."""
+
+    logs = pd.read_csv(path, low_memory=False)
+    if "season" not in logs.columns:
+        logs["season"] = logs["game_id"].str.slice(0, 4).astype(int)
+    if "week" not in logs.columns:
+        logs["week"] = logs["game_id"].str.slice(5, 7).astype(int)
+    for stat in PLAYER_STATS:
+        if stat in logs.columns:
+            logs[stat] = pd.to_numeric(logs[stat], errors="coerce")
+    if "scoring_tds" not in logs.columns:
+        logs["scoring_tds"] = logs[["rush_td", "rec_td"]].fillna(0).sum(axis=1)
+    return logs
+
+
+def trailing(frame: pd.DataFrame, key: Sequence[str], stats: Sequence[str],
+             windows: Sequence[int] = WINDOWS) -> pd.DataFrame:
+    """Means and medians of the previous ``windows`` rows and the expanding mean, per ``key`` group.
+
+    ``frame`` must be sorted by ``key`` and in time within each group; the
+    result is aligned to its index. Each value only uses earlier rows of its
+    group, exactly like the ``transform(lambda s: s.shift(1).rolling(w,
+    min_periods=1).mean())`` the models used to run per column, but as array
+    operations over all groups at once: row ``i`` reads rows ``i-w .. i-1``
+    that are not before the start of its group.
+    """
+
+    keys = frame[list(key)]
+    n = len(frame)
+    positions = np.arange(n)
+    first = keys.ne(keys.shift()).any(axis=1).to_numpy()
+    group_start = np.maximum.accumulate(np.where(first, positions, 0)) if n else positions
+    lookback = {}
+    for w in windows:
+        rows = positions[:, None] - np.arange(1, w + 1)
+        lookback[w] = (np.clip(rows, 0, None), rows >= group_start[:, None])
+    earlier = positions > group_start
+    out: Dict[str, np.ndarray] = {}
+    with warnings.catch_warnings():
+        # A group's first row has no earlier values: NaN, as with rolling().
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for stat in stats:
+            values = frame[stat].to_numpy(dtype="float64")
+            for w, (rows, inside) in lookback.items():
+                window = np.where(inside, values[rows], np.nan)
+                out[f"{stat}_l{w}"] = np.nanmean(window, axis=1)
+                out[f"{stat}_median_l{w}"] = np.nanmedian(window, axis=1)
+            prior = np.where(earlier, np.concatenate(([np.nan], values[:-1])), np.nan)
+            present = ~np.isnan(prior)
+            sums = np.cumsum(np.where(present, prior, 0.0))
+            counts = np.cumsum(present)
+            sums = sums - sums[group_start] + np.where(present, prior, 0.0)[group_start]
+            counts = counts - counts[group_start] + present[group_start]
+            out[f"{stat}_career"] = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+    features = pd.DataFrame(out, index=frame.index).astype("float32")
+    features["games_prior"] = positions - group_start
+    return features
+
+
+def build_player_features(logs: pd.DataFrame) -> pd.DataFrame:
+    stats = [stat for stat in PLAYER_STATS if stat in logs.columns]
+    logs = (logs.dropna(subset=PLAYER_KEY).drop_duplicates(subset=PLAYER_KEY, keep="last")
+            .sort_values(PLAYER_KEY, kind="stable").reset_index(drop=True))
+    return pd.concat([logs[PLAYER_KEY], trailing(logs, ["player_id"], stats)], axis=1)
+
+
+def build_team_features(logs: pd.DataFrame) -> pd.DataFrame:
+    stats = [stat for stat in TEAM_STATS if stat in logs.columns]
+    totals = logs.groupby(TEAM_KEY, sort=True)[stats].sum().reset_index()
+    return pd.concat([totals[TEAM_KEY], trailing(totals, ["team"], stats)], axis=1)
+
+
+def _table_path(store_dir: str, name: str) -> str:
+    return os.path.join(store_dir, f"{name}.{'parquet' if pq is not None else 'csv'}")
+
+
+def _write(frame: pd.DataFrame, path: str) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    if path.endswith(".parquet"):
+        frame.to_parquet(tmp_path, index=False)
+    else:
+        frame.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def _read(path: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path, columns=None if columns is None else list(columns))
+    return pd.read_csv(path, usecols=None if columns is None else list(columns), dtype={"player_id": str, "team": str})
+
+
+def build(source: str, store_dir: str) -> Dict[str, int]:
+    """Compute the player and team feature tables from the game logs at ``source`` into ``store_dir``."""
+
+    logs = game_logs(source)
+    player = build_player_features(logs)
+    team = build_team_features(logs)
+    os.makedirs(store_dir, exist_ok=True)
+    _write(player, _table_path(store_dir, "player_features"))
+    _write(team, _table_path(store_dir, "team_features"))
+    manifest = {"version": VERSION, "source": os.path.basename(source), "source_sha1": _file_hash(source),
+                "windows": list(WINDOWS), "player_rows": len(player), "team_rows": len(team),
+                "format": "parquet" if pq is not None else "csv"}
+    with open(os.path.join(store_dir, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return {"player_rows": len(player), "team_rows": len(team)}
+
+
+def _current(store_dir: str, source: Optional[str]) -> bool:
+    try:
+        with open(os.path.join(store_dir, MANIFEST)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if manifest.get("version") != VERSION or manifest.get("format") != ("parquet" if pq is not None else "csv"):
+        return False
+    return source is None or manifest.get("source_sha1") == _file_hash(source)
+
+
+def _load(name: str, store_dir: str, source: Optional[str], columns: Optional[Sequence[str]]) -> pd.DataFrame:
+    if not _current(store_dir, source):
+        if source is None:
+            raise FileNotFoundError(f"No feature store in {store_dir}; run python -m nfl_data.features first")
+        print(f"Building the feature store in {store_dir} from {source}")
+        build(source, store_dir)
+    return _read(_table_path(store_dir, name), columns)
+
+
+def player_features(store_dir: str, source: Optional[str] = None,
+                    columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Player features keyed by ``PLAYER_KEY``, rebuilt from ``source`` first if the store does not match it."""
+
+    return _load("player_features", store_dir, source, None if columns is None else [*PLAYER_KEY, *columns])
+
+
+def team_features(store_dir: str, source: Optional[str] = None,
+                  columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Team features keyed by ``TEAM_KEY``, rebuilt from ``source`` first if the store does not match it."""
+
+    return _load("team_features", store_dir, source, None if columns is None else [*TEAM_KEY, *columns])
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the rolling-feature store from the PFR player game logs")
+    parser.add_argument("source", help="player_stats_pfr.csv")
+    parser.add_argument("store_dir", help="output directory (e.g. final_data_pfr/features)")
+    args = parser.parse_args(argv)
+
+    counts = build(args.source, args.store_dir)
+    print(f"Feature store written to {args.store_dir} ({counts['player_rows']} player-games, "
+          f"{counts['team_rows']} team-games)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
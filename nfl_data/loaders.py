@@ -0,0 +1,259 @@
+"""Cached, typed loaders for the tables declared in ``schema``.
+
+``load`` parses a table once per process: the frame is kept in memory (until
+the file changes) and every later call, from any page or module, gets the
+columns it asks for from that frame. Columns not loaded yet are parsed on
+demand and added to it.
+
+Every parse is compacted by ``compact``: team and other low-cardinality
+columns are categorical, repeated text (player names, game ids) is interned and
+the stat columns are downcast to int16/int32 or float32. ``python -m
+nfl_data.memory`` reports what that saves per table.
+
+The parse itself goes through the fastest format available. When the scraper's
+season-partitioned Parquet dataset (``parquet/<name>/season=<year>/``, written by
+``scraper_core.dataset``) sits next to the CSV and is at least as new, reads only
+touch the requested columns of it. Otherwise, and without pyarrow or with
+``NFL_DATA_PARQUET=0``, the CSV is read with ``usecols`` and the schema dtypes.
+
+Frames are shared: adding or replacing columns on a returned frame is fine,
+but copy it before editing values in place.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .schema import TABLES, Table
+
+try:
+    import pyarrow.dataset as ds
+except ImportError:  # optional, CSVs are read directly
+    ds = None
+
+
+# Where scraper_core.dataset writes the season-partitioned copies, next to the merged CSVs.
+DATASET_DIR = "parquet"
+
+
+def default_data_dir() -> str:
+    return os.environ.get("NFL_DATA_DIR", "data")
+
+
+def parquet_enabled() -> bool:
+    return ds is not None and os.environ.get("NFL_DATA_PARQUET", "1") != "0"
+
+
+def table_path(name: str, data_dir: Optional[str] = None) -> str:
+    """Path of ``name`` in ``data_dir``; FileNotFoundError if none of its file names exist."""
+
+    table = TABLES[name]
+    data_dir = data_dir or default_data_dir()
+    for filename in table.files:
+        path = os.path.join(data_dir, filename)
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"No {name} table in {data_dir} (looked for {', '.join(table.files)})")
+
+
+def _csv_dtypes(table: Table, columns: Optional[Sequence[str]]) -> Dict[str, str]:
+    wanted = table.dtypes if columns is None else {c: t for c, t in table.dtypes.items() if c in columns}
+    return {**wanted, **{c: "category" for c in table.categorical if columns is None or c in columns}}
+
+
+def read_csv(table: Table, path: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Parse ``columns`` (all if None) of a CSV copy of ``table`` with its schema."""
+
+    usecols = None if columns is None else set(columns)
+    dates = [c for c in table.dates if usecols is None or c in usecols]
+    frame = pd.read_csv(path, usecols=None if usecols is None else (lambda c: c in usecols),
+                        dtype=_csv_dtypes(table, columns), parse_dates=dates or False)
+    frame = compact(frame, table)
+    return frame if columns is None else frame[[c for c in columns if c in frame.columns]]
+
+
+def _intern(values: pd.Series) -> pd.Series:
+    seen: Dict[object, object] = {}
+    return pd.Series([seen.setdefault(value, value) for value in values], index=values.index, dtype=object)
+
+
+def _smallest_int(values: pd.Series) -> Optional[str]:
+    """int16 or int32 if every value of ``values`` is a whole number in its range, else None."""
+
+    if values.isna().any() or not np.isfinite(values).all() or not (values % 1 == 0).all():
+        return None
+    low, high = (values.min(), values.max()) if len(values) else (0, 0)
+    for dtype in ("int16", "int32"):
+        if np.iinfo(dtype).min <= low and high <= np.iinfo(dtype).max:
+            return dtype
+    return None
+
+
+def compact(frame: pd.DataFrame, table: Table) -> pd.DataFrame:
+    """Intern the repeated text and downcast the stat columns of ``frame`` (in place; returns it).
+
+    Columns with a schema dtype, categories and dates are left as they are.
+    Whole-number stats without gaps become int16/int32, the rest float32.
+    """
+
+    skip = set(table.dtypes) | set(table.categorical) | set(table.dates)
+    for column in frame.columns:
+        values = frame[column]
+        if column in table.interned:
+            if values.dtype == object:
+                frame[column] = _intern(values)
+        elif column in skip or pd.api.types.is_bool_dtype(values.dtype):
+            continue
+        elif values.dtype == np.float64 or values.dtype == np.int64:
+            frame[column] = values.astype(_smallest_int(values) or ("float32" if values.dtype == np.float64 else "int64"))
+    return frame
+
+
+def _open_dataset(root: str) -> "ds.Dataset":
+    return ds.dataset(root, format="parquet", partitioning="hive")
+
+
+def dataset_path(table: Table, path: str, columns: Sequence[str]) -> Optional[str]:
+    """The Parquet dataset of ``table`` next to the CSV at ``path``.
+
+    None if it is missing, older than the CSV or lacks any of ``columns`` (the CSV header).
+    """
+
+    if not parquet_enabled():
+        return None
+    root = os.path.join(os.path.dirname(path), DATASET_DIR, table.name)
+    parts = glob.glob(os.path.join(root, "*", "*.parquet"))
+    if not parts or min(os.path.getmtime(part) for part in parts) < os.path.getmtime(path):
+        return None
+    if not set(columns) <= set(_open_dataset(root).schema.names):
+        return None
+    return root
+
+
+def columns_of(path: str) -> List[str]:
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def _from_dataset(frame: pd.DataFrame, table: Table) -> pd.DataFrame:
+    """Give columns read from the Parquet dataset the types ``read_csv`` gives them."""
+
+    dtypes = _csv_dtypes(table, frame.columns)
+    for column in frame.columns:
+        values = frame[column]
+        if column in table.dates:
+            frame[column] = pd.to_datetime(values, errors="coerce")
+        elif isinstance(values.dtype, pd.StringDtype):
+            # Nullable strings back to the text dtype the CSV parser infers, with NaN gaps
+            frame[column] = pd.Series(values.to_numpy(dtype=object, na_value=np.nan), index=frame.index)
+        elif pd.api.types.is_extension_array_dtype(values.dtype) and pd.api.types.is_numeric_dtype(values.dtype):
+            frame[column] = values.to_numpy(dtype="float64", na_value=np.nan)
+        if column in dtypes and dtypes[column] != "str":
+            frame[column] = frame[column].astype(dtypes[column])
+    return compact(frame, table)
+
+
+def read_columns(table: Table, path: str, columns: Sequence[str], dataset: Optional[str] = None) -> pd.DataFrame:
+    """Parse ``columns`` from the Parquet ``dataset`` if given, else from the CSV."""
+
+    if dataset is not None:
+        frame = _open_dataset(dataset).to_table(columns=list(columns)).to_pandas()
+        return _from_dataset(frame, table)
+    return read_csv(table, path, columns)
+
+
+def unify_teams(frame: pd.DataFrame, table: Table) -> pd.DataFrame:
+    """Give every team column of ``frame`` the same categories (the union of their values)."""
+
+    present = [c for c in table.teams if c in frame.columns]
+    if not present:
+        return frame
+    codes = set()
+    for column in present:
+        values = frame[column]
+        codes.update(values.cat.categories if isinstance(values.dtype, pd.CategoricalDtype) else values.dropna().unique())
+    dtype = pd.CategoricalDtype(sorted(str(code) for code in codes))
+    for column in present:
+        if frame[column].dtype != dtype:
+            frame[column] = frame[column].astype(dtype)
+    return frame
+
+
+@dataclass
+class _Entry:
+    mtime: float
+    columns: List[str]
+    # Parquet dataset every column of this entry is read from (None: the CSV),
+    # fixed per entry so columns added later line up row for row.
+    dataset: Optional[str] = None
+    frame: pd.DataFrame = field(default_factory=pd.DataFrame)
+
+
+_cache: Dict[str, _Entry] = {}
+_lock = threading.Lock()
+
+
+def clear_cache() -> None:
+    """Drop every frame held in memory."""
+
+    with _lock:
+        _cache.clear()
+
+
+def _season_mask(table: Table, frame: pd.DataFrame, seasons: Sequence[int]) -> pd.Series:
+    if table.season:
+        return frame[table.season].isin(seasons)
+    years = pd.to_numeric(frame[table.game_id].astype(str).str[:4], errors="coerce")
+    return years.isin(seasons)
+
+
+def load(
+    name: str,
+    columns: Optional[Iterable[str]] = None,
+    seasons: Optional[Union[int, Iterable[int]]] = None,
+    data_dir: Optional[str] = None,
+    path: Optional[str] = None,
+) -> pd.DataFrame:
+    """Typed frame of table ``name``, optionally projected to ``columns`` and filtered to ``seasons``.
+
+    ``data_dir`` defaults to ``NFL_DATA_DIR`` or ``data``; ``path`` reads any
+    other copy of the table (e.g. a single-season roster file) with its schema.
+    """
+
+    table = TABLES[name]
+    path = os.path.abspath(path or table_path(name, data_dir))
+    if seasons is not None:
+        seasons = [seasons] if isinstance(seasons, int) else list(seasons)
+        if not (table.season or table.game_id):
+            raise ValueError(f"The {name} table has no season column to filter on")
+    with _lock:
+        mtime = os.path.getmtime(path)
+        entry = _cache.get(path)
+        if entry is None or entry.mtime != mtime:
+            present = columns_of(path)
+            entry = _cache[path] = _Entry(mtime, present, dataset_path(table, path, present))
+        wanted = list(entry.columns if columns is None else columns)
+        unknown = [c for c in wanted if c not in entry.columns]
+        if unknown:
+            raise KeyError(f"{name} has no columns {unknown}")
+        key = table.season or table.game_id
+        needed = wanted + ([key] if seasons is not None and key not in wanted else [])
+        missing = [c for c in needed if c not in entry.frame.columns]
+        # Team columns are loaded together so they always share one category set.
+        if any(c in table.teams for c in missing):
+            missing += [c for c in table.teams if c in entry.columns and c not in entry.frame.columns and c not in missing]
+        if missing:
+            part = read_columns(table, path, [c for c in entry.columns if c in missing], entry.dataset)
+            frame = part if entry.frame.columns.empty else pd.concat([entry.frame, part], axis=1)
+            entry.frame = unify_teams(frame, table)
+        frame = entry.frame
+    if seasons is not None:
+        frame = frame[_season_mask(table, frame, seasons)].reset_index(drop=True)
+        return frame[wanted]
+    return frame.copy(deep=False) if list(frame.columns) == wanted else frame[wanted]
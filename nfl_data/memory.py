@@ -0,0 +1,80 @@
+"""Memory footprint of the shared tables, before and after ``loaders.compact``.
+
+``footprint`` parses each table the way the pages used to (a plain
+``pd.read_csv``) and the way ``load`` does now, and reports the resident size
+of both::
+
+    python -m nfl_data.memory --data-dir Websites/Streamlit/data
+
+Object columns are measured by distinct string object (interned strings are
+counted once, plus a pointer per row), which ``memory_usage(deep=True)``
+would count once per row.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Iterable, Optional, Sequence
+
+import pandas as pd
+
+from .loaders import clear_cache, load, table_path
+from .schema import TABLES
+
+
+def frame_bytes(frame: pd.DataFrame) -> int:
+    """Bytes held by ``frame``, counting each distinct object once."""
+
+    total = int(frame.index.memory_usage())
+    for column in frame.columns:
+        values = frame[column]
+        if values.dtype == object:
+            array = values.to_numpy()
+            distinct = {id(value): value for value in array}
+            total += array.nbytes + sum(sys.getsizeof(value) for value in distinct.values())
+        else:
+            total += int(values.memory_usage(index=False, deep=True))
+    return total
+
+
+def footprint(names: Optional[Iterable[str]] = None, data_dir: Optional[str] = None) -> pd.DataFrame:
+    """Rows and MB per table as a plain ``read_csv`` and as loaded, for the tables present in ``data_dir``."""
+
+    rows = []
+    for name in names or TABLES:
+        try:
+            path = table_path(name, data_dir)
+        except FileNotFoundError:
+            continue
+        before = frame_bytes(pd.read_csv(path, low_memory=False))
+        clear_cache()
+        frame = load(name, path=path)
+        after = frame_bytes(frame)
+        rows.append({"table": name, "rows": len(frame), "read_csv_mb": before / 2 ** 20,
+                     "loaded_mb": after / 2 ** 20, "saved_pct": 100 * (1 - after / before) if before else 0.0})
+    clear_cache()
+    return pd.DataFrame(rows, columns=["table", "rows", "read_csv_mb", "loaded_mb", "saved_pct"])
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Memory footprint of the shared tables before and after compaction")
+    parser.add_argument("tables", nargs="*", help="table names (default: every table present)")
+    parser.add_argument("--data-dir", help="default: NFL_DATA_DIR or data")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.tables if name not in TABLES]
+    if unknown:
+        parser.error(f"unknown tables {unknown}; choose from {', '.join(TABLES)}")
+    report = footprint(args.tables or None, args.data_dir)
+    if report.empty:
+        print("No tables found")
+        return 1
+    print(report.to_string(index=False, float_format="{:.1f}".format))
+    before, after = report["read_csv_mb"].sum(), report["loaded_mb"].sum()
+    print(f"\nTotal: {before:.1f} MB -> {after:.1f} MB ({100 * (1 - after / before):.0f}% less)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
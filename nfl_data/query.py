@@ -0,0 +1,245 @@
+"""SQL over the data directory through an embedded DuckDB engine.
+
+``connect`` opens an in-process DuckDB database in which every table of
+``schema.TABLES`` found in the data directory is a view over its file (the
+season-partitioned Parquet dataset under ``parquet/`` when it is up to date,
+the CSV otherwise), and ``nfl.db``, if
+present, is attached read-only as ``db``. Nothing is loaded up front: DuckDB
+scans the files when a query runs, in parallel and out of core, and only the
+columns, row groups and season partitions the query touches.
+
+The aggregates the apps ask for are kept as named, parameterized queries::
+
+    from nfl_data import query
+    splits = query.run('team_splits', team='KC', since=2020)
+    league = query.run('team_splits', since=2025, until=2025, game_types=['REG'])
+    logs = query.run('player_vs_opponent', player='Travis Kelce', opponent='LVR')
+    h2h = query.run('head_to_head', team1='KC', team2='BUF', limit=10)
+
+duckdb is optional: the rest of the package works without it, and these
+functions raise ImportError when it is missing.
+"""
+
+from __future__ import annotations
+
+import csv
+import glob
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .loaders import DATASET_DIR, default_data_dir
+from .schema import TABLES, Table
+
+try:
+    import duckdb
+except ImportError:  # optional, only this module needs it
+    duckdb = None
+
+
+DB_FILE = "nfl.db"
+# Per-season files read as one view when the merged CSV is not in the data directory.
+SEASON_FILES: Dict[str, str] = {
+    "passing_rushing_receiving": os.path.join("SR-passing-rushing-receiving-game-logs", "all_passing_rushing_receiving_*.csv"),
+    "defense": os.path.join("SR-defense-game-logs", "all_defense-game-logs_*.csv"),
+    "redzone": os.path.join("SR-redzone", "all_redzone_*.csv"),
+    "scoring_tables": os.path.join("SR-scoring-tables", "all_scoring_tables_*.csv"),
+}
+
+# Pro-Football-Reference codes in the raw season files -> the nflverse codes used by games.
+TEAM_ALIASES: Dict[str, str] = {
+    "GNB": "GB", "KAN": "KC", "NOR": "NO", "NWE": "NE", "SFO": "SF", "TAM": "TB",
+    "OAK": "LVR", "LV": "LVR", "SDG": "LAC", "SD": "LAC", "STL": "LAR", "LA": "LAR",
+}
+
+_SQL_TYPES = {"str": "VARCHAR", "category": "VARCHAR", "Int16": "SMALLINT", "Int32": "INTEGER",
+              "int64": "BIGINT", "Int64": "BIGINT"}
+
+
+@dataclass(frozen=True)
+class NamedQuery:
+    """A parameterized query over the views; ``$name`` placeholders are filled from ``params``."""
+
+    sql: str
+    # Values used for parameters the caller leaves out.
+    defaults: Dict[str, object] = field(default_factory=dict)
+
+
+_TEAM_GAMES = """
+    SELECT game_id, season, week, game_type, date, home_team AS team, away_team AS opponent, 'home' AS venue,
+           home_score AS points_for, away_score AS points_against, try_cast(home_spread AS DOUBLE) AS spread,
+           home_ats AS ats, ats_margin, try_cast(away_spread AS DOUBLE) AS opponent_spread, away_ats AS opponent_ats,
+           ou_result
+    FROM games
+    UNION ALL
+    SELECT game_id, season, week, game_type, date, away_team, home_team, 'away',
+           away_score, home_score, try_cast(away_spread AS DOUBLE),
+           away_ats, -ats_margin, try_cast(home_spread AS DOUBLE), home_ats,
+           ou_result
+    FROM games
+"""
+
+QUERIES: Dict[str, NamedQuery] = {
+    "team_splits": NamedQuery(
+        f"""
+        SELECT team, season, venue,
+               count(*) AS games,
+               count(*) FILTER (WHERE points_for > points_against) AS wins,
+               count(*) FILTER (WHERE points_for < points_against) AS losses,
+               count(*) FILTER (WHERE points_for = points_against) AS ties,
+               round(avg(points_for), 1) AS points_for,
+               round(avg(points_against), 1) AS points_against,
+               count(*) FILTER (WHERE ats = 'Cover') AS ats_covers,
+               count(*) FILTER (WHERE ats = 'No Cover') AS ats_losses,
+               count(*) FILTER (WHERE ats = 'Push') AS ats_pushes,
+               count(*) FILTER (WHERE ou_result = 'Over') AS overs,
+               count(*) FILTER (WHERE ou_result = 'Under') AS unders,
+               count(*) FILTER (WHERE ou_result = 'Push') AS ou_pushes
+        FROM ({_TEAM_GAMES}) AS t
+        WHERE ($team IS NULL OR team = $team) AND season >= $since AND ($until IS NULL OR season <= $until)
+          AND game_type = ANY($game_types) AND points_for IS NOT NULL
+        GROUP BY team, season, venue
+        ORDER BY team, season, venue
+        """,
+        {"team": None, "since": 0, "until": None, "game_types": ["REG", "WC", "DIV", "CON", "SB"]},
+    ),
+    "player_vs_opponent": NamedQuery(
+        f"""
+        SELECT g.season, g.week, g.date, l.player, g.team, g.opponent, g.venue, g.points_for, g.points_against,
+               l.pass_cmp, l.pass_att, l.pass_yds, l.pass_td, l.pass_int,
+               l.rush_att, l.rush_yds, l.rush_td, l.targets, l.rec, l.rec_yds, l.rec_td
+        FROM passing_rushing_receiving AS l
+        LEFT JOIN team_aliases AS a ON a.alias = l.team
+        JOIN ({_TEAM_GAMES}) AS g ON g.game_id = l.game_id AND g.team = coalesce(a.team, l.team)
+        WHERE l.player = $player AND ($opponent IS NULL OR g.opponent = $opponent)
+        ORDER BY g.season, g.week
+        """,
+        {"opponent": None},
+    ),
+    "head_to_head": NamedQuery(
+        f"""
+        SELECT t.season, t.week, t.date, t.game_type, t.game_id, t.team AS team1, t.opponent AS team2,
+               g.home_team, g.away_team, g.home_score, g.away_score, t.venue AS team1_venue,
+               t.points_for AS team1_score, t.points_against AS team2_score,
+               t.points_for - t.points_against AS team1_margin, t.points_for + t.points_against AS total_points,
+               g.total_line, t.ou_result, g.team_favorite, g.team_covered,
+               t.spread AS team1_spread, t.ats AS team1_ats, t.ats_margin AS team1_ats_margin,
+               t.opponent_spread AS team2_spread, t.opponent_ats AS team2_ats
+        FROM ({_TEAM_GAMES}) AS t
+        JOIN games AS g ON g.game_id = t.game_id
+        WHERE ($team1 IS NULL OR t.team = $team1) AND ($team2 IS NULL OR t.opponent = $team2)
+          AND t.season >= $since AND t.points_for IS NOT NULL
+        ORDER BY t.date DESC
+        LIMIT $limit
+        """,
+        {"team1": None, "team2": None, "since": 0, "limit": 10},
+    ),
+}
+
+
+def _require() -> None:
+    if duckdb is None:
+        raise ImportError("duckdb is required for nfl_data.query (pip install duckdb)")
+
+
+def _header(path: str) -> List[str]:
+    with open(path, newline="") as f:
+        return next(csv.reader(f), [])
+
+
+def _literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _read_csv(table: Table, pattern: str, first: str) -> str:
+    header = set(_header(first))
+    types = {c: _SQL_TYPES[t] for c, t in table.dtypes.items() if c in header and t in _SQL_TYPES}
+    types.update({c: "VARCHAR" for c in table.categorical if c in header})
+    spec = ", ".join(f"{_literal(c)}: {_literal(t)}" for c, t in types.items())
+    return f"read_csv({_literal(pattern)}, header = true, union_by_name = true, types = {{{spec}}})"
+
+
+def source(name: str, data_dir: str) -> Optional[str]:
+    """Table function that scans table ``name`` in ``data_dir``, or None if it has no file there."""
+
+    table = TABLES[name]
+    csv_path = next((p for p in (os.path.join(data_dir, f) for f in table.files) if os.path.exists(p)), None)
+    if csv_path is None:
+        pattern = os.path.join(data_dir, SEASON_FILES[name]) if name in SEASON_FILES else None
+        files = sorted(glob.glob(pattern)) if pattern else []
+        return _read_csv(table, pattern, files[0]) if files else None
+    csv_mtime = os.path.getmtime(csv_path)
+    dataset = os.path.join(data_dir, DATASET_DIR, name)
+    parts = glob.glob(os.path.join(dataset, "*", "*.parquet"))
+    if parts and min(os.path.getmtime(p) for p in parts) >= csv_mtime:
+        return f"read_parquet({_literal(os.path.join(dataset, '*', '*.parquet'))}, hive_partitioning = true)"
+    return _read_csv(table, csv_path, csv_path)
+
+
+def connect(data_dir: Optional[str] = None, db_path: Optional[str] = None) -> "duckdb.DuckDBPyConnection":
+    """In-memory DuckDB connection with a view per table in ``data_dir`` and ``nfl.db`` attached as ``db``.
+
+    ``team_aliases`` maps the Pro-Football-Reference team codes to the ones in ``games``.
+    """
+
+    _require()
+    data_dir = os.path.abspath(data_dir or default_data_dir())
+    conn = duckdb.connect()
+    conn.execute("CREATE TABLE team_aliases (alias VARCHAR PRIMARY KEY, team VARCHAR)")
+    conn.executemany("INSERT INTO team_aliases VALUES (?, ?)", list(TEAM_ALIASES.items()))
+    for name in TABLES:
+        scan = source(name, data_dir)
+        if scan is not None:
+            conn.execute(f'CREATE VIEW "{name}" AS SELECT * FROM {scan}')
+    db_path = db_path or os.path.join(data_dir, DB_FILE)
+    if os.path.exists(db_path):
+        try:
+            conn.execute(f"ATTACH {_literal(os.path.abspath(db_path))} AS db (TYPE sqlite, READ_ONLY)")
+        except duckdb.Error as exc:  # the sqlite extension is downloaded on first use
+            print(f"nfl_data.query: {db_path} not attached ({exc})")
+    return conn
+
+
+_connections: Dict[Tuple[str, Optional[str]], Tuple[Dict[str, Optional[str]], "duckdb.DuckDBPyConnection"]] = {}
+_lock = threading.Lock()
+
+
+def _connection(data_dir: Optional[str], db_path: Optional[str]) -> "duckdb.DuckDBPyConnection":
+    """Shared connection for ``data_dir``, reopened when a view would now scan a different file."""
+
+    _require()
+    data_dir = os.path.abspath(data_dir or default_data_dir())
+    key = (data_dir, db_path)
+    sources = {name: source(name, data_dir) for name in TABLES}
+    with _lock:
+        cached = _connections.get(key)
+        if cached is None or cached[0] != sources:
+            if cached is not None:
+                cached[1].close()
+            cached = _connections[key] = (sources, connect(data_dir, db_path))
+        # A cursor per call, so threads (Streamlit sessions) don't share one.
+        return cached[1].cursor()
+
+
+def sql(statement: str, data_dir: Optional[str] = None, db_path: Optional[str] = None, **params) -> pd.DataFrame:
+    """Run ``statement`` against the views of ``data_dir`` with ``$name`` parameters."""
+
+    cursor = _connection(data_dir, db_path)
+    try:
+        return cursor.execute(statement, params).df()
+    finally:
+        cursor.close()
+
+
+def run(name: str, data_dir: Optional[str] = None, db_path: Optional[str] = None, **params) -> pd.DataFrame:
+    """Result of the named query ``name`` (see ``QUERIES``) as a DataFrame."""
+
+    named = QUERIES[name]
+    unknown = set(params) - set(re.findall(r"\$(\w+)", named.sql))
+    if unknown:
+        raise TypeError(f"{name} takes no parameters {sorted(unknown)}")
+    return sql(named.sql, data_dir, db_path, **{**named.defaults, **params})
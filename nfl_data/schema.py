@@ -0,0 +1,98 @@
+"""Schemas of the shared NFL tables.
+
+Every table the scrapers produce is declared once: the file names it goes by
+in a data directory, the dtypes of its text and key columns, the columns that
+hold team codes (one category set shared by all of them, so they compare and
+merge with each other), other low-cardinality columns stored as categories,
+the text columns whose values repeat from row to row (player names, game ids;
+kept as plain strings but interned, one object per distinct value), and the
+columns parsed as dates. Other numeric columns are the stats; ``loaders``
+stores them as int16/int32 when they hold whole numbers and float32 otherwise.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class Table:
+    """One shared table and how its columns are typed."""
+
+    name: str
+    # File names tried in order inside the data directory.
+    files: Sequence[str]
+    dtypes: Dict[str, str] = field(default_factory=dict)
+    # Columns of team codes; they share one category set.
+    teams: Sequence[str] = ()
+    # Other columns stored as categories (each with its own set).
+    categories: Sequence[str] = ()
+    # Repeated text interned rather than made categorical, so group-bys on it
+    # only return the values present.
+    interned: Sequence[str] = ()
+    dates: Sequence[str] = ()
+    # Column used by ``seasons=`` filters; ``game_id`` tables use the year prefix of that column.
+    season: Optional[str] = None
+    game_id: Optional[str] = None
+
+    @property
+    def categorical(self) -> Sequence[str]:
+        return (*self.teams, *self.categories)
+
+
+_ROSTER_IDS = ("gsis_id", "espn_id", "sportradar_id", "yahoo_id", "rotowire_id", "pff_id", "pfr_id",
+               "fantasy_data_id", "sleeper_id", "esb_id", "gsis_it_id", "smart_id")
+
+TABLES: Dict[str, Table] = {table.name: table for table in (
+    Table(
+        "games", ("Games.csv", "games.csv"),
+        dtypes={"game_id": "str", "season": "Int32", "week": "Int16", "away_qb_id": "str", "home_qb_id": "str",
+                "game_id_simple": "str", "game_id_team1": "str", "game_id_team2": "str", "pfr": "str", "gametime": "str"},
+        teams=("away_team", "home_team"),
+        categories=("game_type", "weekday", "location", "roof", "surface", "ou_result"),
+        interned=("away_qb_name", "home_qb_name", "away_coach", "home_coach", "referee", "stadium_id", "stadium"),
+        dates=("date",),
+        season="season",
+    ),
+    Table("teams", ("Teams.csv", "teams.csv"), dtypes={"TeamID": "str", "Team": "str"}, categories=("Division",)),
+    Table("team_game_logs", ("all_team_game_logs.csv",), dtypes={"game_id": "str", "season": "Int32"}, season="season"),
+    Table(
+        "schedule", ("all_teams_schedule_and_game_results_merged.csv",),
+        dtypes={"Team": "str", "Opp": "str", "Date": "str", "Time": "str", "Rec": "str", "Season": "Int32"},
+        categories=("Day", "Outcome", "Home/Away"),
+        interned=("Team", "Opp", "Date", "Time"),
+        season="Season",
+    ),
+    Table("box_scores", ("all_box_scores.csv",), dtypes={"URL": "str", "Team": "str"}, interned=("URL", "Team")),
+    Table("scoring_tables", ("all_scoring_tables.csv",),
+          dtypes={"Game_ID": "str", "Team": "str", "Detail": "str", "Time": "str"},
+          interned=("Game_ID", "Team", "Quarter"), game_id="Game_ID"),
+    Table("team_stats", ("all_team_stats.csv",), dtypes={"Team": "str", "Player": "str", "Year": "Int32"},
+          interned=("Team", "Player"), season="Year"),
+    Table("team_conversions", ("all_team_conversions.csv",), dtypes={"Team": "str", "Year": "Int32"},
+          interned=("Team",), season="Year"),
+    Table(
+        "passing_rushing_receiving", ("all_passing_rushing_receiving.csv",),
+        dtypes={"player": "str", "player_id": "str", "game_id": "str"},
+        teams=("team",),
+        interned=("player", "player_id", "game_id"),
+        game_id="game_id",
+    ),
+    Table("defense", ("all_defense-game-logs.csv",), dtypes={"player": "str", "game_id": "str"},
+          teams=("team",), interned=("player", "game_id"), game_id="game_id"),
+    Table("redzone", ("all_redzone.csv",), dtypes={"Player": "str", "Year": "Int32"},
+          teams=("Tm",), categories=("StatType",), interned=("Player",), season="Year"),
+    Table(
+        "rosters", ("rosters.csv", "Rosters.csv"),
+        dtypes={"season": "Int32", "full_name": "str", "first_name": "str", "last_name": "str",
+                "birth_date": "str", "college": "str", "headshot_url": "str", "football_name": "str",
+                "url": "str", **{column: "str" for column in _ROSTER_IDS}},
+        teams=("team", "draft_club"),
+        categories=("position", "depth_chart_position", "ngs_position", "status", "game_type",
+                    "status_description_abbr"),
+        interned=("full_name", "first_name", "last_name", "football_name", "college", "birth_date",
+                  "headshot_url", "url", *_ROSTER_IDS),
+        season="season",
+    ),
+)}